@@ -1,19 +1,24 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
-    QScrollArea, QGridLayout, QTableWidget, QTableWidgetItem,
-    QHeaderView, QMessageBox, QApplication, QSpacerItem, QSizePolicy
+    QGridLayout, QTableWidget, QTableWidgetItem,
+    QHeaderView, QMessageBox, QSpacerItem, QSizePolicy
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QPixmap, QIcon
-import os
+from PyQt6.QtGui import QIcon, QShortcut, QKeySequence
 import sys
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QListWidget, QMessageBox
-
-plt.style.use('default')
 from database_manager_mysql import get_database
+from decorators import query_budget, profiled
+import profiler
+from query_budget import action_scope
+from memory_tracker import get_memory_tracker
+from logger_config import get_logger
+import icons
+from ui_styles import set_role, set_state, set_screen
+from tab_pages import TabStack, KeyedRows, bar_row, pill_row, set_metric
+from change_bus import changes, STUDENTS_CLEARED
+
+logger = get_logger(__name__)
 
 
 class AdminScreen(QWidget):
@@ -21,10 +26,16 @@ class AdminScreen(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.setStyleSheet("background-color: #F8F9FA;")
+        set_screen(self, "adminScreen")
         self.current_tab = "overview"
         self.db = get_database()
+        self.memory_tracker = get_memory_tracker("admin")
         self.setup_ui()
+        # Every write to a student changes the dashboard figures
+        changes.subscribe(self.on_student_changed)
+
+        # Hidden toggle for on-demand profiling
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, activated=self.toggle_profiling)
 
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
@@ -37,69 +48,43 @@ class AdminScreen(QWidget):
         nav_tabs = self.create_nav_tabs()
         main_layout.addWidget(nav_tabs)
 
-        # Scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #F8F9FA;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #F0F0F0;
-                width: 10px;
-                margin: 0px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #C0C0C0;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #A0A0A0;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
-        self.content_container = QWidget()
-        self.content_container.setStyleSheet("background-color: #F8F9FA;")
-        self.content_layout = QVBoxLayout(self.content_container)
-        self.content_layout.setContentsMargins(80, 60, 80, 100)
-        self.content_layout.setSpacing(40)
-        self.show_overview_content()
-        scroll.setWidget(self.content_container)
-        main_layout.addWidget(scroll)
+        # One page per tab, built on first visit and refreshed in place afterwards
+        self.pages = TabStack()
+        self.pages.add_tab("overview", self.build_overview_page)
+        self.pages.add_tab("analytics", self.build_analytics_page)
+        self.pages.add_tab("data", self.build_data_page)
+        self.pages.add_tab("staff", self.build_staff_page)
+        self.pages.add_tab("system", self.build_system_page)
+        self.pages.show_tab("overview")
+        main_layout.addWidget(self.pages)
+
+    def on_student_changed(self, event):
+        """Recount the visible page (and mark the others stale) once the burst of writes is over"""
+        self.pages.invalidate_soon()
 
     def create_header(self):
         header = QFrame()
-        header.setStyleSheet("QFrame { background-color: #FFFFFF; border: none; }")
+        header.setObjectName("pageHeader")
         header.setFixedHeight(100)
         layout = QHBoxLayout(header)
         layout.setContentsMargins(40, 20, 40, 20)
 
         # Logo
         logo = QLabel()
-        if os.path.exists('assets/enrollify_logo.png'):
-            pixmap = QPixmap('assets/enrollify_logo.png').scaled(
-                50, 50, Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        pixmap = icons.pixmap('enrollify_logo.png', 50)
+        if pixmap is not None:
             logo.setPixmap(pixmap)
         else:
             logo.setText("ðŸ“š")
-            logo.setStyleSheet("font-size: 32px;")
+            logo.setObjectName("headerLogo")
 
         # Text
         text_layout = QVBoxLayout()
         text_layout.setSpacing(2)
         title = QLabel("Enrollify")
-        title.setStyleSheet("font-size: 24px; font-weight: 700; color: #060C0B;")
+        title.setObjectName("headerTitle")
         subtitle = QLabel("Admin Panel - System Administration")
-        subtitle.setStyleSheet("font-size: 14px; color: #666; font-weight: 500;")
+        subtitle.setObjectName("headerSubtitle")
         text_layout.addWidget(title)
         text_layout.addWidget(subtitle)
         layout.addWidget(logo)
@@ -109,20 +94,7 @@ class AdminScreen(QWidget):
         # Logout Button - should be around line 122
         logout_btn = QPushButton("Logout")
         logout_btn.setFixedHeight(45)
-        logout_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #2D9B84;
-                border: 2px solid #2D9B84;
-                border-radius: 10px;
-                font-size: 15px;
-                font-weight: 600;
-                padding: 0 20px;
-            }
-            QPushButton:hover {
-                background-color: #E8F4F2;
-            }
-        """)
+        logout_btn.setObjectName("logoutButton")
         # âœ… THIS LINE IS CRITICAL
         logout_btn.clicked.connect(self.logout_signal.emit)
         layout.addWidget(logout_btn)
@@ -130,58 +102,21 @@ class AdminScreen(QWidget):
 
     def create_nav_tabs(self):
         nav_container = QFrame()
-        nav_container.setStyleSheet("""
-            QFrame {
-                background-color: #F3F4F6;
-                border-radius: 20px;
-                padding: 4px;
-                margin: 0 40px;
-            }
-        """)
+        nav_container.setObjectName("navPills")
         nav_container.setFixedHeight(50)
 
         layout = QHBoxLayout(nav_container)
         layout.setContentsMargins(8, 0, 8, 0)
         layout.setSpacing(0)
 
-        active_style = """
-            QPushButton {
-                background-color: white;
-                color: #060C0B;
-                border: none;
-                border-radius: 16px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 8px 20px;
-            }
-        """
-
-        inactive_style = """
-            QPushButton {
-                background-color: transparent;
-                color: #666;
-                border: none;
-                font-size: 14px;
-                font-weight: 500;
-                padding: 8px 20px;
-            }
-            QPushButton:hover {
-                background-color: #E5E7EB;
-                color: #060C0B;
-            }
-        """
-
         self.overview_btn = QPushButton("📊 Overview")
         self.analytics_btn = QPushButton("📈 Analytics")
         self.data_btn = QPushButton("💾 Data")
         self.staff_btn = QPushButton("👥 Staff")  # NEW TAB
         self.system_btn = QPushButton("⚙️ System")
 
-        self.overview_btn.setStyleSheet(active_style)
-        self.analytics_btn.setStyleSheet(inactive_style)
-        self.data_btn.setStyleSheet(inactive_style)
-        self.staff_btn.setStyleSheet(inactive_style)  # NEW
-        self.system_btn.setStyleSheet(inactive_style)
+        for btn in (self.overview_btn, self.analytics_btn, self.data_btn, self.staff_btn, self.system_btn):
+            set_role(btn, "navPill", active=btn is self.overview_btn)
 
         self.overview_btn.clicked.connect(lambda: self.switch_tab("overview"))
         self.analytics_btn.clicked.connect(lambda: self.switch_tab("analytics"))
@@ -198,28 +133,10 @@ class AdminScreen(QWidget):
         return nav_container
 
     def switch_tab(self, tab_name):
-        """Switch between tabs with proper cleanup"""
+        """Switch between tabs - each page is kept and only its data is refreshed"""
         self.current_tab = tab_name
 
-        # Reset styles for all buttons
-        buttons = [self.overview_btn, self.analytics_btn, self.data_btn, self.staff_btn, self.system_btn]
-        for btn in buttons:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    color: #666;
-                    font-size: 14px;
-                    font-weight: 500;
-                    padding: 8px 20px;
-                }
-                QPushButton:hover {
-                    background-color: #E5E7EB;
-                    color: #060C0B;
-                }
-            """)
-
-        # Activate current button
+        # The active state is a dynamic property matched by the app stylesheet
         btn_map = {
             "overview": self.overview_btn,
             "analytics": self.analytics_btn,
@@ -227,124 +144,52 @@ class AdminScreen(QWidget):
             "staff": self.staff_btn,  # NEW
             "system": self.system_btn
         }
-        active_btn = btn_map[tab_name]
-        active_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #060C0B;
-                border: none;
-                border-radius: 16px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 8px 20px;
-            }
-        """)
-
-        # Clear and load content
-        self.clear_content()
-        QApplication.processEvents()
-        QTimer.singleShot(10, lambda: self.load_tab_content(tab_name))
+        for name, btn in btn_map.items():
+            set_state(btn, active=name == tab_name)
 
-    def load_tab_content(self, tab_name):
-        """Load content for the selected tab"""
-        method_map = {
-            "overview": self.show_overview_content,
-            "analytics": self.show_analytics_content,
-            "data": self.show_data_content,
-            "staff": self.show_staff_content,  # NEW
-            "system": self.show_system_content
-        }
-        method_map[tab_name]()
-
-    def clear_content(self):
-        """Clear all content from layout - IMPROVED"""
-        # Delete all child widgets recursively
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                widget = item.widget()
-                widget.setParent(None)
-                widget.deleteLater()
-            elif item.layout():
-                self.clear_layout_recursive(item.layout())
-
-        # Force garbage collection
-        QApplication.processEvents()
-
-    def clear_layout_recursive(self, layout):
-        """Recursively clear a layout and all its children"""
-        if layout is None:
-            return
+        self.load_tab_content(tab_name)
 
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                widget = item.widget()
-                widget.setParent(None)
-                widget.deleteLater()
-            elif item.layout():
-                self.clear_layout_recursive(item.layout())
+    def load_tab_content(self, tab_name):
+        """Show the page of the selected tab (built on first visit, re-queried when stale)"""
+        with action_scope(f"admin.tab.{tab_name}"), profiler.profile_block(f"admin.tab.{tab_name}"):
+            self.pages.show_tab(tab_name)
+
+        if self.memory_tracker:
+            # After the event loop has run the deleteLater() calls of rows that went away
+            QTimer.singleShot(0, lambda: self.memory_tracker.checkpoint(tab_name))
+
+    def toggle_profiling(self):
+        """Switch cProfile capture on or off for tab loads, exports, enrollments and payments"""
+        enabled = not profiler.is_enabled()
+        profiler.set_enabled(enabled)
+        QMessageBox.information(
+            self,
+            "Profiling",
+            f"Profiling is now {'ON' if enabled else 'OFF'}.\n\n"
+            + (f"Profiles are written to:\n{profiler.profiles_dir()}" if enabled else "")
+        )
 
-    def create_metric_card(self, title, value, subtext="", icon="", color="#6B7280", border_color=""):
+    def create_metric_card(self, title, value, subtext="", icon="", tone="gray", tinted_border=False):
         card = QFrame()
         card.setFixedHeight(150)
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border: 1px solid {border_color if border_color else '#E5E7EB'};
-                border-radius: 16px;
-                padding: 24px;
-            }}
-        """)
+        set_role(card, "metricCard", tone=tone if tinted_border else None)
         layout = QVBoxLayout(card)
         layout.setSpacing(12)
         layout.setContentsMargins(0, 0, 0, 0)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            font-size: 14px;
-            color: #666;
-            font-weight: 500;
-            border: none;
-            background: transparent;
-            margin: 0;
-            padding: 0;
-        """)
+        title_label.setObjectName("metricTitle")
         layout.addWidget(title_label)
 
         value_layout = QHBoxLayout()
         value_label = QLabel(value)
-        value_label.setStyleSheet(f"""
-            font-size: 32px;
-            font-weight: 700;
-            color: {color};
-            border: none;
-            background: transparent;
-            margin: 0;
-            padding: 0;
-        """)
+        set_role(value_label, "metricValue", tone=tone)
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet(f"""
-            font-size: 20px;
-            color: {color};
-            border: none;
-            background: transparent;
-            margin: 0;
-            padding: 0;
-        """)
+        set_role(icon_label, "metricIcon", tone=tone)
 
         if subtext:
             sub_label = QLabel(subtext)
-            sub_label.setStyleSheet(f"""
-                font-size: 14px;
-                font-weight: 600;
-                color: {color};
-                border: none;
-                background: transparent;
-                margin: 0;
-                padding: 0;
-                margin-left: 8px;
-            """)
+            set_role(sub_label, "metricDelta", tone=tone)
             value_layout.addWidget(value_label)
             value_layout.addWidget(icon_label)
             value_layout.addWidget(sub_label)
@@ -358,268 +203,142 @@ class AdminScreen(QWidget):
         layout.addStretch()
         return card
 
-    def create_quick_stats_panel(self):
+    def create_quick_stats_panel(self, page):
         panel = QFrame()
-        panel.setMinimumHeight(200)
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("Quick Stats")
-        title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("panelTitle")
         subtitle = QLabel("System-wide statistics")
-        subtitle.setStyleSheet("""
-            font-size: 13px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
 
-        try:
-            students = self.db.get_all_students()
-            tracks = len(set(s['track'] for s in students))
-            strands = len(set(s['strand'] for s in students if s.get('strand')))
-            grades = len(set(s['grade'] for s in students))
-            rejected = sum(1 for s in students if s.get('status', '').lower() in ['rejected', 'cancelled', 'dropped'])
-
-            stats = [
-                ("Total Tracks", tracks),
-                ("Total Strands", strands),
-                ("Grade Levels", grades),
-                ("Rejected Applications", rejected)
-            ]
+        rows = KeyedRows(layout, lambda label: pill_row(
+            label, pill={'tone': 'red'} if label == "Rejected Applications" else None
+        ))
 
-            for label, value in stats:
-                row = QHBoxLayout()
-                lbl = QLabel(label)
-                lbl.setStyleSheet("""
-                    font-size: 14px;
-                    color: #333;
-                    border: none;
-                    background: transparent;
-                """)
-                val = QLabel(str(value))
-                val.setStyleSheet("""
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: #111827;
-                    padding: 4px 12px;
-                    background: #F3F4F6;
-                    border-radius: 8px;
-                    border: none;
-                """)
-                if label == "Rejected Applications":
-                    val.setStyleSheet("""
-                        font-size: 14px;
-                        font-weight: 600;
-                        color: #DC2626;
-                        padding: 4px 12px;
-                        background: #FEE2E2;
-                        border-radius: 8px;
-                        border: none;
-                    """)
-                row.addWidget(lbl)
-                row.addWidget(val)
-                row.addStretch()
-                layout.addLayout(row)
-        except Exception as e:
-            err = QLabel("âš ï¸ Data unavailable")
-            err.setStyleSheet("""
-                color: #EF4444;
-                font-size: 13px;
-                border: none;
-                background: transparent;
-            """)
-            layout.addWidget(err)
+        @page.on_refresh
+        def refresh():
+            try:
+                students = self.db.get_all_students()
+                tracks = len(set(s['track'] for s in students))
+                strands = len(set(s['strand'] for s in students if s.get('strand')))
+                grades = len(set(s['grade'] for s in students))
+                rejected = sum(1 for s in students if s.get('status', '').lower() in ['rejected', 'cancelled', 'dropped'])
+
+                rows.bind([
+                    ("Total Tracks", tracks),
+                    ("Total Strands", strands),
+                    ("Grade Levels", grades),
+                    ("Rejected Applications", rejected)
+                ])
+            except Exception as e:
+                logger.error(f"Error loading quick stats: {e}")
+                rows.show_message("⚠️ Data unavailable")
 
         return panel
 
-    def create_gender_distribution_panel(self):
+    def create_gender_distribution_panel(self, page):
         panel = QFrame()
-        panel.setMinimumHeight(200)
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(24)
 
         title = QLabel("Gender Distribution")
-        title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("panelTitle")
         subtitle = QLabel("Student demographics")
-        subtitle.setStyleSheet("""
-            font-size: 13px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
 
-        try:
-            gender_data = self.db.get_gender_distribution()
-            gender_dict = dict(gender_data)
-            male = gender_dict.get('Male', 0)
-            female = gender_dict.get('Female', 0)
-            total = male + female or 1
-
-            for gender, count, color in [("Male", male, "#1F2937"), ("Female", female, "#374151")]:
-                row_layout = QHBoxLayout()
-                lbl = QLabel(gender)
-                lbl.setStyleSheet("""
-                    font-size: 14px;
-                    color: #333;
-                    border: none;
-                    background: transparent;
-                """)
-
-                bar_container = QFrame()
-                bar_container.setFixedHeight(8)
-                bar_container.setStyleSheet("background-color: #E5E7EB; border-radius: 4px;")
-
-                bar = QFrame(bar_container)
-                bar.setFixedHeight(8)
-                bar.setStyleSheet(f"background-color: {color}; border-radius: 4px;")
-                bar_width = max(20, int((count / total) * 200))  # Minimum 20px for visibility
-                bar.setMaximumWidth(bar_width)
-                bar.setFixedWidth(bar_width)
-
-                bar_layout = QHBoxLayout(bar_container)
-                bar_layout.setContentsMargins(0, 0, 0, 0)
-                bar_layout.addWidget(bar)
-                bar_layout.addStretch()
-
-                val = QLabel(str(count))
-                val.setStyleSheet("""
-                    font-size: 14px;
-                    color: #333;
-                    border: none;
-                    background: transparent;
-                """)
-                row_layout.addWidget(lbl)
-                row_layout.addWidget(bar_container)
-                row_layout.addWidget(val)
-                row_layout.addStretch()
-                layout.addLayout(row_layout)
-        except Exception as e:
-            err = QLabel("âš ï¸ Gender data unavailable")
-            err.setStyleSheet("""
-                color: #EF4444;
-                font-size: 13px;
-                border: none;
-                background: transparent;
-            """)
-            layout.addWidget(err)
+        tones = {"Male": "dark", "Female": "slate"}
+        # Minimum 20px bar for visibility
+        rows = KeyedRows(layout, lambda gender: bar_row(gender, fill={'tone': tones[gender]}, min_width=20))
+
+        @page.on_refresh
+        def refresh():
+            try:
+                gender_dict = dict(self.db.get_gender_distribution())
+                male = gender_dict.get('Male', 0)
+                female = gender_dict.get('Female', 0)
+                total = male + female or 1
+                rows.bind([("Male", (male, total)), ("Female", (female, total))])
+            except Exception as e:
+                logger.error(f"Error loading gender distribution: {e}")
+                rows.show_message("⚠️ Gender data unavailable")
 
         return panel
 
     # ==================== OVERVIEW TAB ====================
-    def show_overview_content(self):
-        """Show overview content with accurate data"""
-        self.clear_content()
+    def build_overview_page(self, page):
+        """Overview page - the numbers are bound by the page's refresh callbacks"""
+        layout = page.content_layout
 
         title = QLabel("Admin Overview")
-        title.setStyleSheet("""
-            font-size: 28px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
-        self.content_layout.addWidget(title)
+        title.setObjectName("pageTitle")
+        layout.addWidget(title)
 
         subtitle = QLabel("System statistics and key metrics")
-        subtitle.setStyleSheet("""
-            font-size: 14px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
-        self.content_layout.addWidget(subtitle)
+        subtitle.setObjectName("pageSubtitle")
+        layout.addWidget(subtitle)
 
-        self.content_layout.addSpacing(40)
+        layout.addSpacing(40)
 
         # Top metrics cards
-        top_cards_layout = QHBoxLayout()
+        top_cards = QWidget()
+        top_cards_layout = QHBoxLayout(top_cards)
         top_cards_layout.setSpacing(24)
         top_cards_layout.setContentsMargins(0, 0, 0, 0)
 
-        try:
-            stats = self.db.get_statistics()
-            total_students = stats['total_students']
-            enrolled = stats['enrolled']
-            pending = stats['pending']
-
-            enrolled_pct = int((enrolled / total_students * 100)) if total_students > 0 else 0
-            pending_pct = int((pending / total_students * 100)) if total_students > 0 else 0
-
-            # ✅ CALCULATE RECENT ENROLLMENTS (Last 30 days)
-            recent_30_days = self.get_recent_enrollments(30)
-
-            card1 = self.create_metric_card(
-                "Total Enrollments", str(total_students),
-                icon="●", color="#111827", border_color="#E5E7EB"
-            )
-
-            card2 = self.create_metric_card(
-                "Enrolled Students", str(enrolled), subtext=f"{enrolled_pct}%",
-                icon="✓", color="#10B981", border_color="#D1FAE5"
-            )
-
-            card3 = self.create_metric_card(
-                "Pending Review", str(pending), subtext=f"{pending_pct}%",
-                icon="○", color="#F59E0B", border_color="#FEF3C7"
-            )
-
-            card4 = self.create_metric_card(
-                "Recent (30 days)", str(recent_30_days),
-                icon="▲", color="#3B82F6", border_color="#DBEAFE"
-            )
-
-            top_cards_layout.addWidget(card1)
-            top_cards_layout.addWidget(card2)
-            top_cards_layout.addWidget(card3)
-            top_cards_layout.addWidget(card4)
+        cards = {
+            'total': self.create_metric_card("Total Enrollments", "0", icon="●", tone="dark"),
+            'enrolled': self.create_metric_card(
+                "Enrolled Students", "0", subtext="0%", icon="✓", tone="green", tinted_border=True
+            ),
+            'pending': self.create_metric_card(
+                "Pending Review", "0", subtext="0%", icon="○", tone="amber", tinted_border=True
+            ),
+            'recent': self.create_metric_card("Recent (30 days)", "0", icon="▲", tone="blue", tinted_border=True),
+        }
+        for card in cards.values():
+            top_cards_layout.addWidget(card)
+        layout.addWidget(top_cards)
 
-            self.content_layout.addLayout(top_cards_layout)
+        error_label = QLabel("⚠️ Error loading metrics")
+        error_label.setObjectName("errorBanner")
+        error_label.hide()
+        layout.addWidget(error_label)
 
-        except Exception as e:
-            print(f"Error loading top stats: {e}")
-            error_label = QLabel("⚠️ Error loading metrics")
-            error_label.setStyleSheet("""
-                color: #EF4444; font-size: 14px; padding: 20px;
-                background: #FEF2F2; border-radius: 12px; border: none;
-            """)
-            self.content_layout.addWidget(error_label)
+        @page.on_refresh
+        def refresh_cards():
+            try:
+                stats = self.db.get_statistics()
+                total_students = stats['total_students']
+                enrolled = stats['enrolled']
+                pending = stats['pending']
+
+                enrolled_pct = int((enrolled / total_students * 100)) if total_students > 0 else 0
+                pending_pct = int((pending / total_students * 100)) if total_students > 0 else 0
+
+                set_metric(cards['total'], total_students)
+                set_metric(cards['enrolled'], enrolled, f"{enrolled_pct}%")
+                set_metric(cards['pending'], pending, f"{pending_pct}%")
+                set_metric(cards['recent'], self.get_recent_enrollments(30))
+                top_cards.show()
+                error_label.hide()
+            except Exception as e:
+                logger.error(f"Error loading top stats: {e}")
+                top_cards.hide()
+                error_label.show()
 
-        self.content_layout.addSpacing(50)
+        layout.addSpacing(50)
 
         # Bottom section - 2x2 grid
         bottom_layout = QHBoxLayout()
@@ -629,23 +348,23 @@ class AdminScreen(QWidget):
         # Left column
         left_column = QVBoxLayout()
         left_column.setSpacing(30)
-        left_column.addWidget(self.create_quick_stats_panel())
-        left_column.addWidget(self.create_enrollment_status_panel())
+        left_column.addWidget(self.create_quick_stats_panel(page))
+        left_column.addWidget(self.create_enrollment_status_panel(page))
 
         # Right column
         right_column = QVBoxLayout()
         right_column.setSpacing(30)
-        right_column.addWidget(self.create_gender_distribution_panel())
-        right_column.addWidget(self.create_track_distribution_mini_panel())
+        right_column.addWidget(self.create_gender_distribution_panel(page))
+        right_column.addWidget(self.create_track_distribution_mini_panel(page))
 
         bottom_layout.addLayout(left_column, 1)
         bottom_layout.addLayout(right_column, 1)
 
-        self.content_layout.addLayout(bottom_layout)
-        self.content_layout.addSpacing(80)
+        layout.addLayout(bottom_layout)
+        layout.addSpacing(80)
 
         spacer = QSpacerItem(20, 100, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-        self.content_layout.addItem(spacer)
+        layout.addItem(spacer)
 
     def get_recent_enrollments(self, days=30):
         """Get number of enrollments in last N days"""
@@ -669,148 +388,43 @@ class AdminScreen(QWidget):
             return count
 
         except Exception as e:
-            print(f"Error calculating recent enrollments: {e}")
+            logger.error(f"Error calculating recent enrollments: {e}")
             return 0
 
-    def create_enrollment_status_panel(self):
-        """Create enrollment status breakdown panel"""
-        panel = QFrame()
-        panel.setMinimumHeight(200)
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(20)
-
-        title = QLabel("Enrollment Status")
-        title.setStyleSheet("font-size: 18px; font-weight: 700; color: #060C0B;")
-        subtitle = QLabel("Current status breakdown")
-        subtitle.setStyleSheet("font-size: 13px; color: #666;")
-        layout.addWidget(title)
-        layout.addWidget(subtitle)
-        layout.addSpacing(16)
-
-        try:
-            statuses = self.db.count_enrollment_status()
-            total = sum(statuses.values()) if statuses else 1
-
-            status_colors = {
-                'Enrolled': '#10B981', 'Pending': '#F59E0B',
-                'Rejected': '#EF4444', 'Cancelled': '#6B7280', 'Dropped': '#9CA3AF'
-            }
-
-            for status, count in statuses.items():
-                percentage = int((count / total) * 100)
-                color = status_colors.get(status, '#6B7280')
-
-                row_layout = QHBoxLayout()
-
-                lbl = QLabel(status)
-                lbl.setStyleSheet("font-size: 14px; color: #333;")
-                lbl.setFixedWidth(100)
-
-                bar_container = QFrame()
-                bar_container.setFixedHeight(8)
-                bar_container.setStyleSheet("background-color: #E5E7EB; border-radius: 4px;")
-
-                bar = QFrame(bar_container)
-                bar.setFixedHeight(8)
-                bar.setStyleSheet(f"background-color: {color}; border-radius: 4px;")
-                bar_width = max(20, int((count / total) * 200))
-                bar.setFixedWidth(bar_width)
-
-                bar_layout = QHBoxLayout(bar_container)
-                bar_layout.setContentsMargins(0, 0, 0, 0)
-                bar_layout.addWidget(bar)
-                bar_layout.addStretch()
-
-                val = QLabel(f"{count} ({percentage}%)")
-                val.setStyleSheet(f"font-size: 14px; color: {color}; font-weight: 600;")
-
-                row_layout.addWidget(lbl)
-                row_layout.addWidget(bar_container, 1)
-                row_layout.addWidget(val)
-                row_layout.addStretch()
-                layout.addLayout(row_layout)
-
-        except Exception as e:
-            print(f"Error: {e}")
-            layout.addWidget(QLabel("⚠️ Data unavailable"))
-
-        layout.addStretch()
-        return panel
-
-    def create_track_distribution_mini_panel(self):
+    def create_track_distribution_mini_panel(self, page):
         """Create compact track distribution panel"""
         panel = QFrame()
-        panel.setMinimumHeight(200)
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("Track Distribution")
-        title.setStyleSheet("font-size: 18px; font-weight: 700; color: #060C0B;")
+        title.setObjectName("panelTitle")
         subtitle = QLabel("Students per track")
-        subtitle.setStyleSheet("font-size: 13px; color: #666;")
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
 
-        try:
-            tracks = self.db.count_by_track()
-            total = sum(tracks.values()) if tracks else 1
-
-            track_colors = ['#8B5CF6', '#EC4899', '#F59E0B', '#10B981']
-
-            for idx, (track, count) in enumerate(tracks.items()):
-                percentage = int((count / total) * 100)
-                color = track_colors[idx % len(track_colors)]
-
-                row_layout = QHBoxLayout()
-
-                lbl = QLabel(track[:20])
-                lbl.setStyleSheet("font-size: 14px; color: #333;")
-                lbl.setFixedWidth(120)
-
-                bar_container = QFrame()
-                bar_container.setFixedHeight(8)
-                bar_container.setStyleSheet("background-color: #E5E7EB; border-radius: 4px;")
+        track_tones = ['purple', 'pink', 'amber', 'green']
+        row_tones = {}
+        rows = KeyedRows(layout, lambda track: bar_row(
+            track, text=track[:20], label_width=120, scale=150, min_width=20, stretch_track=True,
+            fill={'tone': row_tones[track]}, value={'tone': row_tones[track]}
+        ))
 
-                bar = QFrame(bar_container)
-                bar.setFixedHeight(8)
-                bar.setStyleSheet(f"background-color: {color}; border-radius: 4px;")
-                bar_width = max(20, int((count / total) * 150))
-                bar.setFixedWidth(bar_width)
-
-                bar_layout = QHBoxLayout(bar_container)
-                bar_layout.setContentsMargins(0, 0, 0, 0)
-                bar_layout.addWidget(bar)
-                bar_layout.addStretch()
-
-                val = QLabel(str(count))
-                val.setStyleSheet(f"font-size: 14px; color: {color}; font-weight: 600;")
-
-                row_layout.addWidget(lbl)
-                row_layout.addWidget(bar_container, 1)
-                row_layout.addWidget(val)
-                row_layout.addStretch()
-                layout.addLayout(row_layout)
-
-        except Exception as e:
-            print(f"Error: {e}")
-            layout.addWidget(QLabel("⚠️ No track data"))
+        @page.on_refresh
+        def refresh():
+            try:
+                tracks = self.db.count_by_track()
+                total = sum(tracks.values()) if tracks else 1
+                for idx, track in enumerate(tracks):
+                    row_tones.setdefault(track, track_tones[idx % len(track_tones)])
+                rows.bind((track, (count, total)) for track, count in tracks.items())
+            except Exception as e:
+                logger.error(f"Error: {e}")
+                rows.show_message("⚠️ No track data", role="")
 
         layout.addStretch()
         return panel
@@ -818,39 +432,22 @@ class AdminScreen(QWidget):
     def create_receipts_panel(self):
         """Panel for viewing all payment receipts"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 32px;
-            }
-        """)
+        set_role(panel, "panel", size="large")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(32, 32, 32, 32)
         layout.setSpacing(20)
 
         # Header
         header_layout = QHBoxLayout()
 
         title = QLabel("Payment Receipts")
-        title.setStyleSheet("font-size: 20px; font-weight: 700; color: #060C0B;")
+        set_role(title, "panelTitle", size="large")
 
         search_input = QLineEdit()
         search_input.setPlaceholderText("🔍 Search by receipt #, LRN, or student name...")
         search_input.setFixedHeight(40)
         search_input.setFixedWidth(350)
-        search_input.setStyleSheet("""
-            QLineEdit {
-                background: #F9FAFB;
-                border: 1px solid #E5E7EB;
-                border-radius: 8px;
-                padding: 0 15px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #2D9B84;
-            }
-        """)
+        search_input.setObjectName("searchInput")
 
         header_layout.addWidget(title)
         header_layout.addStretch()
@@ -868,26 +465,7 @@ class AdminScreen(QWidget):
         ])
 
         # Style table
-        table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: none;
-                gridline-color: #F3F4F6;
-            }
-            QTableWidget::item {
-                padding: 12px;
-                border-bottom: 1px solid #F3F4F6;
-            }
-            QHeaderView::section {
-                background-color: #F9FAFB;
-                padding: 12px;
-                font-weight: 700;
-                font-size: 13px;
-                color: #111827;
-                border: none;
-                border-bottom: 2px solid #E5E7EB;
-            }
-        """)
+        table.setObjectName("dataTable")
 
         table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         table.verticalHeader().setVisible(False)
@@ -927,19 +505,7 @@ class AdminScreen(QWidget):
 
                 view_btn = QPushButton("👁️ View")
                 view_btn.setFixedHeight(32)
-                view_btn.setStyleSheet("""
-                    QPushButton {
-                        background: #F3F4F6;
-                        border: none;
-                        border-radius: 6px;
-                        font-size: 13px;
-                        font-weight: 600;
-                        padding: 0 12px;
-                    }
-                    QPushButton:hover {
-                        background: #E5E7EB;
-                    }
-                """)
+                view_btn.setObjectName("rowButton")
                 view_btn.clicked.connect(lambda _, r=receipt: self.view_receipt_details(r))
 
                 actions_layout.addWidget(view_btn)
@@ -948,7 +514,7 @@ class AdminScreen(QWidget):
                 table.setCellWidget(row, 5, actions_widget)
 
         except Exception as e:
-            print(f"Error loading receipts: {e}")
+            logger.error(f"Error loading receipts: {e}")
 
         layout.addWidget(table)
 
@@ -975,17 +541,7 @@ class AdminScreen(QWidget):
 
                     view_btn = QPushButton("👁️ View")
                     view_btn.setFixedHeight(32)
-                    view_btn.setStyleSheet("""
-                        QPushButton {
-                            background: #F3F4F6;
-                            border: none;
-                            border-radius: 6px;
-                            font-size: 13px;
-                            font-weight: 600;
-                            padding: 0 12px;
-                        }
-                        QPushButton:hover { background: #E5E7EB; }
-                    """)
+                    view_btn.setObjectName("rowButton")
                     view_btn.clicked.connect(lambda _, r=receipt: self.view_receipt_details(r))
 
                     actions_layout.addWidget(view_btn)
@@ -994,7 +550,7 @@ class AdminScreen(QWidget):
                     table.setCellWidget(row, 5, actions_widget)
             else:
                 # Reload all receipts
-                self.show_data_content()  # Or refresh current view
+                self.pages.refresh("data")  # Or refresh current view
 
         search_input.returnPressed.connect(search_receipts)
 
@@ -1026,29 +582,18 @@ class AdminScreen(QWidget):
         receipt_dialog.exec()
 
     # ==================== ANALYTICS TAB ====================
-    def show_analytics_content(self):
-        self.clear_content()
+    def build_analytics_page(self, page):
+        layout = page.content_layout
 
         title = QLabel("Analytics Dashboard")
-        title.setStyleSheet("""
-            font-size: 28px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
-        self.content_layout.addWidget(title)
+        title.setObjectName("pageTitle")
+        layout.addWidget(title)
 
         subtitle = QLabel("Visual insights from enrollment data")
-        subtitle.setStyleSheet("""
-            font-size: 14px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
-        self.content_layout.addWidget(subtitle)
+        subtitle.setObjectName("pageSubtitle")
+        layout.addWidget(subtitle)
 
-        self.content_layout.addSpacing(40)
+        layout.addSpacing(40)
 
         # ==================== 2x2 GRID LAYOUT ====================
         grid_layout = QGridLayout()
@@ -1056,537 +601,220 @@ class AdminScreen(QWidget):
         grid_layout.setContentsMargins(0, 0, 0, 0)
 
         # Panel 1: Track Distribution
-        track_panel = self.create_track_distribution_panel()
+        track_panel = self.create_track_distribution_panel(page)
         grid_layout.addWidget(track_panel, 0, 0)
 
         # Panel 2: Strand Distribution
-        strand_panel = self.create_strand_distribution_panel()
+        strand_panel = self.create_strand_distribution_panel(page)
         grid_layout.addWidget(strand_panel, 0, 1)
 
         # Panel 3: Grade Level Distribution
-        grade_panel = self.create_grade_level_distribution_panel()
+        grade_panel = self.create_grade_level_distribution_panel(page)
         grid_layout.addWidget(grade_panel, 1, 0)
 
         # Panel 4: Enrollment Status
-        status_panel = self.create_enrollment_status_panel()
+        status_panel = self.create_enrollment_status_panel(page)
         grid_layout.addWidget(status_panel, 1, 1)
 
-        self.content_layout.addLayout(grid_layout)
-        self.content_layout.addSpacing(80)
-
-        self.content_container.adjustSize()
-        self.content_container.updateGeometry()
+        layout.addLayout(grid_layout)
+        layout.addSpacing(80)
 
-    def create_track_distribution_panel(self):
+    def create_track_distribution_panel(self, page):
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("Track Distribution")
-        title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("panelTitle")
         subtitle = QLabel("Enrollment by academic track")
-        subtitle.setStyleSheet("""
-            font-size: 13px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
 
-        try:
-            tracks = self.db.count_by_track()
-            total = sum(tracks.values()) if tracks else 1
-
-            for track, count in tracks.items():
-                row_layout = QHBoxLayout()
-                lbl = QLabel(track)
-                lbl.setStyleSheet("""
-                    font-size: 14px;
-                    color: #333;
-                    border: none;
-                    background: transparent;
-                """)
-
-                bar_container = QFrame()
-                bar_container.setFixedHeight(8)
-                bar_container.setStyleSheet("background-color: #E5E7EB; border-radius: 4px;")
-
-                bar = QFrame(bar_container)
-                bar.setFixedHeight(8)
-                bar.setStyleSheet("background-color: #059669; border-radius: 4px;")
-                bar.setMaximumWidth(int((count / total) * 200))
-                bar.setFixedWidth(int((count / total) * 200))
-
-                bar_layout = QHBoxLayout(bar_container)
-                bar_layout.setContentsMargins(0, 0, 0, 0)
-                bar_layout.addWidget(bar)
-                bar_layout.addStretch()
-
-                val = QLabel(f"{count} ({int(count / total * 100)}%)")
-                val.setStyleSheet("""
-                    font-size: 14px;
-                    color: #333;
-                    border: none;
-                    background: transparent;
-                """)
-
-                row_layout.addWidget(lbl)
-                row_layout.addWidget(bar_container)
-                row_layout.addWidget(val)
-                row_layout.addStretch()
-                layout.addLayout(row_layout)
+        rows = KeyedRows(layout, lambda track: bar_row(track, fill={'tone': 'teal'}, percent=True))
 
-        except Exception as e:
-            err = QLabel("âš ï¸ No track data")
-            err.setStyleSheet("""
-                color: #EF4444;
-                font-size: 13px;
-                border: none;
-                background: transparent;
-            """)
-            layout.addWidget(err)
+        @page.on_refresh
+        def refresh():
+            try:
+                tracks = self.db.count_by_track()
+                total = sum(tracks.values()) if tracks else 1
+                rows.bind((track, (count, total)) for track, count in tracks.items())
+            except Exception as e:
+                logger.error(f"Error loading track distribution: {e}")
+                rows.show_message("⚠️ No track data")
 
         return panel
 
-    def create_strand_distribution_panel(self):
+    def create_strand_distribution_panel(self, page):
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("Strand Distribution")
-        title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("panelTitle")
         subtitle = QLabel("Enrollment by strand/course")
-        subtitle.setStyleSheet("""
-            font-size: 13px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
 
-        try:
-            strands = self.db.get_all_strands()
-            if not strands:
-                layout.addWidget(QLabel("No strands defined"))
-                return panel
+        rows = KeyedRows(layout, lambda strand: bar_row(strand, fill={'tone': 'violet'}),
+                         empty_text="No strands defined", empty_role="")
 
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            strand_counts = {}
-            for s in strands:
-                cursor.execute('SELECT COUNT(*) FROM students WHERE strand = %s', (s,))
-                cnt = cursor.fetchone()[0]
-                strand_counts[s] = cnt
-            conn.close()
-
-            for strand, count in strand_counts.items():
-                row_layout = QHBoxLayout()
-                lbl = QLabel(strand)
-                lbl.setStyleSheet("""
-                    font-size: 14px;
-                    color: #333;
-                    border: none;
-                    background: transparent;
-                """)
-
-                bar_container = QFrame()
-                bar_container.setFixedHeight(8)
-                bar_container.setStyleSheet("background-color: #E5E7EB; border-radius: 4px;")
-
-                bar = QFrame(bar_container)
-                bar.setFixedHeight(8)
-                bar.setStyleSheet("background-color: #9333EA; border-radius: 4px;")
-                bar.setMaximumWidth(
-                    int((count / sum(strand_counts.values())) * 200) if sum(strand_counts.values()) else 0)
-                bar.setFixedWidth(
-                    int((count / sum(strand_counts.values())) * 200) if sum(strand_counts.values()) else 0)
-
-                bar_layout = QHBoxLayout(bar_container)
-                bar_layout.setContentsMargins(0, 0, 0, 0)
-                bar_layout.addWidget(bar)
-                bar_layout.addStretch()
-
-                val = QLabel(str(count))
-                val.setStyleSheet("""
-                    font-size: 14px;
-                    color: #333;
-                    border: none;
-                    background: transparent;
-                """)
-
-                row_layout.addWidget(lbl)
-                row_layout.addWidget(bar_container)
-                row_layout.addWidget(val)
-                row_layout.addStretch()
-                layout.addLayout(row_layout)
-
-        except Exception as e:
-            err = QLabel("âš ï¸ No strand data")
-            err.setStyleSheet("""
-                color: #EF4444;
-                font-size: 13px;
-                border: none;
-                background: transparent;
-            """)
-            layout.addWidget(err)
+        @page.on_refresh
+        def refresh():
+            try:
+                strands = self.db.get_all_strands()
+                # One grouped query instead of a COUNT per strand
+                counts = self.db.count_by_strand() if strands else {}
+                strand_counts = {s: counts.get(s, 0) for s in strands}
+                total = sum(strand_counts.values())
+                rows.bind((strand, (count, total)) for strand, count in strand_counts.items())
+            except Exception as e:
+                logger.error(f"Error loading strand distribution: {e}")
+                rows.show_message("⚠️ No strand data")
 
         return panel
 
-    def create_grade_level_distribution_panel(self):
+    def create_grade_level_distribution_panel(self, page):
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("Grade Level Distribution")
-        title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("panelTitle")
         subtitle = QLabel("Students per grade level")
-        subtitle.setStyleSheet("""
-            font-size: 13px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
 
-        try:
-            grades = self.db.count_by_grade()
-            total = sum(grades.values()) if grades else 1
-
-            for grade, count in grades.items():
-                row_layout = QHBoxLayout()
-                lbl = QLabel(grade)
-                lbl.setStyleSheet("""
-                    font-size: 14px;
-                    color: #333;
-                    border: none;
-                    background: transparent;
-                """)
-
-                bar_container = QFrame()
-                bar_container.setFixedHeight(8)
-                bar_container.setStyleSheet("background-color: #E5E7EB; border-radius: 4px;")
-
-                bar = QFrame(bar_container)
-                bar.setFixedHeight(8)
-                bar.setStyleSheet("background-color: #2563EB; border-radius: 4px;")
-                bar.setMaximumWidth(int((count / total) * 200))
-                bar.setFixedWidth(int((count / total) * 200))
-
-                bar_layout = QHBoxLayout(bar_container)
-                bar_layout.setContentsMargins(0, 0, 0, 0)
-                bar_layout.addWidget(bar)
-                bar_layout.addStretch()
-
-                val = QLabel(str(count))
-                val.setStyleSheet("""
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: #111827;
-                    padding: 4px 12px;
-                    background: #DBEAFE;
-                    border-radius: 8px;
-                    border: none;
-                """)
-
-                row_layout.addWidget(lbl)
-                row_layout.addWidget(bar_container)
-                row_layout.addWidget(val)
-                row_layout.addStretch()
-                layout.addLayout(row_layout)
+        rows = KeyedRows(layout, lambda grade: bar_row(
+            grade, fill={'tone': 'indigo'}, value_role="pill", value={'tone': 'blue'}
+        ))
 
-        except Exception as e:
-            err = QLabel("âš ï¸ No grade data")
-            err.setStyleSheet("""
-                color: #EF4444;
-                font-size: 13px;
-                border: none;
-                background: transparent;
-            """)
-            layout.addWidget(err)
+        @page.on_refresh
+        def refresh():
+            try:
+                grades = self.db.count_by_grade()
+                total = sum(grades.values()) if grades else 1
+                rows.bind((grade, (count, total)) for grade, count in grades.items())
+            except Exception as e:
+                logger.error(f"Error loading grade distribution: {e}")
+                rows.show_message("⚠️ No grade data")
 
         return panel
 
-    def create_enrollment_status_panel(self):
+    def create_enrollment_status_panel(self, page):
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("Enrollment Status")
-        title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("panelTitle")
         subtitle = QLabel("Application status breakdown")
-        subtitle.setStyleSheet("""
-            font-size: 13px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
 
-        try:
-            statuses = self.db.count_enrollment_status()
-
-            for status, count in statuses.items():
-                row_layout = QHBoxLayout()
-                lbl = QLabel(status)
-                lbl.setStyleSheet("""
-                    font-size: 14px;
-                    color: #333;
-                    border: none;
-                    background: transparent;
-                """)
-
-                color = "#10B981" if "enrolled" in status.lower() else \
-                    "#F59E0B" if "pending" in status.lower() else \
-                        "#EF4444"
-
-                bar_container = QFrame()
-                bar_container.setFixedHeight(8)
-                bar_container.setStyleSheet("background-color: #E5E7EB; border-radius: 4px;")
-
-                bar = QFrame(bar_container)
-                bar.setFixedHeight(8)
-                bar.setStyleSheet(f"background-color: {color}; border-radius: 4px;")
-                total = sum(statuses.values()) if statuses else 1
-                bar.setMaximumWidth(int((count / total) * 200))
-                bar.setFixedWidth(int((count / total) * 200))
-
-                bar_layout = QHBoxLayout(bar_container)
-                bar_layout.setContentsMargins(0, 0, 0, 0)
-                bar_layout.addWidget(bar)
-                bar_layout.addStretch()
-
-                val = QLabel(str(count))
-                val.setStyleSheet(f"""
-                    font-size: 14px;
-                    font-weight: 600;
-                    color: {color};
-                    padding: 4px 12px;
-                    background: {'#D1FAE5' if 'enrolled' in status.lower() else '#FEF3C7' if 'pending' in status.lower() else '#FEF2F2'};
-                    border-radius: 8px;
-                    border: none;
-                """)
-
-                row_layout.addWidget(lbl)
-                row_layout.addWidget(bar_container)
-                row_layout.addWidget(val)
-                row_layout.addStretch()
-                layout.addLayout(row_layout)
+        rows = KeyedRows(layout, lambda status: bar_row(
+            status, fill={'status': status}, value_role="pill", value={'status': status}
+        ))
 
-        except Exception as e:
-            err = QLabel("âš ï¸ No status data")
-            err.setStyleSheet("""
-                color: #EF4444;
-                font-size: 13px;
-                border: none;
-                background: transparent;
-            """)
-            layout.addWidget(err)
+        @page.on_refresh
+        def refresh():
+            try:
+                statuses = self.db.count_enrollment_status()
+                total = sum(statuses.values()) if statuses else 1
+                rows.bind((status, (count, total)) for status, count in statuses.items())
+            except Exception as e:
+                logger.error(f"Error loading status breakdown: {e}")
+                rows.show_message("⚠️ No status data")
 
         return panel
 
     # ==================== DATA TAB ====================
-    def show_data_content(self):
-        self.clear_content()
+    def build_data_page(self, page):
+        layout = page.content_layout
 
         title = QLabel("Data Management")
-        title.setStyleSheet("""
-            font-size: 28px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
-        self.content_layout.addWidget(title)
+        title.setObjectName("pageTitle")
+        layout.addWidget(title)
 
         subtitle = QLabel("Manage enrollment data")
-        subtitle.setStyleSheet("""
-            font-size: 14px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
-        self.content_layout.addWidget(subtitle)
+        subtitle.setObjectName("pageSubtitle")
+        layout.addWidget(subtitle)
 
-        self.content_layout.addSpacing(40)
+        layout.addSpacing(40)
 
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 32px;
-            }
-        """)
+        set_role(panel, "panel", size="large")
         panel_layout = QVBoxLayout(panel)
+        panel_layout.setContentsMargins(32, 32, 32, 32)
         panel_layout.setSpacing(24)
-        panel_layout.setContentsMargins(0, 0, 0, 0)
 
         header_layout = QHBoxLayout()
-        db_icon_path = 'assets/icons/database.png'
         db_icon = QLabel()
-        if os.path.exists(db_icon_path):
-            db_pixmap = QPixmap(db_icon_path).scaled(
-                20, 20, Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        db_pixmap = icons.pixmap('icons/database.png', 20)
+        if db_pixmap is not None:
             db_icon.setPixmap(db_pixmap)
         else:
             db_icon.setText("ðŸ“Š")
 
         header_title = QLabel("Database Information")
-        header_title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-            margin-left: 8px;
-        """)
+        header_title.setObjectName("panelTitle")
         header_layout.addWidget(db_icon)
         header_layout.addWidget(header_title)
         header_layout.addStretch()
         panel_layout.addLayout(header_layout)
 
         desc_label = QLabel("Manage enrollment data")
-        desc_label.setStyleSheet("""
-            font-size: 13px;
-            color: #666;
-            border: none;
-            background: transparent;
-            margin-top: 4px;
-        """)
+        desc_label.setObjectName("panelSubtitle")
         panel_layout.addWidget(desc_label)
         panel_layout.addSpacing(20)
 
         metrics_layout = QHBoxLayout()
         metrics_layout.setSpacing(24)
 
-        try:
-            total_records = len(self.db.get_all_students())
-        except Exception:
-            total_records = 0
-
         total_card = QFrame()
-        total_card.setStyleSheet("""
-            QFrame {
-                background-color: #F9FAFB;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        total_card.setObjectName("statCard")
         total_layout = QVBoxLayout(total_card)
         total_layout.setSpacing(8)
         total_layout.setContentsMargins(0, 0, 0, 0)
         total_label = QLabel("Total Records")
-        total_label.setStyleSheet("""
-            font-size: 14px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
-        total_value = QLabel(str(total_records))
-        total_value.setStyleSheet("""
-            font-size: 24px;
-            font-weight: 700;
-            color: #111827;
-            border: none;
-            background: transparent;
-        """)
+        total_label.setObjectName("statLabel")
+        total_value = QLabel("0")
+        total_value.setObjectName("statValue")
         total_layout.addWidget(total_label)
         total_layout.addWidget(total_value)
         total_layout.addStretch()
 
+        @page.on_refresh
+        def refresh_total():
+            try:
+                total_value.setText(str(len(self.db.get_all_students())))
+            except Exception:
+                total_value.setText("0")
+
         storage_card = QFrame()
-        storage_card.setStyleSheet("""
-            QFrame {
-                background-color: #F9FAFB;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        storage_card.setObjectName("statCard")
         storage_layout = QVBoxLayout(storage_card)
         storage_layout.setSpacing(8)
         storage_layout.setContentsMargins(0, 0, 0, 0)
         storage_label = QLabel("Storage Type")
-        storage_label.setStyleSheet("""
-            font-size: 14px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
+        storage_label.setObjectName("statLabel")
         storage_value = QLabel("MySQL Database")
-        storage_value.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 600;
-            color: #111827;
-            border: none;
-            background: transparent;
-        """)
+        set_role(storage_value, "statValue", size="small")
         storage_layout.addWidget(storage_label)
         storage_layout.addWidget(storage_value)
         storage_layout.addStretch()
@@ -1599,27 +827,15 @@ class AdminScreen(QWidget):
 
         divider = QFrame()
         divider.setFixedHeight(1)
-        divider.setStyleSheet("background-color: #E5E7EB;")
+        divider.setObjectName("divider")
         panel_layout.addWidget(divider)
         panel_layout.addSpacing(20)
 
         data_mgmt_title = QLabel("Data Management")
-        data_mgmt_title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
+        data_mgmt_title.setObjectName("panelTitle")
         panel_layout.addWidget(data_mgmt_title)
         data_mgmt_desc = QLabel("Export, backup, or clear enrollment data")
-        data_mgmt_desc.setStyleSheet("""
-            font-size: 13px;
-            color: #666;
-            border: none;
-            background: transparent;
-            margin-top: 4px;
-        """)
+        data_mgmt_desc.setObjectName("panelSubtitle")
         panel_layout.addWidget(data_mgmt_desc)
         panel_layout.addSpacing(16)
 
@@ -1628,45 +844,13 @@ class AdminScreen(QWidget):
 
         export_btn = QPushButton("Export Data")
         export_btn.setFixedHeight(40)
-        export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #2563EB;
-                border: 2px solid #3B82F6;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0 20px;
-            }
-            QPushButton:hover {
-                background-color: #DBEAFE;
-            }
-            QPushButton:pressed {
-                background-color: #BFDBFE;
-            }
-        """)
-        export_btn.clicked.connect(self.export_data)
+        set_role(export_btn, "outlineButton", tone="blue")
+        export_btn.clicked.connect(lambda: self.export_data())
 
         clear_btn = QPushButton("Clear All Data")
         clear_btn.setFixedHeight(40)
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #EF4444;
-                border: 2px solid #F87171;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0 20px;
-            }
-            QPushButton:hover {
-                background-color: #FEF2F2;
-            }
-            QPushButton:pressed {
-                background-color: #FEE2E2;
-            }
-        """)
-        clear_btn.clicked.connect(self.clear_all_data)
+        set_role(clear_btn, "outlineButton", tone="red")
+        clear_btn.clicked.connect(lambda: self.clear_all_data())
 
         btn_layout.addWidget(export_btn)
         btn_layout.addWidget(clear_btn)
@@ -1674,17 +858,16 @@ class AdminScreen(QWidget):
 
         panel_layout.addLayout(btn_layout)
 
-        self.content_layout.addWidget(panel)
-        self.content_layout.addSpacing(80)
-
-        self.content_container.adjustSize()
-        self.content_container.updateGeometry()
+        layout.addWidget(panel)
+        layout.addSpacing(80)
 
     """
     UPDATED export_data() method for admin_screen.py
     Replace the existing export_data method with this version
     """
 
+    @query_budget("admin.export_data")
+    @profiled("admin.export_data")
     def export_data(self):
         """Export all student data to PDF with professional formatting"""
         from datetime import datetime
@@ -1902,6 +1085,7 @@ class AdminScreen(QWidget):
             import traceback
             traceback.print_exc()
 
+    @query_budget("admin.clear_all_data")
     def clear_all_data(self):
         """Clear all student and payment data"""
         reply = QMessageBox.question(
@@ -1919,70 +1103,50 @@ class AdminScreen(QWidget):
                 cursor.execute('DELETE FROM payments')
                 conn.commit()
                 conn.close()
+                self.db.bump_data_versions('students', 'payments')
                 self.db.log_action(None, 'CLEAR_DATA', "All enrollment data cleared by admin")
+                changes.publish(STUDENTS_CLEARED)
                 QMessageBox.information(self, "Success", "All data has been cleared.")
-                self.switch_tab("data")
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
 
     # ==================== SYSTEM TAB ====================
-    def show_system_content(self):
-        self.clear_content()
+    def build_system_page(self, page):
+        layout = page.content_layout
 
         title = QLabel("System Settings")
-        title.setStyleSheet("""
-            font-size: 28px;
-            font-weight: 700;
-            color: #060C0B;
-            border: none;
-            background: transparent;
-        """)
-        self.content_layout.addWidget(title)
+        title.setObjectName("pageTitle")
+        layout.addWidget(title)
 
         subtitle = QLabel("Application settings and information")
-        subtitle.setStyleSheet("""
-            font-size: 14px;
-            color: #666;
-            border: none;
-            background: transparent;
-        """)
-        self.content_layout.addWidget(subtitle)
+        subtitle.setObjectName("pageSubtitle")
+        layout.addWidget(subtitle)
 
-        self.content_layout.addSpacing(40)
+        layout.addSpacing(40)
 
         sys_panel = QFrame()
-        sys_panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 32px;
-            }
-        """)
+        set_role(sys_panel, "panel", size="large")
         sys_layout = QVBoxLayout(sys_panel)
+        sys_layout.setContentsMargins(32, 32, 32, 32)
         sys_layout.setSpacing(24)
 
         header_layout = QHBoxLayout()
-        sys_icon_path = 'assets/icons/settings.png'
         sys_icon = QLabel()
-        if os.path.exists(sys_icon_path):
-            sys_pixmap = QPixmap(sys_icon_path).scaled(
-                20, 20, Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        sys_pixmap = icons.pixmap('icons/settings.png', 20)
+        if sys_pixmap is not None:
             sys_icon.setPixmap(sys_pixmap)
         else:
-            sys_icon.setText("âš™ï¸")
+            sys_icon.setText("⚙️")
 
         header_title = QLabel("System Information")
-        header_title.setStyleSheet("font-size: 18px; font-weight: 700; color: #060C0B; margin-left: 8px;")
+        header_title.setObjectName("panelTitle")
         header_layout.addWidget(sys_icon)
         header_layout.addWidget(header_title)
         header_layout.addStretch()
         sys_layout.addLayout(header_layout)
 
         desc_label = QLabel("Application settings and information")
-        desc_label.setStyleSheet("font-size: 13px; color: #666; margin-top: 4px;")
+        desc_label.setObjectName("panelSubtitle")
         sys_layout.addWidget(desc_label)
         sys_layout.addSpacing(20)
 
@@ -1992,33 +1156,25 @@ class AdminScreen(QWidget):
         self.add_info_row(info_layout, "Application Name", "Enrollify")
         self.add_info_row(info_layout, "Version", "1.0.0")
         self.add_info_row(info_layout, "Database", "MySQL")
+        users_value = self.add_info_row(info_layout, "Active Users", "")
+        tracks_value = self.add_info_row(info_layout, "Supported Tracks", "")
 
-        try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('SELECT COUNT(*) FROM users')
-            user_count = cursor.fetchone()[0]
-            cursor.execute('''
-                           SELECT timestamp
-                           FROM audit_log
-                           WHERE action = 'LOGIN'
-                           ORDER BY timestamp DESC
-                               LIMIT 1
-                           ''')
-            last_login_row = cursor.fetchone()
-            last_login = last_login_row[0] if last_login_row else "Never"
-            conn.close()
-            user_info = f"{user_count} (Student, Staff, Admin)"
-        except Exception:
-            user_info = "Unknown"
-        self.add_info_row(info_layout, "Active Users", user_info)
+        @page.on_refresh
+        def refresh_info():
+            try:
+                conn = self.db.get_connection()
+                cursor = conn.cursor()
+                cursor.execute('SELECT COUNT(*) FROM users')
+                user_count = cursor.fetchone()[0]
+                cursor.close()
+                users_value.setText(f"{user_count} (Student, Staff, Admin)")
+            except Exception:
+                users_value.setText("Unknown")
 
-        try:
-            tracks = self.db.count_by_track()
-            track_count = len(tracks)
-        except Exception:
-            track_count = 0
-        self.add_info_row(info_layout, "Supported Tracks", str(track_count))
+            try:
+                tracks_value.setText(str(len(self.db.count_by_track())))
+            except Exception:
+                tracks_value.setText("0")
 
         sys_layout.addLayout(info_layout)
         sys_layout.addSpacing(24)
@@ -2028,38 +1184,12 @@ class AdminScreen(QWidget):
 
         edit_tracks_btn = QPushButton("Edit Tracks")
         edit_tracks_btn.setFixedHeight(40)
-        edit_tracks_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #2563EB;
-                border: 2px solid #3B82F6;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0 20px;
-            }
-            QPushButton:hover {
-                background-color: #DBEAFE;
-            }
-        """)
+        set_role(edit_tracks_btn, "outlineButton", tone="blue")
         edit_tracks_btn.clicked.connect(self.open_edit_tracks_dialog)
 
         update_btn = QPushButton("Check for Updates")
         update_btn.setFixedHeight(40)
-        update_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #7C2D12;
-                border: 2px solid #F59E0B;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0 20px;
-            }
-            QPushButton:hover {
-                background-color: #FEF3C7;
-            }
-        """)
+        set_role(update_btn, "outlineButton", tone="amber")
         update_btn.clicked.connect(self.check_for_updates)
 
         actions_layout.addWidget(edit_tracks_btn)
@@ -2068,78 +1198,150 @@ class AdminScreen(QWidget):
 
         sys_layout.addLayout(actions_layout)
 
-        self.content_layout.addWidget(sys_panel)
-        self.content_layout.addSpacing(30)
+        layout.addWidget(sys_panel)
+        layout.addSpacing(30)
+
+        layout.addWidget(self.create_slow_queries_panel(page))
+        layout.addSpacing(30)
+
+        layout.addWidget(self.create_tracks_panel(page))
+        layout.addSpacing(80)
+
+    def create_slow_queries_panel(self, page):
+        """Top statements recorded by query_stats since the app started"""
+        from query_stats import registry
+        from config import Config
+
+        panel = QFrame()
+        set_role(panel, "panel", size="large")
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(32, 32, 32, 32)
+        layout.setSpacing(16)
+
+        header_layout = QHBoxLayout()
+        title = QLabel("Slow Statements")
+        title.setObjectName("panelTitle")
+        header_layout.addWidget(title)
+        header_layout.addStretch()
+
+        reset_btn = QPushButton("Reset")
+        reset_btn.setFixedHeight(36)
+        set_role(reset_btn, "outlineButton", size="small")
+        reset_btn.clicked.connect(lambda: (registry.reset(), self.pages.refresh("system")))
+
+        stalls_btn = QPushButton("GUI Stalls")
+        stalls_btn.setFixedHeight(36)
+        set_role(stalls_btn, "outlineButton", size="small")
+        stalls_btn.clicked.connect(self.open_stall_diagnostics)
+
+        header_layout.addWidget(stalls_btn)
+        header_layout.addWidget(reset_btn)
+        layout.addLayout(header_layout)
+
+        desc = QLabel(f"Slowest statements since startup. Anything over {Config.SLOW_QUERY_MS} ms "
+                      f"is also written to the log with its call site.")
+        desc.setObjectName("panelSubtitle")
+        desc.setWordWrap(True)
+        layout.addWidget(desc)
+
+        empty = QLabel("No statements recorded yet")
+        empty.setObjectName("emptyText")
+        layout.addWidget(empty)
 
-        self.refresh_tracks_panel()
+        table = QTableWidget(0, 6)
+        table.setHorizontalHeaderLabels(["Statement", "Calls", "Avg (ms)", "Max (ms)", "Rows", "Call Site"])
+        table.setObjectName("compactTable")
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for col in range(1, 5):
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(table)
+
+        @page.on_refresh
+        def refresh():
+            statements = registry.top(limit=10, key='max_ms')
+            empty.setVisible(not statements)
+            table.setVisible(bool(statements))
+            table.setRowCount(len(statements))
+
+            for row, stat in enumerate(statements):
+                statement_item = QTableWidgetItem(stat['fingerprint'][:160])
+                statement_item.setToolTip(stat['fingerprint'])
+                if stat['slow_count']:
+                    statement_item.setForeground(Qt.GlobalColor.darkRed)
+                table.setItem(row, 0, statement_item)
+                table.setItem(row, 1, QTableWidgetItem(str(stat['count'])))
+                table.setItem(row, 2, QTableWidgetItem(f"{stat['avg_ms']:.1f}"))
+                table.setItem(row, 3, QTableWidgetItem(f"{stat['max_ms']:.1f}"))
+                table.setItem(row, 4, QTableWidgetItem(str(stat['rows'])))
+                site_item = QTableWidgetItem(stat['call_site'])
+                site_item.setToolTip(stat['call_site'])
+                table.setItem(row, 5, site_item)
+
+            table.setFixedHeight(44 + 32 * len(statements))
 
-        self.content_container.adjustSize()
-        self.content_container.updateGeometry()
+        return panel
+
+    def open_stall_diagnostics(self):
+        """Show the GUI stalls recorded by the watchdog"""
+        from stall_watchdog import StallDiagnosticsDialog
+        StallDiagnosticsDialog(self).exec()
 
     def add_info_row(self, parent_layout, key, value):
         row = QHBoxLayout()
         key_label = QLabel(key)
-        key_label.setStyleSheet("font-size: 14px; color: #666;")
+        key_label.setObjectName("infoKey")
         val_label = QLabel(value)
-        val_label.setStyleSheet("font-size: 16px; font-weight: 600; color: #111827;")
+        val_label.setObjectName("infoValue")
         val_label.setWordWrap(True)
         row.addWidget(key_label)
         row.addStretch()
         row.addWidget(val_label)
         parent_layout.addLayout(row)
+        return val_label
 
-    def refresh_tracks_panel(self):
+    def create_tracks_panel(self, page):
         tracks_panel = QFrame()
-        tracks_panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 32px;
-            }
-        """)
+        set_role(tracks_panel, "panel", size="large")
         tracks_layout = QVBoxLayout(tracks_panel)
+        tracks_layout.setContentsMargins(32, 32, 32, 32)
         tracks_layout.setSpacing(24)
 
         header = QLabel("Available Tracks")
-        header.setStyleSheet("font-size: 18px; font-weight: 700; color: #060C0B;")
+        header.setObjectName("panelTitle")
         desc = QLabel("Supported SHS academic tracks")
-        desc.setStyleSheet("font-size: 13px; color: #666; margin-top: 4px;")
+        desc.setObjectName("panelSubtitle")
         tracks_layout.addWidget(header)
         tracks_layout.addWidget(desc)
         tracks_layout.addSpacing(20)
 
-        try:
-            tracks = self.db.get_all_tracks()
-        except Exception:
-            tracks = []
-
         grid = QGridLayout()
         grid.setSpacing(16)
-        for i, track in enumerate(tracks):
-            btn = QPushButton(track)
-            btn.setFixedHeight(40)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #F0fdfa;
-                    color: #065F46;
-                    border: 1px solid #6EE7B7;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-weight: 600;
-                    padding: 0 16px;
-                }
-                QPushButton:hover {
-                    background-color: #CCFBF1;
-                }
-            """)
-            grid.addWidget(btn, i // 2, i % 2)
-
         tracks_layout.addLayout(grid)
         tracks_layout.addStretch()
+        buttons = {}
 
-        self.content_layout.addWidget(tracks_panel)
-        self.content_layout.addSpacing(80)
+        @page.on_refresh
+        def refresh():
+            try:
+                tracks = self.db.get_all_tracks()
+            except Exception:
+                tracks = []
+
+            for track in [t for t in buttons if t not in tracks]:
+                buttons.pop(track).deleteLater()
+            for i, track in enumerate(tracks):
+                if track not in buttons:
+                    btn = QPushButton(track)
+                    btn.setFixedHeight(40)
+                    set_role(btn, "outlineButton", tone="teal")
+                    buttons[track] = btn
+                grid.addWidget(buttons[track], i // 2, i % 2)
+
+        return tracks_panel
 
     def open_edit_tracks_dialog(self):
         dialog = QDialog(self)
@@ -2149,7 +1351,7 @@ class AdminScreen(QWidget):
         layout = QVBoxLayout(dialog)
 
         instr = QLabel("Add or remove academic tracks. Tracks in use by students cannot be removed.")
-        instr.setStyleSheet("font-size: 13px; color: #666; margin-bottom: 10px;")
+        instr.setObjectName("panelSubtitle")
         instr.setWordWrap(True)
         layout.addWidget(instr)
 
@@ -2175,7 +1377,7 @@ class AdminScreen(QWidget):
 
         self.load_tracks_into_list()
         dialog.exec()
-        self.refresh_tracks_panel()
+        self.pages.refresh("system")
 
     def load_tracks_into_list(self):
         self.track_list.clear()
@@ -2225,209 +1427,155 @@ class AdminScreen(QWidget):
     def check_for_updates(self):
         QMessageBox.information(self, "Check for Updates", "No updates available.")
 
-    def show_staff_content(self):
+    def build_staff_page(self, page):
         """Staff Management Tab - Assign students to staff"""
-        self.clear_content()
+        layout = page.content_layout
 
         title = QLabel("Staff Management")
-        title.setStyleSheet("font-size: 28px; font-weight: 700; color: #060C0B;")
-        self.content_layout.addWidget(title)
+        title.setObjectName("pageTitle")
+        layout.addWidget(title)
 
         subtitle = QLabel("Manage staff users and student assignments")
-        subtitle.setStyleSheet("font-size: 14px; color: #666;")
-        self.content_layout.addWidget(subtitle)
+        subtitle.setObjectName("infoKey")
+        layout.addWidget(subtitle)
 
-        self.content_layout.addSpacing(40)
+        layout.addSpacing(40)
 
         # Two column layout
         columns = QHBoxLayout()
         columns.setSpacing(30)
 
         # LEFT: Staff List
-        left_panel = self.create_staff_list_panel()
+        left_panel = self.create_staff_list_panel(page)
         columns.addWidget(left_panel, 1)
 
         # RIGHT: Unassigned Students
-        right_panel = self.create_unassigned_students_panel()
+        right_panel = self.create_unassigned_students_panel(page)
         columns.addWidget(right_panel, 1)
 
-        self.content_layout.addLayout(columns)
-        self.content_layout.addSpacing(80)
+        layout.addLayout(columns)
+        layout.addSpacing(80)
 
-    def create_staff_list_panel(self):
+    def create_list_row(self, button_text, button_role, on_click, badge_role=None):
+        """
+        Name / detail / optional badge / button row with a divider below, for KeyedRows
+        update((name, detail, badge, item)) rebinds the texts and the item the button acts on
+        """
+        widget = QWidget()
+        outer = QVBoxLayout(widget)
+        outer.setContentsMargins(0, 0, 0, 0)
+        outer.setSpacing(20)
+
+        row = QHBoxLayout()
+        info_layout = QVBoxLayout()
+        info_layout.setSpacing(4)
+        name = QLabel()
+        name.setObjectName("itemName")
+        detail = QLabel()
+        detail.setObjectName("itemDetail")
+        info_layout.addWidget(name)
+        info_layout.addWidget(detail)
+        row.addLayout(info_layout)
+        row.addStretch()
+
+        badge = None
+        if badge_role:
+            badge = QLabel()
+            set_role(badge, "pill", **badge_role)
+            row.addWidget(badge)
+
+        current = {}
+        button = QPushButton(button_text)
+        button.setFixedHeight(35)
+        button.setObjectName(button_role)
+        button.clicked.connect(lambda: on_click(current['item']))
+        row.addWidget(button)
+        outer.addLayout(row)
+
+        # Divider
+        divider = QFrame()
+        divider.setFrameShape(QFrame.Shape.HLine)
+        divider.setObjectName("divider")
+        outer.addWidget(divider)
+
+        def update(value):
+            name_text, detail_text, badge_text, current['item'] = value
+            name.setText(name_text)
+            detail.setText(detail_text)
+            if badge is not None:
+                badge.setText(badge_text)
+
+        return widget, update
+
+    def create_staff_list_panel(self, page):
         """Panel showing all staff and their student counts"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 32px;
-            }
-        """)
+        set_role(panel, "panel", size="large")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(32, 32, 32, 32)
         layout.setSpacing(20)
 
         title = QLabel("Staff Members")
-        title.setStyleSheet("font-size: 18px; font-weight: 700; color: #060C0B;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
 
-        try:
-            staff_users = self.db.get_all_staff_users()
+        rows = KeyedRows(layout, lambda staff_id: self.create_list_row(
+            "View Students", "secondaryButton", self.view_staff_students,
+            badge_role={'tone': 'teal', 'size': 'small'}
+        ))
 
-            for staff in staff_users:
-                staff_id = staff['id']
-                student_count = self.db.get_staff_student_count(staff_id)
-
-                row = QHBoxLayout()
-
-                # Staff info
-                info_layout = QVBoxLayout()
-                info_layout.setSpacing(4)
-
-                name = QLabel(staff['full_name'])
-                name.setStyleSheet("font-size: 14px; font-weight: 600; color: #111827;")
-
-                email = QLabel(staff['email'])
-                email.setStyleSheet("font-size: 13px; color: #6B7280;")
-
-                info_layout.addWidget(name)
-                info_layout.addWidget(email)
-
-                # Student count badge
-                count_label = QLabel(f"{student_count} students")
-                count_label.setStyleSheet("""
-                    font-size: 13px;
-                    color: #059669;
-                    background: #ECFDF5;
-                    padding: 4px 12px;
-                    border-radius: 8px;
-                    font-weight: 600;
-                """)
-
-                # View button
-                view_btn = QPushButton("View Students")
-                view_btn.setFixedHeight(35)
-                view_btn.setStyleSheet("""
-                    QPushButton {
-                        background: #F9FAFB;
-                        border: 1px solid #E5E7EB;
-                        border-radius: 8px;
-                        padding: 0 16px;
-                        font-size: 13px;
-                        font-weight: 600;
-                        color: #111827;
-                    }
-                    QPushButton:hover {
-                        background: #E5E7EB;
-                    }
-                """)
-                view_btn.clicked.connect(lambda _, s=staff: self.view_staff_students(s))
-
-                row.addLayout(info_layout)
-                row.addStretch()
-                row.addWidget(count_label)
-                row.addWidget(view_btn)
-
-                layout.addLayout(row)
-
-                # Divider
-                divider = QFrame()
-                divider.setFrameShape(QFrame.Shape.HLine)
-                divider.setStyleSheet("background-color: #E5E7EB; max-height: 1px;")
-                layout.addWidget(divider)
-
-        except Exception as e:
-            print(f"Error loading staff: {e}")
-            error_label = QLabel("Failed to load staff members")
-            error_label.setStyleSheet("color: #EF4444; font-size: 13px;")
-            layout.addWidget(error_label)
+        @page.on_refresh
+        def refresh():
+            try:
+                staff_users = self.db.get_all_staff_users()
+                # One grouped query instead of a COUNT per staff member
+                staff_counts = self.db.count_students_by_staff()
+                rows.bind(
+                    (staff['id'], (staff['full_name'], staff['email'],
+                                   f"{staff_counts.get(staff['id'], 0)} students", staff))
+                    for staff in staff_users
+                )
+            except Exception as e:
+                logger.error(f"Error loading staff: {e}")
+                rows.show_message("Failed to load staff members")
 
         layout.addStretch()
         return panel
 
-    def create_unassigned_students_panel(self):
+    def create_unassigned_students_panel(self, page):
         """Panel showing students not assigned to any staff"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 32px;
-            }
-        """)
+        set_role(panel, "panel", size="large")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(32, 32, 32, 32)
         layout.setSpacing(20)
 
         title = QLabel("Unassigned Students")
-        title.setStyleSheet("font-size: 18px; font-weight: 700; color: #060C0B;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
 
         subtitle = QLabel("Students not yet assigned to any staff member")
-        subtitle.setStyleSheet("font-size: 13px; color: #6B7280;")
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(subtitle)
 
-        try:
-            unassigned = self.db.get_unassigned_students()
-
-            if not unassigned:
-                empty_label = QLabel("✅ All students have been assigned!")
-                empty_label.setStyleSheet("font-size: 14px; color: #059669; padding: 20px;")
-                layout.addWidget(empty_label)
-            else:
-                for student in unassigned[:10]:  # Show first 10
-                    row = QHBoxLayout()
-
-                    # Student info
-                    info_layout = QVBoxLayout()
-                    info_layout.setSpacing(4)
-
-                    name = QLabel(f"{student['firstname']} {student['lastname']}")
-                    name.setStyleSheet("font-size: 14px; font-weight: 600; color: #111827;")
-
-                    details = QLabel(f"{student['grade']} - {student['track']}")
-                    details.setStyleSheet("font-size: 13px; color: #6B7280;")
-
-                    info_layout.addWidget(name)
-                    info_layout.addWidget(details)
-
-                    # Assign button
-                    assign_btn = QPushButton("Assign")
-                    assign_btn.setFixedHeight(35)
-                    assign_btn.setStyleSheet("""
-                        QPushButton {
-                            background: #059669;
-                            border: none;
-                            border-radius: 8px;
-                            padding: 0 16px;
-                            font-size: 13px;
-                            font-weight: 600;
-                            color: white;
-                        }
-                        QPushButton:hover {
-                            background: #047857;
-                        }
-                    """)
-                    assign_btn.clicked.connect(lambda _, s=student: self.assign_student_dialog(s))
-
-                    row.addLayout(info_layout)
-                    row.addStretch()
-                    row.addWidget(assign_btn)
-
-                    layout.addLayout(row)
-
-                    # Divider
-                    divider = QFrame()
-                    divider.setFrameShape(QFrame.Shape.HLine)
-                    divider.setStyleSheet("background-color: #E5E7EB; max-height: 1px;")
-                    layout.addWidget(divider)
+        rows = KeyedRows(
+            layout,
+            lambda lrn: self.create_list_row("Assign", "successButton", self.assign_student_dialog),
+            empty_text="✅ All students have been assigned!", empty_role="successText"
+        )
 
-        except Exception as e:
-            print(f"Error loading unassigned: {e}")
-            error_label = QLabel("Failed to load students")
-            error_label.setStyleSheet("color: #EF4444; font-size: 13px;")
-            layout.addWidget(error_label)
+        @page.on_refresh
+        def refresh():
+            try:
+                unassigned = self.db.get_unassigned_students()
+                rows.bind(
+                    (student['lrn'], (f"{student['firstname']} {student['lastname']}",
+                                      f"{student['grade']} - {student['track']}", None, student))
+                    for student in unassigned[:10]  # Show first 10
+                )
+            except Exception as e:
+                logger.error(f"Error loading unassigned: {e}")
+                rows.show_message("Failed to load students")
 
         layout.addStretch()
         return panel
@@ -2445,11 +1593,11 @@ class AdminScreen(QWidget):
 
         # Student info
         student_label = QLabel(f"Student: {student['firstname']} {student['lastname']}")
-        student_label.setStyleSheet("font-size: 16px; font-weight: 600;")
+        student_label.setObjectName("dialogHeading")
         layout.addWidget(student_label)
 
         grade_label = QLabel(f"{student['grade']} - {student['track']}")
-        grade_label.setStyleSheet("font-size: 14px; color: #6B7280;")
+        grade_label.setObjectName("dialogSubtitle")
         layout.addWidget(grade_label)
 
         # Staff dropdown
@@ -2477,20 +1625,9 @@ class AdminScreen(QWidget):
         cancel_btn.clicked.connect(dialog.reject)
 
         assign_btn = QPushButton("Assign")
-        assign_btn.setStyleSheet("""
-            QPushButton {
-                background: #059669;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: #047857;
-            }
-        """)
+        set_role(assign_btn, "successButton", size="large")
 
+        @query_budget("admin.assign_student")
         def do_assign():
             selected_staff = staff_combo.currentData()
             if selected_staff:
@@ -2506,11 +1643,10 @@ class AdminScreen(QWidget):
                         f"✅ {student['firstname']} {student['lastname']} assigned to {selected_staff['full_name']}"
                     )
                     dialog.accept()
-                    self.show_staff_content()  # Refresh
                 else:
                     QMessageBox.warning(self, "Error", "Failed to assign student")
 
-        assign_btn.clicked.connect(do_assign)
+        assign_btn.clicked.connect(lambda: do_assign())
 
         btn_layout.addWidget(cancel_btn)
         btn_layout.addWidget(assign_btn)
@@ -2518,6 +1654,7 @@ class AdminScreen(QWidget):
 
         dialog.exec()
 
+    @query_budget("admin.view_staff_students")
     def view_staff_students(self, staff):
         """View all students assigned to a staff member"""
         from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget
@@ -2531,11 +1668,11 @@ class AdminScreen(QWidget):
 
         # Header
         header = QLabel(f"{staff['full_name']}'s Students")
-        header.setStyleSheet("font-size: 20px; font-weight: 700;")
+        header.setObjectName("dialogTitle")
         layout.addWidget(header)
 
         email = QLabel(staff['email'])
-        email.setStyleSheet("font-size: 14px; color: #6B7280;")
+        email.setObjectName("dialogSubtitle")
         layout.addWidget(email)
 
         # Student list
@@ -2548,7 +1685,7 @@ class AdminScreen(QWidget):
                 item_text = f"{s['firstname']} {s['lastname']} - {s['grade']} ({s['track']})"
                 student_list.addItem(item_text)
         except Exception as e:
-            print(f"Error: {e}")
+            logger.error(f"Error: {e}")
 
         layout.addWidget(student_list)
 
@@ -0,0 +1,203 @@
+"""
+Asyncio data access for Enrollify
+AsyncDatabaseManager has a coroutine for every public DatabaseManager
+method (get_all_students, filter_students, add_student,
+add_payment_with_receipt, get_statistics, ...). Calls run on a bounded
+pool of Config.DB_POOL_SIZE worker threads, each with its own
+DatabaseManager and MySQL connection, so independent queries run
+concurrently and the caller never blocks:
+
+    adb = get_async_database()
+    students, stats = await asyncio.gather(adb.get_all_students(), adb.get_statistics())
+
+Change events from writes (change_bus.py) are published on the thread
+that awaited the call, so screens keep receiving them in the GUI thread.
+
+Qt bridge: QtAsyncBridge runs an asyncio event loop inside the Qt event
+loop, so UI code in the GUI thread can await queries and touch widgets
+straight after:
+
+    @async_slot
+    async def refresh(self):
+        students = await get_async_database().get_all_students()
+        self.populate_table(students)
+
+    self.refresh_btn.clicked.connect(lambda: self.refresh())
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QTimer
+
+from change_bus import changes
+from config import Config
+from database_manager_mysql import DatabaseManager, get_database
+from logger_config import get_logger
+from metrics import registry as metrics
+
+logger = get_logger(__name__)
+
+# DatabaseManager methods with no coroutine: the connection belongs to a worker thread
+NOT_ASYNC = {'get_connection'}
+
+
+class AsyncDatabaseManager:
+    """Coroutine versions of the DatabaseManager methods, run on a bounded pool of connections"""
+
+    def __init__(self, host="127.0.0.1", user="root", password="", database="enrollify_db", workers=None):
+        self.settings = {'host': host, 'user': user, 'password': password, 'database': database}
+        self.workers = workers or Config.DB_POOL_SIZE
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='db-async')
+        self._local = threading.local()
+        self._managers = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def like(cls, db, workers=None):
+        """An async manager on the same database as the DatabaseManager db"""
+        return cls(db.host, db.user, db.password, db.database, workers=workers)
+
+    def _manager(self):
+        """This worker thread's DatabaseManager (connects on first use)"""
+        manager = getattr(self._local, 'manager', None)
+        if manager is None:
+            manager = DatabaseManager(connect=False, **self.settings)
+            self._local.manager = manager
+            with self._lock:
+                self._managers.append(manager)
+        return manager
+
+    def _run(self, name, args, kwargs):
+        # Worker thread: keep the change events for the awaiting thread
+        with changes.capture() as events:
+            try:
+                return events, getattr(self._manager(), name)(*args, **kwargs), None
+            except Exception as e:
+                return events, None, e
+
+    async def call(self, name, *args, **kwargs):
+        """Run DatabaseManager.name(*args, **kwargs) on the pool and return its result"""
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        events, result, error = await loop.run_in_executor(self._executor, self._run, name, args, kwargs)
+        metrics.observe(f"async_db.{name}", (time.perf_counter() - started) * 1000, error=error is not None)
+
+        for event in events:
+            changes.publish(event.kind, event.lrn, **event.fields)
+        if error is not None:
+            raise error
+        return result
+
+    async def close_connection(self):
+        self.close()
+
+    def close(self):
+        """Stop the workers and close their connections"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            managers, self._managers = self._managers, []
+        for manager in managers:
+            manager.close_connection()
+
+
+def _coroutine_method(name):
+    method = getattr(DatabaseManager, name)
+
+    @functools.wraps(method)
+    async def coroutine(self, *args, **kwargs):
+        return await self.call(name, *args, **kwargs)
+    return coroutine
+
+
+# Same method surface as DatabaseManager, generated so the two never drift apart
+for _name in dir(DatabaseManager):
+    if (not _name.startswith('_') and _name not in NOT_ASYNC and _name not in vars(AsyncDatabaseManager)
+            and callable(getattr(DatabaseManager, _name))):
+        setattr(AsyncDatabaseManager, _name, _coroutine_method(_name))
+
+
+_async_db = None
+
+
+def get_async_database():
+    """Async manager on the same database as get_database() (singleton)"""
+    global _async_db
+    if _async_db is None:
+        _async_db = AsyncDatabaseManager.like(get_database(connect=False))
+    return _async_db
+
+
+# ==================== QT BRIDGE ====================
+
+class QtAsyncBridge(QObject):
+    """
+    An asyncio event loop driven by the Qt event loop, in the GUI thread
+
+    While coroutines are in flight the loop is run for one iteration every
+    Config.ASYNC_PUMP_MS; with nothing in flight the timer is stopped.
+    """
+
+    def __init__(self, interval_ms=None, parent=None):
+        super().__init__(parent)
+        self.loop = asyncio.new_event_loop()
+        self._tasks = set()
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms or Config.ASYNC_PUMP_MS)
+        self._timer.timeout.connect(self._pump)
+
+    def start(self, coro):
+        """Run coro in the GUI thread; returns its asyncio.Task"""
+        task = self.loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        if not self._timer.isActive():
+            self._timer.start()
+        # Run it up to its first await straight away
+        self._pump()
+        return task
+
+    def _pump(self):
+        if self.loop.is_running():
+            # Re-entered from a nested Qt event loop (e.g. a modal dialog in a coroutine)
+            return
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        if not self._tasks:
+            self._timer.stop()
+
+    def _task_done(self, task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            logger.error(f"Async task {task.get_coro().__qualname__} failed: {error}", exc_info=error)
+
+    def close(self):
+        self._timer.stop()
+        for task in list(self._tasks):
+            task.cancel()
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.loop.close()
+
+
+_bridge = None
+
+
+def get_async_bridge():
+    """The GUI thread's QtAsyncBridge (created on first use, after the QApplication)"""
+    global _bridge
+    if _bridge is None:
+        _bridge = QtAsyncBridge()
+    return _bridge
+
+
+def async_slot(func):
+    """Turn a coroutine function into a Qt slot that starts it on the bridge"""
+    @functools.wraps(func)
+    def slot(*args, **kwargs):
+        return get_async_bridge().start(func(*args, **kwargs))
+    return slot
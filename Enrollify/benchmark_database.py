@@ -0,0 +1,390 @@
+"""
+Data Layer Benchmarks for Enrollify
+Times every public DatabaseManager method and the models.py repositories
+against generated datasets of increasing size, so calls that scale badly
+show up before they reach the registrar's office.
+
+Usage:
+    python benchmark_database.py                                  # 1k/10k/100k on MySQL
+    python benchmark_database.py --sizes 1000,10000 --output baseline.json
+    python benchmark_database.py --compare baseline.json          # exit 1 on regressions
+    python benchmark_database.py --backend sqlite --sizes 1000,10000
+
+The MySQL run works in its own database (--database, default
+enrollify_bench) which is dropped and re-created for every size.
+"""
+
+import argparse
+import math
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+from config import Config
+from generate_test_data import (
+    LRN_BASE, REGISTRAR_EMAIL, STAFF_PASSWORD, LOADTEST_DOMAIN,
+    MySQLTarget, SQLiteTarget, load_dataset
+)
+from perf_utils import (
+    summarize, time_call, run_metadata, save_results, load_results,
+    compare_results, print_comparison
+)
+
+
+# LRNs created by the write benchmarks (never overlaps generated data)
+BENCH_LRN_BASE = 800000000000
+
+# Public methods that are deliberately not timed
+SKIPPED_METHODS = {'close_connection', 'init_database', 'ensure_tuition_fees_table'}
+
+
+class BenchContext:
+    """Fixtures shared by the benchmark cases for one dataset size"""
+
+    def __init__(self, db, size, staff_role):
+        self.db = db
+        self.size = size
+        self.staff_role = staff_role
+        self.counter = 0
+        self.created = []
+        self.tracks = []
+        self.subjects = []
+
+        # Pick fixtures out of the middle of the generated data
+        self.sample_lrn = str(LRN_BASE + size // 2)
+        row = self._fetch_one(
+            "SELECT lrn FROM payments WHERE receipt_number IS NOT NULL ORDER BY id LIMIT 1")
+        self.paid_lrn = row[0] if row else self.sample_lrn
+        row = self._fetch_one(
+            "SELECT receipt_number FROM payments WHERE receipt_number IS NOT NULL ORDER BY id DESC LIMIT 1")
+        self.receipt = row[0] if row else ''
+        row = self._fetch_one(f"SELECT id, email FROM users WHERE email LIKE 'staff001@{LOADTEST_DOMAIN}'")
+        self.staff_id, self.staff_email = row if row else (None, None)
+
+        if hasattr(db, 'get_connection') and 'mysql' in type(db).__module__:
+            from models import StudentRepository, StatisticsRepository, TrackRepository
+            self.students = StudentRepository()
+            self.statistics = StatisticsRepository()
+            self.track_repo = TrackRepository()
+
+    def _fetch_one(self, sql):
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql)
+            return cursor.fetchone()
+        except Exception as e:
+            print(f"⚠️  Fixture query failed: {e}")
+            return None
+        finally:
+            cursor.close()
+            if isinstance(conn, sqlite3.Connection):
+                conn.close()
+
+    def _next(self):
+        self.counter += 1
+        return self.counter
+
+    def new_student(self):
+        """Student form data for a fresh LRN (remembered for later write cases)"""
+        n = self._next()
+        lrn = str(BENCH_LRN_BASE + n)
+        self.created.append(lrn)
+        return self.student_data(lrn, n)
+
+    def student_data(self, lrn, n=0):
+        return {
+            'lrn': lrn, 'firstname': 'Bench', 'middlename': 'Mark', 'lastname': f'Student{n}',
+            'gender': 'Female', 'birthdate': '2008-01-15', 'email': f'bench{n}@example.com',
+            'phone': '09171234567', 'address': '1 Rizal St., Quezon City', 'grade': 'Grade 11',
+            'track': 'Academic Track', 'strand': 'STEM', 'guardian_name': 'Bench Guardian',
+            'guardian_contact': '09181234567', 'status': 'Pending'
+        }
+
+    def cycle_created(self):
+        """Round-robin over the students created by add_student"""
+        return self.created[self.counter % len(self.created)] if self.created else self.sample_lrn
+
+    def payment(self):
+        return {'student_data': {'lrn': self.cycle_created()}, 'amount': 26500, 'payment_method': 'ewallet'}
+
+    def new_receipt(self):
+        return f"BENCH{self._next():09d}"
+
+    def new_email(self):
+        return f"bench{self._next()}@{LOADTEST_DOMAIN}"
+
+    def new_track(self):
+        name = f"Bench Track {self._next()}"
+        self.tracks.append(name)
+        return name
+
+    def new_subject(self):
+        subject_id = self.db.add_staff_subject(self.staff_id, self.staff_email, 'Bench Subject', 'Grade 11')
+        self.subjects.append(subject_id)
+        return subject_id
+
+    def reconnect(self):
+        if hasattr(self.db, 'connect'):
+            self.db.close_connection()
+            self.db.connect()
+        return self.db.get_connection()
+
+
+# (case name, callable(ctx)). Reads run first so the writes do not skew them;
+# add_student must run before the cases that reuse its LRNs and
+# delete_student runs last to clean them up again.
+DB_CASES = [
+    ('connect', lambda c: c.reconnect()),
+    ('get_connection', lambda c: c.db.get_connection()),
+    ('get_all_tracks', lambda c: c.db.get_all_tracks()),
+    ('is_valid_track', lambda c: c.db.is_valid_track('Academic Track')),
+    ('get_strands_by_track', lambda c: c.db.get_strands_by_track('Academic Track')),
+    ('get_all_strands', lambda c: c.db.get_all_strands()),
+    ('get_tuition_fees', lambda c: c.db.get_tuition_fees('Academic Track', 'STEM')),
+    ('get_student_by_lrn', lambda c: c.db.get_student_by_lrn(c.sample_lrn)),
+    ('get_all_students', lambda c: c.db.get_all_students()),
+    ('get_payments_by_lrn', lambda c: c.db.get_payments_by_lrn(c.paid_lrn)),
+    ('authenticate_user', lambda c: c.db.authenticate_user(c.staff_email, STAFF_PASSWORD)),
+    ('get_statistics', lambda c: c.db.get_statistics()),
+    ('get_gender_distribution', lambda c: c.db.get_gender_distribution()),
+    ('count_by_track', lambda c: c.db.count_by_track()),
+    ('count_by_grade', lambda c: c.db.count_by_grade()),
+    ('count_by_strand', lambda c: c.db.count_by_strand()),
+    ('count_enrollment_status', lambda c: c.db.count_enrollment_status()),
+    ('get_grade_distribution', lambda c: c.db.get_grade_distribution()),
+    ('get_enrollment_status_distribution', lambda c: c.db.get_enrollment_status_distribution()),
+    ('get_monthly_enrollments', lambda c: c.db.get_monthly_enrollments()),
+    ('get_audit_log', lambda c: c.db.get_audit_log()),
+    ('search_students', lambda c: c.db.search_students('Santos')),
+    ('filter_students', lambda c: c.db.filter_students('Grade 11', 'Academic Track', 'Enrolled')),
+    ('get_receipt_by_number', lambda c: c.db.get_receipt_by_number(c.receipt)),
+    ('get_all_receipts', lambda c: c.db.get_all_receipts()),
+    ('search_receipt', lambda c: c.db.search_receipt('Reyes')),
+    ('get_students_by_staff', lambda c: c.db.get_students_by_staff(c.staff_id)),
+    ('get_unassigned_students', lambda c: c.db.get_unassigned_students()),
+    ('get_all_staff_users', lambda c: c.db.get_all_staff_users()),
+    ('get_staff_student_count', lambda c: c.db.get_staff_student_count(c.staff_id)),
+    ('get_staff_subjects', lambda c: c.db.get_staff_subjects(c.staff_id)),
+    ('reference_data', lambda c: c.db.reference_data()),
+
+    ('add_student', lambda c: c.db.add_student(c.new_student())),
+    ('update_student', lambda c: c.db.update_student(c.cycle_created(), c.student_data(c.cycle_created()))),
+    ('update_enrollment_status', lambda c: c.db.update_enrollment_status(c.cycle_created(), 'Enrolled')),
+    ('add_payment', lambda c: c.db.add_payment(c.payment())),
+    ('add_payment_with_receipt', lambda c: c.db.add_payment_with_receipt(c.payment(), c.new_receipt())),
+    ('assign_student_to_staff',
+     lambda c: c.db.assign_student_to_staff(c.cycle_created(), c.staff_id, c.staff_email)),
+    ('unassign_student_from_staff', lambda c: c.db.unassign_student_from_staff(c.cycle_created())),
+    ('log_action', lambda c: c.db.log_action(REGISTRAR_EMAIL, 'BENCHMARK', 'Benchmark entry')),
+    ('bump_data_versions', lambda c: c.db.bump_data_versions('tracks')),
+    ('add_user', lambda c: c.db.add_user(c.new_email(), 'bench123', c.staff_role, 'Benchmark User')),
+    ('add_track', lambda c: c.db.add_track(c.new_track(), 'Benchmark track')),
+    ('remove_track', lambda c: c.db.remove_track(c.tracks.pop())),
+    ('add_staff_subject', lambda c: c.new_subject()),
+    ('delete_staff_subject', lambda c: c.db.delete_staff_subject(c.subjects.pop())),
+    ('delete_student', lambda c: c.db.delete_student(c.created.pop())),
+]
+
+REPOSITORY_CASES = [
+    ('StudentRepository.find_all', lambda c: c.students.find_all()),
+    ('StudentRepository.find_by_lrn', lambda c: c.students.find_by_lrn(c.sample_lrn)),
+    ('StudentRepository.search', lambda c: c.students.search('Santos')),
+    ('StudentRepository.filter', lambda c: c.students.filter('Grade 11', 'Academic Track', 'Enrolled')),
+    ('TrackRepository.get_all', lambda c: c.track_repo.get_all()),
+    ('StatisticsRepository.get_overview', lambda c: c.statistics.get_overview()),
+    ('StatisticsRepository.get_track_distribution', lambda c: c.statistics.get_track_distribution()),
+    ('StatisticsRepository.get_grade_distribution', lambda c: c.statistics.get_grade_distribution()),
+]
+
+
+# ==================== DATASETS ====================
+
+def create_mysql_bench_database(args):
+    """Drop and re-create the benchmark database from enrollify_schema.sql"""
+    import mysql.connector
+
+    if args.database == Config.DB_NAME:
+        raise ValueError(f"Refusing to benchmark in the application database '{Config.DB_NAME}'")
+
+    schema = (Path(__file__).parent / 'enrollify_schema.sql').read_text(encoding='utf-8')
+    schema = schema.replace('`enrollify_db`', f'`{args.database}`')
+    lines = [line for line in schema.splitlines() if not line.strip().startswith('--')]
+    statements = [s.strip() for s in '\n'.join(lines).split(';') if s.strip()]
+
+    conn = mysql.connector.connect(host=args.host, user=args.user, password=args.password, port=args.port)
+    cursor = conn.cursor()
+    for statement in statements:
+        cursor.execute(statement)
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+
+def prepare_dataset(args, size):
+    """Build a fresh dataset of `size` students and return a DatabaseManager on it"""
+    print(f"\n📦 Generating {size:,} students ({args.backend})...")
+
+    if args.backend == 'sqlite':
+        path = os.path.join(args.sqlite_dir, f'enrollify_bench_{size}.db')
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        target = SQLiteTarget(path)
+        try:
+            load_dataset(target, size, seed=args.seed, progress=False)
+        finally:
+            target.close()
+
+        from database_manager import DatabaseManager as SQLiteDatabaseManager
+        return SQLiteDatabaseManager(db_name=path), 'staff'
+
+    create_mysql_bench_database(args)
+    target = MySQLTarget(args.host, args.user, args.password, args.database, args.port)
+    try:
+        load_dataset(target, size, seed=args.seed, progress=False)
+    finally:
+        target.close()
+
+    # Use the singleton so models.py repositories hit the same database
+    from database_manager_mysql import get_database
+    db = get_database(host=args.host, user=args.user, password=args.password, database=args.database)
+    db.close_connection()
+    db.connect()
+    # Time the queries themselves unless --cached asks for the cached reads
+    db.cache.enabled = args.cached
+    return db, 'STAFF'
+
+
+# ==================== RUNNING ====================
+
+def _row_count(result):
+    if isinstance(result, (list, tuple, dict)):
+        return len(result)
+    return None
+
+
+def run_cases(ctx, cases, args):
+    """Time each case; failures are recorded instead of aborting the run"""
+    results = {}
+    for name, func in cases:
+        if args.only and args.only not in name:
+            continue
+        if '.' not in name and not hasattr(ctx.db, name):
+            continue
+        try:
+            samples, result = time_call(lambda: func(ctx), repeat=args.repeat, warmup=args.warmup)
+            summary = summarize(samples)
+            summary['rows'] = _row_count(result)
+            results[name] = summary
+            print(f"   {name:<45} {summary['median_ms']:>10.2f} ms   (rows: {summary['rows']})")
+        except Exception as e:
+            results[name] = {'error': str(e)}
+            print(f"   {name:<45} {'FAILED':>10}      {e}")
+    return results
+
+
+def untimed_methods(db):
+    """Public DatabaseManager methods no case covers - add a case when this is not empty"""
+    covered = {name for name, _ in DB_CASES}
+    public = {name for name in dir(type(db)) if not name.startswith('_') and callable(getattr(db, name))}
+    return sorted(public - covered - SKIPPED_METHODS)
+
+
+def scaling_report(results, sizes):
+    """Growth exponent between the smallest and largest size (1.0 = linear in N)"""
+    if len(sizes) < 2:
+        return {}
+    small, large = str(sizes[0]), str(sizes[-1])
+    report = {}
+    for case, summary in results.get(large, {}).items():
+        base = results.get(small, {}).get(case, {})
+        if 'median_ms' not in summary or not base.get('median_ms'):
+            continue
+        ratio = summary['median_ms'] / base['median_ms']
+        report[case] = round(math.log(max(ratio, 1e-9)) / math.log(sizes[-1] / sizes[0]), 2)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the Enrollify data layer')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='comma separated student counts')
+    parser.add_argument('--repeat', type=int, default=5, help='timed repetitions per case')
+    parser.add_argument('--warmup', type=int, default=1, help='untimed repetitions per case')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', help='only run cases whose name contains this text')
+    parser.add_argument('--output', default='benchmark_results.json', help='where to write the JSON results')
+    parser.add_argument('--compare', metavar='BASELINE', help='compare against a stored result file')
+    parser.add_argument('--threshold', type=float, default=1.25, help='slowdown ratio counted as a regression')
+    parser.add_argument('--backend', choices=['mysql', 'sqlite'], default='mysql')
+    parser.add_argument('--cached', action='store_true', help='keep the MySQL query cache on (data_cache.py)')
+    parser.add_argument('--sqlite-dir', default=tempfile.gettempdir())
+    parser.add_argument('--host', default=Config.DB_HOST)
+    parser.add_argument('--port', type=int, default=Config.DB_PORT)
+    parser.add_argument('--user', default=Config.DB_USER)
+    parser.add_argument('--password', default=Config.DB_PASSWORD)
+    parser.add_argument('--database', default='enrollify_bench')
+    args = parser.parse_args(argv)
+
+    sizes = sorted(int(s) for s in args.sizes.split(',') if s.strip())
+
+    print("=" * 60)
+    print("ENROLLIFY DATA LAYER BENCHMARK")
+    print("=" * 60)
+    print(f"Backend: {args.backend}   Sizes: {', '.join(f'{s:,}' for s in sizes)}   "
+          f"Repeat: {args.repeat}")
+
+    results = {}
+    for size in sizes:
+        try:
+            db, staff_role = prepare_dataset(args, size)
+        except Exception as e:
+            print(f"❌ Could not prepare dataset: {e}")
+            return 1
+
+        ctx = BenchContext(db, size, staff_role)
+        print(f"\n⏱️  DatabaseManager @ {size:,} students")
+        group = run_cases(ctx, DB_CASES, args)
+        if hasattr(ctx, 'students'):
+            print(f"\n⏱️  Repositories @ {size:,} students")
+            group.update(run_cases(ctx, REPOSITORY_CASES, args))
+        results[str(size)] = group
+
+        missing = untimed_methods(db)
+        if missing:
+            print(f"\n⚠️  Public methods without a benchmark case: {', '.join(missing)}")
+
+    scaling = scaling_report(results, sizes)
+    if scaling:
+        print("\n" + "=" * 60)
+        print(f"SCALING {sizes[0]:,} → {sizes[-1]:,} (exponent, 1.0 = grows linearly with students)")
+        print("=" * 60)
+        for case, exponent in sorted(scaling.items(), key=lambda item: item[1], reverse=True):
+            flag = '🔴' if exponent >= 0.8 else '🟡' if exponent >= 0.4 else '🟢'
+            print(f"   {flag} {case:<45} {exponent:>6.2f}")
+
+    meta = run_metadata(backend=args.backend, sizes=sizes, seed=args.seed,
+                        repeat=args.repeat, warmup=args.warmup, scaling=scaling)
+    save_results(args.output, meta, results)
+    print(f"\n💾 Results saved to {args.output}")
+
+    if args.compare:
+        baseline = load_results(args.compare)
+        rows = compare_results(baseline, {'results': results}, threshold=args.threshold)
+        print("\n" + "=" * 60)
+        print(f"COMPARISON WITH {args.compare}")
+        print("=" * 60)
+        print_comparison(rows)
+        regressions = [r for r in rows if r['status'] == 'REGRESSION']
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) above {args.threshold:.2f}x")
+            return 1
+        print("\n✅ No regressions")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
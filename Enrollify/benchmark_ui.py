@@ -0,0 +1,302 @@
+"""
+Headless UI Benchmarks for Enrollify
+Builds the heavy screens under the offscreen Qt platform against a seeded
+dataset and reports, for every tab switch and table fill:
+    - wall time
+    - widgets created
+    - peak RSS of the process
+
+Usage:
+    python benchmark_ui.py                                  # 1k/10k students, MySQL
+    python benchmark_ui.py --sizes 1000 --output ui_baseline.json
+    python benchmark_ui.py --compare ui_baseline.json
+    python benchmark_ui.py --existing                       # use the current database as-is
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Must be set before the first PyQt6 import
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QCoreApplication, QEvent, QTimer
+
+from config import Config
+from ui_styles import apply_app_stylesheet
+from perf_utils import (
+    summarize, peak_rss_mb, current_rss_mb, run_metadata, save_results,
+    load_results, compare_results, print_comparison
+)
+
+
+ADMIN_TABS = ['overview', 'analytics', 'data', 'staff', 'system']
+STAFF_TABS = ['analytics', 'enrollees', 'reports']
+
+
+def status_flipper(lrn):
+    """Publish a status change for lrn, alternating Enrolled/Pending (no database write)"""
+    from change_bus import changes, STATUS_CHANGED
+    statuses = ['Enrolled', 'Pending']
+
+    def flip():
+        statuses.reverse()
+        changes.publish(STATUS_CHANGED, lrn, status=statuses[0])
+    return flip
+
+
+class UIBench:
+    """Runs one screen operation at a time and records what it cost"""
+
+    def __init__(self, app, repeat):
+        self.app = app
+        self.repeat = repeat
+        self.results = {}
+        self.dialogs_dismissed = 0
+
+        # Error paths open modal QMessageBoxes, which would block a headless
+        # run forever - close them and count them instead
+        self.dialog_timer = QTimer()
+        self.dialog_timer.timeout.connect(self._dismiss_dialogs)
+        self.dialog_timer.start(50)
+
+    def _dismiss_dialogs(self):
+        dialog = QApplication.activeModalWidget()
+        if dialog is not None:
+            self.dialogs_dismissed += 1
+            print(f"   ⚠️  Dismissed dialog: {dialog.windowTitle()}")
+            dialog.close()
+
+    def flush(self):
+        """Run pending events and deleteLater() so widget counts are settled"""
+        self.app.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        self.app.processEvents()
+
+    def measure(self, name, operation, setup=None):
+        """Time operation() `repeat` times, calling setup() before each run"""
+        samples, widgets = [], []
+        for _ in range(self.repeat):
+            if setup:
+                setup()
+            self.flush()
+
+            before = len(QApplication.allWidgets())
+            started = time.perf_counter()
+            operation()
+            # Layout and deferred work are part of what the user waits for
+            self.app.processEvents()
+            samples.append((time.perf_counter() - started) * 1000)
+            widgets.append(len(QApplication.allWidgets()) - before)
+
+        summary = summarize(samples)
+        summary['widgets_created'] = max(widgets) if widgets else 0
+        summary['peak_rss_mb'] = peak_rss_mb()
+        summary['rss_mb'] = current_rss_mb()
+        self.results[name] = summary
+        print(f"   {name:<45} {summary['median_ms']:>9.1f} ms  "
+              f"{summary['widgets_created']:>6} widgets  peak {summary['peak_rss_mb']} MB")
+        return summary
+
+
+# ==================== SCENARIOS ====================
+
+def bench_admin(bench):
+    from admin_screen import AdminScreen
+
+    screen = AdminScreen()
+    screen.resize(Config.WINDOW_MIN_WIDTH, Config.WINDOW_MIN_HEIGHT)
+    screen.show()
+    bench.flush()
+
+    # First visit (build + query), data refresh of the existing page, and a
+    # switch back to a page that is still fresh
+    for tab in ADMIN_TABS:
+        bench.measure(
+            f"admin.tab_build[{tab}]",
+            lambda tab=tab: screen.load_tab_content(tab),
+            setup=lambda tab=tab: screen.pages.discard(tab)
+        )
+        bench.measure(f"admin.tab_refresh[{tab}]", lambda tab=tab: screen.pages.refresh(tab))
+        bench.measure(f"admin.switch_tab[{tab}]", lambda tab=tab: screen.switch_tab(tab))
+
+    screen.close()
+    screen.deleteLater()
+
+
+def bench_enrollees(bench):
+    from enrollees_screen import EnrolleesScreen
+
+    screen = EnrolleesScreen()
+    screen.resize(Config.WINDOW_MIN_WIDTH, Config.WINDOW_MIN_HEIGHT)
+    screen.show()
+    bench.flush()
+
+    bench.measure("enrollees.load_students", screen.load_students)
+    bench.measure("enrollees.populate_table", screen.populate_table)
+    # One status change patches a single row (compare with load_students)
+    if screen.all_students:
+        bench.measure("enrollees.patch_status", status_flipper(screen.all_students[0]['lrn']))
+
+    screen.close()
+    screen.deleteLater()
+
+
+def bench_staff_portal(bench, staff_user):
+    from staff_portal import StaffPortalScreen
+
+    screen = StaffPortalScreen()
+    screen.set_current_user(staff_user)
+    screen.resize(Config.WINDOW_MIN_WIDTH, Config.WINDOW_MIN_HEIGHT)
+    screen.show()
+    bench.flush()
+
+    for tab in STAFF_TABS:
+        bench.measure(
+            f"staff.tab_build[{tab}]",
+            lambda tab=tab: screen.switch_tab(tab),
+            setup=lambda tab=tab: screen.pages.discard(tab)
+        )
+        bench.measure(f"staff.tab_refresh[{tab}]", lambda tab=tab: screen.pages.refresh(tab))
+        bench.measure(f"staff.switch_tab[{tab}]", lambda tab=tab: screen.switch_tab(tab))
+    bench.measure("staff.load_enrollees_data", screen.load_enrollees_data)
+    if screen.my_enrollees:
+        bench.measure("staff.patch_status", status_flipper(next(iter(screen.my_enrollees))))
+
+    screen.close()
+    screen.deleteLater()
+
+
+def bench_reports(bench):
+    try:
+        from reports_screen import ReportsScreen
+    except Exception as e:
+        print(f"   ⚠️  Skipping ReportsScreen (QtWebEngine unavailable: {e})")
+        bench.results['reports.refresh_data'] = {'skipped': str(e)}
+        return
+
+    screen = ReportsScreen()
+    screen.resize(Config.WINDOW_MIN_WIDTH, Config.WINDOW_MIN_HEIGHT)
+    screen.show()
+    bench.flush()
+
+    bench.measure("reports.refresh_data", screen.refresh_data)
+
+    screen.close()
+    screen.deleteLater()
+
+
+def busiest_staff_user(db):
+    """The staff account with the most assigned students (the slowest portal)"""
+    cursor = db.get_connection().cursor(dictionary=True)
+    cursor.execute('''
+                   SELECT u.id, u.email, u.full_name, u.role
+                   FROM users u
+                            LEFT JOIN students s ON s.assigned_staff_id = u.id
+                   WHERE u.role = 'STAFF'
+                   GROUP BY u.id, u.email, u.full_name, u.role
+                   ORDER BY COUNT(s.id) DESC LIMIT 1
+                   ''')
+    user = cursor.fetchone()
+    cursor.close()
+    return user or {'id': None, 'email': 'staff@enrollify.edu', 'full_name': 'Enrollment Staff', 'role': 'STAFF'}
+
+
+def run_size(app, args, size):
+    """Benchmark every screen against one dataset; returns the results dict"""
+    from database_manager_mysql import get_database
+
+    if size is None:
+        db = get_database(host=args.host, user=args.user, password=args.password, database=args.database)
+    else:
+        from benchmark_database import prepare_dataset
+        db, _ = prepare_dataset(args, size)
+
+    bench = UIBench(app, args.repeat)
+    label = 'existing database' if size is None else f'{size:,} students'
+
+    for name, scenario in [
+        ('AdminScreen', lambda: bench_admin(bench)),
+        ('EnrolleesScreen', lambda: bench_enrollees(bench)),
+        ('StaffPortalScreen', lambda: bench_staff_portal(bench, busiest_staff_user(db))),
+        ('ReportsScreen', lambda: bench_reports(bench)),
+    ]:
+        if args.only and args.only.lower() not in name.lower():
+            continue
+        print(f"\n⏱️  {name} @ {label}")
+        try:
+            scenario()
+        except Exception as e:
+            print(f"   ❌ {name} failed: {e}")
+            bench.results[f"{name}.error"] = {'error': str(e)}
+        bench.flush()
+
+    if bench.dialogs_dismissed:
+        bench.results['dialogs_dismissed'] = {'count': bench.dialogs_dismissed}
+    return bench.results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark Enrollify screens headlessly')
+    parser.add_argument('--sizes', default='1000,10000', help='comma separated student counts')
+    parser.add_argument('--existing', action='store_true',
+                        help='benchmark the database named by --database without generating data')
+    parser.add_argument('--repeat', type=int, default=3, help='timed repetitions per operation')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', help='only run screens whose name contains this text')
+    parser.add_argument('--output', default='benchmark_ui_results.json')
+    parser.add_argument('--compare', metavar='BASELINE', help='compare against a stored result file')
+    parser.add_argument('--threshold', type=float, default=1.25)
+    parser.add_argument('--host', default=Config.DB_HOST)
+    parser.add_argument('--port', type=int, default=Config.DB_PORT)
+    parser.add_argument('--user', default=Config.DB_USER)
+    parser.add_argument('--password', default=Config.DB_PASSWORD)
+    parser.add_argument('--database', default=None,
+                        help='defaults to enrollify_bench, or the app database with --existing')
+    args = parser.parse_args(argv)
+
+    # prepare_dataset() expects the benchmark_database options
+    args.backend = 'mysql'
+    args.sqlite_dir = tempfile.gettempdir()
+    if args.database is None:
+        args.database = Config.DB_NAME if args.existing else 'enrollify_bench'
+
+    sizes = [None] if args.existing else sorted(int(s) for s in args.sizes.split(',') if s.strip())
+
+    print("=" * 60)
+    print("ENROLLIFY UI BENCHMARK")
+    print("=" * 60)
+    print(f"Qt platform: {os.environ.get('QT_QPA_PLATFORM')}   Repeat: {args.repeat}")
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    app.setStyle('Fusion')
+    apply_app_stylesheet(app)
+
+    results = {}
+    for size in sizes:
+        try:
+            results['existing' if size is None else str(size)] = run_size(app, args, size)
+        except Exception as e:
+            print(f"❌ Could not prepare dataset: {e}")
+            return 1
+
+    meta = run_metadata(sizes=[s for s in sizes if s], seed=args.seed, repeat=args.repeat,
+                        qt_platform=os.environ.get('QT_QPA_PLATFORM'))
+    save_results(args.output, meta, results)
+    print(f"\n💾 Results saved to {args.output}")
+
+    if args.compare:
+        rows = compare_results(load_results(args.compare), {'results': results}, threshold=args.threshold)
+        print()
+        print_comparison(rows)
+        if any(r['status'] == 'REGRESSION' for r in rows):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
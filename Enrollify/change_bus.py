@@ -0,0 +1,118 @@
+"""
+In-process change notifications for Enrollify
+DatabaseManager publishes a ChangeEvent after every committed student
+write; open screens subscribe and patch the affected row or counter
+instead of reloading the whole student list.
+
+    from change_bus import changes, STATUS_CHANGED
+
+    changes.subscribe(self.on_student_changed)                       # every kind
+    changes.subscribe(self.on_status_changed, kinds=(STATUS_CHANGED,))
+
+    def on_student_changed(self, event):
+        event.kind, event.lrn, event.fields    # e.g. {'status': 'Enrolled'}
+
+Subscribers are called synchronously on the thread that published, right
+after the commit (for the screens that is the GUI thread). Bound methods
+are held weakly, so a subscription never keeps a screen alive.
+
+Writes made on worker threads (async_database.py) are captured there and
+published again on the GUI thread:
+
+    with changes.capture() as events:    # published on this thread -> events
+        db.add_student(data)
+"""
+
+import threading
+import weakref
+from collections import namedtuple
+from contextlib import contextmanager
+
+from logger_config import get_logger
+
+logger = get_logger(__name__)
+
+# Event kinds - fields carried by each, with the UI key names of get_all_students
+STUDENT_ADDED = 'student_added'        # the new student's data (grade, track, status, ...)
+STUDENT_UPDATED = 'student_updated'    # the edited fields (status is not among them)
+STATUS_CHANGED = 'status_changed'      # status
+STUDENT_DELETED = 'student_deleted'    # -
+PAYMENT_RECORDED = 'payment_recorded'  # status ('Enrolled'), amount, receipt_number
+STUDENT_ASSIGNED = 'student_assigned'  # staff_id, staff_email (both None when unassigned)
+STUDENTS_CLEARED = 'students_cleared'  # lrn is None: every student was removed
+STUDENT_SYNCED = 'student_synced'      # changed on another terminal: the full row (change_feed.py)
+
+
+class ChangeEvent(namedtuple('ChangeEvent', 'kind lrn fields')):
+    """One committed write: its kind, the student's LRN and the new values"""
+    __slots__ = ()
+
+
+class ChangeBus:
+    """Publish/subscribe registry for ChangeEvents"""
+
+    def __init__(self):
+        self._subscribers = []  # (reference, kinds or None)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def subscribe(self, callback, kinds=None):
+        """Call callback(event) for every event, or only those whose kind is in kinds"""
+        if hasattr(callback, '__self__'):
+            reference = weakref.WeakMethod(callback)
+        else:
+            reference = lambda: callback
+        with self._lock:
+            self._subscribers.append((reference, frozenset(kinds) if kinds else None))
+        return callback
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers = [(ref, kinds) for ref, kinds in self._subscribers
+                                 if ref() not in (None, callback)]
+
+    @contextmanager
+    def capture(self):
+        """Collect the events published on this thread instead of delivering them"""
+        previous = getattr(self._local, 'captured', None)
+        self._local.captured = events = []
+        try:
+            yield events
+        finally:
+            self._local.captured = previous
+
+    def publish(self, kind, lrn=None, /, **fields):
+        """Deliver a ChangeEvent to the matching subscribers; returns the event"""
+        # kind and lrn are positional-only: fields may be a whole student row (with its own 'lrn')
+        event = ChangeEvent(kind, lrn, fields)
+        captured = getattr(self._local, 'captured', None)
+        if captured is not None:
+            captured.append(event)
+            return event
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        dead = False
+        for reference, kinds in subscribers:
+            callback = reference()
+            if callback is None:
+                dead = True
+                continue
+            if kinds is not None and kind not in kinds:
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                # A failing screen must not fail the write that was already committed
+                logger.error(f"Change subscriber {callback} failed on {kind} {lrn}: {e}")
+
+        if dead:
+            with self._lock:
+                self._subscribers = [(ref, kinds) for ref, kinds in self._subscribers
+                                     if ref() is not None]
+        return event
+
+
+# Shared bus for the application
+changes = ChangeBus()
@@ -0,0 +1,245 @@
+"""
+Cross-terminal change feed for Enrollify
+Writes made on this terminal are published on the change bus as they
+happen (change_bus.py). Writes made on other terminals are picked up by
+polling a high-water mark over:
+    - students.updated_at    changed students (full row)
+    - payments.payment_date  recorded payments
+    - audit_log.id           deletions (DELETE_STUDENT, CLEAR_DATA); the mark
+                             moves past every other audit row too
+
+One background thread per terminal, with its own autocommit connection,
+runs a single indexed range query every Config.CHANGE_FEED_INTERVAL_MS.
+It only returns rows newer than the last token, so the cost is the same
+for 1k or 100k students. Changed students are then fetched by LRN; as
+updated_at only has one-second resolution, a student is delivered again
+whenever its full row differs from the one delivered last. The deltas are
+published on the change bus in the GUI thread, where the screens patch
+their rows exactly as for local writes:
+
+    feed = start_change_feed(db)       # once the database is connected
+"""
+
+import threading
+import time
+from datetime import timedelta
+
+import mysql.connector
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from change_bus import (
+    changes, STUDENT_SYNCED, PAYMENT_RECORDED, STUDENT_DELETED, STUDENTS_CLEARED
+)
+from config import Config
+from logger_config import get_logger
+from metrics import registry as metrics
+from query_stats import instrument_connection
+
+logger = get_logger(__name__)
+
+# Everything since the token, as (source, lrn, changed_at, row_id, action, details)
+FEED_QUERY = '''
+    SELECT 'student', lrn, updated_at, id, NULL, NULL
+    FROM students WHERE updated_at >= %s
+    UNION ALL
+    SELECT 'payment', lrn, payment_date, id, NULL, receipt_number
+    FROM payments WHERE payment_date >= %s
+    UNION ALL
+    SELECT 'audit', NULL, timestamp, id, action, details
+    FROM audit_log WHERE id > %s AND action IN ('DELETE_STUDENT', 'CLEAR_DATA')
+    UNION ALL
+    SELECT 'audit_mark', NULL, NULL, MAX(id), NULL, NULL
+    FROM audit_log WHERE id > %s
+'''
+
+# Same columns and aliases as DatabaseManager.get_all_students
+STUDENT_COLUMNS = '''
+    id, lrn, firstname, middlename, lastname, gender, birthdate,
+    email, phone, address,
+    grade_level AS grade,
+    track, strand,
+    guardian_name, guardian_contact,
+    enrollment_status AS status,
+    assigned_staff_id, assigned_staff_email,
+    created_at, updated_at
+'''
+
+
+class ChangeFeed(QObject):
+    """Polls the database for other terminals' writes and publishes them on the change bus"""
+
+    # list of (kind, lrn, fields), delivered in the GUI thread
+    changes_received = pyqtSignal(list)
+
+    def __init__(self, db, interval_ms=None, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.interval = (interval_ms or Config.CHANGE_FEED_INTERVAL_MS) / 1000
+        self.overlap = timedelta(seconds=Config.CHANGE_FEED_OVERLAP)
+
+        # High-water marks; set from the server on the first poll
+        self.students_since = None
+        self.payments_since = None
+        self.audit_id = None
+        # Rows already delivered inside the overlap window:
+        # (source, key) -> (changed_at, hash of the student row or None)
+        self._seen = {}
+
+        # (lrn, updated_at or receipt_number) of this terminal's own writes -> monotonic time
+        self._local_writes = {}
+        self._publishing = False
+        changes.subscribe(self._on_local_change)
+
+        self._connection = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self.changes_received.connect(self._publish)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='change-feed', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    # ==================== POLLING (feed thread) ====================
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            started = time.perf_counter()
+            try:
+                deltas = self.poll()
+            except Exception as e:
+                logger.warning(f"Change feed poll failed: {e}")
+                self._close()
+                continue
+            metrics.observe('change_feed_poll', (time.perf_counter() - started) * 1000)
+            if deltas:
+                self.changes_received.emit(deltas)
+        self._close()
+
+    def _cursor(self, **kwargs):
+        if self._connection is None or not self._connection.is_connected():
+            # Its own connection: the GUI thread keeps using the shared one.
+            # Autocommit so every poll sees the latest committed rows.
+            self._connection = instrument_connection(mysql.connector.connect(
+                host=self.db.host, user=self.db.user, password=self.db.password,
+                database=self.db.database, autocommit=True, use_pure=True
+            ))
+        return self._connection.cursor(**kwargs)
+
+    def _close(self):
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+
+    def poll(self):
+        """Advance the token and return the new deltas as (kind, lrn, fields)"""
+        cursor = self._cursor()
+        try:
+            if self.audit_id is None:
+                # Start from now: earlier writes are already on screen
+                cursor.execute('SELECT NOW(), (SELECT COALESCE(MAX(id), 0) FROM audit_log)')
+                now, self.audit_id = cursor.fetchone()
+                self.students_since = self.payments_since = now
+                return []
+
+            # Re-read a little behind the marks, for rows committed late
+            # with an earlier timestamp; _seen drops the repeats
+            cursor.execute(FEED_QUERY, (self.students_since - self.overlap,
+                                        self.payments_since - self.overlap, self.audit_id, self.audit_id))
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        deltas, student_lrns = [], []
+        for source, lrn, changed_at, row_id, action, details in rows:
+            if source == 'audit_mark':
+                # Newest audit row of any action (logins, adds...): the next poll starts after it
+                if row_id is not None:
+                    self.audit_id = max(self.audit_id, row_id)
+            elif source == 'audit':
+                self.audit_id = max(self.audit_id, row_id)
+                if action == 'CLEAR_DATA':
+                    deltas.append((STUDENTS_CLEARED, None, {}))
+                elif details and details.startswith('Deleted student: '):
+                    deltas.append((STUDENT_DELETED, details.split(': ', 1)[1], {}))
+            elif source == 'student':
+                # Two writes in the same second share updated_at: the row itself is compared below
+                self.students_since = max(self.students_since, changed_at)
+                student_lrns.append(lrn)
+            elif ('payment', row_id) not in self._seen:
+                self._seen[('payment', row_id)] = (changed_at, None)
+                self.payments_since = max(self.payments_since, changed_at)
+                deltas.append((PAYMENT_RECORDED, lrn, {'status': 'Enrolled', 'receipt_number': details}))
+
+        if student_lrns:
+            # Full rows, so screens can patch without another query
+            cursor = self._cursor(dictionary=True)
+            try:
+                cursor.execute(
+                    f"SELECT {STUDENT_COLUMNS} FROM students WHERE lrn IN ({', '.join(['%s'] * len(student_lrns))})",
+                    student_lrns
+                )
+                students = cursor.fetchall()
+            finally:
+                cursor.close()
+            for row in students:
+                key, version = ('student', row['lrn']), hash(tuple(row.items()))
+                if self._seen.get(key, (None, None))[1] != version:
+                    self._seen[key] = (row['updated_at'], version)
+                    deltas.append((STUDENT_SYNCED, row['lrn'], row))
+
+        # Forget rows that fell out of the overlap window
+        marks = {'student': self.students_since, 'payment': self.payments_since}
+        self._seen = {key: seen for key, seen in self._seen.items() if seen[0] >= marks[key[0]] - self.overlap}
+        return deltas
+
+    # ==================== PUBLISHING (GUI thread) ====================
+
+    def _on_local_change(self, event):
+        if self._publishing:
+            return
+        # Exactly the row versions this terminal wrote (DatabaseManager publishes
+        # updated_at); deletions carry none and are harmless to repeat
+        for token in (event.fields.get('updated_at'), event.fields.get('receipt_number')):
+            if token is not None:
+                self._local_writes[(event.lrn, token)] = time.monotonic()
+
+    def _publish(self, deltas):
+        # This terminal's own writes were published when they were made
+        recent = time.monotonic() - 2 * self.interval - self.overlap.total_seconds()
+        self._local_writes = {key: at for key, at in self._local_writes.items() if at >= recent}
+
+        self._publishing = True
+        try:
+            for kind, lrn, fields in deltas:
+                token = fields.get('receipt_number') if kind == PAYMENT_RECORDED else fields.get('updated_at')
+                if (lrn, token) not in self._local_writes:
+                    changes.publish(kind, lrn, **fields)
+        finally:
+            self._publishing = False
+
+
+_feed = None
+
+
+def start_change_feed(db):
+    """Start polling for other terminals' writes (GUI thread); None when disabled"""
+    global _feed
+    if not Config.CHANGE_FEED_INTERVAL_MS:
+        return None
+    if _feed is None:
+        _feed = ChangeFeed(db)
+    _feed.start()
+    return _feed
+
+
+def get_change_feed():
+    return _feed
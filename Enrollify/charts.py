@@ -0,0 +1,474 @@
+"""
+Native QPainter charts for Enrollify
+Lightweight alternative to the QtWebEngine/plotly report charts:
+    - BarChart          vertical or horizontal bars with a value axis
+    - StackedBarChart   several series stacked per category
+    - DonutChart        donut with a legend (hole=0 draws a pie)
+    - LineChart         one or more series over shared categories
+
+A chart records its drawing into a QPicture the first time it is painted
+at a given size and replays the picture on every later paint event.
+set_data() updates the numbers in place and drops the picture, so the
+widget is never rebuilt to show new data.
+"""
+
+import math
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QRectF, QPointF, QVariantAnimation, QEasingCurve
+from PyQt6.QtGui import QPainter, QPicture, QColor, QFont, QFontMetricsF, QPainterPath, QPen
+
+PALETTE = ['#0099FF', '#5DBAA3', '#8B7EC8', '#F59E0B', '#EF4444', '#10B981', '#6366F1', '#EC4899']
+TEXT_COLOR = QColor('#666666')
+AXIS_COLOR = QColor('#CCCCCC')
+GRID_COLOR = QColor('#EEEEEE')
+
+
+def nice_ticks(max_value, count=5):
+    """Evenly spaced round axis ticks from 0 up to at least max_value"""
+    if max_value <= 0:
+        return [0, 1]
+    raw_step = max_value / count
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw_step)
+    return [step * i for i in range(math.ceil(max_value / step - 1e-9) + 1)]
+
+
+def format_value(value):
+    """12 -> '12', 2.5 -> '2.5', 12500 -> '12,500'"""
+    if float(value).is_integer():
+        return f"{int(value):,}"
+    return f"{value:,.2f}".rstrip('0').rstrip('.')
+
+
+def _font(pixel_size, bold=False):
+    # Pixel sizes keep text the same size when a QPicture is replayed
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
+
+
+class ChartWidget(QWidget):
+    """Base class: QPicture caching, optional grow-in animation, legend"""
+
+    def __init__(self, parent=None, legend=True):
+        super().__init__(parent)
+        self.show_legend = legend
+        self.label_font = _font(12)
+        self.value_font = _font(12, bold=True)
+        self._picture = None
+        self._progress = 1.0
+        self._animation = None
+        self.setMinimumSize(240, 200)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def invalidate(self):
+        """Drop the cached drawing and repaint"""
+        self._picture = None
+        self.update()
+
+    def animate(self, duration=600):
+        """Grow the chart in from zero; cached drawing resumes when it ends"""
+        if self._animation is not None:
+            self._animation.stop()
+        self._animation = QVariantAnimation(self)
+        self._animation.setStartValue(0.0)
+        self._animation.setEndValue(1.0)
+        self._animation.setDuration(duration)
+        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._animation.valueChanged.connect(self._set_progress)
+        self._animation.finished.connect(self._animation_finished)
+        self._progress = 0.0
+        self._animation.start()
+
+    def _set_progress(self, value):
+        self._progress = value
+        self.update()
+
+    def _animation_finished(self):
+        self._animation = None
+        self._progress = 1.0
+        self.invalidate()
+
+    def resizeEvent(self, event):
+        self._picture = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(self.rect())
+
+        if self._progress < 1.0:
+            # Every animation frame differs - draw directly
+            self.draw(painter, rect, self._progress)
+            return
+
+        if self._picture is None:
+            self._picture = QPicture()
+            recorder = QPainter(self._picture)
+            recorder.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self.draw(recorder, rect, 1.0)
+            recorder.end()
+        painter.drawPicture(0, 0, self._picture)
+
+    def draw(self, painter, rect, progress):
+        """Draw the chart into rect; progress runs 0..1 during animate()"""
+        raise NotImplementedError
+
+    # ==================== HELPERS ====================
+
+    def draw_empty(self, painter, rect, text="No data"):
+        painter.setFont(self.label_font)
+        painter.setPen(TEXT_COLOR)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+    def draw_legend(self, painter, rect, items):
+        """One row of (label, color) centred at the bottom; returns the rect left above it"""
+        if not self.show_legend or not items:
+            return rect
+
+        painter.setFont(self.label_font)
+        metrics = QFontMetricsF(self.label_font)
+        swatch, gap, spacing = 10, 6, 18
+        widths = [swatch + gap + metrics.horizontalAdvance(label) for label, _ in items]
+        total = sum(widths) + spacing * (len(items) - 1)
+
+        x = max(rect.left(), rect.center().x() - total / 2)
+        y = rect.bottom() - metrics.height()
+        for (label, color), width in zip(items, widths):
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(QRectF(x, y + (metrics.height() - swatch) / 2, swatch, swatch), 2, 2)
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(QRectF(x + swatch + gap, y, width, metrics.height()),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, label)
+            x += width + spacing
+        return rect.adjusted(0, 0, 0, -(metrics.height() + 12))
+
+    def draw_axis_title(self, painter, rect, plot, title, horizontal):
+        """Axis title below the plot (horizontal) or rotated left of it"""
+        if not title:
+            return
+        painter.setFont(self.label_font)
+        painter.setPen(TEXT_COLOR)
+        metrics = QFontMetricsF(self.label_font)
+        if horizontal:
+            painter.drawText(QRectF(plot.left(), rect.bottom() - metrics.height(), plot.width(), metrics.height()),
+                             Qt.AlignmentFlag.AlignCenter, title)
+        else:
+            painter.save()
+            painter.translate(rect.left() + metrics.height() / 2, plot.center().y())
+            painter.rotate(-90)
+            painter.drawText(QRectF(-plot.height() / 2, -metrics.height() / 2, plot.height(), metrics.height()),
+                             Qt.AlignmentFlag.AlignCenter, title)
+            painter.restore()
+
+
+class _CategoryChart(ChartWidget):
+    """Shared value axis and category layout for bar, stacked bar and line charts"""
+
+    def __init__(self, horizontal=False, axis_title='', show_values=True, parent=None, legend=False):
+        super().__init__(parent, legend=legend)
+        self.horizontal = horizontal
+        self.axis_title = axis_title
+        self.show_values = show_values
+        self.categories = []
+
+    def max_value(self):
+        raise NotImplementedError
+
+    def layout_axes(self, painter, rect):
+        """Draw grid, ticks and category labels; returns (plot rect, axis maximum)"""
+        metrics = QFontMetricsF(self.label_font)
+        ticks = nice_ticks(self.max_value())
+        top = ticks[-1]
+        tick_labels = [format_value(t) for t in ticks]
+        title_space = metrics.height() + 6 if self.axis_title else 0
+        value_space = (metrics.horizontalAdvance(format_value(self.max_value())) + 10
+                       if self.show_values else 10)
+
+        if self.horizontal:
+            label_width = min(max((metrics.horizontalAdvance(c) for c in self.categories), default=0),
+                              rect.width() * 0.4)
+            plot = QRectF(rect.left() + label_width + 10, rect.top() + 4,
+                          rect.width() - label_width - 10 - value_space,
+                          rect.height() - 4 - metrics.height() - 8 - title_space)
+        else:
+            tick_width = max(metrics.horizontalAdvance(t) for t in tick_labels)
+            left = title_space + tick_width + 8
+            plot = QRectF(rect.left() + left, rect.top() + metrics.height() + 6,
+                          rect.width() - left - 8,
+                          rect.height() - metrics.height() - 6 - metrics.height() - 10)
+        if plot.width() <= 0 or plot.height() <= 0:
+            return None, top
+
+        painter.setFont(self.label_font)
+        for tick, label in zip(ticks, tick_labels):
+            painter.setPen(QPen(GRID_COLOR if tick else AXIS_COLOR, 1))
+            if self.horizontal:
+                x = plot.left() + tick / top * plot.width()
+                painter.drawLine(QPointF(x, plot.top()), QPointF(x, plot.bottom()))
+                painter.setPen(TEXT_COLOR)
+                painter.drawText(QRectF(x - 40, plot.bottom() + 4, 80, metrics.height()),
+                                 Qt.AlignmentFlag.AlignCenter, label)
+            else:
+                y = plot.bottom() - tick / top * plot.height()
+                painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+                painter.setPen(TEXT_COLOR)
+                painter.drawText(QRectF(plot.left() - 8 - 200, y - metrics.height() / 2, 200, metrics.height()),
+                                 Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label)
+
+        slot = (plot.height() if self.horizontal else plot.width()) / max(len(self.categories), 1)
+        painter.setPen(TEXT_COLOR)
+        for i, category in enumerate(self.categories):
+            if self.horizontal:
+                text = metrics.elidedText(category, Qt.TextElideMode.ElideRight, plot.left() - rect.left() - 10)
+                painter.drawText(QRectF(rect.left(), plot.top() + i * slot, plot.left() - rect.left() - 10, slot),
+                                 Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, text)
+            else:
+                text = metrics.elidedText(category, Qt.TextElideMode.ElideRight, slot - 4)
+                painter.drawText(QRectF(plot.left() + i * slot, plot.bottom() + 6, slot, metrics.height()),
+                                 Qt.AlignmentFlag.AlignCenter, text)
+
+        self.draw_axis_title(painter, rect, plot, self.axis_title, self.horizontal)
+        return plot, top
+
+
+class BarChart(_CategoryChart):
+    """
+    Bar chart with a value axis
+
+    Example:
+        chart = BarChart(["Academic", "TVL"], [120, 80], color='#8B7EC8', axis_title="Students")
+        chart.set_data(labels, values)     # later refreshes
+    """
+
+    def __init__(self, labels=None, values=None, color='#5DBAA3', horizontal=False,
+                 axis_title='', show_values=True, parent=None):
+        super().__init__(horizontal, axis_title, show_values, parent)
+        self.color = color
+        self.values = []
+        self.set_data(labels or [], values or [])
+
+    def set_data(self, labels, values):
+        self.categories = [str(label) for label in labels]
+        self.values = list(values)
+        self.invalidate()
+
+    def max_value(self):
+        return max(self.totals(), default=0)
+
+    def totals(self):
+        return self.values
+
+    def segments(self, index):
+        """[(value, color)] drawn end to end for the bar at index"""
+        return [(self.values[index], self.color)]
+
+    def draw(self, painter, rect, progress):
+        if not self.categories:
+            self.draw_empty(painter, rect)
+            return
+        area = self.draw_legend(painter, rect, self.legend_items())
+        plot, top = self.layout_axes(painter, area)
+        if plot is None:
+            return
+
+        count = len(self.categories)
+        slot = (plot.height() if self.horizontal else plot.width()) / count
+        thickness = min(slot * 0.6, 40 if self.horizontal else 80)
+        metrics = QFontMetricsF(self.value_font)
+
+        for i in range(count):
+            offset = 0.0
+            for value, color in self.segments(i):
+                length = value / top * (plot.width() if self.horizontal else plot.height()) * progress
+                if self.horizontal:
+                    bar = QRectF(plot.left() + offset, plot.top() + i * slot + (slot - thickness) / 2,
+                                 length, thickness)
+                else:
+                    bar = QRectF(plot.left() + i * slot + (slot - thickness) / 2,
+                                 plot.bottom() - offset - length, thickness, length)
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QColor(color))
+                painter.drawRect(bar)
+                offset += length
+
+            if self.show_values and progress >= 1.0:
+                painter.setFont(self.value_font)
+                painter.setPen(TEXT_COLOR)
+                text = format_value(self.totals()[i])
+                if self.horizontal:
+                    painter.drawText(QRectF(plot.left() + offset + 6, plot.top() + i * slot, 200, slot),
+                                     Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+                else:
+                    painter.drawText(QRectF(plot.left() + i * slot, plot.bottom() - offset - metrics.height() - 4,
+                                            slot, metrics.height()),
+                                     Qt.AlignmentFlag.AlignCenter, text)
+
+    def legend_items(self):
+        return []
+
+
+class StackedBarChart(BarChart):
+    """
+    Several series stacked per category
+
+    Example:
+        chart = StackedBarChart(["Grade 11", "Grade 12"],
+                                [("Enrolled", [90, 70]), ("Pending", [10, 12])])
+    """
+
+    def __init__(self, categories=None, series=None, colors=None, horizontal=False,
+                 axis_title='', show_values=True, parent=None):
+        self.series = []
+        self.colors = list(colors or PALETTE)
+        super().__init__(horizontal=horizontal, axis_title=axis_title, show_values=show_values, parent=parent)
+        self.show_legend = True
+        self.set_series(categories or [], series or [])
+
+    def set_series(self, categories, series):
+        """series: [(name, [value per category]), ...]"""
+        self.series = [(str(name), list(values)) for name, values in series]
+        self.set_data(categories, [sum(column) for column in zip(*(v for _, v in self.series))]
+                      if self.series else [0] * len(categories))
+
+    def segments(self, index):
+        return [(values[index], self.colors[k % len(self.colors)])
+                for k, (_, values) in enumerate(self.series)]
+
+    def legend_items(self):
+        return [(name, self.colors[k % len(self.colors)]) for k, (name, _) in enumerate(self.series)]
+
+
+class LineChart(_CategoryChart):
+    """
+    One or more series over shared categories
+
+    Example:
+        chart = LineChart(["Jun", "Jul", "Aug"], [("Enrollments", [40, 95, 130])])
+    """
+
+    def __init__(self, categories=None, series=None, colors=None, axis_title='', show_values=False, parent=None):
+        super().__init__(horizontal=False, axis_title=axis_title, show_values=show_values,
+                         parent=parent, legend=True)
+        self.colors = list(colors or PALETTE)
+        self.series = []
+        self.set_series(categories or [], series or [])
+
+    def set_series(self, categories, series):
+        self.categories = [str(c) for c in categories]
+        self.series = [(str(name), list(values)) for name, values in series]
+        self.invalidate()
+
+    def max_value(self):
+        return max((max(values, default=0) for _, values in self.series), default=0)
+
+    def draw(self, painter, rect, progress):
+        if not self.categories or not self.series:
+            self.draw_empty(painter, rect)
+            return
+        items = [(name, self.colors[k % len(self.colors)]) for k, (name, _) in enumerate(self.series)]
+        area = self.draw_legend(painter, rect, items if len(items) > 1 else [])
+        plot, top = self.layout_axes(painter, area)
+        if plot is None:
+            return
+
+        slot = plot.width() / len(self.categories)
+        painter.save()
+        painter.setClipRect(QRectF(plot.left(), rect.top(), plot.width() * progress, rect.height()))
+        for (name, values), (_, color) in zip(self.series, items):
+            points = [QPointF(plot.left() + (i + 0.5) * slot, plot.bottom() - v / top * plot.height())
+                      for i, v in enumerate(values[:len(self.categories)])]
+            if not points:
+                continue
+            path = QPainterPath(points[0])
+            for point in points[1:]:
+                path.lineTo(point)
+            painter.setPen(QPen(QColor(color), 2.5))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawPath(path)
+
+            painter.setBrush(QColor(color))
+            painter.setPen(QPen(QColor('white'), 1.5))
+            for point, value in zip(points, values):
+                painter.drawEllipse(point, 4, 4)
+                if self.show_values:
+                    painter.setFont(self.value_font)
+                    painter.setPen(TEXT_COLOR)
+                    painter.drawText(QRectF(point.x() - slot / 2, point.y() - 24, slot, 18),
+                                     Qt.AlignmentFlag.AlignCenter, format_value(value))
+                    painter.setPen(QPen(QColor('white'), 1.5))
+        painter.restore()
+
+
+class DonutChart(ChartWidget):
+    """
+    Donut chart with a legend and percentage labels (hole=0 for a pie)
+
+    Example:
+        chart = DonutChart(["Enrolled", "Pending"], [120, 30], ['#0099FF', '#5DBAA3'])
+    """
+
+    def __init__(self, labels=None, values=None, colors=None, hole=0.45, show_percent=True, parent=None):
+        super().__init__(parent, legend=True)
+        self.colors = list(colors or PALETTE)
+        self.hole = hole
+        self.show_percent = show_percent
+        self.labels = []
+        self.values = []
+        self.set_data(labels or [], values or [])
+
+    def set_data(self, labels, values, colors=None):
+        self.labels = [str(label) for label in labels]
+        self.values = list(values)
+        if colors:
+            self.colors = list(colors)
+        self.invalidate()
+
+    def draw(self, painter, rect, progress):
+        total = sum(self.values)
+        if total <= 0:
+            self.draw_empty(painter, rect)
+            return
+
+        items = [(label, self.colors[i % len(self.colors)]) for i, label in enumerate(self.labels)]
+        area = self.draw_legend(painter, rect, items)
+        size = min(area.width(), area.height()) - 20
+        if size <= 0:
+            return
+        center = area.center()
+        circle = QRectF(center.x() - size / 2, center.y() - size / 2, size, size)
+        inner = size * self.hole
+
+        painter.save()
+        if inner:
+            ring = QPainterPath()
+            ring.addEllipse(circle)
+            hole = QPainterPath()
+            hole.addEllipse(center, inner / 2, inner / 2)
+            painter.setClipPath(ring.subtracted(hole))
+
+        start = 90 * 16
+        label_positions = []
+        for value, (_, color) in zip(self.values, items):
+            span = -value / total * 360 * 16 * progress
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawPie(circle, int(start), int(round(span)))
+            if value / total >= 0.05:
+                angle = math.radians((start + span / 2) / 16)
+                radius = (size / 2 + inner / 2) / 2
+                label_positions.append((QPointF(center.x() + radius * math.cos(angle),
+                                                center.y() - radius * math.sin(angle)), value / total))
+            start += span
+        painter.restore()
+
+        if self.show_percent and progress >= 1.0:
+            painter.setFont(self.value_font)
+            painter.setPen(QColor('white'))
+            for point, share in label_positions:
+                painter.drawText(QRectF(point.x() - 30, point.y() - 10, 60, 20),
+                                 Qt.AlignmentFlag.AlignCenter, f"{share * 100:.1f}%")
@@ -1,102 +1,29 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QFrame, QTableWidget, QTableWidgetItem,
                              QHeaderView, QLineEdit, QComboBox, QSizePolicy)
-from PyQt6.QtCore import (
-    Qt, QTimer, QPropertyAnimation,
-    QEasingCurve, pyqtSignal
-)
-from PyQt6.QtGui import QPainter, QColor, QPixmap
-import os
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor
+from charts import BarChart, DonutChart
+import icons
 
 
-class PieChartWidget(QWidget):
+class PieChartWidget(DonutChart):
+    """Two-slice pie kept for existing callers - see charts.DonutChart"""
+
     def __init__(self, value1, value2, color1, color2, label1, label2):
-        super().__init__()
-        self.value1 = value1
-        self.value2 = value2
-        self.color1 = QColor(color1)
-        self.color2 = QColor(color2)
-        self.label1 = label1
-        self.label2 = label2
-        self._angle = 0
+        super().__init__([label1, label2], [value1, value2], [color1, color2], hole=0)
         self.setMinimumSize(300, 300)
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-
-    def get_angle(self):
-        return self._angle
-
-    def set_angle(self, angle):
-        self._angle = angle
-        self.update()
-
-    angle = property(get_angle, set_angle)
 
     def start_animation(self):
-        self.animation = QPropertyAnimation(self, b"angle")
-        self.animation.setDuration(1500)
-        self.animation.setStartValue(0)
-        self.animation.setEndValue(360)
-        self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self.animation.start()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        total = self.value1 + self.value2
-        if total == 0:
-            return
-
-        width = self.width()
-        height = self.height()
-        margin = 30
-        size = min(width, height) - (margin * 2)
-        x = (width - size) // 2
-        y = (height - size) // 2
-
-        angle1 = int((self.value1 / total) * self._angle * 16)
-        angle2 = int((self.value2 / total) * self._angle * 16)
+        self.animate(1500)
 
-        painter.setBrush(self.color1)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPie(x, y, size, size, 90 * 16, -angle1)
 
-        painter.setBrush(self.color2)
-        painter.drawPie(x, y, size, size, (90 * 16) - angle1, -angle2)
+class BarWidget(BarChart):
+    """Vertical bar chart kept for existing callers - see charts.BarChart"""
 
-
-class BarWidget(QWidget):
     def __init__(self, labels, values, color):
-        super().__init__()
-        self.labels = labels
-        self.values = values
-        self.color = QColor(color)
+        super().__init__(labels, values, color)
         self.setMinimumHeight(280)
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-
-    def paintEvent(self, event):
-        if not self.values:
-            return
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        width = self.width()
-        height = self.height() - 60
-        bar_width = (width - 120) / len(self.values)
-        max_value = max(self.values) if self.values else 1
-
-        for i, (label, value) in enumerate(zip(self.labels, self.values)):
-            x = 60 + i * bar_width + (bar_width - 70) / 2
-            bar_height = (value / max_value) * height
-            y = height - bar_height + 30
-
-            painter.setBrush(self.color)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRect(int(x), int(y), 70, int(bar_height))
-
-            painter.setPen(QColor("#666"))
-            painter.drawText(int(x), height + 40, 70, 25, Qt.AlignmentFlag.AlignCenter, label)
 
 
 class HeaderWidget(QWidget):
@@ -128,16 +55,11 @@ class HeaderWidget(QWidget):
         logo_layout.setSpacing(20)
 
         logo = QLabel()
-        if os.path.exists('assets/enrollify_logo.png'):
-            pixmap = QPixmap('assets/enrollify_logo.png')
-            if not pixmap.isNull():
-                # scale and set fixed size so the logo is not cut off
-                scaled = pixmap.scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio,
-                                      Qt.TransformationMode.SmoothTransformation)
-                logo.setPixmap(scaled)
-                logo.setFixedSize(scaled.size())
-            else:
-                self.create_fallback_logo(logo, 50)
+        scaled = icons.pixmap('enrollify_logo.png', 50)
+        if scaled is not None:
+            # fixed size so the logo is not cut off
+            logo.setPixmap(scaled)
+            logo.setFixedSize(icons.logical_size(scaled))
         else:
             self.create_fallback_logo(logo, 50)
 
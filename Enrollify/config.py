@@ -14,6 +14,8 @@ class Config:
     BASE_DIR = Path(__file__).parent
     ASSETS_DIR = BASE_DIR / 'assets'
     LOGS_DIR = BASE_DIR / 'logs'
+    ASSET_BUNDLE = BASE_DIR / 'enrollify_assets.rcc'  # optional, built with: python icons.py --build-rcc
+    OFFLINE_QUEUE_PATH = BASE_DIR / 'offline_queue.db'  # enrollments journaled while MySQL is down
 
     # ===== DATABASE =====
     # Works with both SQLite AND MySQL
@@ -30,6 +32,9 @@ class Config:
 
     # For database_manager_enhanced.py (MySQL with connection pooling)
     DB_POOL_SIZE = 5  # ← THIS WAS MISSING!
+    ASYNC_PUMP_MS = 5  # how often awaiting UI coroutines are resumed (see async_database.py)
+    DB_WARMUP_RETRY_MS = 30000  # retry a failed background connect after this long (0 = never)
+    OFFLINE_SYNC_BATCH = 25  # journaled entries replayed per event loop turn (see offline_queue.py)
 
     # ===== APPLICATION =====
     APP_NAME = "Enrollify"
@@ -38,6 +43,8 @@ class Config:
     # ===== UI SETTINGS =====
     WINDOW_MIN_WIDTH = 1200
     WINDOW_MIN_HEIGHT = 800
+    # 'native' (QPainter, see charts.py) or 'plotly' (QtWebEngine, several hundred MB per terminal)
+    REPORT_CHARTS = os.environ.get('ENROLLIFY_REPORT_CHARTS', 'native')
 
     # ===== SECURITY =====
     PASSWORD_MIN_LENGTH = 6
@@ -48,6 +55,36 @@ class Config:
     # ===== PERFORMANCE =====
     PAGE_SIZE = 50
     CACHE_TIMEOUT = 60
+    TAB_STALE_AFTER = 30  # seconds a cached admin/staff tab is shown before its data is re-queried
+    CHANGE_REFRESH_DELAY_MS = 250  # dashboards recount once per burst of change events (see change_bus.py)
+    CHANGE_FEED_INTERVAL_MS = 3000  # poll for other terminals' writes this often (0 = off, see change_feed.py)
+    CHANGE_FEED_OVERLAP = 2  # seconds re-read behind the feed's high-water mark, for late commits
+    DATA_CACHE_ENABLED = True  # serve repeated reads from memory until their tables change (see data_cache.py)
+    DATA_VERSION_CHECK_MS = 500  # re-read data_versions at most this often
+    QUERY_STATS_ENABLED = True  # time every statement (see query_stats.py)
+    SLOW_QUERY_MS = 200  # statements slower than this are logged with their call site
+    METRICS_EXPORT_INTERVAL = 60  # seconds between metrics.prom / metrics.json writes
+    TERMINAL_NAME = os.environ.get('ENROLLIFY_TERMINAL', '')  # defaults to the hostname
+    QUERY_BUDGET = 25  # round-trips one user action may issue before a warning is logged
+    N_PLUS_ONE_THRESHOLD = 5  # same statement shape this many times in one action = N+1
+    STALL_WATCHDOG_ENABLED = True  # report event-loop stalls (see stall_watchdog.py)
+    STALL_THRESHOLD_MS = 100  # event loop blocked longer than this counts as a stall
+    STALL_HEARTBEAT_MS = 25
+    MEMORY_TRACKING = os.environ.get('ENROLLIFY_MEMORY_TRACKING') == '1'  # see memory_tracker.py
+
+    # ===== ENROLLMENT SERVICE (see enrollment_service.py) =====
+    SERVICE_HOST = os.environ.get('ENROLLIFY_SERVICE_HOST', '127.0.0.1')
+    SERVICE_PORT = int(os.environ.get('ENROLLIFY_SERVICE_PORT', '8765'))
+    SERVICE_REFERENCE_TTL = 60  # seconds tracks/strands/fees responses are served from memory
+    SERVICE_DASHBOARD_TTL = 2  # seconds a dashboard snapshot is shared by all callers
+    SERVICE_MAX_BODY = 64 * 1024  # largest request body accepted, in bytes
+
+    # ===== LOGGING =====
+    LOG_LEVEL = os.environ.get('ENROLLIFY_LOG_LEVEL', 'INFO')
+    LOG_MAX_BYTES = 5 * 1024 * 1024  # rotate log files at this size
+    LOG_BACKUP_COUNT = 10  # rotated files kept (gzip compressed)
+    LOG_RATE_LIMIT = 20  # records per call site per window before sampling kicks in
+    LOG_RATE_WINDOW = 60  # seconds
 
     @classmethod
     def ensure_directories(cls):
@@ -61,9 +98,6 @@ class Config:
         return cls.ASSETS_DIR / filename
 
 
-# Create directories on import
-Config.ensure_directories()
-
 # Print what we're using (for debugging)
 if __name__ == '__main__':
     print("=" * 60)
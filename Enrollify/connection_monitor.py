@@ -0,0 +1,97 @@
+"""
+Background database warm-up for Enrollify
+The window is shown before the database is touched. ConnectionMonitor then
+connects on a worker thread, pre-fetches reference data (tracks, strands,
+fee matrix) and reports progress through its state_changed signal:
+
+    monitor = get_connection_monitor()
+    monitor.state_changed.connect(self.on_db_state)   # (state, detail)
+
+States: 'disconnected' -> 'connecting' -> 'connected' | 'failed'.
+A failed warm-up is retried every Config.DB_WARMUP_RETRY_MS.
+"""
+
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from config import Config
+from logger_config import get_logger
+from metrics import registry as metrics
+
+logger = get_logger(__name__)
+
+DISCONNECTED = 'disconnected'
+CONNECTING = 'connecting'
+CONNECTED = 'connected'
+FAILED = 'failed'
+
+
+class ConnectionMonitor(QObject):
+    """Connects a DatabaseManager off the GUI thread and publishes its state"""
+
+    # state, detail (error message when failed)
+    state_changed = pyqtSignal(str, str)
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.state = DISCONNECTED
+        self.detail = ''
+        self._thread = None
+
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self.start)
+        # Signals emitted from the worker thread are delivered in the GUI thread
+        self.state_changed.connect(self._on_state_changed)
+
+    def start(self):
+        """Start a warm-up unless one is already running"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._set_state(CONNECTING)
+        self._thread = threading.Thread(target=self._warm_up, name='db-warmup', daemon=True)
+        self._thread.start()
+
+    def is_connected(self):
+        return self.state == CONNECTED
+
+    def _warm_up(self):
+        started = time.perf_counter()
+        try:
+            self.db.warm_up()
+        except Exception as e:
+            logger.error(f"Database warm-up failed: {e}")
+            self._set_state(FAILED, str(e))
+            return
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        metrics.observe('db_warmup', elapsed_ms)
+        logger.info(f"Database warmed up in {elapsed_ms:.0f} ms")
+        self._set_state(CONNECTED)
+
+    def _set_state(self, state, detail=''):
+        self.state, self.detail = state, detail
+        self.state_changed.emit(state, detail)
+
+    def _on_state_changed(self, state, detail):
+        if state == FAILED and Config.DB_WARMUP_RETRY_MS:
+            self._retry_timer.start(Config.DB_WARMUP_RETRY_MS)
+
+
+_monitor = None
+
+
+def start_database_warmup(db):
+    """Create the monitor for db and start warming it up (GUI thread)"""
+    global _monitor
+    if _monitor is None:
+        _monitor = ConnectionMonitor(db)
+    _monitor.start()
+    return _monitor
+
+
+def get_connection_monitor():
+    return _monitor
@@ -0,0 +1,137 @@
+"""
+Version-checked query cache for Enrollify
+Every write path in DatabaseManager bumps a counter per logical table in
+the data_versions table, in the same transaction as the write. Cached
+reads are tagged with the versions of the tables they read; one tiny
+query (SELECT table_name, version FROM data_versions) tells which tags
+are out of date, so only entries over tables that changed - on this
+terminal or any other - are dropped:
+
+    @cached_read('students', 'payments', default={})
+    def get_statistics(self):
+        ...                                   # plain query, raises on errors
+
+Versions are re-read at most every Config.DATA_VERSION_CHECK_MS, so a
+screen refresh that issues ten cached reads costs one version query.
+Writes made through this DatabaseManager invalidate at once.
+"""
+
+import copy
+import functools
+import threading
+import time
+
+from config import Config
+from logger_config import get_logger
+from metrics import registry as metrics
+
+logger = get_logger(__name__)
+
+# Logical tables with a row in data_versions
+VERSIONED_TABLES = ('students', 'payments', 'tracks', 'strands', 'tuition_fees', 'users', 'staff_subjects')
+
+
+class DataCache:
+    """Query results tagged with the data_versions of the tables they were read from"""
+
+    def __init__(self, read_versions, check_interval_ms=None, enabled=None):
+        # read_versions() -> {table: version}; raises when the database is unavailable
+        self._read_versions = read_versions
+        self.check_interval = (Config.DATA_VERSION_CHECK_MS if check_interval_ms is None
+                               else check_interval_ms) / 1000
+        self.enabled = Config.DATA_CACHE_ENABLED if enabled is None else enabled
+        self._entries = {}  # key -> (value, {table: version})
+        self._versions = None
+        self._checked_at = None
+        self._lock = threading.RLock()
+
+    def get(self, key, tables, load):
+        """The cached value for key if none of tables changed since, else load() (and cache it)"""
+        if not self.enabled:
+            return load()
+
+        with self._lock:
+            self.validate()
+            entry = self._entries.get(key)
+            if entry is not None:
+                metrics.increment('data_cache_hit')
+                return entry[0]
+            # Tag with the versions seen before loading: a write that lands
+            # meanwhile makes the entry look stale, never fresh
+            versions = self._versions
+
+        metrics.increment('data_cache_miss')
+        value = load()
+        if versions is not None:
+            with self._lock:
+                self._entries[key] = (value, {table: versions.get(table, 0) for table in tables})
+        return value
+
+    def validate(self, force=False):
+        """Re-read data_versions (unless checked within the interval) and drop outdated entries"""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._checked_at is not None and now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            try:
+                versions = self._read_versions()
+            except Exception as e:
+                # Unknown versions: cache nothing until they can be read again
+                logger.warning(f"Could not read data versions: {e}")
+                self._versions = None
+                self._entries.clear()
+                return
+
+            self._versions = versions
+            self._drop(lambda tags: any(versions.get(table, 0) != version for table, version in tags.items()))
+
+    def invalidate(self, *tables):
+        """Drop entries over tables (all when none given) - after this terminal wrote to them"""
+        with self._lock:
+            if not tables:
+                self._entries.clear()
+                return
+            if self._versions is not None:
+                # Expect our own bump, so entries loaded from now on stay valid
+                self._versions = dict(self._versions)
+                for table in tables:
+                    self._versions[table] = self._versions.get(table, 0) + 1
+            self._drop(lambda tags: any(table in tags for table in tables))
+
+    def _drop(self, is_stale):
+        stale = [key for key, (_, tags) in self._entries.items() if is_stale(tags)]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            metrics.increment('data_cache_invalidated', len(stale))
+
+
+def fresh_copy(value):
+    """Copy of a cached result that callers may modify (rows and nested dicts are copied)"""
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    if isinstance(value, dict):
+        return {key: copy.copy(item) if isinstance(item, (dict, list)) else item for key, item in value.items()}
+    return value
+
+
+def cached_read(*tables, default=None):
+    """
+    Serve a DatabaseManager read method from self.cache, keyed by the
+    method and its arguments and tagged with the tables it reads.
+    The method itself just queries and raises on errors; the caller then
+    gets the error logged and a copy of default (which is not cached).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (func.__name__,) + args + tuple(sorted(kwargs.items()))
+            try:
+                value = self.cache.get(key, tables, lambda: func(self, *args, **kwargs))
+            except Exception as e:
+                logger.error(f"Error in {func.__name__}: {e}")
+                return copy.deepcopy(default)
+            return fresh_copy(value)
+        return wrapper
+    return decorator
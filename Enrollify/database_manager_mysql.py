@@ -1,46 +1,281 @@
+import threading
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, InterfaceError
 from datetime import datetime
+from query_stats import instrument_connection
+from data_cache import DataCache, cached_read, VERSIONED_TABLES
+from change_bus import (
+    changes, STUDENT_ADDED, STUDENT_UPDATED, STATUS_CHANGED, STUDENT_DELETED,
+    PAYMENT_RECORDED, STUDENT_ASSIGNED
+)
+from logger_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class DatabaseManager:
     """MySQL Database Manager for Enrollify - Updated for new schema"""
 
-    def __init__(self, host="127.0.0.1", user="root", password="", database="enrollify_db"):
+    def __init__(self, host="127.0.0.1", user="root", password="", database="enrollify_db", connect=True):
         self.host = host
         self.user = user
         self.password = password
         self.database = database
         self.connection = None
-        self.connect()
+        # Guards the two fields below and the publishing of self.connection;
+        # never held across network I/O
+        self._connect_lock = threading.Lock()
+        # Thread running connect(), and the connection it is setting up.
+        # Other threads fail fast meanwhile (callers fall back to the offline path)
+        self._connecting = None
+        self._pending = None
+        # Cached reads, validated against data_versions (see data_cache.py)
+        self.cache = DataCache(self._read_data_versions)
+        # False when data_versions could not be created: writes skip the bump
+        self._versioned = False
+        if connect:
+            self.connect()
+
+    def connect(self, prefetch=False):
+        """
+        Establish connection to MySQL database
 
-    def connect(self):
-        """Establish connection to MySQL database"""
+        The connection is only published once it is set up (and, with
+        prefetch, reference data is loaded); until then other threads get
+        an InterfaceError instead of waiting.
+        """
+        with self._connect_lock:
+            if self._connecting is not None:
+                raise InterfaceError(msg="Database is still connecting")
+            self._connecting = threading.current_thread()
         try:
-            self.connection = mysql.connector.connect(
+            self._pending = instrument_connection(mysql.connector.connect(
                 host=self.host,
                 user=self.user,
                 password=self.password,
                 database=self.database,
                 autocommit=False,
                 use_pure=True
-            )
-            if self.connection.is_connected():
-                print(f"✅ Connected to MySQL database: {self.database}")
+            ))
+            if self._pending.is_connected():
+                logger.info(f"✅ Connected to MySQL database: {self.database}")
+                self._ensure_data_versions()
+                self._ensure_updated_at_index()
+                self._ensure_unique_receipts()
+                if prefetch:
+                    self.prefetch_reference_data()
+            with self._connect_lock:
+                self.connection = self._pending
         except Error as e:
-            print(f"❌ MySQL connection error: {e}")
+            logger.error(f"❌ MySQL connection error: {e}")
             raise
+        finally:
+            with self._connect_lock:
+                self._connecting = self._pending = None
+        return self.connection
 
     def get_connection(self):
         """Get or reconnect to database"""
+        if self._connecting is threading.current_thread():
+            # Inside connect(): the connection being set up
+            return self._pending
         try:
-            if self.connection is None or not self.connection.is_connected():
-                self.connect()
-            return self.connection
+            connection = self.connection
+            if connection is None or not connection.is_connected():
+                connection = self.connect()
+            return connection
         except Error as e:
-            print(f"Connection error: {e}")
+            logger.error(f"Connection error: {e}")
             raise
 
+    def warm_up(self):
+        """
+        Connect and load reference data (called off the GUI thread at startup)
+
+        Queries issued meanwhile fail fast rather than wait for it.
+        """
+        connection = self.connection
+        if connection is None or not connection.is_connected():
+            self.connect(prefetch=True)
+        else:
+            self.prefetch_reference_data()
+
+    # ==================== DATA VERSIONS ====================
+
+    def _ensure_data_versions(self):
+        """Create the data_versions table (and its rows) on databases that predate it"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS data_versions (
+                    table_name VARCHAR(64) NOT NULL PRIMARY KEY,
+                    version BIGINT NOT NULL DEFAULT 0
+                )
+            ''')
+            cursor.executemany('INSERT IGNORE INTO data_versions (table_name) VALUES (%s)',
+                               [(table,) for table in VERSIONED_TABLES])
+            conn.commit()
+            self._versioned = True
+        except Error as e:
+            logger.warning(f"data_versions unavailable, query cache disabled: {e}")
+            self._versioned = False
+            self.cache.enabled = False
+        finally:
+            cursor.close()
+
+    def _ensure_updated_at_index(self):
+        """Index students.updated_at (the change feed's high-water mark) on databases that predate it"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute('''
+                SELECT COUNT(*) FROM information_schema.statistics
+                WHERE table_schema = DATABASE() AND table_name = 'students' AND index_name = 'idx_updated_at'
+            ''')
+            if cursor.fetchone()[0] == 0:
+                cursor.execute('CREATE INDEX idx_updated_at ON students (updated_at)')
+                logger.info("✅ Added idx_updated_at index to students table")
+        except Error as e:
+            # 1061: another terminal created it first
+            if e.errno != 1061:
+                logger.warning(f"idx_updated_at unavailable, change feed polls will scan students: {e}")
+        finally:
+            cursor.close()
+
+    def _ensure_unique_receipts(self):
+        """Make payments.idx_receipt_number unique on databases that predate it"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute('''
+                SELECT MIN(non_unique) FROM information_schema.statistics
+                WHERE table_schema = DATABASE() AND table_name = 'payments' AND index_name = 'idx_receipt_number'
+            ''')
+            non_unique = cursor.fetchone()[0]
+            if non_unique == 0:
+                return
+
+            # Existing duplicates have to be resolved by hand first
+            cursor.execute('''
+                SELECT receipt_number, COUNT(*) FROM payments
+                WHERE receipt_number IS NOT NULL
+                GROUP BY receipt_number HAVING COUNT(*) > 1
+            ''')
+            duplicates = cursor.fetchall()
+            if duplicates:
+                logger.warning(f"⚠️ {len(duplicates)} receipt numbers are used by more than one payment "
+                               f"(e.g. {duplicates[0][0]}); idx_receipt_number left non-unique")
+                return
+
+            cursor.execute('ALTER TABLE payments '
+                           + ('DROP INDEX idx_receipt_number, ' if non_unique is not None else '')
+                           + 'ADD UNIQUE KEY idx_receipt_number (receipt_number)')
+            logger.info("✅ Made idx_receipt_number unique on payments table")
+        except Error as e:
+            logger.warning(f"Could not make idx_receipt_number unique: {e}")
+        finally:
+            cursor.close()
+
+    def _read_data_versions(self):
+        """{table: version} - the one query that validates every cached read"""
+        conn = self.get_connection()
+        # autocommit is off: end the snapshot left by earlier reads, so
+        # versions bumped by other terminals are visible
+        conn.commit()
+        cursor = conn.cursor()
+        try:
+            cursor.execute('SELECT table_name, version FROM data_versions')
+            return dict(cursor.fetchall())
+        finally:
+            cursor.close()
+
+    def _bump_versions(self, cursor, *tables):
+        """Bump tables in data_versions inside the caller's transaction (and drop our cached reads)"""
+        # The rows are locked in VALUES order: one order for every writer, so
+        # e.g. a delete and a payment on two terminals cannot deadlock
+        tables = tuple(sorted(set(tables)))
+        if self._versioned:
+            cursor.execute(
+                'INSERT INTO data_versions (table_name, version) VALUES '
+                + ', '.join(['(%s, 1)'] * len(tables))
+                + ' ON DUPLICATE KEY UPDATE version = version + 1',
+                tables
+            )
+        self.cache.invalidate(*tables)
+
+    def _updated_at(self, cursor, lrn):
+        """A student's updated_at as written by the caller's transaction (published with the change)"""
+        cursor.execute('SELECT updated_at FROM students WHERE lrn = %s', (lrn,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def bump_data_versions(self, *tables):
+        """Bump tables after writes made outside DatabaseManager (e.g. bulk deletes)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            self._bump_versions(cursor, *tables)
+            conn.commit()
+        finally:
+            cursor.close()
+
+    # ==================== REFERENCE DATA ====================
+
+    def prefetch_reference_data(self):
+        """Tracks, strands and the fee matrix, cached until one of their tables changes"""
+        return self.cache.get('reference', ('tracks', 'strands', 'tuition_fees'), self._load_reference_data)
+
+    def reference_data(self):
+        """Cached reference data, or None (callers then query directly)"""
+        if not self.cache.enabled:
+            return None
+        try:
+            return self.prefetch_reference_data()
+        except Error as e:
+            logger.error(f"Error loading reference data: {e}")
+            return None
+
+    def _load_reference_data(self):
+        """Load tracks, strands and the fee matrix in three queries"""
+        conn = self.get_connection()
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute('SELECT name FROM tracks ORDER BY name')
+            tracks = [row['name'] for row in cursor.fetchall()]
+
+            cursor.execute('SELECT track, name FROM strands ORDER BY name')
+            strands = {}
+            for row in cursor.fetchall():
+                strands.setdefault(row['track'], []).append(row['name'])
+
+            cursor.execute('''
+                SELECT track, strand, enrollment_fee, miscellaneous_fee, tuition_fee, special_fee
+                FROM tuition_fees
+            ''')
+            fees = {(row['track'], row['strand']): self._fee_breakdown(row) for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+        logger.info(f"Reference data loaded: {len(tracks)} tracks, "
+                    f"{sum(len(s) for s in strands.values())} strands, {len(fees)} fee rows")
+        return {'tracks': tracks, 'strands': strands, 'fees': fees}
+
+    def invalidate_reference_data(self):
+        """Drop cached reference data (reloaded on next use)"""
+        self.cache.invalidate('tracks', 'strands', 'tuition_fees')
+
+    @staticmethod
+    def _fee_breakdown(row):
+        return {
+            'enrollment_fee': float(row['enrollment_fee']),
+            'miscellaneous_fee': float(row['miscellaneous_fee']),
+            'tuition_fee': float(row['tuition_fee']),
+            'special_fee': float(row['special_fee']),
+            'total': float(row['enrollment_fee'] + row['miscellaneous_fee'] +
+                           row['tuition_fee'] + row['special_fee'])
+        }
+
     def close_connection(self):
         """Close database connection"""
         if self.connection and self.connection.is_connected():
@@ -50,6 +285,9 @@ class DatabaseManager:
 
     def get_all_tracks(self):
         """Get all available tracks"""
+        reference = self.reference_data()
+        if reference is not None:
+            return list(reference['tracks'])
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
@@ -58,7 +296,7 @@ class DatabaseManager:
             cursor.close()
             return tracks
         except Error as e:
-            print(f"Error fetching tracks: {e}")
+            logger.error(f"Error fetching tracks: {e}")
             return []
 
     def add_track(self, name, description=""):
@@ -67,6 +305,7 @@ class DatabaseManager:
             conn = self.get_connection()
             cursor = conn.cursor()
             cursor.execute('INSERT INTO tracks (name, description) VALUES (%s, %s)', (name, description))
+            self._bump_versions(cursor, 'tracks')
             conn.commit()
             cursor.close()
             self.log_action(None, 'ADD_TRACK', f"Added track: {name}")
@@ -89,6 +328,7 @@ class DatabaseManager:
                 raise ValueError("Cannot delete track in use by students")
 
             cursor.execute('DELETE FROM tracks WHERE name = %s', (name,))
+            self._bump_versions(cursor, 'tracks')
             conn.commit()
             cursor.close()
             self.log_action(None, 'REMOVE_TRACK', f"Removed track: {name}")
@@ -98,6 +338,9 @@ class DatabaseManager:
 
     def is_valid_track(self, track_name):
         """Check if track exists"""
+        reference = self.reference_data()
+        if reference is not None:
+            return track_name in reference['tracks']
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
@@ -106,11 +349,14 @@ class DatabaseManager:
             cursor.close()
             return exists
         except Error as e:
-            print(f"Error checking track: {e}")
+            logger.error(f"Error checking track: {e}")
             return False
 
     def get_strands_by_track(self, track_name):
         """Get strands for a specific track"""
+        reference = self.reference_data()
+        if reference is not None:
+            return list(reference['strands'].get(track_name, []))
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
@@ -119,11 +365,14 @@ class DatabaseManager:
             cursor.close()
             return strands
         except Error as e:
-            print(f"Error fetching strands: {e}")
+            logger.error(f"Error fetching strands: {e}")
             return []
 
     def get_all_strands(self):
         """Get all strands"""
+        reference = self.reference_data()
+        if reference is not None:
+            return sorted({name for names in reference['strands'].values() for name in names})
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
@@ -132,13 +381,18 @@ class DatabaseManager:
             cursor.close()
             return strands
         except Error as e:
-            print(f"Error fetching strands: {e}")
+            logger.error(f"Error fetching strands: {e}")
             return []
 
     # ==================== TUITION FEE OPERATIONS ====================
 
     def get_tuition_fees(self, track, strand=None):
         """Get tuition fee breakdown for a track/strand"""
+        reference = self.reference_data()
+        if reference is not None:
+            key = (track, None if strand is None or strand.strip() == "" else strand)
+            if key in reference['fees']:
+                return dict(reference['fees'][key])
         try:
             conn = self.get_connection()
             cursor = conn.cursor(dictionary=True)
@@ -160,14 +414,7 @@ class DatabaseManager:
             cursor.close()
 
             if result:
-                return {
-                    'enrollment_fee': float(result['enrollment_fee']),
-                    'miscellaneous_fee': float(result['miscellaneous_fee']),
-                    'tuition_fee': float(result['tuition_fee']),
-                    'special_fee': float(result['special_fee']),
-                    'total': float(result['enrollment_fee'] + result['miscellaneous_fee'] +
-                                 result['tuition_fee'] + result['special_fee'])
-                }
+                return self._fee_breakdown(result)
             else:
                 # Fallback default fees
                 return {
@@ -178,7 +425,7 @@ class DatabaseManager:
                     'total': 26500
                 }
         except Error as e:
-            print(f"Error fetching tuition fees: {e}")
+            logger.error(f"Error fetching tuition fees: {e}")
             return {
                 'enrollment_fee': 5000,
                 'miscellaneous_fee': 4500,
@@ -191,6 +438,7 @@ class DatabaseManager:
 
     def add_student(self, student_data):
         """Add new student to database - USES NEW COLUMN NAMES"""
+        conn = None
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
@@ -222,18 +470,23 @@ class DatabaseManager:
             )
 
             cursor.execute(query, values)
-            conn.commit()
             student_id = cursor.lastrowid
+            updated_at = self._updated_at(cursor, student_data['lrn'])
+            self._bump_versions(cursor, 'students')
+            conn.commit()
             cursor.close()
 
             self.log_action(None, 'ADD_STUDENT', f"Added student: {student_data['lrn']}")
+            changes.publish(STUDENT_ADDED, student_data['lrn'],
+                            **dict(student_data, status=student_data.get('status', 'Pending'), updated_at=updated_at))
             return student_id
 
         except Error as e:
-            conn.rollback()
+            if conn is not None:
+                conn.rollback()
             if "Duplicate entry" in str(e):
-                raise Exception(f"Student with LRN {student_data['lrn']} already exists")
-            raise Exception(f"Error adding student: {e}")
+                raise Exception(f"Student with LRN {student_data['lrn']} already exists") from e
+            raise Exception(f"Error adding student: {e}") from e
 
     def get_student_by_lrn(self, lrn):
         """Get student by LRN - RETURNS WITH UI-FRIENDLY ALIASES"""
@@ -259,35 +512,31 @@ class DatabaseManager:
             return result
 
         except Error as e:
-            print(f"Error retrieving student: {e}")
+            logger.error(f"Error retrieving student: {e}")
             return None
 
+    @cached_read('students', default=[])
     def get_all_students(self):
         """Get all students - RETURNS WITH UI-FRIENDLY ALIASES"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor(dictionary=True)
-
-            cursor.execute('''
-                SELECT 
-                    id, lrn, firstname, middlename, lastname, gender, birthdate,
-                    email, phone, address, 
-                    grade_level AS grade,
-                    track, strand,
-                    guardian_name, guardian_contact, 
-                    enrollment_status AS status,
-                    created_at, updated_at
-                FROM students 
-                ORDER BY created_at DESC
-            ''')
+        conn = self.get_connection()
+        cursor = conn.cursor(dictionary=True)
 
-            results = cursor.fetchall()
-            cursor.close()
-            return results
+        cursor.execute('''
+            SELECT 
+                id, lrn, firstname, middlename, lastname, gender, birthdate,
+                email, phone, address, 
+                grade_level AS grade,
+                track, strand,
+                guardian_name, guardian_contact, 
+                enrollment_status AS status,
+                created_at, updated_at
+            FROM students 
+            ORDER BY created_at DESC
+        ''')
 
-        except Error as e:
-            print(f"Error retrieving students: {e}")
-            return []
+        results = cursor.fetchall()
+        cursor.close()
+        return results
 
     def update_student(self, lrn, student_data):
         """Update student information - USES NEW COLUMN NAMES"""
@@ -331,10 +580,14 @@ class DatabaseManager:
             )
 
             cursor.execute(query, values)
+            updated_at = self._updated_at(cursor, lrn)
+            self._bump_versions(cursor, 'students')
             conn.commit()
             cursor.close()
 
             self.log_action(None, 'UPDATE_STUDENT', f"Updated student: {lrn}")
+            fields = {key: value for key, value in student_data.items() if key != 'status'}
+            changes.publish(STUDENT_UPDATED, lrn, **dict(fields, updated_at=updated_at))
             return True
 
         except Error as e:
@@ -357,10 +610,12 @@ class DatabaseManager:
                 cursor.execute('DELETE FROM payments WHERE student_id = %s', (student_id,))
                 # Delete student
                 cursor.execute('DELETE FROM students WHERE lrn = %s', (lrn,))
+                self._bump_versions(cursor, 'students', 'payments')
                 conn.commit()
 
                 self.log_action(None, 'DELETE_STUDENT', f"Deleted student: {lrn}")
                 cursor.close()
+                changes.publish(STUDENT_DELETED, lrn)
                 return True
 
             cursor.close()
@@ -382,9 +637,12 @@ class DatabaseManager:
                 WHERE lrn = %s
             ''', (status, lrn))
 
+            updated_at = self._updated_at(cursor, lrn)
+            self._bump_versions(cursor, 'students')
             conn.commit()
             cursor.close()
             self.log_action(None, 'UPDATE_STATUS', f"Changed status for {lrn} to {status}")
+            changes.publish(STATUS_CHANGED, lrn, status=status, updated_at=updated_at)
 
         except Error as e:
             conn.rollback()
@@ -427,8 +685,9 @@ class DatabaseManager:
                 WHERE lrn = %s
             ''', (payment_data['student_data']['lrn'],))
 
-            conn.commit()
             payment_id = cursor.lastrowid
+            self._bump_versions(cursor, 'payments', 'students')
+            conn.commit()
             cursor.close()
 
             self.log_action(None, 'ADD_PAYMENT',
@@ -456,7 +715,7 @@ class DatabaseManager:
             return results
 
         except Error as e:
-            print(f"Error retrieving payments: {e}")
+            logger.error(f"Error retrieving payments: {e}")
             return []
 
     # ==================== USER OPERATIONS ====================
@@ -500,6 +759,8 @@ class DatabaseManager:
                                         SET last_login = CURRENT_TIMESTAMP
                                         WHERE id = %s
                                         ''', (result['id'],))
+                        # No version bump: no cached read shows last_login, and
+                        # every login would otherwise drop the cached staff lists
                         conn2.commit()
                         cursor2.close()
                     except:
@@ -518,7 +779,7 @@ class DatabaseManager:
                 return None
 
         except Exception as e:
-            print(f"Error authenticating user: {e}")
+            logger.error(f"Error authenticating user: {e}")
             import traceback
             traceback.print_exc()
             return None
@@ -539,11 +800,12 @@ class DatabaseManager:
                            VALUES (%s, %s, %s, %s)
                            ''', (email, password_hash, role, full_name))
 
-            conn.commit()
             user_id = cursor.lastrowid
+            self._bump_versions(cursor, 'users')
+            conn.commit()
             cursor.close()
 
-            self.log_action(None, 'ADD_USER', 'CREATE', f"Added user: {email}")
+            self.log_action(None, 'ADD_USER', f"Added user: {email}")
             return user_id
 
         except Error as e:
@@ -554,189 +816,157 @@ class DatabaseManager:
 
     # ==================== ANALYTICS & STATISTICS ====================
 
+    @cached_read('students', 'payments', default={
+        'total_students': 0,
+        'enrolled': 0,
+        'pending': 0,
+        'total_revenue': 0.0
+    })
     def get_statistics(self):
         """Get key system statistics - USES NEW COLUMN NAMES"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            # Total students
-            cursor.execute('SELECT COUNT(*) FROM students')
-            total_students = cursor.fetchone()[0]
+        # Total students
+        cursor.execute('SELECT COUNT(*) FROM students')
+        total_students = cursor.fetchone()[0]
 
-            # Enrolled students
-            cursor.execute("SELECT COUNT(*) FROM students WHERE enrollment_status = 'Enrolled'")
-            enrolled = cursor.fetchone()[0]
+        # Enrolled students
+        cursor.execute("SELECT COUNT(*) FROM students WHERE enrollment_status = 'Enrolled'")
+        enrolled = cursor.fetchone()[0]
 
-            # Pending students
-            cursor.execute("SELECT COUNT(*) FROM students WHERE enrollment_status = 'Pending'")
-            pending = cursor.fetchone()[0]
+        # Pending students
+        cursor.execute("SELECT COUNT(*) FROM students WHERE enrollment_status = 'Pending'")
+        pending = cursor.fetchone()[0]
 
-            # Total revenue
-            cursor.execute('SELECT SUM(amount) FROM payments')
-            total_revenue = cursor.fetchone()[0] or 0.0
+        # Total revenue
+        cursor.execute('SELECT SUM(amount) FROM payments')
+        total_revenue = cursor.fetchone()[0] or 0.0
 
-            cursor.close()
-
-            return {
-                'total_students': total_students,
-                'enrolled': enrolled,
-                'pending': pending,
-                'total_revenue': float(total_revenue)
-            }
+        cursor.close()
 
-        except Error as e:
-            print(f"Error retrieving statistics: {e}")
-            return {
-                'total_students': 0,
-                'enrolled': 0,
-                'pending': 0,
-                'total_revenue': 0.0
-            }
+        return {
+            'total_students': total_students,
+            'enrolled': enrolled,
+            'pending': pending,
+            'total_revenue': float(total_revenue)
+        }
 
+    @cached_read('students', default=[])
     def get_gender_distribution(self):
         """Return list of (gender, count)"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT gender, COUNT(*) 
-                FROM students 
-                WHERE gender IS NOT NULL AND TRIM(gender) != ''
-                GROUP BY gender
-            ''')
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            results = cursor.fetchall()
-            cursor.close()
-            return [(row[0], row[1]) for row in results]
+        cursor.execute('''
+            SELECT gender, COUNT(*) 
+            FROM students 
+            WHERE gender IS NOT NULL AND TRIM(gender) != ''
+            GROUP BY gender
+        ''')
 
-        except Error as e:
-            print(f"Error getting gender distribution: {e}")
-            return []
+        results = cursor.fetchall()
+        cursor.close()
+        return [(row[0], row[1]) for row in results]
 
+    @cached_read('students', default={})
     def count_by_track(self):
         """Return dict {track: count}"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('SELECT track, COUNT(*) FROM students GROUP BY track')
-            result = dict(cursor.fetchall())
-            cursor.close()
-            return result
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-        except Error as e:
-            print(f"Error counting by track: {e}")
-            return {}
+        cursor.execute('SELECT track, COUNT(*) FROM students GROUP BY track')
+        result = dict(cursor.fetchall())
+        cursor.close()
+        return result
 
+    @cached_read('students', default={})
     def count_by_grade(self):
         """Return dict {grade: count} - USES NEW COLUMN NAME"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT grade_level, COUNT(*) 
-                FROM students 
-                GROUP BY grade_level
-                ORDER BY grade_level
-            ''')
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            result = dict(cursor.fetchall())
-            cursor.close()
-            return result
+        cursor.execute('''
+            SELECT grade_level, COUNT(*) 
+            FROM students 
+            GROUP BY grade_level
+            ORDER BY grade_level
+        ''')
 
-        except Error as e:
-            print(f"Error counting by grade: {e}")
-            return {}
+        result = dict(cursor.fetchall())
+        cursor.close()
+        return result
 
+    @cached_read('students', default={"Unspecified": 0})
     def count_by_strand(self, top_n=None):
         """Return dict {strand: count}"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            query = '''
-                SELECT strand, COUNT(*) as c 
-                FROM students 
-                WHERE strand IS NOT NULL AND strand != ''
-                GROUP BY strand 
-                ORDER BY c DESC
-            '''
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            if top_n:
-                query += f' LIMIT {int(top_n)}'
+        query = '''
+            SELECT strand, COUNT(*) as c 
+            FROM students 
+            WHERE strand IS NOT NULL AND strand != ''
+            GROUP BY strand 
+            ORDER BY c DESC
+        '''
 
-            cursor.execute(query)
-            result = dict(cursor.fetchall())
-            cursor.close()
-            return result or {"Unspecified": 0}
+        if top_n:
+            query += f' LIMIT {int(top_n)}'
 
-        except Error as e:
-            print(f"Error counting by strand: {e}")
-            return {"Unspecified": 0}
+        cursor.execute(query)
+        result = dict(cursor.fetchall())
+        cursor.close()
+        return result or {"Unspecified": 0}
 
+    @cached_read('students', default={})
     def count_enrollment_status(self):
         """Return dict {status: count} - USES NEW COLUMN NAME"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT enrollment_status, COUNT(*) 
-                FROM students
-                GROUP BY enrollment_status
-            ''')
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            result = dict(cursor.fetchall())
-            cursor.close()
-            return result
+        cursor.execute('''
+            SELECT enrollment_status, COUNT(*) 
+            FROM students
+            GROUP BY enrollment_status
+        ''')
 
-        except Error as e:
-            print(f"Error counting enrollment status: {e}")
-            return {}
+        result = dict(cursor.fetchall())
+        cursor.close()
+        return result
 
+    @cached_read('students', default=[])
     def get_grade_distribution(self):
         """Return list of (grade_level, count) - USES NEW COLUMN NAME"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT grade_level, COUNT(*) 
-                FROM students 
-                GROUP BY grade_level
-                ORDER BY grade_level
-            ''')
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            results = cursor.fetchall()
-            cursor.close()
-            return [(row[0], row[1]) for row in results]
+        cursor.execute('''
+            SELECT grade_level, COUNT(*) 
+            FROM students 
+            GROUP BY grade_level
+            ORDER BY grade_level
+        ''')
 
-        except Error as e:
-            print(f"Error getting grade distribution: {e}")
-            return []
+        results = cursor.fetchall()
+        cursor.close()
+        return [(row[0], row[1]) for row in results]
 
+    @cached_read('students', default=[])
     def get_enrollment_status_distribution(self):
         """Return list of (status, count) - USES NEW COLUMN NAME"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT enrollment_status, COUNT(*) 
-                FROM students 
-                GROUP BY enrollment_status
-            ''')
+        conn = self.get_connection()
+        cursor = conn.cursor()
 
-            results = cursor.fetchall()
-            cursor.close()
-            return [(row[0], row[1]) for row in results]
+        cursor.execute('''
+            SELECT enrollment_status, COUNT(*) 
+            FROM students 
+            GROUP BY enrollment_status
+        ''')
 
-        except Error as e:
-            print(f"Error getting enrollment status distribution: {e}")
-            return []
+        results = cursor.fetchall()
+        cursor.close()
+        return [(row[0], row[1]) for row in results]
 
     # ==================== AUDIT LOG ====================
 
@@ -760,7 +990,7 @@ class DatabaseManager:
             cursor.close()
 
         except Error as e:
-            print(f"Error logging action: {e}")
+            logger.error(f"Error logging action: {e}")
 
     def get_audit_log(self, limit=100):
         """Get audit log entries - Uses user_email column"""
@@ -780,7 +1010,7 @@ class DatabaseManager:
             return results
 
         except Error as e:
-            print(f"Error retrieving audit log: {e}")
+            logger.error(f"Error retrieving audit log: {e}")
             return []
     # ==================== SEARCH & FILTER ====================
 
@@ -810,7 +1040,7 @@ class DatabaseManager:
             return results
 
         except Error as e:
-            print(f"Error searching students: {e}")
+            logger.error(f"Error searching students: {e}")
             return []
 
     def filter_students(self, grade=None, track=None, status=None):
@@ -853,197 +1083,180 @@ class DatabaseManager:
             return results
 
         except Error as e:
-            print(f"Error filtering students: {e}")
+            logger.error(f"Error filtering students: {e}")
             return []
 
-def add_payment_with_receipt(self, payment_data, receipt_number):
-    """Record payment with receipt number"""
-    try:
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        # Get student ID
-        cursor.execute('SELECT id FROM students WHERE lrn = %s',
-                       (payment_data['student_data']['lrn'],))
-        result = cursor.fetchone()
-
-        if not result:
-            cursor.close()
-            raise Exception("Student not found")
-
-        student_id = result[0]
+    # ==================== RECEIPT OPERATIONS ====================
 
-        # Check if receipt_number column exists, if not add it
+    def add_payment_with_receipt(self, payment_data, receipt_number):
+        """Record payment with receipt number"""
+        conn = None
         try:
-            cursor.execute('''
-                           ALTER TABLE payments
-                               ADD COLUMN receipt_number VARCHAR(50) NULL AFTER payment_method
-                           ''')
-            conn.commit()
-            print("✅ Added receipt_number column to payments table")
-        except:
-            pass  # Column already exists
-
-        # Insert payment with receipt number
-        cursor.execute('''
-                       INSERT INTO payments
-                           (student_id, lrn, amount, payment_method, receipt_number)
-                       VALUES (%s, %s, %s, %s, %s)
-                       ''', (
-                           student_id,
-                           payment_data['student_data']['lrn'],
-                           payment_data['amount'],
-                           payment_data['payment_method'],
-                           receipt_number
-                       ))
-
-        # Update enrollment status to Enrolled
-        cursor.execute('''
-                       UPDATE students
-                       SET enrollment_status = 'Enrolled'
-                       WHERE lrn = %s
-                       ''', (payment_data['student_data']['lrn'],))
+            conn = self.get_connection()
+            cursor = conn.cursor()
 
-        conn.commit()
-        payment_id = cursor.lastrowid
-        cursor.close()
+            # Get student ID
+            cursor.execute('SELECT id FROM students WHERE lrn = %s',
+                           (payment_data['student_data']['lrn'],))
+            result = cursor.fetchone()
 
-        self.log_action(None, 'ADD_PAYMENT',
-                        f"Payment received for LRN: {payment_data['student_data']['lrn']}, Receipt: {receipt_number}")
-        return payment_id
+            if not result:
+                cursor.close()
+                raise Exception("Student not found")
 
-    except Exception as e:
-        conn.rollback()
-        raise Exception(f"Error adding payment: {e}")
+            student_id = result[0]
 
+            # Check if receipt_number column exists, if not add it
+            try:
+                cursor.execute('''
+                               ALTER TABLE payments
+                                   ADD COLUMN receipt_number VARCHAR(50) NULL AFTER payment_method
+                               ''')
+                conn.commit()
+                logger.info("✅ Added receipt_number column to payments table")
+            except:
+                pass  # Column already exists
 
-def get_receipt_by_number(self, receipt_number):
-    """Get payment details by receipt number"""
-    try:
-        conn = self.get_connection()
-        cursor = conn.cursor(dictionary=True)
+            # Insert payment with receipt number
+            cursor.execute('''
+                           INSERT INTO payments
+                               (student_id, lrn, amount, payment_method, receipt_number)
+                           VALUES (%s, %s, %s, %s, %s)
+                           ''', (
+                               student_id,
+                               payment_data['student_data']['lrn'],
+                               payment_data['amount'],
+                               payment_data['payment_method'],
+                               receipt_number
+                           ))
 
-        cursor.execute('''
-                       SELECT p.*,
-                              s.firstname,
-                              s.middlename,
-                              s.lastname,
-                              s.lrn,
-                              s.grade_level AS grade,
-                              s.track,
-                              s.strand,
-                              s.email,
-                              s.phone
-                       FROM payments p
-                                JOIN students s ON p.student_id = s.id
-                       WHERE p.receipt_number = %s
-                       ''', (receipt_number,))
-
-        result = cursor.fetchone()
-        cursor.close()
-        return result
+            # Update enrollment status to Enrolled
+            cursor.execute('''
+                           UPDATE students
+                           SET enrollment_status = 'Enrolled'
+                           WHERE lrn = %s
+                           ''', (payment_data['student_data']['lrn'],))
 
-    except Exception as e:
-        print(f"Error retrieving receipt: {e}")
-        return None
+            payment_id = cursor.lastrowid
+            updated_at = self._updated_at(cursor, payment_data['student_data']['lrn'])
+            self._bump_versions(cursor, 'payments', 'students')
+            conn.commit()
+            cursor.close()
 
+            self.log_action(None, 'ADD_PAYMENT',
+                            f"Payment received for LRN: {payment_data['student_data']['lrn']}, Receipt: {receipt_number}")
+            changes.publish(PAYMENT_RECORDED, payment_data['student_data']['lrn'], status='Enrolled',
+                            amount=payment_data['amount'], receipt_number=receipt_number, updated_at=updated_at)
+            return payment_id
 
-def get_all_receipts(self, limit=100):
-    """Get all payment receipts"""
-    try:
-        conn = self.get_connection()
-        cursor = conn.cursor(dictionary=True)
+        except Exception as e:
+            if conn is not None:
+                conn.rollback()
+            raise Exception(f"Error adding payment: {e}") from e
 
-        cursor.execute('''
-                       SELECT p.receipt_number,
-                              p.amount,
-                              p.payment_method,
-                              p.payment_date,
-                              s.firstname,
-                              s.lastname,
-                              s.lrn
-                       FROM payments p
-                                JOIN students s ON p.student_id = s.id
-                       WHERE p.receipt_number IS NOT NULL
-                       ORDER BY p.payment_date DESC
-                           LIMIT %s
-                       ''', (limit,))
 
-        results = cursor.fetchall()
-        cursor.close()
-        return results
+    def get_receipt_by_number(self, receipt_number):
+        """Get payment details by receipt number"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
 
-    except Exception as e:
-        print(f"Error retrieving receipts: {e}")
-        return []
+            cursor.execute('''
+                           SELECT p.*,
+                                  s.firstname,
+                                  s.middlename,
+                                  s.lastname,
+                                  s.lrn,
+                                  s.grade_level AS grade,
+                                  s.track,
+                                  s.strand,
+                                  s.email,
+                                  s.phone
+                           FROM payments p
+                                    JOIN students s ON p.student_id = s.id
+                           WHERE p.receipt_number = %s
+                           ''', (receipt_number,))
 
+            result = cursor.fetchone()
+            cursor.close()
+            return result
 
-def search_receipt(self, search_query):
-    """Search receipts by receipt number, LRN, or student name"""
-    try:
-        conn = self.get_connection()
-        cursor = conn.cursor(dictionary=True)
+        except Exception as e:
+            logger.error(f"Error retrieving receipt: {e}")
+            return None
 
-        search_pattern = f"%{search_query}%"
 
-        cursor.execute('''
-                       SELECT p.receipt_number,
-                              p.amount,
-                              p.payment_method,
-                              p.payment_date,
-                              s.firstname,
-                              s.lastname,
-                              s.lrn,
-                              s.grade_level AS grade,
-                              s.track
-                       FROM payments p
-                                JOIN students s ON p.student_id = s.id
-                       WHERE p.receipt_number LIKE %s
-                          OR s.lrn LIKE %s
-                          OR s.firstname LIKE %s
-                          OR s.lastname LIKE %s
-                       ORDER BY p.payment_date DESC LIMIT 50
-                       ''', (search_pattern, search_pattern, search_pattern, search_pattern))
+    def get_all_receipts(self, limit=100):
+        """Get all payment receipts"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
 
-        results = cursor.fetchall()
-        cursor.close()
-        return results
+            cursor.execute('''
+                           SELECT p.receipt_number,
+                                  p.amount,
+                                  p.payment_method,
+                                  p.payment_date,
+                                  s.firstname,
+                                  s.lastname,
+                                  s.lrn
+                           FROM payments p
+                                    JOIN students s ON p.student_id = s.id
+                           WHERE p.receipt_number IS NOT NULL
+                           ORDER BY p.payment_date DESC
+                               LIMIT %s
+                           ''', (limit,))
 
-    except Exception as e:
-        print(f"Error searching receipts: {e}")
-        return []
+            results = cursor.fetchall()
+            cursor.close()
+            return results
 
-# ==================== SINGLETON INSTANCE ====================
+        except Exception as e:
+            logger.error(f"Error retrieving receipts: {e}")
+            return []
 
-_db_instance = None
 
+    def search_receipt(self, search_query):
+        """Search receipts by receipt number, LRN, or student name"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor(dictionary=True)
 
-def get_database(host="127.0.0.1", user="root", password="", database="enrollify_db"):
-    """Get database manager singleton instance"""
-    global _db_instance
-    if _db_instance is None:
-        _db_instance = DatabaseManager(host=host, user=user, password=password, database=database)
-    return _db_instance
+            search_pattern = f"%{search_query}%"
 
+            cursor.execute('''
+                           SELECT p.receipt_number,
+                                  p.amount,
+                                  p.payment_method,
+                                  p.payment_date,
+                                  s.firstname,
+                                  s.lastname,
+                                  s.lrn,
+                                  s.grade_level AS grade,
+                                  s.track
+                           FROM payments p
+                                    JOIN students s ON p.student_id = s.id
+                           WHERE p.receipt_number LIKE %s
+                              OR s.lrn LIKE %s
+                              OR s.firstname LIKE %s
+                              OR s.lastname LIKE %s
+                           ORDER BY p.payment_date DESC LIMIT 50
+                           ''', (search_pattern, search_pattern, search_pattern, search_pattern))
 
-def close_database():
-    """Close database connection"""
-    global _db_instance
-    if _db_instance is not None:
-        _db_instance.close_connection()
-        _db_instance = None
+            results = cursor.fetchall()
+            cursor.close()
+            return results
 
+        except Exception as e:
+            logger.error(f"Error searching receipts: {e}")
+            return []
 
-# ============================================
-# ADD THESE METHODS TO database_manager_mysql.py
-# Paste at the end of the DatabaseManager class
-# ============================================
 
-# ==================== STAFF ASSIGNMENT METHODS ====================
+    # ==================== STAFF ASSIGNMENT METHODS ====================
 
-def get_students_by_staff(self, staff_id):
-    """Get all students assigned to a specific staff member"""
-    try:
+    @cached_read('students', default=[])
+    def get_students_by_staff(self, staff_id):
+        """Get all students assigned to a specific staff member"""
         conn = self.get_connection()
         cursor = conn.cursor(dictionary=True)
 
@@ -1077,68 +1290,71 @@ def get_students_by_staff(self, staff_id):
         cursor.close()
         return results
 
-    except Exception as e:
-        print(f"Error getting students by staff: {e}")
-        return []
-
 
-def assign_student_to_staff(self, student_lrn, staff_id, staff_email):
-    """Assign a student to a staff member"""
-    try:
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute('''
-                       UPDATE students
-                       SET assigned_staff_id    = %s,
-                           assigned_staff_email = %s
-                       WHERE lrn = %s
-                       ''', (staff_id, staff_email, student_lrn))
-
-        conn.commit()
-        cursor.close()
+    def assign_student_to_staff(self, student_lrn, staff_id, staff_email):
+        """Assign a student to a staff member"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
 
-        self.log_action(
-            staff_email,
-            'ASSIGN_STUDENT',
-            f"Assigned student {student_lrn} to staff {staff_email}"
-        )
-        return True
+            cursor.execute('''
+                           UPDATE students
+                           SET assigned_staff_id    = %s,
+                               assigned_staff_email = %s
+                           WHERE lrn = %s
+                           ''', (staff_id, staff_email, student_lrn))
+
+            updated_at = self._updated_at(cursor, student_lrn)
+            self._bump_versions(cursor, 'students')
+            conn.commit()
+            cursor.close()
 
-    except Exception as e:
-        conn.rollback()
-        print(f"Error assigning student: {e}")
-        return False
+            self.log_action(
+                staff_email,
+                'ASSIGN_STUDENT',
+                f"Assigned student {student_lrn} to staff {staff_email}"
+            )
+            changes.publish(STUDENT_ASSIGNED, student_lrn, staff_id=staff_id, staff_email=staff_email,
+                            updated_at=updated_at)
+            return True
 
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error assigning student: {e}")
+            return False
 
-def unassign_student_from_staff(self, student_lrn):
-    """Remove staff assignment from a student"""
-    try:
-        conn = self.get_connection()
-        cursor = conn.cursor()
 
-        cursor.execute('''
-                       UPDATE students
-                       SET assigned_staff_id    = NULL,
-                           assigned_staff_email = NULL
-                       WHERE lrn = %s
-                       ''', (student_lrn,))
+    def unassign_student_from_staff(self, student_lrn):
+        """Remove staff assignment from a student"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
 
-        conn.commit()
-        cursor.close()
+            cursor.execute('''
+                           UPDATE students
+                           SET assigned_staff_id    = NULL,
+                               assigned_staff_email = NULL
+                           WHERE lrn = %s
+                           ''', (student_lrn,))
+
+            updated_at = self._updated_at(cursor, student_lrn)
+            self._bump_versions(cursor, 'students')
+            conn.commit()
+            cursor.close()
 
-        self.log_action(None, 'UNASSIGN_STUDENT', f"Removed staff assignment for {student_lrn}")
-        return True
+            self.log_action(None, 'UNASSIGN_STUDENT', f"Removed staff assignment for {student_lrn}")
+            changes.publish(STUDENT_ASSIGNED, student_lrn, staff_id=None, staff_email=None, updated_at=updated_at)
+            return True
 
-    except Exception as e:
-        conn.rollback()
-        print(f"Error unassigning student: {e}")
-        return False
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error unassigning student: {e}")
+            return False
 
 
-def get_unassigned_students(self):
-    """Get all students not assigned to any staff"""
-    try:
+    @cached_read('students', default=[])
+    def get_unassigned_students(self):
+        """Get all students not assigned to any staff"""
         conn = self.get_connection()
         cursor = conn.cursor(dictionary=True)
 
@@ -1170,14 +1386,10 @@ def get_unassigned_students(self):
         cursor.close()
         return results
 
-    except Exception as e:
-        print(f"Error getting unassigned students: {e}")
-        return []
-
 
-def get_all_staff_users(self):
-    """Get all staff users"""
-    try:
+    @cached_read('users', default=[])
+    def get_all_staff_users(self):
+        """Get all staff users"""
         conn = self.get_connection()
         cursor = conn.cursor(dictionary=True)
 
@@ -1193,14 +1405,10 @@ def get_all_staff_users(self):
         cursor.close()
         return results
 
-    except Exception as e:
-        print(f"Error getting staff users: {e}")
-        return []
-
 
-def get_staff_student_count(self, staff_id):
-    """Get count of students assigned to a staff member"""
-    try:
+    @cached_read('students', default=0)
+    def get_staff_student_count(self, staff_id):
+        """Get count of students assigned to a staff member"""
         conn = self.get_connection()
         cursor = conn.cursor()
 
@@ -1214,38 +1422,52 @@ def get_staff_student_count(self, staff_id):
         cursor.close()
         return count
 
-    except Exception as e:
-        print(f"Error counting staff students: {e}")
-        return 0
-
-
-# ==================== STAFF SUBJECTS METHODS ====================
-
-def add_staff_subject(self, staff_id, staff_email, subject_name, grade_level=None, track=None):
-    """Add a subject that a staff member teaches"""
-    try:
+    @cached_read('students', default={})
+    def count_students_by_staff(self):
+        """Return dict {staff_id: count} of assigned students in one query"""
         conn = self.get_connection()
         cursor = conn.cursor()
 
         cursor.execute('''
-                       INSERT INTO staff_subjects (staff_id, staff_email, subject_name, grade_level, track)
-                       VALUES (%s, %s, %s, %s, %s)
-                       ''', (staff_id, staff_email, subject_name, grade_level, track))
+                       SELECT assigned_staff_id, COUNT(*)
+                       FROM students
+                       WHERE assigned_staff_id IS NOT NULL
+                       GROUP BY assigned_staff_id
+                       ''')
 
-        conn.commit()
-        subject_id = cursor.lastrowid
+        result = dict(cursor.fetchall())
         cursor.close()
-        return subject_id
+        return result
 
-    except Exception as e:
-        conn.rollback()
-        print(f"Error adding staff subject: {e}")
-        return None
 
+    # ==================== STAFF SUBJECTS METHODS ====================
+
+    def add_staff_subject(self, staff_id, staff_email, subject_name, grade_level=None, track=None):
+        """Add a subject that a staff member teaches"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                           INSERT INTO staff_subjects (staff_id, staff_email, subject_name, grade_level, track)
+                           VALUES (%s, %s, %s, %s, %s)
+                           ''', (staff_id, staff_email, subject_name, grade_level, track))
+
+            subject_id = cursor.lastrowid
+            self._bump_versions(cursor, 'staff_subjects')
+            conn.commit()
+            cursor.close()
+            return subject_id
 
-def get_staff_subjects(self, staff_id):
-    """Get all subjects a staff member teaches"""
-    try:
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error adding staff subject: {e}")
+            return None
+
+
+    @cached_read('staff_subjects', default=[])
+    def get_staff_subjects(self, staff_id):
+        """Get all subjects a staff member teaches"""
         conn = self.get_connection()
         cursor = conn.cursor(dictionary=True)
 
@@ -1260,23 +1482,42 @@ def get_staff_subjects(self, staff_id):
         cursor.close()
         return results
 
-    except Exception as e:
-        print(f"Error getting staff subjects: {e}")
-        return []
 
+    def delete_staff_subject(self, subject_id):
+        """Delete a staff subject"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
 
-def delete_staff_subject(self, subject_id):
-    """Delete a staff subject"""
-    try:
-        conn = self.get_connection()
-        cursor = conn.cursor()
+            cursor.execute('DELETE FROM staff_subjects WHERE id = %s', (subject_id,))
+            self._bump_versions(cursor, 'staff_subjects')
+            conn.commit()
+            cursor.close()
+            return True
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error deleting staff subject: {e}")
+            return False
+
+
+# ==================== SINGLETON INSTANCE ====================
+
+_db_instance = None
 
-        cursor.execute('DELETE FROM staff_subjects WHERE id = %s', (subject_id,))
-        conn.commit()
-        cursor.close()
-        return True
 
-    except Exception as e:
-        conn.rollback()
-        print(f"Error deleting staff subject: {e}")
-        return False
\ No newline at end of file
+def get_database(host="127.0.0.1", user="root", password="", database="enrollify_db", connect=True):
+    """Get database manager singleton instance"""
+    global _db_instance
+    if _db_instance is None:
+        _db_instance = DatabaseManager(host=host, user=user, password=password, database=database,
+                                       connect=connect)
+    return _db_instance
+
+
+def close_database():
+    """Close database connection"""
+    global _db_instance
+    if _db_instance is not None:
+        _db_instance.close_connection()
+        _db_instance = None
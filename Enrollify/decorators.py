@@ -5,8 +5,13 @@ Makes code cleaner and more maintainable
 
 import functools
 import logging
+import time
 from PyQt6.QtWidgets import QMessageBox
 
+from metrics import registry as metrics
+from query_budget import action_scope
+from profiler import profile_block
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +21,7 @@ def safe_database_operation(operation_name: str):
 
     Catches errors and shows user-friendly messages
     Logs all errors for debugging
+    Records latency and errors in the metrics registry under operation_name
 
     Args:
         operation_name: Description of the operation (e.g., "Load Students")
@@ -30,11 +36,15 @@ def safe_database_operation(operation_name: str):
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            started = time.perf_counter()
             try:
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
+                metrics.observe(operation_name, (time.perf_counter() - started) * 1000)
+                return result
 
             except ValueError as e:
                 # User-friendly errors (like duplicate LRN)
+                metrics.observe(operation_name, (time.perf_counter() - started) * 1000, error=True)
                 logger.warning(f"{operation_name} - Validation error: {e}")
                 QMessageBox.warning(
                     None,
@@ -45,6 +55,7 @@ def safe_database_operation(operation_name: str):
 
             except ConnectionError as e:
                 # Database connection errors
+                metrics.observe(operation_name, (time.perf_counter() - started) * 1000, error=True)
                 logger.error(f"{operation_name} - Connection error: {e}")
                 QMessageBox.critical(
                     None,
@@ -56,6 +67,7 @@ def safe_database_operation(operation_name: str):
 
             except Exception as e:
                 # Unexpected errors
+                metrics.observe(operation_name, (time.perf_counter() - started) * 1000, error=True)
                 logger.error(
                     f"{operation_name} - Unexpected error: {e}",
                     exc_info=True
@@ -89,6 +101,7 @@ def require_authentication(func):
     def wrapper(self, *args, **kwargs):
         if not hasattr(self, 'current_user') or self.current_user is None:
             logger.warning(f"Unauthenticated access attempt to {func.__name__}")
+            metrics.increment(f"unauthenticated:{func.__name__}")
             QMessageBox.warning(
                 self,
                 "Authentication Required",
@@ -118,6 +131,7 @@ def require_role(*allowed_roles):
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
             if not hasattr(self, 'current_user') or self.current_user is None:
+                metrics.increment(f"unauthenticated:{func.__name__}")
                 QMessageBox.warning(
                     self,
                     "Authentication Required",
@@ -130,6 +144,7 @@ def require_role(*allowed_roles):
                 logger.warning(
                     f"Unauthorized access attempt by {user_role} to {func.__name__}"
                 )
+                metrics.increment(f"access_denied:{func.__name__}")
                 QMessageBox.warning(
                     self,
                     "Access Denied",
@@ -162,14 +177,108 @@ def log_operation(operation_type: str):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             logger.info(f"Starting operation: {operation_type}")
+            started = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                logger.info(f"Completed operation: {operation_type}")
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                metrics.observe(operation_type, elapsed_ms)
+                logger.info(f"Completed operation: {operation_type} ({elapsed_ms:.0f} ms)")
                 return result
             except Exception as e:
+                metrics.observe(operation_type, (time.perf_counter() - started) * 1000, error=True)
                 logger.error(f"Failed operation: {operation_type} - {e}")
                 raise
 
         return wrapper
 
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def track_latency(operation_name: str):
+    """
+    Decorator that only measures: records latency, call count and errors
+    under operation_name and lets exceptions through unchanged
+
+    Args:
+        operation_name: Metric name (e.g., "enrollment_submit")
+
+    Example:
+        @track_latency("payment_post")
+        def save_payment(self, payment_data):
+            return self.db.add_payment_with_receipt(...)
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                metrics.observe(operation_name, (time.perf_counter() - started) * 1000, error=True)
+                raise
+            metrics.observe(operation_name, (time.perf_counter() - started) * 1000)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def query_budget(action_name: str, budget: int = None):
+    """
+    Decorator that counts the queries a user action issues and warns when
+    it goes over budget or repeats a statement shape (N+1)
+
+    Args:
+        action_name: Action label used in the warning (e.g., "staff.update_status")
+        budget: Maximum round-trips (defaults to Config.QUERY_BUDGET)
+
+    Note:
+        Connect buttons through a lambda - Qt passes the `checked` argument
+        to a decorated slot.
+
+    Example:
+        @query_budget("admin.export_data")
+        def export_data(self):
+            ...
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with action_scope(action_name, budget):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def profiled(operation_name: str):
+    """
+    Decorator that runs the function under cProfile when profiling is on
+    (ENROLLIFY_PROFILE or Ctrl+Shift+P on the admin screen)
+
+    Args:
+        operation_name: Used in the profile file names (e.g., "payment_post")
+
+    Note:
+        Connect buttons through a lambda - Qt passes the `checked` argument
+        to a decorated slot.
+
+    Example:
+        @profiled("reports.refresh_data")
+        def refresh_data(self):
+            ...
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_block(operation_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -5,8 +5,17 @@ Run this FIRST to identify all problems preventing your system from running
 
 import sys
 import os
+import json
+import platform
+import subprocess
+import time
+from datetime import datetime
 from pathlib import Path
 
+# --performance adds timing, index and EXPLAIN checks; --report PATH sets the JSON file
+PERFORMANCE_MODE = '--performance' in sys.argv
+REPORT_PATH = sys.argv[sys.argv.index('--report') + 1] if '--report' in sys.argv[:-1] else None
+
 print("=" * 80)
 print("🔍 ENROLLIFY SYSTEM DIAGNOSTIC")
 print("=" * 80)
@@ -201,6 +210,227 @@ for module_name, class_name in components_to_test:
         print(f"❌ {module_name}.{class_name} - Error: {e}")
         issues.append(f"ERROR: {module_name}.{class_name} - {e}")
 
+# ============================================================================
+# TEST 9: Performance (python diagnostic_complete.py --performance)
+# ============================================================================
+performance = {}
+
+# Indexes the dashboard and portal queries rely on: table -> [(leading columns, suggested name)]
+EXPECTED_INDEXES = {
+    'students': [
+        (('lrn',), 'idx_lrn'),
+        (('enrollment_status',), 'idx_status'),
+        (('assigned_staff_id',), 'idx_assigned_staff'),
+        (('created_at',), 'idx_created_at'),
+        (('updated_at',), 'idx_updated_at'),
+    ],
+    'payments': [
+        (('student_id',), 'fk_payment_student'),
+        (('lrn',), 'idx_lrn'),
+        (('receipt_number',), 'idx_receipt_number'),
+        (('payment_date',), 'idx_payment_date'),
+    ],
+    'users': [(('email',), 'idx_email')],
+    'strands': [(('track',), 'idx_track')],
+    'audit_log': [(('timestamp',), 'idx_timestamp')],
+    'staff_subjects': [(('staff_id',), 'idx_staff')],
+}
+
+# The statements behind the admin dashboard, analytics and staff tabs
+DASHBOARD_QUERIES = [
+    ('total_students', "SELECT COUNT(*) FROM students"),
+    ('count_enrolled', "SELECT COUNT(*) FROM students WHERE enrollment_status = 'Enrolled'"),
+    ('total_revenue', "SELECT SUM(amount) FROM payments"),
+    ('count_by_track', "SELECT track, COUNT(*) FROM students GROUP BY track"),
+    ('count_by_grade', "SELECT grade_level, COUNT(*) FROM students GROUP BY grade_level ORDER BY grade_level"),
+    ('count_by_strand', "SELECT strand, COUNT(*) AS c FROM students WHERE strand IS NOT NULL AND strand != '' "
+                        "GROUP BY strand ORDER BY c DESC"),
+    ('count_enrollment_status', "SELECT enrollment_status, COUNT(*) FROM students GROUP BY enrollment_status"),
+    ('gender_distribution', "SELECT gender, COUNT(*) FROM students WHERE gender IS NOT NULL "
+                            "AND TRIM(gender) != '' GROUP BY gender"),
+    ('recent_enrollments', "SELECT COUNT(*) FROM students WHERE created_at >= NOW() - INTERVAL 30 DAY"),
+    ('count_students_by_staff', "SELECT assigned_staff_id, COUNT(*) FROM students "
+                                "WHERE assigned_staff_id IS NOT NULL GROUP BY assigned_staff_id"),
+    ('unassigned_students', "SELECT id, lrn, firstname, lastname FROM students "
+                            "WHERE assigned_staff_id IS NULL ORDER BY created_at DESC"),
+    ('recent_receipts', "SELECT p.receipt_number, p.amount, s.lrn FROM payments p "
+                        "JOIN students s ON p.student_id = s.id WHERE p.receipt_number IS NOT NULL "
+                        "ORDER BY p.payment_date DESC LIMIT 50"),
+    ('all_students', "SELECT * FROM students ORDER BY created_at DESC"),
+]
+
+# Heavy imports that decide how long the app takes to start
+IMPORT_MODULES = [
+    'PyQt6.QtWidgets',
+    'PyQt6.QtWebEngineWidgets',
+    'plotly.graph_objects',
+    'reportlab.platypus',
+    'matplotlib.pyplot',
+    'mysql.connector',
+]
+
+
+def timed_ms(func, repeat=1):
+    """Run func() repeat times; returns (median ms, last result)"""
+    samples, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return round(samples[len(samples) // 2], 2), result
+
+
+def measure_import(module_name):
+    """Cold import time in a fresh interpreter (ms), or the error"""
+    code = ("import time; t = time.perf_counter(); import " + module_name +
+            "; print((time.perf_counter() - t) * 1000)")
+    try:
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, timeout=120)
+        if result.returncode == 0:
+            return {'ms': round(float(result.stdout.strip().splitlines()[-1]), 1)}
+        return {'error': (result.stderr.strip().splitlines() or ['failed'])[-1]}
+    except Exception as e:
+        return {'error': str(e)}
+
+
+if PERFORMANCE_MODE:
+    print("\n[TEST 9] Measuring Performance...")
+
+    # --- Import times ---
+    print("\n  Import times (fresh interpreter):")
+    performance['imports'] = {}
+    for module_name in IMPORT_MODULES:
+        outcome = measure_import(module_name)
+        performance['imports'][module_name] = outcome
+        if 'ms' in outcome:
+            print(f"  {'⚠️ ' if outcome['ms'] > 1000 else '✅'} {module_name:<28} {outcome['ms']:>8.1f} ms")
+            if outcome['ms'] > 1000:
+                warnings.append(f"Slow import: {module_name} takes {outcome['ms']:.0f} ms")
+        else:
+            print(f"  ❌ {module_name:<28} {outcome['error']}")
+
+    # --- Database ---
+    try:
+        import mysql.connector
+        from config import Config
+
+        def connect():
+            return mysql.connector.connect(
+                host=Config.DB_HOST, port=Config.DB_PORT, user=Config.DB_USER,
+                password=Config.DB_PASSWORD, database=Config.DB_NAME, connection_timeout=10
+            )
+
+        connect_samples = []
+        for _ in range(3):
+            ms, probe = timed_ms(connect)
+            probe.close()
+            connect_samples.append(ms)
+        conn = connect()
+        cursor = conn.cursor()
+
+        def ping():
+            cursor.execute('SELECT 1')
+            return cursor.fetchall()
+
+        rtt_ms, _ = timed_ms(ping, repeat=20)
+        cursor.execute('SELECT VERSION()')
+        server_version = cursor.fetchone()[0]
+
+        performance['database'] = {
+            'server_version': server_version,
+            'connect_ms': connect_samples,
+            'round_trip_ms': rtt_ms,
+        }
+        print(f"\n  Database {Config.DB_HOST}:{Config.DB_PORT}/{Config.DB_NAME} (MySQL {server_version})")
+        print(f"  ✅ Connect: {min(connect_samples):.1f} - {max(connect_samples):.1f} ms   Round-trip: {rtt_ms:.2f} ms")
+        if rtt_ms > 5:
+            warnings.append(f"High database round-trip latency ({rtt_ms:.1f} ms) - every query pays this")
+
+        # --- Row counts and table sizes ---
+        print("\n  Tables:")
+        cursor.execute('''
+                       SELECT table_name, data_length, index_length
+                       FROM information_schema.tables
+                       WHERE table_schema = %s
+                       ''', (Config.DB_NAME,))
+        sizes = {row[0]: (row[1] or 0, row[2] or 0) for row in cursor.fetchall()}
+        performance['tables'] = {}
+        for table in sorted(EXPECTED_INDEXES):
+            if table not in sizes:
+                print(f"  ❌ {table:<16} missing")
+                issues.append(f"ERROR: Table '{table}' does not exist")
+                continue
+            cursor.execute(f'SELECT COUNT(*) FROM `{table}`')
+            rows = cursor.fetchone()[0]
+            data_mb, index_mb = (round(size / (1024 * 1024), 2) for size in sizes[table])
+            performance['tables'][table] = {'rows': rows, 'data_mb': data_mb, 'index_mb': index_mb}
+            print(f"  ✅ {table:<16} {rows:>10,} rows  {data_mb:>8.2f} MB data  {index_mb:>8.2f} MB index")
+
+        # --- Indexes ---
+        print("\n  Indexes:")
+        cursor.execute('''
+                       SELECT table_name, index_name, seq_in_index, column_name
+                       FROM information_schema.statistics
+                       WHERE table_schema = %s
+                       ORDER BY table_name, index_name, seq_in_index
+                       ''', (Config.DB_NAME,))
+        leading = {}
+        for table, index_name, seq, column in cursor.fetchall():
+            leading.setdefault(table, {}).setdefault(index_name, []).append(column)
+
+        performance['indexes'] = {'missing': [], 'present': {t: list(ix) for t, ix in leading.items()}}
+        for table, expected in EXPECTED_INDEXES.items():
+            if table not in sizes:
+                continue
+            for columns, suggested_name in expected:
+                covered = any(tuple(cols[:len(columns)]) == columns for cols in leading.get(table, {}).values())
+                if covered:
+                    print(f"  ✅ {table}({', '.join(columns)})")
+                else:
+                    statement = f"CREATE INDEX {suggested_name} ON {table} ({', '.join(columns)});"
+                    print(f"  ⚠️  {table}({', '.join(columns)}) not indexed  ->  {statement}")
+                    performance['indexes']['missing'].append({'table': table, 'columns': list(columns),
+                                                              'create': statement})
+                    warnings.append(f"Missing index on {table}({', '.join(columns)}): {statement}")
+
+        # --- Dashboard queries ---
+        print("\n  Dashboard queries (median of 3, with EXPLAIN):")
+        performance['queries'] = {}
+        explain_cursor = conn.cursor(dictionary=True)
+        for name, sql in DASHBOARD_QUERIES:
+            try:
+                def run_query():
+                    cursor.execute(sql)
+                    return cursor.fetchall()
+
+                ms, rows = timed_ms(run_query, repeat=3)
+                explain_cursor.execute(f"EXPLAIN {sql}")
+                plan = [{k: (v if isinstance(v, (int, float, str)) or v is None else str(v))
+                         for k, v in row.items()} for row in explain_cursor.fetchall()]
+                full_scans = [p.get('table') for p in plan
+                              if p.get('type') == 'ALL' and (p.get('rows') or 0) > 10000]
+
+                performance['queries'][name] = {'sql': sql, 'ms': ms, 'rows': len(rows), 'explain': plan}
+                flag = '⚠️ ' if ms > 200 or full_scans else '✅'
+                print(f"  {flag} {name:<26} {ms:>9.2f} ms  {len(rows):>8,} rows"
+                      + (f"  full scan: {', '.join(full_scans)}" if full_scans else ""))
+                if ms > 200:
+                    warnings.append(f"Slow dashboard query '{name}' ({ms:.0f} ms)")
+            except Exception as e:
+                performance['queries'][name] = {'sql': sql, 'error': str(e)}
+                print(f"  ❌ {name:<26} {e}")
+        explain_cursor.close()
+
+        cursor.close()
+        conn.close()
+        passed.append("Performance measurements completed")
+
+    except Exception as e:
+        print(f"  ❌ Database performance checks failed: {e}")
+        performance['database'] = {'error': str(e)}
+        issues.append(f"ERROR: Cannot measure database performance - {e}")
+
 # ============================================================================
 # FINAL REPORT
 # ============================================================================
@@ -258,6 +488,28 @@ else:
     print("2. Run this diagnostic again: python diagnostic_complete.py")
     print("3. Once all issues are fixed, run: python main.py")
 
+# ============================================================================
+# MACHINE-READABLE REPORT
+# ============================================================================
+if PERFORMANCE_MODE or REPORT_PATH:
+    report_path = REPORT_PATH or f"enrollify_diagnostic_{datetime.now():%Y%m%d_%H%M%S}.json"
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'host': platform.node(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'passed': passed,
+        'warnings': warnings,
+        'issues': issues,
+        'performance': performance,
+    }
+    try:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"\n💾 Report saved to {report_path} - attach it to your support ticket")
+    except Exception as e:
+        print(f"\n❌ Could not save report: {e}")
+
 print("\n" + "=" * 80)
 print("Need help? Share this diagnostic output!")
 print("=" * 80)
\ No newline at end of file
@@ -4,6 +4,12 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtCore import pyqtSignal
 from components import HeaderWidget, NavTabsWidget
 from database_manager_mysql import get_database
+from change_bus import (
+    changes, STUDENT_ADDED, STUDENT_DELETED, STUDENT_ASSIGNED, STUDENTS_CLEARED, STUDENT_SYNCED
+)
+from logger_config import get_logger
+
+logger = get_logger(__name__)
 
 
 class EnrolleesScreen(QWidget):
@@ -19,6 +25,7 @@ class EnrolleesScreen(QWidget):
         self.all_students = []
         self.filtered_students = []
         self.setup_ui()
+        changes.subscribe(self.on_student_changed)
 
     def set_current_user(self, user):
         """
@@ -243,40 +250,40 @@ class EnrolleesScreen(QWidget):
             self.filtered_students = self.all_students.copy()
             self.populate_table()
         except Exception as e:
-            print(f"Error loading students: {e}")
+            logger.error(f"Error loading students: {e}")
             QMessageBox.warning(self, "Database Error", f"Failed to load students: {str(e)}")
 
-    def apply_filters(self):
-        """Apply search and filter criteria"""
+    def student_matches(self, student):
+        """Does a student pass the search and filter criteria?"""
         search_text = self.search_input.text().lower()
         grade = self.grade_filter.currentText()
         track = self.track_filter.currentText()
         status = self.status_filter.currentText()
 
-        self.filtered_students = []
-
-        for student in self.all_students:
-            # Search filter
-            if search_text:
-                lrn = student.get('lrn', '').lower()
-                name = f"{student.get('firstname', '')} {student.get('lastname', '')}".lower()
-                if search_text not in lrn and search_text not in name:
-                    continue
+        # Search filter
+        if search_text:
+            lrn = student.get('lrn', '').lower()
+            name = f"{student.get('firstname', '')} {student.get('lastname', '')}".lower()
+            if search_text not in lrn and search_text not in name:
+                return False
 
-            # Grade filter
-            if grade != "All Grades" and student.get('grade_level', '') != grade:
-                continue
+        # Grade filter
+        if grade != "All Grades" and student.get('grade', '') != grade:
+            return False
 
-            # Track filter
-            if track != "All Tracks" and student.get('track', '') != track:
-                continue
+        # Track filter
+        if track != "All Tracks" and student.get('track', '') != track:
+            return False
 
-            # Status filter
-            if status != "All Status" and student.get('enrollment_status', '') != status:
-                continue
+        # Status filter
+        if status != "All Status" and student.get('status', '') != status:
+            return False
 
-            self.filtered_students.append(student)
+        return True
 
+    def apply_filters(self):
+        """Apply search and filter criteria"""
+        self.filtered_students = [s for s in self.all_students if self.student_matches(s)]
         self.populate_table()
 
     def populate_table(self):
@@ -284,31 +291,98 @@ class EnrolleesScreen(QWidget):
         self.table.setRowCount(0)
 
         for row, student in enumerate(self.filtered_students):
-            self.table.insertRow(row)
-
-            # LRN
-            self.table.setItem(row, 0, QTableWidgetItem(student.get('lrn', '')))
-
-            # Name
-            name = f"{student.get('lastname', '')}, {student.get('firstname', '')} {student.get('middlename', '')}"
-            self.table.setItem(row, 1, QTableWidgetItem(name.strip()))
-
-            # Grade
-            self.table.setItem(row, 2, QTableWidgetItem(student.get('grade_level', '')))
-
-            # Track
-            self.table.setItem(row, 3, QTableWidgetItem(student.get('track', '')))
-
-            # Status - dropdown
-            status_combo = self.create_status_combo(student.get('enrollment_status', 'Pending'), student.get('lrn', ''))
-            self.table.setCellWidget(row, 4, status_combo)
-
-            # Contact
-            self.table.setItem(row, 5, QTableWidgetItem(student.get('email', '')))
-
-            # Actions
-            actions_widget = self.create_actions_widget(student)
-            self.table.setCellWidget(row, 6, actions_widget)
+            self.insert_row(row, student)
+
+    def insert_row(self, row, student):
+        """Insert a table row for a student at row"""
+        self.table.insertRow(row)
+
+        # LRN
+        self.table.setItem(row, 0, QTableWidgetItem(student.get('lrn', '')))
+
+        # Name, Grade, Track, Contact (text set by patch_row)
+        for col in (1, 2, 3, 5):
+            self.table.setItem(row, col, QTableWidgetItem())
+
+        # Status - dropdown
+        status_combo = self.create_status_combo(student.get('status', 'Pending'), student.get('lrn', ''))
+        self.table.setCellWidget(row, 4, status_combo)
+
+        # Actions
+        actions_widget = self.create_actions_widget(student)
+        self.table.setCellWidget(row, 6, actions_widget)
+
+        self.patch_row(row, student)
+
+    def patch_row(self, row, student):
+        """Write a student's current values into the existing cells of its row"""
+        name = f"{student.get('lastname', '')}, {student.get('firstname', '')} {student.get('middlename', '')}"
+        self.table.item(row, 1).setText(name.strip())
+        self.table.item(row, 2).setText(student.get('grade', ''))
+        self.table.item(row, 3).setText(student.get('track', ''))
+        self.table.item(row, 5).setText(student.get('email', ''))
+
+        status_combo = self.table.cellWidget(row, 4)
+        status = student.get('status', 'Pending')
+        if status_combo.currentText() != status:
+            status_combo.blockSignals(True)
+            status_combo.setCurrentText(status)
+            status_combo.blockSignals(False)
+            self.apply_status_color(status_combo, status_combo.currentText())
+
+    def find_row(self, lrn):
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, 0).text() == lrn:
+                return row
+        return None
+
+    def filtered_position(self, student):
+        """Row a student goes in: filtered rows keep the order of all_students"""
+        index = next(i for i, s in enumerate(self.all_students) if s is student)
+        before = {id(s) for s in self.all_students[:index]}
+        return sum(1 for s in self.filtered_students if id(s) in before)
+
+    def on_student_changed(self, event):
+        """Patch the table for one write instead of reloading every student"""
+        if event.kind == STUDENT_ASSIGNED:
+            return
+        if event.kind == STUDENTS_CLEARED:
+            self.all_students = []
+            self.apply_filters()
+            return
+
+        student = next((s for s in self.all_students if s.get('lrn') == event.lrn), None)
+        if event.kind == STUDENT_ADDED:
+            # One row, with the id and created_at the database assigned
+            student = self.db.get_student_by_lrn(event.lrn)
+            if student is None:
+                return
+            self.all_students.insert(0, student)  # newest first, as get_all_students
+        elif event.kind == STUDENT_SYNCED and student is None:
+            # Added on another terminal: the event carries the full row
+            student = dict(event.fields)
+            self.all_students.insert(0, student)
+        elif student is None:
+            return
+        elif event.kind == STUDENT_DELETED:
+            self.all_students.remove(student)
+            student = None
+        else:
+            student.update((key, value) for key, value in event.fields.items() if key in student)
+
+        # filtered_students[i] is always the student shown in table row i
+        row = self.find_row(event.lrn)
+        matches = student is not None and self.student_matches(student)
+        if row is not None and matches:
+            self.patch_row(row, student)
+        elif row is not None:
+            # Deleted, or no longer passes the filters
+            self.table.removeRow(row)
+            del self.filtered_students[row]
+        elif matches:
+            row = self.filtered_position(student)
+            self.filtered_students.insert(row, student)
+            self.insert_row(row, student)
 
     def create_status_combo(self, current_status, lrn):
         """Create status dropdown with styling"""
@@ -317,52 +391,53 @@ class EnrolleesScreen(QWidget):
         status_combo.setCurrentText(current_status)
         status_combo.setMinimumHeight(50)
 
-        def apply_status_color(combo, status_text):
-            if status_text == "Enrolled":
-                combo.setStyleSheet("""
-                    QComboBox {
-                        background-color: #ECFDF5;
-                        border: none;
-                        border-bottom: 2px solid #10B981;
-                        border-radius: 0px;
-                        padding: 8px 12px;
-                        font-size: 13px;
-                        font-weight: 600;
-                        color: #065F46;
-                    }
-                    QComboBox:focus {
-                        border-bottom: 2px solid #059669;
-                    }
-                    QComboBox::drop-down {
-                        border: none;
-                    }
-                """)
-            elif status_text == "Pending":
-                combo.setStyleSheet("""
-                    QComboBox {
-                        background-color: #FFFBEB;
-                        border: none;
-                        border-bottom: 2px solid #F59E0B;
-                        border-radius: 0px;
-                        padding: 8px 12px;
-                        font-size: 13px;
-                        font-weight: 600;
-                        color: #92400E;
-                    }
-                    QComboBox:focus {
-                        border-bottom: 2px solid #D97706;
-                    }
-                    QComboBox::drop-down {
-                        border: none;
-                    }
-                """)
-
-        apply_status_color(status_combo, current_status)
+        self.apply_status_color(status_combo, current_status)
         status_combo.currentTextChanged.connect(lambda text, c=status_combo, l=lrn: self.update_status(l, text, c))
-        status_combo.currentTextChanged.connect(lambda text, combo=status_combo: apply_status_color(combo, text))
+        status_combo.currentTextChanged.connect(lambda text, combo=status_combo: self.apply_status_color(combo, text))
 
         return status_combo
 
+    def apply_status_color(self, combo, status_text):
+        """Colour a status dropdown for its status"""
+        if status_text == "Enrolled":
+            combo.setStyleSheet("""
+                QComboBox {
+                    background-color: #ECFDF5;
+                    border: none;
+                    border-bottom: 2px solid #10B981;
+                    border-radius: 0px;
+                    padding: 8px 12px;
+                    font-size: 13px;
+                    font-weight: 600;
+                    color: #065F46;
+                }
+                QComboBox:focus {
+                    border-bottom: 2px solid #059669;
+                }
+                QComboBox::drop-down {
+                    border: none;
+                }
+            """)
+        elif status_text == "Pending":
+            combo.setStyleSheet("""
+                QComboBox {
+                    background-color: #FFFBEB;
+                    border: none;
+                    border-bottom: 2px solid #F59E0B;
+                    border-radius: 0px;
+                    padding: 8px 12px;
+                    font-size: 13px;
+                    font-weight: 600;
+                    color: #92400E;
+                }
+                QComboBox:focus {
+                    border-bottom: 2px solid #D97706;
+                }
+                QComboBox::drop-down {
+                    border: none;
+                }
+            """)
+
     def create_actions_widget(self, student):
         """Create actions buttons widget"""
         actions_widget = QWidget()
@@ -448,12 +523,17 @@ class EnrolleesScreen(QWidget):
     def update_status(self, lrn, new_status, combo):
         """Update student enrollment status"""
         try:
+            # on_student_changed patches the row
             self.db.update_enrollment_status(lrn, new_status)
             QMessageBox.information(self, "Success", f"Status updated to {new_status}")
-            self.load_students()
         except Exception as e:
-            print(f"Error updating status: {e}")
+            logger.error(f"Error updating status: {e}")
             QMessageBox.warning(self, "Error", f"Failed to update status: {str(e)}")
+            # Put the dropdown back to the stored status
+            row = self.find_row(lrn)
+            student = next((s for s in self.all_students if s.get('lrn') == lrn), None)
+            if row is not None and student is not None:
+                self.patch_row(row, student)
 
     def view_student(self, student):
         """View student details"""
@@ -469,7 +549,7 @@ Phone: {student.get('phone', '')}
 Address: {student.get('address', '')}
 
 Academic Information:
-Grade Level: {student.get('grade_level', '')}
+Grade Level: {student.get('grade', '')}
 Track: {student.get('track', '')}
 Strand: {student.get('strand', '')}
 
@@ -477,7 +557,7 @@ Guardian Information:
 Guardian Name: {student.get('guardian_name', '')}
 Guardian Contact: {student.get('guardian_contact', '')}
 
-Enrollment Status: {student.get('enrollment_status', '')}
+Enrollment Status: {student.get('status', '')}
 Created: {student.get('created_at', '')}
         """
         QMessageBox.information(self, "Student Details", details)
@@ -498,7 +578,6 @@ Created: {student.get('created_at', '')}
             try:
                 self.db.delete_student(student.get('lrn', ''))
                 QMessageBox.information(self, "Success", "Student deleted successfully")
-                self.load_students()
             except Exception as e:
-                print(f"Error deleting student: {e}")
+                logger.error(f"Error deleting student: {e}")
                 QMessageBox.warning(self, "Error", f"Failed to delete student: {str(e)}")
\ No newline at end of file
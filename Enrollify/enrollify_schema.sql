@@ -32,11 +32,16 @@ CREATE TABLE `students` (
   `guardian_name` varchar(150) DEFAULT NULL,
   `guardian_contact` varchar(50) DEFAULT NULL,
   `enrollment_status` varchar(20) DEFAULT 'Pending',  -- FIXED: was 'status'
+  `assigned_staff_id` int(11) DEFAULT NULL,
+  `assigned_staff_email` varchar(150) DEFAULT NULL,
   `created_at` timestamp NOT NULL DEFAULT current_timestamp(),
   `updated_at` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp(),
   PRIMARY KEY (`id`),
   KEY `idx_lrn` (`lrn`),
-  KEY `idx_status` (`enrollment_status`)
+  KEY `idx_status` (`enrollment_status`),
+  KEY `idx_assigned_staff` (`assigned_staff_id`, `created_at`),
+  KEY `idx_created_at` (`created_at`),
+  KEY `idx_updated_at` (`updated_at`)  -- change feed high-water mark
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
 -- --------------------------------------------------------
@@ -89,11 +94,14 @@ CREATE TABLE `payments` (
   `lrn` varchar(12) NOT NULL,
   `amount` decimal(10,2) NOT NULL,
   `payment_method` varchar(50) DEFAULT 'Cash',
+  `receipt_number` varchar(50) DEFAULT NULL,
   `payment_date` timestamp NOT NULL DEFAULT current_timestamp(),
   `created_at` timestamp NOT NULL DEFAULT current_timestamp(),
   PRIMARY KEY (`id`),
   KEY `fk_payment_student` (`student_id`),
   KEY `idx_lrn` (`lrn`),
+  UNIQUE KEY `idx_receipt_number` (`receipt_number`),  -- a receipt is one payment
+  KEY `idx_payment_date` (`payment_date`),
   CONSTRAINT `fk_payment_student` FOREIGN KEY (`student_id`) REFERENCES `students` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
@@ -127,10 +135,40 @@ CREATE TABLE `audit_log` (
   KEY `idx_timestamp` (`timestamp`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
+-- --------------------------------------------------------
+-- Table: staff_subjects
+-- --------------------------------------------------------
+CREATE TABLE `staff_subjects` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `staff_id` int(11) NOT NULL,
+  `staff_email` varchar(150) DEFAULT NULL,
+  `subject_name` varchar(150) NOT NULL,
+  `grade_level` varchar(20) DEFAULT NULL,
+  `track` varchar(100) DEFAULT NULL,
+  `created_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`id`),
+  KEY `idx_staff` (`staff_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- --------------------------------------------------------
+-- Table: data_versions
+-- Bumped in the same transaction as every write to a table;
+-- terminals compare it to drop cached reads (see data_cache.py)
+-- --------------------------------------------------------
+CREATE TABLE `data_versions` (
+  `table_name` varchar(64) NOT NULL,
+  `version` bigint(20) NOT NULL DEFAULT 0,
+  PRIMARY KEY (`table_name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
 -- ========================================
 -- INSERT SAMPLE DATA
 -- ========================================
 
+-- One version row per cached table
+INSERT INTO `data_versions` (`table_name`) VALUES
+('students'), ('payments'), ('tracks'), ('strands'), ('tuition_fees'), ('users'), ('staff_subjects');
+
 -- Insert default tracks
 INSERT INTO `tracks` (`name`, `description`) VALUES
 ('Academic Track', 'College preparatory programs'),
@@ -187,4 +225,7 @@ COMMIT;
 -- SELECT * FROM users;
 -- SELECT * FROM tracks;
 -- SELECT * FROM strands;
--- SELECT * FROM tuition_fees;
\ No newline at end of file
+-- SELECT * FROM tuition_fees;
+--
+-- For a large synthetic dataset (load testing):
+--   python generate_test_data.py --students 100000
\ No newline at end of file
@@ -5,6 +5,14 @@ Handles business logic and coordinates between View and Model
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from decorators import track_latency, profiled
+from connection_monitor import get_connection_monitor, CONNECTED
+from offline_queue import get_offline_sync, is_connection_error
+from validation_utils import validate_enrollment_submission
+from logger_config import get_logger
+
+logger = get_logger(__name__)
+
 
 class EnrollmentFormController(QObject):
     """
@@ -26,16 +34,22 @@ class EnrollmentFormController(QObject):
         self.connect_signals()
 
         # Load initial data
+        self.tracks_loaded = False
         self.load_tracks()
 
+        # Tracks are reloaded once the background warm-up connects
+        monitor = get_connection_monitor()
+        if monitor is not None:
+            monitor.state_changed.connect(self.on_database_state)
+
     def init_database(self):
         """Initialize database connection"""
         try:
             from database_manager_mysql import get_database
             self.db = get_database()
-            print("✅ Controller: Database connected")
+            logger.info("✅ Controller: Database connected")
         except Exception as e:
-            print(f"⚠️ Controller: Database connection failed: {e}")
+            logger.warning(f"⚠️ Controller: Database connection failed: {e}")
             self.db = None
 
     def connect_signals(self):
@@ -43,30 +57,41 @@ class EnrollmentFormController(QObject):
         self.view.submit_clicked.connect(self.handle_submit)
         self.view.track_changed.connect(self.handle_track_change)
 
+    def database_online(self):
+        """Whether to use the database now - while offline it is not touched, so nothing blocks on a connect"""
+        sync = get_offline_sync()
+        return self.db is not None and (sync is None or sync.is_online())
+
     def load_tracks(self):
         """Load available tracks from database"""
         try:
-            if self.db:
+            if self.database_online():
                 tracks = self.db.get_all_tracks()
                 self.view.set_tracks(tracks)
-                print(f"✅ Loaded {len(tracks)} tracks")
+                self.tracks_loaded = bool(tracks)
+                logger.info(f"✅ Loaded {len(tracks)} tracks")
             else:
                 # Fallback tracks
                 self.view.set_tracks(["Academic", "TVL", "Sports", "Arts & Design"])
         except Exception as e:
-            print(f"⚠️ Error loading tracks: {e}")
+            logger.warning(f"⚠️ Error loading tracks: {e}")
             self.view.set_tracks(["Academic", "TVL", "Sports", "Arts & Design"])
 
+    def on_database_state(self, state, detail):
+        """Fill in the tracks if the form was opened before the database connected"""
+        if state == CONNECTED and not self.tracks_loaded:
+            self.load_tracks()
+
     def handle_track_change(self, track_name):
         """Handle track selection change"""
-        print(f"🔄 Track changed: {track_name}")
+        logger.debug(f"🔄 Track changed: {track_name}")
 
         # Hide strand options by default
         self.view.hide_strand_options()
 
         # If Academic or TVL, show strand options
         if track_name in ["Academic", "TVL", "Academic Track", "TVL Track"]:
-            if self.db:
+            if self.database_online():
                 try:
                     strands = self.db.get_strands_by_track(track_name)
                     if strands:
@@ -74,7 +99,7 @@ class EnrollmentFormController(QObject):
                     else:
                         self.view.show_strand_input("Enter strand (e.g., STEM, Cookery)")
                 except Exception as e:
-                    print(f"⚠️ Error loading strands: {e}")
+                    logger.warning(f"⚠️ Error loading strands: {e}")
                     self.view.show_strand_input("Enter strand")
             else:
                 self.view.show_strand_input("Enter strand")
@@ -83,11 +108,10 @@ class EnrollmentFormController(QObject):
         elif track_name in ["Sports", "Arts & Design", "Sports Track", "Arts and Design Track"]:
             self.view.show_strand_input("Specialization (Optional)")
 
+    @profiled("enrollment_submit")
     def handle_submit(self, form_data):
         """Handle form submission"""
-        print("\n" + "=" * 60)
-        print("🎯 ENROLLMENT SUBMISSION")
-        print("=" * 60)
+        logger.info(f"🎯 Enrollment submission for LRN {form_data.get('lrn')}")
 
         # Step 1: Validate
         is_valid, error_msg = self.validate_form(form_data)
@@ -95,13 +119,18 @@ class EnrollmentFormController(QObject):
             self.view.show_error("Validation Error", error_msg)
             return
 
-        print("✅ Validation passed")
+        logger.debug("✅ Validation passed")
+
+        # Step 2: Save to database, or journal it while the database is unreachable
+        sync = get_offline_sync()
+        if sync is not None and not sync.is_online():
+            self.journal_student(sync, form_data)
+            return
 
-        # Step 2: Save to database
         if self.db:
             try:
-                student_id = self.db.add_student(form_data)
-                print(f"✅ Student saved with ID: {student_id}")
+                student_id = self.save_student(form_data)
+                logger.info(f"✅ Student saved with ID: {student_id}")
 
                 # Show success message
                 self.view.show_success(
@@ -117,12 +146,14 @@ class EnrollmentFormController(QObject):
                 # Emit signal for main app
                 self.enrollment_complete.emit(form_data)
 
-                print("=" * 60)
-                print("✅ ENROLLMENT COMPLETE")
-                print("=" * 60 + "\n")
+                logger.info("✅ Enrollment complete")
 
             except Exception as e:
-                print(f"❌ Database error: {e}")
+                if sync is not None and is_connection_error(e):
+                    sync.connection_lost()
+                    self.journal_student(sync, form_data)
+                    return
+                logger.error(f"❌ Database error: {e}")
                 self.view.show_error("Database Error", f"Failed to save enrollment:\n{str(e)}")
         else:
             # No database - show mock success
@@ -132,45 +163,42 @@ class EnrollmentFormController(QObject):
             )
             self.view.clear_form()
 
+    def journal_student(self, sync, form_data):
+        """Keep an enrollment made while the database is unreachable (replayed on reconnect)"""
+        try:
+            sync.queue.enqueue_student(form_data)
+        except Exception as e:
+            logger.error(f"❌ Offline journal error: {e}")
+            self.view.show_error("Enrollment Not Saved", f"Failed to store enrollment offline:\n{str(e)}")
+            return
+
+        self.view.show_success(
+            "Enrollment Saved Offline",
+            f"Student: {form_data['firstname']} {form_data['lastname']}\n"
+            f"LRN: {form_data['lrn']}\n\n"
+            f"The database is unreachable right now. This enrollment is stored on this "
+            f"terminal and will be uploaded automatically when the connection is back."
+        )
+        self.view.clear_form()
+        self.enrollment_complete.emit(form_data)
+
+    @track_latency("enrollment_submit")
+    def save_student(self, form_data):
+        """Save a validated enrollment (timed as enrollment_submit)"""
+        return self.db.add_student(form_data)
+
     def validate_form(self, data):
         """Validate form data"""
-        # Required fields
-        required_fields = {
-            "lrn": "Learner Reference Number (LRN)",
-            "gender": "Gender",
-            "firstname": "First Name",
-            "lastname": "Last Name",
-            "birthdate": "Birthdate",
-            "email": "Email Address",
-            "phone": "Phone Number",
-            "address": "Complete Address",
-            "grade": "Grade Level",
-            "track": "Track",
-            "guardian_name": "Guardian Name",
-            "guardian_contact": "Guardian Contact"
-        }
-
-        for key, label in required_fields.items():
-            value = data.get(key, "")
-            if not value or value.startswith("Select "):
-                return False, f"Please fill in: {label}"
-
-        # Validate LRN format
-        if not data["lrn"].isdigit() or len(data["lrn"]) != 12:
-            return False, "LRN must be exactly 12 digits"
-
-        # Track-specific strand validation
-        if data["track"] in ["Academic", "TVL", "Academic Track", "TVL Track"]:
-            strand = data["strand"]
-            if not strand or strand == "Select strand":
-                return False, "Please select or enter a valid strand for this track"
+        is_valid, error_msg = validate_enrollment_submission(data)
+        if not is_valid:
+            return False, error_msg
 
         # Validate track against database
-        if self.db:
+        if self.database_online():
             try:
                 if not self.db.is_valid_track(data["track"]):
                     return False, "Invalid track selected. Please choose a valid track."
             except Exception as e:
-                print(f"⚠️ Track validation error: {e}")
+                logger.warning(f"⚠️ Track validation error: {e}")
 
         return True, ""
\ No newline at end of file
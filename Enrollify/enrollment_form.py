@@ -3,14 +3,13 @@ from PyQt6.QtWidgets import (
     QScrollArea, QMessageBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap
 from form_components.FormInput import FormInput
 from form_components.FormCombo import FormCombo
 from form_components.FormDate import FormDate
 from form_components.SectionHeader import SectionHeader
 from form_components.SubmitButton import SubmitButton
 import traceback
-import os
+import icons
 
 class EnrollmentForm(QWidget):
     logout_signal = pyqtSignal()
@@ -91,11 +90,8 @@ class EnrollmentForm(QWidget):
 
         # Logo
         logo = QLabel()
-        if os.path.exists('assets/enrollify_logo.png'):
-            pixmap = QPixmap('assets/enrollify_logo.png').scaled(
-                60, 60, Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        pixmap = icons.pixmap('enrollify_logo.png', 60)
+        if pixmap is not None:
             logo.setPixmap(pixmap)
         else:
             logo.setText("📚")
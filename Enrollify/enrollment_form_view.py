@@ -8,13 +8,13 @@ from PyQt6.QtWidgets import (
     QScrollArea, QMessageBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap
 from form_components.FormInput import FormInput
 from form_components.FormCombo import FormCombo
 from form_components.FormDate import FormDate
 from form_components.SectionHeader import SectionHeader
 from form_components.SubmitButton import SubmitButton
-import os
+import icons
+from ui_styles import set_screen
 
 
 class EnrollmentFormView(QWidget):
@@ -30,7 +30,7 @@ class EnrollmentFormView(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.setStyleSheet("background-color: #F8FAFA;")
+        set_screen(self, "enrollmentScreen")
         self.available_tracks = []  # Will be set by controller
         self.build_ui()
 
@@ -47,8 +47,10 @@ class EnrollmentFormView(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
+        scroll.setObjectName("portalScroll")
 
         container = QWidget()
+        container.setObjectName("portalContent")
         container_layout = QVBoxLayout(container)
         container_layout.setContentsMargins(60, 40, 60, 40)
         container_layout.setSpacing(30)
@@ -64,29 +66,26 @@ class EnrollmentFormView(QWidget):
         """Build header with logout button"""
         header = QWidget()
         header.setFixedHeight(100)
-        header.setStyleSheet("background-color: white; border-bottom: none;")
+        header.setObjectName("pageHeader")
 
         layout = QHBoxLayout(header)
         layout.setContentsMargins(60, 20, 60, 20)
 
         # Logo
         logo = QLabel()
-        if os.path.exists('assets/enrollify_logo.png'):
-            pixmap = QPixmap('assets/enrollify_logo.png').scaled(
-                60, 60, Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        pixmap = icons.pixmap('enrollify_logo.png', 60)
+        if pixmap is not None:
             logo.setPixmap(pixmap)
         else:
             logo.setText("📚")
-            logo.setStyleSheet("font-size: 32px; color: #060C0B;")
+            logo.setObjectName("headerLogo")
 
         # Title
         titles = QVBoxLayout()
         title = QLabel("Enrollify")
-        title.setStyleSheet("font-size: 28px; color: #234940; font-weight: 700;")
+        title.setObjectName("headerTitle")
         subtitle = QLabel("Student Enrollment Portal")
-        subtitle.setStyleSheet("font-size: 15px; color: #6B7280; font-weight: 500;")
+        subtitle.setObjectName("headerSubtitle")
         titles.addWidget(title)
         titles.addWidget(subtitle)
 
@@ -94,17 +93,7 @@ class EnrollmentFormView(QWidget):
         logout_btn = QPushButton("↪ Logout")
         logout_btn.setFixedSize(110, 40)
         logout_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        logout_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #2D9B84;
-                border: 2px solid #2D9B84;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover { background-color: #F0FAF8; }
-        """)
+        logout_btn.setObjectName("logoutButton")
         logout_btn.clicked.connect(self.logout_clicked.emit)
 
         layout.addWidget(logo)
@@ -117,16 +106,16 @@ class EnrollmentFormView(QWidget):
     def build_page_title(self):
         """Build page title banner"""
         box = QFrame()
-        box.setStyleSheet("background-color: #E8F5F3; border-radius: 12px;")
+        box.setObjectName("portalBanner")
 
         layout = QVBoxLayout(box)
         layout.setContentsMargins(30, 25, 30, 25)
 
         title = QLabel("Student Enrollment Form")
-        title.setStyleSheet("font-size: 28px; font-weight: 700; color: #234940;")
+        title.setObjectName("pageTitle")
 
         subtitle = QLabel("Fill out all required fields to complete your application")
-        subtitle.setStyleSheet("font-size: 15px; font-weight: 500; color: #6B7280;")
+        subtitle.setObjectName("pageSubtitle")
 
         layout.addWidget(title)
         layout.addWidget(subtitle)
@@ -136,13 +125,7 @@ class EnrollmentFormView(QWidget):
     def build_form_card(self):
         """Build the main form card"""
         self.form = QFrame()
-        self.form.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 16px;
-                border: none;
-            }
-        """)
+        self.form.setObjectName("card")
         layout = QVBoxLayout(self.form)
         layout.setContentsMargins(70, 60, 70, 60)
         layout.setSpacing(42)
@@ -177,12 +160,7 @@ class EnrollmentFormView(QWidget):
 
         # STRAND / SPECIALIZATION
         self.strand_label = QLabel("Strand / Specialization")
-        self.strand_label.setStyleSheet("""
-            color: #374151;
-            font-size: 14px;
-            font-weight: 600;
-            letter-spacing: 0.3px;
-        """)
+        self.strand_label.setObjectName("fieldLabel")
         self.strand_label.hide()
 
         self.strand_input = FormInput("", "")
@@ -0,0 +1,435 @@
+"""
+Enrollment HTTP/JSON service for Enrollify
+An optional backend that thin kiosks can share instead of each running
+its own MySQL connection and queries. It serves the enrollment API over
+plain HTTP/1.1 (asyncio, standard library only) on top of
+AsyncDatabaseManager, so all terminals share one pool of
+Config.DB_POOL_SIZE connections:
+
+    python enrollment_service.py                  # Config.SERVICE_HOST:SERVICE_PORT
+    python enrollment_service.py --port 9000 --workers 8
+
+Endpoints (JSON in and out):
+    GET  /health
+    GET  /tracks                                  reference data, cached
+    GET  /strands?track=Academic Track            reference data, cached
+    GET  /fees?track=Academic Track&strand=STEM   reference data, cached
+    GET  /students/<lrn>
+    POST /enrollments     form fields as sent by the enrollment form -> 201
+    POST /payments        {"lrn", "payment_method", "amount"?, "receipt_number"?} -> 201
+    GET  /dashboard       statistics and distributions
+
+Reference responses are kept for Config.SERVICE_REFERENCE_TTL seconds.
+Identical dashboard requests are coalesced: callers arriving while a
+snapshot is being built wait for that one, and the result is shared for
+Config.SERVICE_DASHBOARD_TTL seconds, so fifty dashboards refreshing at
+once cost one set of queries.
+
+Enrollments are validated with the enrollment form's own rules
+(validation_utils.validate_enrollment_submission). A payment with a
+receipt number that is already recorded returns the recorded payment
+instead of recording it twice, or 409 when that receipt records another
+LRN or amount.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from http import HTTPStatus
+from urllib.parse import urlsplit, parse_qsl
+
+from async_database import AsyncDatabaseManager
+from config import Config
+from logger_config import setup_logging, get_logger
+from metrics import registry as metrics
+from offline_queue import same_payment
+from validation_utils import validate_enrollment_submission
+
+logger = get_logger(__name__)
+
+# Generated receipt numbers tried before giving up (date + 4 random digits, as the payment screen)
+RECEIPT_ATTEMPTS = 10
+# MySQL ER_DUP_ENTRY
+DUPLICATE_KEY_ERRNO = 1062
+
+
+class HTTPError(Exception):
+    """Ends a request with status and {"error": message}"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def to_json(payload):
+    return json.dumps(payload, default=_json_default).encode('utf-8')
+
+
+def is_duplicate_key(error):
+    """True if error (or an error it was raised from) is a unique key violation"""
+    while error is not None:
+        if getattr(error, 'errno', None) == DUPLICATE_KEY_ERRNO:
+            return True
+        error = error.__cause__
+    return False
+
+
+class ResponseCache:
+    """Payloads kept for ttl seconds, with identical concurrent loads coalesced into one"""
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._values = {}    # key -> (expires_at, payload)
+        self._inflight = {}  # key -> asyncio.Task
+        self.hits = self.misses = self.coalesced = 0
+
+    async def get(self, key, load):
+        """The payload for key, from memory, from a load already running, or from load()"""
+        cached = self._values.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self.hits += 1
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(load())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._store(key, done))
+        # shield: one caller giving up must not cancel the load for the others
+        return await asyncio.shield(task)
+
+    def _store(self, key, task):
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self._values[key] = (time.monotonic() + self.ttl, task.result())
+
+    def clear(self):
+        self._values.clear()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'coalesced': self.coalesced,
+                'entries': len(self._values)}
+
+
+class EnrollmentService:
+    """Routes API requests to an AsyncDatabaseManager"""
+
+    def __init__(self, adb):
+        self.adb = adb
+        self.reference = ResponseCache(Config.SERVICE_REFERENCE_TTL)
+        self.dashboards = ResponseCache(Config.SERVICE_DASHBOARD_TTL)
+        self.started_at = time.time()
+        self.routes = [
+            ('GET', re.compile(r'/health'), self.health),
+            ('GET', re.compile(r'/tracks'), self.tracks),
+            ('GET', re.compile(r'/strands'), self.strands),
+            ('GET', re.compile(r'/fees'), self.fees),
+            ('GET', re.compile(r'/students/(?P<lrn>\d+)'), self.student),
+            ('POST', re.compile(r'/enrollments'), self.enroll),
+            ('POST', re.compile(r'/payments'), self.pay),
+            ('GET', re.compile(r'/dashboard'), self.dashboard),
+        ]
+
+    async def handle(self, method, target, body=b''):
+        """(status, payload) for one request"""
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        query = dict(parse_qsl(url.query))
+
+        allowed = []
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            if route_method != method:
+                allowed.append(route_method)
+                continue
+
+            started = time.perf_counter()
+            try:
+                data = self._parse_body(body) if method == 'POST' else None
+                status, payload = await handler(query=query, data=data, **match.groupdict())
+            except HTTPError as e:
+                status, payload = e.status, {'error': e.message}
+            except Exception as e:
+                logger.error(f"{method} {path} failed: {e}", exc_info=True)
+                status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}
+            metrics.observe(f"service.{handler.__name__}", (time.perf_counter() - started) * 1000,
+                            error=status >= 500)
+            return status, payload
+
+        if allowed:
+            return HTTPStatus.METHOD_NOT_ALLOWED, {'error': f"Use {', '.join(allowed)} for {path}"}
+        return HTTPStatus.NOT_FOUND, {'error': f"No endpoint {path}"}
+
+    @staticmethod
+    def _parse_body(body):
+        try:
+            data = json.loads(body or b'{}')
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body is not valid JSON")
+        if not isinstance(data, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+        return data
+
+    # ==================== REFERENCE DATA ====================
+
+    async def _reference_data(self):
+        return await self.reference.get('reference', self.adb.prefetch_reference_data)
+
+    async def tracks(self, **_):
+        reference = await self._reference_data()
+        return HTTPStatus.OK, {'tracks': reference['tracks']}
+
+    async def strands(self, query, **_):
+        reference = await self._reference_data()
+        track = query.get('track')
+        if track:
+            return HTTPStatus.OK, {'track': track, 'strands': reference['strands'].get(track, [])}
+        return HTTPStatus.OK, {'strands': reference['strands']}
+
+    async def _fees(self, track, strand):
+        # get_tuition_fees also supplies the default fees for tracks without a row
+        return await self.reference.get(('fees', track, strand),
+                                        lambda: self.adb.get_tuition_fees(track, strand))
+
+    async def fees(self, query, **_):
+        track = query.get('track')
+        if not track:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "track is required")
+        strand = query.get('strand') or None
+        return HTTPStatus.OK, {'track': track, 'strand': strand, 'fees': await self._fees(track, strand)}
+
+    # ==================== STUDENTS ====================
+
+    async def student(self, lrn, **_):
+        student = await self.adb.get_student_by_lrn(lrn)
+        if student is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No student with LRN {lrn}")
+        return HTTPStatus.OK, student
+
+    async def enroll(self, data, **_):
+        is_valid, error_msg = validate_enrollment_submission(data)
+        if not is_valid:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, error_msg)
+        reference = await self._reference_data()
+        if data['track'] not in reference['tracks']:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid track selected. Please choose a valid track.")
+
+        try:
+            student_id = await self.adb.add_student(data)
+        except Exception as e:
+            if "already exists" in str(e):
+                raise HTTPError(HTTPStatus.CONFLICT, str(e))
+            raise
+        logger.info(f"🎯 Enrollment via service for LRN {data['lrn']}")
+        return HTTPStatus.CREATED, {'id': student_id, 'lrn': data['lrn']}
+
+    # ==================== PAYMENTS ====================
+
+    async def pay(self, data, **_):
+        lrn = str(data.get('lrn') or '')
+        method = data.get('payment_method')
+        if not lrn or not method:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "lrn and payment_method are required")
+
+        receipt_number = data.get('receipt_number')
+        existing = await self.adb.get_receipt_by_number(receipt_number) if receipt_number else None
+
+        student = await self.adb.get_student_by_lrn(lrn)
+        if student is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No student with LRN {lrn}")
+
+        amount = data.get('amount')
+        if amount is None:
+            fees = await self._fees(student['track'], student.get('strand') or None)
+            amount = fees['total']
+
+        if existing:
+            if not same_payment(existing, lrn, amount):
+                raise HTTPError(HTTPStatus.CONFLICT,
+                                f"Receipt {receipt_number} already records a different payment")
+            # Retried request: answer with the payment already recorded
+            return HTTPStatus.OK, {'receipt_number': receipt_number, 'payment': existing}
+
+        payment_data = {
+            'student_data': student,
+            'payment_method': method,
+            'amount': amount,
+            'currency': 'PHP'
+        }
+        generate = not receipt_number
+        for attempt in range(1, RECEIPT_ATTEMPTS + 1):
+            if generate:
+                receipt_number = await self._new_receipt_number()
+            try:
+                payment_id = await self.adb.add_payment_with_receipt(payment_data, receipt_number)
+                break
+            except Exception as e:
+                if not is_duplicate_key(e):
+                    raise
+                if not generate:
+                    # Recorded by another request since the check above
+                    raise HTTPError(HTTPStatus.CONFLICT, f"Receipt {receipt_number} is already recorded")
+                if attempt == RECEIPT_ATTEMPTS:
+                    raise
+        logger.info(f"💳 Payment via service: LRN {lrn}, receipt {receipt_number}")
+        return HTTPStatus.CREATED, {'id': payment_id, 'receipt_number': receipt_number, 'amount': amount}
+
+    async def _new_receipt_number(self):
+        """Today's date plus a random suffix no recorded payment uses (the unique key covers races)"""
+        for _ in range(RECEIPT_ATTEMPTS):
+            receipt_number = f"{datetime.now():%Y%m%d}{random.randint(1000, 9999)}"
+            if await self.adb.get_receipt_by_number(receipt_number) is None:
+                return receipt_number
+        raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Could not allocate a free receipt number")
+
+    # ==================== DASHBOARD ====================
+
+    async def _dashboard_snapshot(self):
+        # Independent queries, run concurrently on the pool
+        stats, tracks, grades, strands, statuses, genders = await asyncio.gather(
+            self.adb.get_statistics(),
+            self.adb.count_by_track(),
+            self.adb.count_by_grade(),
+            self.adb.count_by_strand(),
+            self.adb.count_enrollment_status(),
+            self.adb.get_gender_distribution(),
+        )
+        return {
+            'statistics': stats,
+            'by_track': tracks,
+            'by_grade': grades,
+            'by_strand': strands,
+            'by_status': statuses,
+            'by_gender': genders,
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+        }
+
+    async def dashboard(self, **_):
+        return HTTPStatus.OK, await self.dashboards.get('dashboard', self._dashboard_snapshot)
+
+    async def health(self, **_):
+        return HTTPStatus.OK, {
+            'status': 'ok',
+            'uptime': round(time.time() - self.started_at),
+            'workers': self.adb.workers,
+            'reference_cache': self.reference.stats(),
+            'dashboard_cache': self.dashboards.stats(),
+        }
+
+
+# ==================== HTTP ====================
+
+async def serve_connection(service, reader, writer):
+    """HTTP/1.1 with keep-alive: one request after another on the same connection"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, target, version = request_line.decode('latin-1').split()
+            except ValueError:
+                await _respond(writer, HTTPStatus.BAD_REQUEST, {'error': "Malformed request line"}, False)
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                length = int(headers.get('content-length') or 0)
+                if length < 0:
+                    raise ValueError(length)
+            except ValueError:
+                await _respond(writer, HTTPStatus.BAD_REQUEST, {'error': "Invalid Content-Length"}, False)
+                break
+            if length > Config.SERVICE_MAX_BODY:
+                await _respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': "Request body too large"}, False)
+                break
+            body = await reader.readexactly(length) if length else b''
+
+            keep_alive = (headers.get('connection', '').lower() != 'close'
+                          and version.upper() == 'HTTP/1.1')
+            status, payload = await service.handle(method.upper(), target, body)
+            await _respond(writer, status, payload, keep_alive)
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _respond(writer, status, payload, keep_alive):
+    status = HTTPStatus(status)
+    body = to_json(payload)
+    head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode('latin-1') + body)
+    await writer.drain()
+
+
+async def run_service(host=None, port=None, adb=None):
+    """Serve the API until cancelled"""
+    adb = adb or AsyncDatabaseManager(Config.DB_HOST, Config.DB_USER, Config.DB_PASSWORD, Config.DB_NAME)
+    service = EnrollmentService(adb)
+    server = await asyncio.start_server(lambda r, w: serve_connection(service, r, w),
+                                        host or Config.SERVICE_HOST, port or Config.SERVICE_PORT)
+    addresses = ', '.join(str(sock.getsockname()) for sock in server.sockets)
+    logger.info(f"Enrollment service listening on {addresses} ({adb.workers} DB connections)")
+    print(f"✅ Enrollment service on {addresses} - {adb.workers} pooled DB connections")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        adb.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Enrollify enrollment HTTP/JSON service')
+    parser.add_argument('--host', default=Config.SERVICE_HOST)
+    parser.add_argument('--port', type=int, default=Config.SERVICE_PORT)
+    parser.add_argument('--workers', type=int, default=Config.DB_POOL_SIZE, help='pooled DB connections')
+    parser.add_argument('--db-host', default=Config.DB_HOST)
+    parser.add_argument('--db-user', default=Config.DB_USER)
+    parser.add_argument('--db-password', default=Config.DB_PASSWORD)
+    parser.add_argument('--database', default=Config.DB_NAME)
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    adb = AsyncDatabaseManager(args.db_host, args.db_user, args.db_password, args.database, workers=args.workers)
+    try:
+        asyncio.run(run_service(args.host, args.port, adb))
+    except KeyboardInterrupt:
+        print("\n👋 Enrollment service stopped")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -15,41 +15,12 @@ class FormCombo(QWidget):
         layout.setSpacing(10)
 
         self.label = QLabel(label_text)
-        self.label.setStyleSheet("""
-            color: #374151;
-            font-size: 14px;
-            font-weight: 600;
-            letter-spacing: 0.3px;
-        """)
+        self.label.setObjectName("fieldLabel")
 
         self.combo = QComboBox()
         self.combo.addItems(items)
         self.combo.setMinimumHeight(52)
-        self.combo.setStyleSheet("""
-            QComboBox {
-                background-color: #FFFFFF;
-                border: none;
-                border-bottom: 2px solid #E5E7EB;
-                border-radius: 0px;
-                padding: 12px 0px;
-                padding-left: 4px;
-                padding-right: 4px;
-                font-size: 14px;
-                color: #1F2937;
-            }
-            QComboBox:focus {
-                border-bottom: 2px solid #2D9B84;
-                background-color: #FAFBFC;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 24px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                width: 0px;
-            }
-        """)
+        self.combo.setObjectName("fieldInput")
 
         # Connect signal
         self.combo.currentTextChanged.connect(self.value_changed.emit)
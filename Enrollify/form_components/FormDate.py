@@ -13,12 +13,7 @@ class FormDate(QWidget):
         layout.setSpacing(10)
 
         self.label = QLabel(label_text)
-        self.label.setStyleSheet("""
-            color: #374151;
-            font-size: 14px;
-            font-weight: 600;
-            letter-spacing: 0.3px;
-        """)
+        self.label.setObjectName("fieldLabel")
         layout.addWidget(self.label)
 
         # Date picker container
@@ -29,7 +24,7 @@ class FormDate(QWidget):
 
         # Month selector
         month_label = QLabel("Month")
-        month_label.setStyleSheet("color: #9CA3AF; font-size: 12px; font-weight: 500;")
+        month_label.setObjectName("fieldHint")
         self.month_combo = QComboBox()
         self.month_combo.addItems([
             "January", "February", "March", "April", "May", "June",
@@ -37,78 +32,27 @@ class FormDate(QWidget):
         ])
         self.month_combo.setCurrentIndex(QDate.currentDate().month() - 1)
         self.month_combo.setMinimumHeight(50)
-        self.month_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #FFFFFF;
-                border: none;
-                border-bottom: 2px solid #E5E7EB;
-                border-radius: 0px;
-                padding: 12px 0px;
-                padding-left: 4px;
-                padding-right: 4px;
-                font-size: 14px;
-                color: #1F2937;
-            }
-            QComboBox:focus {
-                border-bottom: 2px solid #2D9B84;
-                background-color: #FAFBFC;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-        """)
+        self.month_combo.setObjectName("fieldInput")
 
         # Day selector
         day_label = QLabel("Day")
-        day_label.setStyleSheet("color: #9CA3AF; font-size: 12px; font-weight: 500;")
+        day_label.setObjectName("fieldHint")
         self.day_spin = QSpinBox()
         self.day_spin.setMinimum(1)
         self.day_spin.setMaximum(31)
         self.day_spin.setValue(QDate.currentDate().day())
         self.day_spin.setMinimumHeight(50)
-        self.day_spin.setStyleSheet("""
-            QSpinBox {
-                background-color: #FFFFFF;
-                border: none;
-                border-bottom: 2px solid #E5E7EB;
-                border-radius: 0px;
-                padding: 12px 0px;
-                padding-left: 4px;
-                padding-right: 4px;
-                font-size: 14px;
-                color: #1F2937;
-            }
-            QSpinBox:focus {
-                border-bottom: 2px solid #2D9B84;
-                background-color: #FAFBFC;
-            }
-        """)
+        self.day_spin.setObjectName("fieldInput")
 
         # Year selector
         year_label = QLabel("Year")
-        year_label.setStyleSheet("color: #9CA3AF; font-size: 12px; font-weight: 500;")
+        year_label.setObjectName("fieldHint")
         self.year_spin = QSpinBox()
         self.year_spin.setMinimum(1950)
         self.year_spin.setMaximum(QDate.currentDate().year())
         self.year_spin.setValue(QDate.currentDate().year() - 16)  # Default to ~16 years old
         self.year_spin.setMinimumHeight(50)
-        self.year_spin.setStyleSheet("""
-            QSpinBox {
-                background-color: #FFFFFF;
-                border: none;
-                border-bottom: 2px solid #E5E7EB;
-                border-radius: 0px;
-                padding: 12px 0px;
-                padding-left: 4px;
-                padding-right: 4px;
-                font-size: 14px;
-                color: #1F2937;
-            }
-            QSpinBox:focus {
-                border-bottom: 2px solid #2D9B84;
-                background-color: #FAFBFC;
-            }
-        """)
+        self.year_spin.setObjectName("fieldInput")
 
         # Month column
         month_box = QVBoxLayout()
@@ -139,7 +83,7 @@ class FormDate(QWidget):
 
         # Age display
         self.age_label = QLabel()
-        self.age_label.setStyleSheet("color: #059669; font-size: 11px; font-weight: 500; margin-top: 4px;")
+        self.age_label.setObjectName("ageHint")
         layout.addWidget(self.age_label)
 
         # Connect changes to update age
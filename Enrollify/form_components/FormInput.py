@@ -12,36 +12,12 @@ class FormInput(QWidget):
         layout.setSpacing(10)
 
         self.label = QLabel(label_text)
-        self.label.setStyleSheet("""
-            color: #374151;
-            font-size: 14px;
-            font-weight: 600;
-            letter-spacing: 0.3px;
-        """)
+        self.label.setObjectName("fieldLabel")
 
         self.input = QLineEdit()
         self.input.setPlaceholderText(placeholder)
         self.input.setMinimumHeight(52)
-        self.input.setStyleSheet("""
-            QLineEdit {
-                background-color: #FFFFFF;
-                border: none;
-                border-bottom: 2px solid #E5E7EB;
-                border-radius: 0px;
-                padding: 12px 0px;
-                padding-left: 4px;
-                padding-right: 4px;
-                font-size: 14px;
-                color: #1F2937;
-            }
-            QLineEdit:focus {
-                border-bottom: 2px solid #2D9B84;
-                background-color: #FAFBFC;
-            }
-            QLineEdit::placeholder {
-                color: #D1D5DB;
-            }
-        """)
+        self.input.setObjectName("fieldInput")
 
         layout.addWidget(self.label)
         layout.addWidget(self.input)
@@ -0,0 +1,587 @@
+"""
+Synthetic Dataset Generator for Enrollify
+Bulk-loads students, payments with receipts, staff users with student
+assignments and a matching audit log so the app can be tried at scale.
+
+The same --seed always produces the same rows, so benchmark runs are
+comparable between machines.
+
+Usage:
+    python generate_test_data.py --students 10000
+    python generate_test_data.py --students 1000000 --seed 7 --reset
+    python generate_test_data.py --backend sqlite --sqlite-path loadtest.db --students 100000
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+
+from config import Config
+
+
+# ==================== DATASET SHAPE ====================
+
+# Generated LRNs start with 9 so they never collide with real learner numbers
+LRN_BASE = 900000000000
+LRN_LAST = '999999999999'
+
+# Every generated account and audit entry uses this domain, which is how
+# --reset finds them again
+LOADTEST_DOMAIN = 'loadtest.enrollify.edu'
+REGISTRAR_EMAIL = f'registrar@{LOADTEST_DOMAIN}'
+STAFF_PASSWORD = 'staff123'
+
+# Enrollment season the generated timestamps are spread over
+SEASON_START = datetime(2025, 5, 1, 7, 0, 0)
+SEASON_DAYS = 120
+
+FIRST_NAMES_MALE = [
+    'Juan', 'Jose', 'Mark', 'John', 'Paolo', 'Miguel', 'Carlo', 'Angelo', 'Joshua', 'Christian',
+    'Renz', 'Kenneth', 'Adrian', 'Gabriel', 'Nathaniel', 'Rafael', 'Bryan', 'Jericho', 'Vincent', 'Ivan'
+]
+FIRST_NAMES_FEMALE = [
+    'Maria', 'Angel', 'Kristine', 'Nicole', 'Princess', 'Andrea', 'Camille', 'Jasmine', 'Patricia', 'Bea',
+    'Mae', 'Joy', 'Angelica', 'Shaira', 'Trisha', 'Danica', 'Hannah', 'Rhea', 'Sofia', 'Erica'
+]
+LAST_NAMES = [
+    'Santos', 'Reyes', 'Cruz', 'Bautista', 'Ocampo', 'Garcia', 'Mendoza', 'Torres', 'Tomas', 'Andrada',
+    'Castillo', 'Flores', 'Villanueva', 'Ramos', 'Castro', 'Rivera', 'Aquino', 'Navarro', 'Salazar', 'Mercado',
+    'Dela Cruz', 'Gonzales', 'Lopez', 'Hernandez', 'Perez', 'Aguilar', 'Domingo', 'Pascual', 'Soriano', 'Valdez'
+]
+CITIES = [
+    'Quezon City', 'Manila', 'Caloocan', 'Pasig', 'Taguig', 'Makati', 'Marikina', 'Antipolo',
+    'Cainta', 'Valenzuela', 'Malabon', 'Paranaque', 'Las Pinas', 'Muntinlupa', 'San Juan'
+]
+STREETS = ['Rizal St.', 'Mabini St.', 'Bonifacio Ave.', 'Luna St.', 'Magsaysay Blvd.', 'Aguinaldo Hwy.']
+
+# (track, strand, weight) - roughly how a public SHS splits its intake
+TRACK_STRANDS = [
+    ('Academic Track', 'STEM', 24),
+    ('Academic Track', 'ABM', 14),
+    ('Academic Track', 'HUMSS', 18),
+    ('Academic Track', 'GAS', 9),
+    ('TVL Track', 'ICT', 13),
+    ('TVL Track', 'Home Economics', 9),
+    ('TVL Track', 'Agri-Fishery Arts', 4),
+    ('Sports Track', None, 5),
+    ('Arts and Design Track', None, 4),
+]
+GRADES = [('Grade 11', 53), ('Grade 12', 47)]
+GENDERS = [('Male', 49), ('Female', 51)]
+STATUSES = [('Enrolled', 62), ('Pending', 31), ('Rejected', 7)]
+PAYMENT_METHODS = [('card', 22), ('ewallet', 48), ('bank', 30)]
+
+# Same rows as the tuition_fees inserts in enrollify_schema.sql
+# (track, strand, enrollment, miscellaneous, tuition, special)
+TUITION_FEES = [
+    ('Academic Track', 'STEM', 5000, 4500, 18000, 3000),
+    ('Academic Track', 'ABM', 5000, 4500, 16000, 2500),
+    ('Academic Track', 'HUMSS', 5000, 4500, 15000, 2000),
+    ('Academic Track', 'GAS', 5000, 4500, 15000, 2000),
+    ('TVL Track', 'ICT', 5000, 4500, 17000, 2500),
+    ('TVL Track', 'Home Economics', 5000, 4500, 16000, 2500),
+    ('Sports Track', None, 5000, 4500, 15000, 3500),
+    ('Arts and Design Track', None, 5000, 4500, 16000, 3000),
+]
+FEE_TOTALS = {(row[0], row[1]): sum(row[2:]) for row in TUITION_FEES}
+
+
+def _split_weights(pairs):
+    """Split [(value, weight), ...] into two lists for random.choices"""
+    return [p[0] for p in pairs], [p[-1] for p in pairs]
+
+
+# ==================== ROW GENERATION ====================
+
+class DatasetGenerator:
+    """Deterministic row factory - the same seed always yields the same dataset"""
+
+    def __init__(self, seed=42, staff_count=25, assigned_ratio=0.7, audit_per_student=3):
+        self.seed = seed
+        self.staff_count = staff_count
+        self.assigned_ratio = assigned_ratio
+        self.audit_per_student = audit_per_student
+
+        # Separate streams so changing one option does not reshuffle the others
+        self.student_rng = random.Random(seed)
+        self.payment_rng = random.Random(seed * 7919 + 1)
+        self.audit_rng = random.Random(seed * 7919 + 2)
+
+        self.grades, self.grade_weights = _split_weights(GRADES)
+        self.genders, self.gender_weights = _split_weights(GENDERS)
+        self.statuses, self.status_weights = _split_weights(STATUSES)
+        self.programs = [(t, s) for t, s, _ in TRACK_STRANDS]
+        self.program_weights = [w for _, _, w in TRACK_STRANDS]
+        self.methods, self.method_weights = _split_weights(PAYMENT_METHODS)
+
+        self.receipt_seq = 0
+
+    def staff_users(self):
+        """Staff accounts as (email, full_name) pairs"""
+        rng = random.Random(self.seed * 7919 + 3)
+        staff = []
+        for n in range(1, self.staff_count + 1):
+            first = rng.choice(FIRST_NAMES_MALE + FIRST_NAMES_FEMALE)
+            last = rng.choice(LAST_NAMES)
+            staff.append((f'staff{n:03d}@{LOADTEST_DOMAIN}', f'{first} {last}'))
+        return staff
+
+    def students(self, start, count, staff_ids):
+        """
+        Build student rows for indexes [start, start + count)
+
+        staff_ids is a list of (id, email) used for assignments.
+        Returns a list of dicts so each backend can pick its own column order.
+        """
+        rng = self.student_rng
+        rows = []
+        for i in range(start, start + count):
+            gender = rng.choices(self.genders, self.gender_weights)[0]
+            names = FIRST_NAMES_MALE if gender == 'Male' else FIRST_NAMES_FEMALE
+            first = rng.choice(names)
+            middle = rng.choice(LAST_NAMES)
+            last = rng.choice(LAST_NAMES)
+            track, strand = rng.choices(self.programs, self.program_weights)[0]
+            grade = rng.choices(self.grades, self.grade_weights)[0]
+            status = rng.choices(self.statuses, self.status_weights)[0]
+
+            age_days = rng.randint(15 * 365, 18 * 365)
+            created = SEASON_START + timedelta(seconds=rng.randint(0, SEASON_DAYS * 86400))
+            updated = created + timedelta(seconds=rng.randint(0, 14 * 86400)) if status != 'Pending' else created
+
+            staff_id, staff_email = None, None
+            if staff_ids and rng.random() < self.assigned_ratio:
+                staff_id, staff_email = staff_ids[rng.randrange(len(staff_ids))]
+
+            lrn = str(LRN_BASE + i)
+            rows.append({
+                'lrn': lrn,
+                'firstname': first,
+                'middlename': middle,
+                'lastname': last,
+                'gender': gender,
+                'birthdate': (created - timedelta(days=age_days)).strftime('%Y-%m-%d'),
+                'email': f'{first}.{last}.{i}@student.{LOADTEST_DOMAIN}'.lower().replace(' ', ''),
+                'phone': f'09{rng.randint(100000000, 999999999)}',
+                'address': f'{rng.randint(1, 999)} {rng.choice(STREETS)}, {rng.choice(CITIES)}',
+                'grade_level': grade,
+                'track': track,
+                'strand': strand,
+                'guardian_name': f'{rng.choice(FIRST_NAMES_MALE + FIRST_NAMES_FEMALE)} {last}',
+                'guardian_contact': f'09{rng.randint(100000000, 999999999)}',
+                'enrollment_status': status,
+                'assigned_staff_id': staff_id,
+                'assigned_staff_email': staff_email,
+                'created_at': created.strftime('%Y-%m-%d %H:%M:%S'),
+                'updated_at': updated.strftime('%Y-%m-%d %H:%M:%S'),
+            })
+        return rows
+
+    def payments(self, students, id_by_lrn):
+        """Payment rows for the enrolled students in a batch (a few pay in installments)"""
+        rng = self.payment_rng
+        rows = []
+        for s in students:
+            if s['enrollment_status'] != 'Enrolled':
+                continue
+            total = FEE_TOTALS.get((s['track'], s['strand']), 26500)
+            installments = 1 if rng.random() < 0.8 else rng.randint(2, 3)
+            paid_at = datetime.strptime(s['updated_at'], '%Y-%m-%d %H:%M:%S')
+            for n in range(installments):
+                self.receipt_seq += 1
+                when = paid_at + timedelta(days=30 * n, seconds=rng.randint(0, 3600))
+                rows.append({
+                    'student_id': id_by_lrn[s['lrn']],
+                    'lrn': s['lrn'],
+                    'amount': round(total / installments, 2),
+                    'payment_method': rng.choices(self.methods, self.method_weights)[0],
+                    # yyyyMMdd like payment_screen, plus a sequence so receipts stay unique
+                    'receipt_number': f"{when:%Y%m%d}{self.receipt_seq:07d}",
+                    'payment_date': when.strftime('%Y-%m-%d %H:%M:%S'),
+                })
+        return rows
+
+    def audit_entries(self, students, payments):
+        """Audit rows shaped like the ones DatabaseManager.log_action writes"""
+        rng = self.audit_rng
+        rows = []
+        for s in students:
+            rows.append((REGISTRAR_EMAIL, 'ADD_STUDENT', f"Added student: {s['lrn']}", s['created_at']))
+            if s['assigned_staff_email']:
+                rows.append((s['assigned_staff_email'], 'ASSIGN_STUDENT',
+                             f"Assigned student {s['lrn']} to staff {s['assigned_staff_email']}", s['created_at']))
+            if s['enrollment_status'] != 'Pending':
+                rows.append((s['assigned_staff_email'] or REGISTRAR_EMAIL, 'UPDATE_STATUS',
+                             f"Changed status for {s['lrn']} to {s['enrollment_status']}", s['updated_at']))
+            # Background noise (logins, record edits) up to the requested density
+            for _ in range(max(0, self.audit_per_student - 2)):
+                if rng.random() < 0.5:
+                    rows.append((s['assigned_staff_email'] or REGISTRAR_EMAIL, 'LOGIN', 'STAFF logged in',
+                                 s['created_at']))
+                else:
+                    rows.append((REGISTRAR_EMAIL, 'UPDATE_STUDENT', f"Updated student: {s['lrn']}", s['updated_at']))
+        for p in payments:
+            rows.append((REGISTRAR_EMAIL, 'ADD_PAYMENT',
+                         f"Payment received for LRN: {p['lrn']}, Receipt: {p['receipt_number']}", p['payment_date']))
+        return rows
+
+
+# ==================== BACKENDS ====================
+
+STUDENT_COLUMNS = [
+    'lrn', 'firstname', 'middlename', 'lastname', 'gender', 'birthdate', 'email', 'phone', 'address',
+    'grade_level', 'track', 'strand', 'guardian_name', 'guardian_contact', 'enrollment_status',
+    'assigned_staff_id', 'assigned_staff_email', 'created_at', 'updated_at'
+]
+PAYMENT_COLUMNS = ['student_id', 'lrn', 'amount', 'payment_method', 'receipt_number', 'payment_date']
+
+
+class MySQLTarget:
+    """Writes generated rows into the MySQL schema used by database_manager_mysql"""
+
+    placeholder = '%s'
+    staff_role = 'STAFF'
+
+    def __init__(self, host, user, password, database, port=3306):
+        import mysql.connector
+        self.conn = mysql.connector.connect(
+            host=host, user=user, password=password, database=database, port=port,
+            autocommit=False, use_pure=False
+        )
+        self.cursor = self.conn.cursor()
+
+    def prepare(self):
+        """Add the columns/tables the app expects but older schemas lack"""
+        self.cursor.execute('''
+                            SELECT TABLE_NAME, COLUMN_NAME
+                            FROM information_schema.COLUMNS
+                            WHERE TABLE_SCHEMA = DATABASE()
+                            ''')
+        existing = {(t.lower(), c.lower()) for t, c in self.cursor.fetchall()}
+
+        if ('payments', 'receipt_number') not in existing:
+            self.cursor.execute('ALTER TABLE payments ADD COLUMN receipt_number VARCHAR(50) NULL AFTER payment_method')
+        if ('students', 'assigned_staff_id') not in existing:
+            self.cursor.execute('ALTER TABLE students ADD COLUMN assigned_staff_id INT NULL')
+        if ('students', 'assigned_staff_email') not in existing:
+            self.cursor.execute('ALTER TABLE students ADD COLUMN assigned_staff_email VARCHAR(150) NULL')
+
+        # Bulk load speedups for this session only
+        self.cursor.execute('SET SESSION unique_checks = 0')
+        self.cursor.execute('SET SESSION foreign_key_checks = 0')
+        self.conn.commit()
+
+    def staff_password(self):
+        from auth_utils import hash_password
+        # One bcrypt hash shared by every generated account - hashing is deliberately slow
+        return hash_password(STAFF_PASSWORD)
+
+    def staff_insert_sql(self):
+        return ('INSERT INTO users (email, password_hash, role, full_name, is_active) '
+                'VALUES (%s, %s, %s, %s, 1)')
+
+    def finish(self):
+        self.cursor.execute('SET SESSION unique_checks = 1')
+        self.cursor.execute('SET SESSION foreign_key_checks = 1')
+        # Running terminals drop their cached reads of the loaded tables
+        self.cursor.execute("SHOW TABLES LIKE 'data_versions'")
+        if self.cursor.fetchall():
+            self.cursor.execute(
+                "INSERT INTO data_versions (table_name, version) "
+                "VALUES ('students', 1), ('payments', 1), ('users', 1) "
+                "ON DUPLICATE KEY UPDATE version = version + 1"
+            )
+        self.conn.commit()
+
+    def close(self):
+        self.cursor.close()
+        self.conn.close()
+
+
+class SQLiteTarget:
+    """Writes generated rows into a SQLite file laid out like enrollify.db"""
+
+    placeholder = '?'
+    staff_role = 'staff'
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        self.cursor = self.conn.cursor()
+        # The file is scratch data - trade durability for load speed
+        self.cursor.execute('PRAGMA synchronous = OFF')
+        self.cursor.execute('PRAGMA journal_mode = WAL')
+
+    def prepare(self):
+        """Create the tables if this is a fresh file, then add missing columns"""
+        self.cursor.executescript('''
+            CREATE TABLE IF NOT EXISTS students (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                lrn TEXT UNIQUE NOT NULL,
+                firstname TEXT NOT NULL,
+                middlename TEXT,
+                lastname TEXT NOT NULL,
+                gender TEXT NOT NULL,
+                birthdate TEXT NOT NULL,
+                email TEXT NOT NULL,
+                phone TEXT NOT NULL,
+                address TEXT NOT NULL,
+                grade_level TEXT NOT NULL,
+                track TEXT NOT NULL,
+                strand TEXT,
+                guardian_name TEXT NOT NULL,
+                guardian_contact TEXT NOT NULL,
+                enrollment_status TEXT DEFAULT 'Pending',
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE IF NOT EXISTS payments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                student_id INTEGER NOT NULL,
+                lrn TEXT NOT NULL,
+                amount REAL NOT NULL,
+                payment_method TEXT NOT NULL,
+                payment_status TEXT DEFAULT 'Completed',
+                payment_date TEXT DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (student_id) REFERENCES students(id),
+                FOREIGN KEY (lrn) REFERENCES students(lrn)
+            );
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                email TEXT UNIQUE NOT NULL,
+                password TEXT NOT NULL,
+                role TEXT NOT NULL CHECK(role IN ('staff', 'admin')),
+                full_name TEXT NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE IF NOT EXISTS audit_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_email TEXT,
+                action TEXT NOT NULL,
+                details TEXT,
+                timestamp TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE IF NOT EXISTS tracks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL,
+                description TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE IF NOT EXISTS strands (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                track TEXT NOT NULL,
+                FOREIGN KEY (track) REFERENCES tracks(name) ON DELETE CASCADE
+            );
+            CREATE TABLE IF NOT EXISTS tuition_fees (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                track TEXT NOT NULL,
+                strand TEXT,
+                enrollment_fee REAL DEFAULT 5000,
+                miscellaneous_fee REAL DEFAULT 4500,
+                tuition_fee REAL NOT NULL,
+                special_fee REAL DEFAULT 0,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE (track, strand)
+            );
+        ''')
+
+        # Reference data the app expects (same names as enrollify_schema.sql)
+        if self.cursor.execute('SELECT COUNT(*) FROM tracks').fetchone()[0] == 0:
+            tracks = list(dict.fromkeys(t for t, _, _ in TRACK_STRANDS))
+            self.cursor.executemany('INSERT INTO tracks (name) VALUES (?)', [(t,) for t in tracks])
+        if self.cursor.execute('SELECT COUNT(*) FROM strands').fetchone()[0] == 0:
+            self.cursor.executemany('INSERT INTO strands (name, track) VALUES (?, ?)',
+                                    [(s, t) for t, s, _ in TRACK_STRANDS if s])
+        if self.cursor.execute('SELECT COUNT(*) FROM tuition_fees').fetchone()[0] == 0:
+            self.cursor.executemany('''
+                INSERT INTO tuition_fees (track, strand, enrollment_fee, miscellaneous_fee, tuition_fee, special_fee)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', TUITION_FEES)
+        for table, column, ddl in [
+            ('payments', 'receipt_number', 'TEXT'),
+            ('students', 'assigned_staff_id', 'INTEGER'),
+            ('students', 'assigned_staff_email', 'TEXT'),
+        ]:
+            columns = [row[1] for row in self.cursor.execute(f'PRAGMA table_info({table})')]
+            if column not in columns:
+                self.cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {ddl}')
+        self.conn.commit()
+
+    def staff_password(self):
+        # database_manager.py compares plain-text passwords
+        return STAFF_PASSWORD
+
+    def staff_insert_sql(self):
+        return 'INSERT INTO users (email, password, role, full_name) VALUES (?, ?, ?, ?)'
+
+    def finish(self):
+        self.conn.commit()
+
+    def close(self):
+        self.cursor.close()
+        self.conn.close()
+
+
+# ==================== LOADING ====================
+
+def reset_generated_data(target):
+    """Remove rows from a previous run (only generated LRNs and load test accounts)"""
+    p = target.placeholder
+    lrn_range = (str(LRN_BASE), LRN_LAST)
+    domain = (f'%@{LOADTEST_DOMAIN}',)
+    target.cursor.execute(f'DELETE FROM payments WHERE lrn BETWEEN {p} AND {p}', lrn_range)
+    target.cursor.execute(f'DELETE FROM students WHERE lrn BETWEEN {p} AND {p}', lrn_range)
+    target.cursor.execute(f'DELETE FROM audit_log WHERE user_email LIKE {p}', domain)
+    target.cursor.execute(f'DELETE FROM users WHERE email LIKE {p}', domain)
+    target.conn.commit()
+
+
+def load_staff(target, generator):
+    """Insert staff accounts and return [(id, email), ...]"""
+    staff = generator.staff_users()
+    if not staff:
+        return []
+
+    password = target.staff_password()
+    target.cursor.executemany(
+        target.staff_insert_sql(),
+        [(email, password, target.staff_role, name) for email, name in staff]
+    )
+    target.conn.commit()
+
+    p = target.placeholder
+    target.cursor.execute(f'SELECT id, email FROM users WHERE email LIKE {p} ORDER BY email',
+                          (f'staff%@{LOADTEST_DOMAIN}',))
+    return [(row[0], row[1]) for row in target.cursor.fetchall()]
+
+
+def load_dataset(target, student_count, seed=42, staff_count=25, batch_size=10000,
+                 audit_per_student=3, reset=False, progress=True):
+    """
+    Generate and insert the whole dataset through executemany
+
+    Returns a dict of row counts per table.
+    """
+    generator = DatasetGenerator(seed=seed, staff_count=staff_count, audit_per_student=audit_per_student)
+    p = target.placeholder
+
+    student_sql = (f"INSERT INTO students ({', '.join(STUDENT_COLUMNS)}) "
+                   f"VALUES ({', '.join([p] * len(STUDENT_COLUMNS))})")
+    payment_sql = (f"INSERT INTO payments ({', '.join(PAYMENT_COLUMNS)}) "
+                   f"VALUES ({', '.join([p] * len(PAYMENT_COLUMNS))})")
+    audit_sql = f"INSERT INTO audit_log (user_email, action, details, timestamp) VALUES ({p}, {p}, {p}, {p})"
+    id_sql = f'SELECT id, lrn FROM students WHERE lrn BETWEEN {p} AND {p}'
+
+    target.prepare()
+    if reset:
+        reset_generated_data(target)
+
+    counts = {'students': 0, 'payments': 0, 'users': 0, 'audit_log': 0}
+    staff_ids = load_staff(target, generator)
+    counts['users'] = len(staff_ids)
+
+    started = time.perf_counter()
+    for start in range(0, student_count, batch_size):
+        count = min(batch_size, student_count - start)
+        students = generator.students(start, count, staff_ids)
+
+        target.cursor.executemany(student_sql, [tuple(s[c] for c in STUDENT_COLUMNS) for s in students])
+
+        # Payments need the AUTO_INCREMENT ids the batch just received
+        target.cursor.execute(id_sql, (students[0]['lrn'], students[-1]['lrn']))
+        id_by_lrn = {lrn: sid for sid, lrn in target.cursor.fetchall()}
+
+        payments = generator.payments(students, id_by_lrn)
+        if payments:
+            target.cursor.executemany(payment_sql, [tuple(pay[c] for c in PAYMENT_COLUMNS) for pay in payments])
+
+        audit = generator.audit_entries(students, payments)
+        target.cursor.executemany(audit_sql, audit)
+        target.conn.commit()
+
+        counts['students'] += len(students)
+        counts['payments'] += len(payments)
+        counts['audit_log'] += len(audit)
+
+        if progress:
+            elapsed = time.perf_counter() - started
+            rate = counts['students'] / elapsed if elapsed else 0
+            print(f"  ... {counts['students']:,}/{student_count:,} students "
+                  f"({rate:,.0f}/s, {elapsed:.1f}s)", flush=True)
+
+    target.finish()
+    return counts
+
+
+def open_target(args):
+    """Open the backend selected on the command line"""
+    if args.backend == 'sqlite':
+        return SQLiteTarget(args.sqlite_path)
+    return MySQLTarget(
+        host=args.host, user=args.user, password=args.password,
+        database=args.database, port=args.port
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a synthetic Enrollify dataset for load testing')
+    parser.add_argument('--students', type=int, default=10000, help='number of students (default: 10000)')
+    parser.add_argument('--staff', type=int, default=25, help='number of staff accounts (default: 25)')
+    parser.add_argument('--seed', type=int, default=42, help='random seed (default: 42)')
+    parser.add_argument('--audit-per-student', type=int, default=3,
+                        help='approximate audit rows per student (default: 3)')
+    parser.add_argument('--batch-size', type=int, default=10000, help='rows per executemany batch')
+    parser.add_argument('--reset', action='store_true', help='delete rows from a previous generator run first')
+    parser.add_argument('--backend', choices=['mysql', 'sqlite'], default='mysql')
+    parser.add_argument('--sqlite-path', default='loadtest.db', help='SQLite file (sqlite backend only)')
+    parser.add_argument('--host', default=Config.DB_HOST)
+    parser.add_argument('--port', type=int, default=Config.DB_PORT)
+    parser.add_argument('--user', default=Config.DB_USER)
+    parser.add_argument('--password', default=Config.DB_PASSWORD)
+    parser.add_argument('--database', default=Config.DB_NAME)
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("ENROLLIFY SYNTHETIC DATASET")
+    print("=" * 60)
+    target_name = args.sqlite_path if args.backend == 'sqlite' else f"{args.database}@{args.host}"
+    print(f"Backend:  {args.backend} ({target_name})")
+    print(f"Students: {args.students:,}   Staff: {args.staff}   Seed: {args.seed}")
+    print()
+
+    try:
+        target = open_target(args)
+    except Exception as e:
+        print(f"❌ Could not open database: {e}")
+        return 1
+
+    started = time.perf_counter()
+    try:
+        counts = load_dataset(
+            target, args.students, seed=args.seed, staff_count=args.staff,
+            batch_size=args.batch_size, audit_per_student=args.audit_per_student, reset=args.reset
+        )
+    except Exception as e:
+        print(f"❌ Load failed: {e}")
+        if 'Duplicate' in str(e) or 'UNIQUE' in str(e):
+            print("   Generated rows already exist - run again with --reset")
+        return 1
+    finally:
+        target.close()
+
+    elapsed = time.perf_counter() - started
+    print()
+    print("=" * 60)
+    print(f"✅ Done in {elapsed:.1f}s")
+    for table, count in counts.items():
+        print(f"   {table:<10} {count:>12,}")
+    print(f"   Staff login password: {STAFF_PASSWORD}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
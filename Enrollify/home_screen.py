@@ -1,8 +1,7 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QSizePolicy
 from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtGui import QPixmap, QFont, QColor, QPainter, QPen
-from PyQt6.QtSvgWidgets import QSvgWidget
-import os
+import icons
 
 
 class HomeScreen(QWidget):
@@ -34,44 +33,13 @@ class HomeScreen(QWidget):
         icon_label = QLabel()
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        # Try different file extensions
-        icon_extensions = ['.png', '.svg', '.jpg', '.jpeg']
-        icon_path = None
-
-        for ext in icon_extensions:
-            path = f'assets/icons/{icon_name}{ext}'
-            if os.path.exists(path):
-                icon_path = path
-                break
-
-        if icon_path:
-            if icon_path.endswith('.svg'):
-                # For SVG files, use QSvgWidget approach
-                svg_widget = QSvgWidget(icon_path)
-                svg_widget.setFixedSize(size, size)
-                # Create a layout to embed the SVG widget - centered
-                container = QWidget()
-                container.setStyleSheet("background-color: transparent;")
-                container.setFixedHeight(size)
-                layout = QHBoxLayout(container)
-                layout.setContentsMargins(0, 0, 0, 0)
-                layout.addStretch()
-                layout.addWidget(svg_widget)
-                layout.addStretch()
-                return container
-            else:
-                # For raster images (PNG, JPG)
-                pixmap = QPixmap(icon_path)
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(
-                        size, size,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    icon_label.setPixmap(scaled_pixmap)
-                    icon_label.setFixedHeight(size)
-                    icon_label.setStyleSheet("background-color: transparent;")
-                    return icon_label
+        # .png/.svg/.jpg resolved once; SVGs are pre-rendered at this size
+        pixmap = icons.pixmap(f'icons/{icon_name}', size)
+        if pixmap is not None:
+            icon_label.setPixmap(pixmap)
+            icon_label.setFixedHeight(size)
+            icon_label.setStyleSheet("background-color: transparent;")
+            return icon_label
 
         # Fallback to emoji/text
         icon_label.setText(fallback_text)
@@ -168,16 +136,10 @@ class HomeScreen(QWidget):
 
         # Logo at top
         logo_label = QLabel()
-        if os.path.exists('assets/enrollify_logo.png'):
-            pixmap = QPixmap('assets/enrollify_logo.png')
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(100, 100, Qt.AspectRatioMode.KeepAspectRatio,
-                                       Qt.TransformationMode.SmoothTransformation)
-                logo_label.setPixmap(scaled)
-                logo_label.setFixedSize(scaled.size())
-            else:
-                logo_label.setFixedSize(80, 80)
-                self.create_checkmark_logo(logo_label)
+        scaled = icons.pixmap('enrollify_logo.png', 100)
+        if scaled is not None:
+            logo_label.setPixmap(scaled)
+            logo_label.setFixedSize(icons.logical_size(scaled))
         else:
             logo_label.setFixedSize(80, 80)
             self.create_checkmark_logo(logo_label)
@@ -0,0 +1,219 @@
+"""
+Icon and pixmap registry for Enrollify
+Every screen loads its logo and icons through here:
+    - each asset name is resolved to a file once (no repeated os.path.exists)
+    - paths are looked up in asset_dirs(), not the working directory
+    - SVGs are rendered straight at the target size and device pixel ratio
+    - scaled pixmaps are kept in QPixmapCache keyed by (name, size, dpr)
+
+Assets can also be compiled into a Qt resource bundle so loading an icon
+does no filesystem I/O at all:
+    python icons.py --build-rcc        # writes Config.ASSET_BUNDLE
+When the bundle exists it is registered on first use and preferred over
+the loose files.
+
+Example:
+    pixmap = icons.pixmap('icons/search', 20)      # extension optional
+    label = icons.icon_label('icons/admin', 18, fallback_text="🛡")
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import Qt, QResource, QRectF, QFile
+from PyQt6.QtGui import QPixmap, QPixmapCache, QPainter, QGuiApplication
+from PyQt6.QtSvg import QSvgRenderer
+
+from config import Config
+from logger_config import get_logger
+
+logger = get_logger(__name__)
+
+ICON_EXTENSIONS = ('.png', '.svg', '.jpg', '.jpeg')
+RESOURCE_PREFIX = ':/enrollify/'
+
+# asset name -> resolved path (None when missing)
+_resolved = {}
+_bundle_registered = None
+
+
+def asset_dirs():
+    """
+    Folders searched for assets, in order: Config.ASSETS_DIR, then the
+    assets/ folder next to the application folder (where the repository
+    keeps the icons and logo - the old 'assets/...' paths only worked when
+    started from the repository root)
+    """
+    dirs = []
+    for directory in (Config.ASSETS_DIR, Config.BASE_DIR.parent / 'assets'):
+        if directory.is_dir() and directory not in dirs:
+            dirs.append(directory)
+    return dirs
+
+
+def register_resource_bundle(path=None):
+    """Register the compiled .rcc bundle if it exists; returns True when registered"""
+    global _bundle_registered
+    path = str(path or Config.ASSET_BUNDLE)
+    _bundle_registered = os.path.exists(path) and QResource.registerResource(path)
+    if _bundle_registered:
+        logger.info(f"Asset bundle registered: {path}")
+    return _bundle_registered
+
+
+def resolve(name):
+    """
+    Path of an asset such as 'enrollify_logo.png' or 'icons/search'
+    (without an extension, .png/.svg/.jpg/.jpeg are tried in that order)
+    """
+    if name in _resolved:
+        return _resolved[name]
+    if _bundle_registered is None:
+        register_resource_bundle()
+
+    candidates = [name] if os.path.splitext(name)[1] else [name + ext for ext in ICON_EXTENSIONS]
+    path = None
+    for candidate in candidates:
+        if _bundle_registered and QFile.exists(RESOURCE_PREFIX + candidate):
+            path = RESOURCE_PREFIX + candidate
+            break
+        on_disk = next((d / candidate for d in asset_dirs() if (d / candidate).exists()), None)
+        if on_disk is not None:
+            path = str(on_disk)
+            break
+
+    _resolved[name] = path
+    return path
+
+
+def _device_pixel_ratio():
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app is not None else 1.0
+
+
+def _render(path, size, dpr):
+    """Pixmap of path fitted into a size x size box at dpr"""
+    target = int(round(size * dpr))
+    if path.endswith('.svg'):
+        renderer = QSvgRenderer(path)
+        if not renderer.isValid():
+            return None
+        bounds = renderer.defaultSize()
+        scale = target / max(bounds.width(), bounds.height(), 1)
+        result = QPixmap(max(1, int(bounds.width() * scale)), max(1, int(bounds.height() * scale)))
+        result.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(result)
+        renderer.render(painter, QRectF(0, 0, result.width(), result.height()))
+        painter.end()
+    else:
+        source = QPixmap(path)
+        if source.isNull():
+            return None
+        result = source.scaled(target, target, Qt.AspectRatioMode.KeepAspectRatio,
+                               Qt.TransformationMode.SmoothTransformation)
+    result.setDevicePixelRatio(dpr)
+    return result
+
+
+def pixmap(name, size, device_pixel_ratio=None):
+    """Cached pixmap of an asset fitted into size x size logical pixels, or None if missing"""
+    path = resolve(name)
+    if path is None:
+        return None
+
+    dpr = device_pixel_ratio or _device_pixel_ratio()
+    key = f"enrollify:{name}:{size}:{dpr}"
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+
+    result = _render(path, size, dpr)
+    if result is None:
+        logger.warning(f"Could not load image asset: {path}")
+        return None
+    QPixmapCache.insert(key, result)
+    return result
+
+
+def logical_size(pm):
+    """Size of a pixmap in widget (device independent) pixels"""
+    return pm.deviceIndependentSize().toSize()
+
+
+def icon_label(name, size, fallback_text="", fallback_style=""):
+    """QLabel showing the icon, or fallback_text when the asset is missing"""
+    label = QLabel()
+    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    pm = pixmap(name, size)
+    if pm is not None:
+        label.setPixmap(pm)
+    else:
+        label.setText(fallback_text)
+        if fallback_style:
+            label.setStyleSheet(fallback_style)
+    return label
+
+
+# ==================== RESOURCE BUNDLE ====================
+
+def write_qrc(qrc_path):
+    """Write a .qrc with every image under asset_dirs(); returns the file count"""
+    files = {}
+    for directory in asset_dirs():
+        for root, _, names in os.walk(directory):
+            for file_name in sorted(names):
+                if not file_name.lower().endswith(ICON_EXTENSIONS):
+                    continue
+                full = os.path.join(root, file_name)
+                alias = os.path.relpath(full, directory).replace(os.sep, '/')
+                # The first folder wins, as in resolve()
+                files.setdefault(alias, os.path.abspath(full))
+
+    lines = ['<!DOCTYPE RCC>', '<RCC version="1.0">', '<qresource prefix="/enrollify">']
+    lines += [f'    <file alias="{alias}">{full}</file>' for alias, full in sorted(files.items())]
+    lines += ['</qresource>', '</RCC>']
+    with open(qrc_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    return len(files)
+
+
+def build_rcc(output=None):
+    """Compile the image assets into a binary .rcc with Qt's rcc tool"""
+    output = str(output or Config.ASSET_BUNDLE)
+    qrc_path = output + '.qrc'
+    count = write_qrc(qrc_path)
+
+    # Qt's own rcc, or the copy that ships with PySide6
+    if shutil.which('rcc'):
+        command = ['rcc', '--binary', qrc_path, '-o', output]
+    elif shutil.which('pyside6-rcc'):
+        command = ['pyside6-rcc', '--binary', qrc_path, '-o', output]
+    else:
+        raise RuntimeError("Neither 'rcc' nor 'pyside6-rcc' was found on PATH")
+
+    try:
+        subprocess.run(command, check=True)
+    finally:
+        os.remove(qrc_path)
+    return output, count
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Enrollify asset tools')
+    parser.add_argument('--build-rcc', action='store_true', help='compile the image assets into a .rcc bundle')
+    parser.add_argument('--output', default=None, help=f'bundle path (default {Config.ASSET_BUNDLE})')
+    args = parser.parse_args()
+
+    if args.build_rcc:
+        try:
+            path, count = build_rcc(args.output)
+        except Exception as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"✅ {count} assets compiled into {path}")
+    else:
+        parser.print_help()
@@ -1,26 +1,111 @@
 """
 Logging configuration for Enrollify System
 Sets up file and console logging
+
+Log calls never touch the disk on the caller's thread: the root logger
+only has a QueueHandler, and a QueueListener thread writes the records
+to the rotating files and the console.
 """
 
+import atexit
+import gzip
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
 import sys
+import threading
+import time
 from pathlib import Path
 from config import Config
 
+_listener = None
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Sampling for high-volume messages
+
+    Each call site (file + line) may log `limit` records per `window`
+    seconds; further records are dropped and counted, and the next record
+    that gets through says how many were suppressed. Errors always pass.
+    """
+
+    def __init__(self, limit=None, window=None):
+        super().__init__()
+        self.limit = limit or Config.LOG_RATE_LIMIT
+        self.window = window or Config.LOG_RATE_WINDOW
+        self._sites = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.ERROR:
+            return True
+
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            window_start, count, suppressed = self._sites.get(key, (now, 0, 0))
+            if now - window_start >= self.window:
+                window_start, count = now, 0
+
+            if count >= self.limit:
+                self._sites[key] = (window_start, count, suppressed + 1)
+                return False
+            self._sites[key] = (window_start, count + 1, 0)
+
+        if suppressed:
+            record.msg = f"{record.getMessage()} [{suppressed} similar messages suppressed]"
+            record.args = None
+        return True
+
+
+def _gzip_namer(name):
+    return name + '.gz'
+
+
+def _gzip_rotator(source, dest):
+    """Compress the rotated file (runs on the listener thread)"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def _rotating_handler(filename, level, formatter):
+    handler = logging.handlers.RotatingFileHandler(
+        Config.LOGS_DIR / filename,
+        maxBytes=Config.LOG_MAX_BYTES,
+        backupCount=Config.LOG_BACKUP_COUNT,
+        encoding='utf-8',
+        delay=True
+    )
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    handler.setLevel(level)
+    handler.setFormatter(formatter)
+    return handler
+
 
 def setup_logging():
     """
     Setup application logging
 
     Creates:
-    - enrollify.log: All logs (INFO and above)
-    - errors.log: Error logs only
+    - enrollify.log: All logs (INFO and above), rotated and gzip compressed
+    - errors.log: Error logs only, rotated and gzip compressed
     - Console output: Warnings and errors
 
+    Safe to call more than once - later calls return the configured logger.
+
     Returns:
         logging.Logger: Configured root logger
     """
+    global _listener
+
+    root_logger = logging.getLogger()
+    if _listener is not None:
+        return root_logger
 
     # Ensure log directory exists
     Config.ensure_directories()
@@ -37,37 +122,36 @@ def setup_logging():
     )
 
     # File handler for all logs
-    all_logs_handler = logging.FileHandler(
-        Config.LOGS_DIR / 'enrollify.log',
-        encoding='utf-8'
-    )
-    all_logs_handler.setLevel(logging.INFO)
-    all_logs_handler.setFormatter(detailed_formatter)
+    all_logs_handler = _rotating_handler('enrollify.log', logging.DEBUG, detailed_formatter)
 
     # File handler for errors only
-    error_handler = logging.FileHandler(
-        Config.LOGS_DIR / 'errors.log',
-        encoding='utf-8'
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(detailed_formatter)
+    error_handler = _rotating_handler('errors.log', logging.ERROR, detailed_formatter)
 
     # Console handler for development
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.WARNING)
     console_handler.setFormatter(simple_formatter)
 
+    # The only handler on the caller's thread: put the record on a queue
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+
     # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
+    root_logger.setLevel(getattr(logging, str(Config.LOG_LEVEL).upper(), logging.INFO))
 
     # Remove existing handlers (in case of reconfiguration)
     root_logger.handlers.clear()
 
     # Add handlers
-    root_logger.addHandler(all_logs_handler)
-    root_logger.addHandler(error_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, all_logs_handler, error_handler, console_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
 
     # Log startup message
     root_logger.info("=" * 60)
@@ -77,6 +161,16 @@ def setup_logging():
     return root_logger
 
 
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
 def get_logger(name):
     """
     Get a logger instance for a specific module
@@ -91,4 +185,4 @@ def get_logger(name):
         logger = get_logger(__name__)
         logger.info("This is an info message")
     """
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
@@ -1,15 +1,49 @@
 """
 MAIN.PY - MVC Integration Fixed
 Properly integrates View and Controller
+
+Only HomeScreen is imported and built at startup; every other screen is
+imported and constructed the first time the user navigates to it.
+
+Startup report:
+    python main.py --startup-report     # time each startup phase, then exit
+    python -X importtime main.py        # per-module import times (CPython)
 """
 
 import sys
 import os
+import time
+import importlib
+
+_STARTED = time.perf_counter()
+STARTUP_REPORT = '--startup-report' in sys.argv or os.environ.get('ENROLLIFY_STARTUP_REPORT') == '1'
+_startup_phases = []
+
+
+def mark_startup(phase):
+    """Record how long startup took to reach phase (and how many modules are loaded)"""
+    _startup_phases.append((phase, (time.perf_counter() - _STARTED) * 1000, len(sys.modules)))
 
 os.environ['QT_AUTO_SCREEN_SCALE_FACTOR'] = '1'
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QShortcut, QKeySequence
+
+from logger_config import setup_logging, get_logger
+
+# Before anything else logs: records go through a queue to rotating files
+setup_logging()
+logger = get_logger(__name__)
+
+from decorators import track_latency, profiled
+from metrics import start_metrics_exporter
+from stall_watchdog import start_stall_watchdog, StallDiagnosticsDialog
+from connection_monitor import start_database_warmup, CONNECTING, CONNECTED, FAILED
+from change_feed import start_change_feed
+from offline_queue import start_offline_sync, get_offline_sync, is_connection_error
+from config import Config
+from ui_styles import apply_app_stylesheet
 
 QApplication.setHighDpiScaleFactorRoundingPolicy(
     Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -24,17 +58,6 @@ print("=" * 80)
 # ============================================================================
 print("\n[1/4] Loading MVC Components...")
 
-try:
-    # ✅ CORRECT: Import View and Controller separately
-    from enrollment_form_view import EnrollmentFormView
-    from enrollment_controller import EnrollmentFormController
-    print("  ✅ EnrollmentFormView (MVC)")
-    print("  ✅ EnrollmentFormController (MVC)")
-except Exception as e:
-    print(f"  ❌ Enrollment MVC: {e}")
-    EnrollmentFormView = None
-    EnrollmentFormController = None
-
 try:
     from home_screen import HomeScreen
     print("  ✅ HomeScreen")
@@ -42,26 +65,20 @@ except Exception as e:
     print(f"  ❌ HomeScreen: {e}")
     sys.exit(1)
 
-try:
-    from payment_screen import PaymentScreen
-    print("  ✅ PaymentScreen")
-except Exception as e:
-    print(f"  ⚠️ PaymentScreen: {e}")
-    PaymentScreen = None
-
-# Import staff screens
-try:
-    from staff_login import StaffLoginScreen
-    from admin_login import AdminLoginScreen
-    from staff_portal import StaffPortalScreen
-    from enrollees_screen import EnrolleesScreen
-    from reports_screen import ReportsScreen
-    from admin_screen import AdminScreen
-    print("  ✅ Staff Screens")
-    HAS_STAFF_SCREENS = True
-except Exception as e:
-    print(f"  ⚠️ Staff Screens: {e}")
-    HAS_STAFF_SCREENS = False
+# Everything else is imported on first navigation (see EnrollifyApp.screen)
+# name: (module, class)
+LAZY_SCREENS = {
+    'enrollment': ('enrollment_form_view', 'EnrollmentFormView'),
+    'payment': ('payment_screen', 'PaymentScreen'),
+    'staff_login': ('staff_login', 'StaffLoginScreen'),
+    'admin_login': ('admin_login', 'AdminLoginScreen'),
+    'staff_portal': ('staff_portal', 'StaffPortalScreen'),
+    'enrollees': ('enrollees_screen', 'EnrolleesScreen'),
+    'reports': ('reports_screen', 'ReportsScreen'),
+    'admin': ('admin_screen', 'AdminScreen'),
+}
+logger.info(f"{len(LAZY_SCREENS)} screens deferred until first use")
+mark_startup("imports")
 
 # ============================================================================
 # STEP 2: Setup Database
@@ -71,16 +88,19 @@ print("\n[2/4] Setting Up Database...")
 db_instance = None
 try:
     from database_manager_mysql import get_database
+    # Connects in the background once the window is up (EnrollifyApp.start_database_warmup)
     db_instance = get_database(
         host="127.0.0.1",
         user="root",
         password="",
-        database="enrollify_db"
+        database="enrollify_db",
+        connect=False
     )
-    print("  ✅ MySQL Connected")
+    logger.info("MySQL connects in the background")
 except Exception as e:
     print(f"  ⚠️ Database: {e}")
     db_instance = None
+mark_startup("database")
 
 
 # ============================================================================
@@ -103,6 +123,11 @@ class EnrollifyApp(QMainWindow):
 
         print("[4/4] Creating Screens...")
 
+        # Screens other than home are built by self.screen(name) on first use
+        self._screens = {}
+        self._failed_screens = {}
+        self.enrollment_controller = None
+
         # ====================================================================
         # HOME SCREEN
         # ====================================================================
@@ -114,79 +139,6 @@ class EnrollifyApp(QMainWindow):
             print(f"  ❌ Home Screen: {e}")
             raise
 
-        # ====================================================================
-        # ENROLLMENT FORM (✅ MVC VERSION - FIXED!)
-        # ====================================================================
-        if EnrollmentFormView and EnrollmentFormController:
-            try:
-                # Create View
-                self.enrollment_view = EnrollmentFormView()
-
-                # Create Controller and connect it to View
-                self.enrollment_controller = EnrollmentFormController(self.enrollment_view)
-
-                # Connect controller signals to main app
-                self.enrollment_controller.enrollment_complete.connect(
-                    self.handle_enrollment_complete
-                )
-
-                # Connect view logout signal
-                self.enrollment_view.logout_clicked.connect(self.show_home)
-
-                # Add view to stacked widget
-                self.stacked_widget.addWidget(self.enrollment_view)
-
-                print("  ✅ Enrollment Form (MVC - View + Controller)")
-            except Exception as e:
-                print(f"  ❌ Enrollment Form: {e}")
-                import traceback
-                traceback.print_exc()
-                self.enrollment_view = None
-        else:
-            print("  ⚠️ Enrollment Form: MVC components not available")
-            self.enrollment_view = None
-
-        # ====================================================================
-        # PAYMENT SCREEN
-        # ====================================================================
-        self.payment_screen = None
-        if PaymentScreen:
-            try:
-                self.payment_screen = PaymentScreen()
-                self.stacked_widget.addWidget(self.payment_screen)
-                print("  ✅ Payment Screen")
-            except Exception as e:
-                print(f"  ⚠️ Payment Screen: {e}")
-
-        # ====================================================================
-        # STAFF SCREENS
-        # ====================================================================
-        self.staff_screens_available = False
-        if HAS_STAFF_SCREENS:
-            try:
-                self.staff_login = StaffLoginScreen()
-                self.stacked_widget.addWidget(self.staff_login)
-
-                self.admin_login = AdminLoginScreen()
-                self.stacked_widget.addWidget(self.admin_login)
-
-                self.staff_portal = StaffPortalScreen()
-                self.stacked_widget.addWidget(self.staff_portal)
-
-                self.enrollees_screen = EnrolleesScreen()
-                self.stacked_widget.addWidget(self.enrollees_screen)
-
-                self.reports_screen = ReportsScreen()
-                self.stacked_widget.addWidget(self.reports_screen)
-
-                self.admin_screen = AdminScreen()
-                self.stacked_widget.addWidget(self.admin_screen)
-
-                self.staff_screens_available = True
-                print("  ✅ Staff Screens")
-            except Exception as e:
-                print(f"  ⚠️ Staff Screens: {e}")
-
         # ====================================================================
         # CONNECT SIGNALS
         # ====================================================================
@@ -198,67 +150,155 @@ class EnrollifyApp(QMainWindow):
         self.home_screen.admin_login_signal.connect(self.show_admin_login)
         print("  ✅ Home Screen Signals")
 
-        # Payment screen
-        if self.payment_screen:
-            self.payment_screen.logout_signal.connect(self.show_home)
-            self.payment_screen.back_signal.connect(self.show_enrollment_form)
-            self.payment_screen.payment_completed.connect(self.handle_payment_completion)
-            print("  ✅ Payment Screen Signals")
-
-        # Staff screens
-        if self.staff_screens_available:
-            self.staff_login.back_signal.connect(self.show_home)
-            self.staff_login.login_signal.connect(self.handle_staff_login)
-
-            self.admin_login.back_signal.connect(self.show_home)
-            self.admin_login.login_signal.connect(self.handle_admin_login)
-
-            self.staff_portal.logout_signal.connect(self.show_home)
-            self.enrollees_screen.logout_signal.connect(self.show_home)
-            self.reports_screen.logout_signal.connect(self.show_home)
-            self.admin_screen.logout_signal.connect(self.show_home)
-
-            print("  ✅ Staff Screen Signals")
+        # Diagnostics: GUI stalls recorded by the watchdog
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=self.show_stall_diagnostics)
 
         # Show home screen
         self.show_home()
+        mark_startup("home screen")
 
         print("\n[6/6] ✅ Application Ready!")
         print("=" * 80)
-        print(f"\n📊 Feature Status:")
-        print(f"  • Core Features: ✅ Available")
-        print(f"  • MVC Pattern: ✅ Enrollment Form Refactored")
-        print(f"  • Database: {'✅ Connected' if self.db else '❌ Not Connected'}")
-        print(f"  • Payment: {'✅ Available' if self.payment_screen else '❌ Disabled'}")
-        print(f"  • Staff Portal: {'✅ Available' if self.staff_screens_available else '❌ Disabled'}")
+        print("\n📊 Feature Status:")
+        print("  • Core Features: ✅ Available")
+        print("  • MVC Pattern: ✅ Enrollment Form Refactored")
         print("=" * 80 + "\n")
+        logger.info("Database: " + ("connecting in background" if self.db else "not available"))
+        logger.info("Other screens: loaded on first use")
+
+    # ========================================================================
+    # DATABASE WARM-UP
+    # ========================================================================
+
+    def start_database_warmup(self):
+        """Connect and pre-fetch reference data off the GUI thread"""
+        if self.db is not None:
+            monitor = start_database_warmup(self.db)
+            monitor.state_changed.connect(self.on_database_state)
+
+        # Enrollments made while the database is unreachable are journaled and replayed
+        sync = start_offline_sync(self.db)
+        sync.progress.connect(self.on_offline_sync_progress)
+        sync.finished.connect(self.on_offline_sync_finished)
+
+    def on_database_state(self, state, detail):
+        """Show the connection state in the status bar"""
+        if state == CONNECTING:
+            self.statusBar().showMessage("Connecting to database...")
+        elif state == CONNECTED:
+            self.statusBar().showMessage("Database connected", 3000)
+            # Follow writes made on other terminals
+            start_change_feed(self.db)
+        elif state == FAILED:
+            self.statusBar().showMessage(f"Database unavailable - retrying ({detail})")
+
+    def on_offline_sync_progress(self, done, total):
+        self.statusBar().showMessage(f"Uploading offline enrollments... {done}/{total}")
+
+    def on_offline_sync_finished(self, summary):
+        message = f"Offline enrollments uploaded: {summary['synced']} synced, {summary['duplicates']} already present"
+        if summary['conflicts'] or summary['failed']:
+            message += (f", {summary['conflicts']} LRN conflicts, {summary['failed']} failed "
+                        f"(see: python offline_queue.py --status)")
+        self.statusBar().showMessage(message, 10000)
+
+    # ========================================================================
+    # LAZY SCREENS
+    # ========================================================================
+
+    def screen(self, name):
+        """
+        The screen registered as name in LAZY_SCREENS, imported and built
+        on first use. Returns None (and logs why) if it cannot be loaded.
+        """
+        if name in self._screens:
+            return self._screens[name]
+        if name in self._failed_screens:
+            return None
+
+        module_name, class_name = LAZY_SCREENS[name]
+        started = time.perf_counter()
+        modules_before = len(sys.modules)
+        try:
+            module = importlib.import_module(module_name)
+            imported = time.perf_counter()
+            widget = getattr(module, class_name)()
+            self._connect_screen(name, widget)
+        except Exception as e:
+            logger.error(f"❌ Could not load {class_name}: {e}", exc_info=True)
+            self._failed_screens[name] = str(e)
+            return None
+
+        self.stacked_widget.addWidget(widget)
+        self._screens[name] = widget
+        finished = time.perf_counter()
+        logger.info(
+            f"Loaded {class_name} in {(finished - started) * 1000:.0f} ms "
+            f"(import {(imported - started) * 1000:.0f} ms, "
+            f"{len(sys.modules) - modules_before} new modules)"
+        )
+        return widget
+
+    def _connect_screen(self, name, widget):
+        """Wire a freshly built screen into the app"""
+        if name == 'enrollment':
+            from enrollment_controller import EnrollmentFormController
+
+            # Create Controller and connect it to View
+            self.enrollment_controller = EnrollmentFormController(widget)
+            self.enrollment_controller.enrollment_complete.connect(self.handle_enrollment_complete)
+            widget.logout_clicked.connect(self.show_home)
+
+        elif name == 'payment':
+            widget.logout_signal.connect(self.show_home)
+            widget.back_signal.connect(self.show_enrollment_form)
+            widget.payment_completed.connect(self.handle_payment_completion)
+
+        elif name == 'staff_login':
+            widget.back_signal.connect(self.show_home)
+            widget.login_signal.connect(self.handle_staff_login)
+
+        elif name == 'admin_login':
+            widget.back_signal.connect(self.show_home)
+            widget.login_signal.connect(self.handle_admin_login)
+
+        else:
+            widget.logout_signal.connect(self.show_home)
+            if name == 'enrollees' and self.current_user:
+                widget.set_current_user(self.current_user)
 
     # ========================================================================
     # NAVIGATION METHODS
     # ========================================================================
 
+    def show_stall_diagnostics(self):
+        """Show recent GUI stalls (Ctrl+Shift+D)"""
+        StallDiagnosticsDialog(self).exec()
+
     def show_home(self):
         """Show home screen"""
         self.stacked_widget.setCurrentWidget(self.home_screen)
-        print("🏠 Navigated to: Home")
+        logger.debug("🏠 Navigated to: Home")
 
     def show_enrollment_form(self):
         """Show enrollment form"""
-        if self.enrollment_view:
-            self.stacked_widget.setCurrentWidget(self.enrollment_view)
-            print("📝 Navigated to: Enrollment Form (MVC)")
+        enrollment_view = self.screen('enrollment')
+        if enrollment_view:
+            self.stacked_widget.setCurrentWidget(enrollment_view)
+            logger.debug("📝 Navigated to: Enrollment Form (MVC)")
         else:
             QMessageBox.warning(self, "Error", "Enrollment form not available")
 
     def show_payment_screen(self, student_data):
         """Show payment screen"""
-        if self.payment_screen:
+        payment_screen = self.screen('payment')
+        if payment_screen:
             try:
-                self.payment_screen.set_student_data(student_data)
-                self.stacked_widget.setCurrentWidget(self.payment_screen)
-                print("💳 Navigated to: Payment Screen")
+                payment_screen.set_student_data(student_data)
+                self.stacked_widget.setCurrentWidget(payment_screen)
+                logger.debug("💳 Navigated to: Payment Screen")
             except Exception as e:
-                print(f"❌ Payment screen error: {e}")
+                logger.error(f"❌ Payment screen error: {e}")
                 QMessageBox.warning(self, "Error", "Could not open payment screen.")
         else:
             QMessageBox.information(
@@ -268,35 +308,43 @@ class EnrollifyApp(QMainWindow):
 
     def show_staff_login(self):
         """Show staff login screen"""
-        if self.staff_screens_available:
-            self.staff_login.email_input.clear()
-            self.staff_login.password_input.clear()
-            self.stacked_widget.setCurrentWidget(self.staff_login)
-            print("🔑 Navigated to: Staff Login")
+        staff_login = self.screen('staff_login')
+        if staff_login:
+            staff_login.email_input.clear()
+            staff_login.password_input.clear()
+            self.stacked_widget.setCurrentWidget(staff_login)
+            logger.debug("🔑 Navigated to: Staff Login")
         else:
             QMessageBox.warning(self, "Feature Unavailable", "Staff Portal is not available.")
 
     def show_admin_login(self):
         """Show admin login screen"""
-        if self.staff_screens_available:
-            self.admin_login.email_input.clear()
-            self.admin_login.password_input.clear()
-            self.stacked_widget.setCurrentWidget(self.admin_login)
-            print("🔑 Navigated to: Admin Login")
+        admin_login = self.screen('admin_login')
+        if admin_login:
+            admin_login.email_input.clear()
+            admin_login.password_input.clear()
+            self.stacked_widget.setCurrentWidget(admin_login)
+            logger.debug("🔑 Navigated to: Admin Login")
         else:
             QMessageBox.warning(self, "Feature Unavailable", "Admin Panel is not available.")
 
     def show_staff_portal(self):
         """Show staff portal"""
-        if self.staff_screens_available:
-            self.stacked_widget.setCurrentWidget(self.staff_portal)
-            print("📊 Navigated to: Staff Portal")
+        staff_portal = self.screen('staff_portal')
+        if staff_portal:
+            self.stacked_widget.setCurrentWidget(staff_portal)
+            logger.debug("📊 Navigated to: Staff Portal")
+        else:
+            QMessageBox.warning(self, "Feature Unavailable", "Staff Portal is not available.")
 
     def show_admin_portal(self):
         """Show admin screen"""
-        if self.staff_screens_available:
-            self.stacked_widget.setCurrentWidget(self.admin_screen)
-            print("⚙️ Navigated to: Admin Panel")
+        admin_screen = self.screen('admin')
+        if admin_screen:
+            self.stacked_widget.setCurrentWidget(admin_screen)
+            logger.debug("⚙️ Navigated to: Admin Panel")
+        else:
+            QMessageBox.warning(self, "Feature Unavailable", "Admin Panel is not available.")
 
     # ========================================================================
     # EVENT HANDLERS
@@ -306,13 +354,10 @@ class EnrollifyApp(QMainWindow):
         """
         ✅ Handle enrollment completion from MVC controller
         """
-        print("\n" + "=" * 60)
-        print("🎉 ENROLLMENT COMPLETE:")
-        print("=" * 60)
-        print(f"  Student: {student_data['firstname']} {student_data['lastname']}")
-        print(f"  LRN: {student_data['lrn']}")
-        print(f"  Track: {student_data['track']}")
-        print("=" * 60)
+        logger.info(
+            f"🎉 Enrollment complete: {student_data['firstname']} {student_data['lastname']} "
+            f"(LRN {student_data['lrn']}, {student_data['track']})"
+        )
 
         # Ask if they want to proceed to payment
         reply = QMessageBox.question(
@@ -330,40 +375,59 @@ class EnrollifyApp(QMainWindow):
 
     def handle_payment_completion(self, payment_data):
         """Handle payment completion - UPDATED WITH RECEIPT"""
-        print("\n" + "=" * 60)
-        print("💳 PAYMENT COMPLETED:")
-        print("=" * 60)
-        print(f"  Amount: ₱{payment_data['amount']:,}")
-        print(f"  Method: {payment_data['payment_method']}")
-        print("=" * 60)
-
-        # Save to database with receipt
-        if self.db:
+        logger.info(f"💳 Payment completed: ₱{payment_data['amount']:,} via {payment_data['payment_method']}")
+
+        # Generate receipt number if not provided
+        if 'receipt_number' not in payment_data:
+            import random
+            from PyQt6.QtCore import QDateTime
+            receipt_number = f"{QDateTime.currentDateTime().toString('yyyyMMdd')}{random.randint(1000, 9999)}"
+            payment_data['receipt_number'] = receipt_number
+
+        # Save to database with receipt, or journal it while the database is unreachable
+        sync = get_offline_sync()
+        if sync is not None and not sync.is_online():
+            self.journal_payment(sync, payment_data)
+        elif self.db:
             try:
-                # Generate receipt number if not provided
-                if 'receipt_number' not in payment_data:
-                    import random
-                    from PyQt6.QtCore import QDateTime
-                    receipt_number = f"{QDateTime.currentDateTime().toString('yyyyMMdd')}{random.randint(1000, 9999)}"
-                    payment_data['receipt_number'] = receipt_number
-
                 # Save payment with receipt number
-                payment_id = self.db.add_payment_with_receipt(
-                    payment_data,
-                    payment_data.get('receipt_number')
-                )
-                print(f"✅ Payment saved! ID: {payment_id}, Receipt: {payment_data.get('receipt_number')}")
+                payment_id = self.save_payment(payment_data)
+                logger.info(f"✅ Payment saved! ID: {payment_id}, Receipt: {payment_data.get('receipt_number')}")
 
             except Exception as e:
-                print(f"❌ Payment save error: {e}")
-                QMessageBox.critical(self, "Error", f"Payment recording failed: {str(e)}")
+                if sync is not None and is_connection_error(e):
+                    sync.connection_lost()
+                    self.journal_payment(sync, payment_data)
+                else:
+                    logger.error(f"❌ Payment save error: {e}")
+                    QMessageBox.critical(self, "Error", f"Payment recording failed: {str(e)}")
 
         self.show_home()
 
+    def journal_payment(self, sync, payment_data):
+        """Keep a payment made while the database is unreachable (replayed on reconnect)"""
+        try:
+            sync.queue.enqueue_payment(payment_data, payment_data['receipt_number'])
+            self.statusBar().showMessage(
+                f"Database unreachable - payment #{payment_data['receipt_number']} stored offline", 10000)
+        except Exception as e:
+            logger.error(f"❌ Offline journal error: {e}")
+            QMessageBox.critical(self, "Error", f"Payment recording failed: {str(e)}")
+
+    @track_latency("payment_post")
+    @profiled("payment_post")
+    def save_payment(self, payment_data):
+        """Record a payment with its receipt number (timed as payment_post)"""
+        return self.db.add_payment_with_receipt(
+            payment_data,
+            payment_data.get('receipt_number')
+        )
+
     def handle_staff_login(self):
         """Handle staff login - UPDATED"""
-        email = self.staff_login.email_input.text().strip()
-        password = self.staff_login.password_input.text()
+        staff_login = self.screen('staff_login')
+        email = staff_login.email_input.text().strip()
+        password = staff_login.password_input.text()
 
         if not email or not password:
             QMessageBox.warning(self, "Invalid Input", "Please enter email and password")
@@ -376,22 +440,27 @@ class EnrollifyApp(QMainWindow):
                     self.current_user = user
 
                     # ✅ SET CURRENT USER FOR STAFF PORTAL
-                    self.staff_portal.set_current_user(user)
-                    self.enrollees_screen.set_current_user(user)
+                    staff_portal = self.screen('staff_portal')
+                    if staff_portal:
+                        staff_portal.set_current_user(user)
+                    # A not-yet-built enrollees screen picks the user up when it is created
+                    if 'enrollees' in self._screens:
+                        self._screens['enrollees'].set_current_user(user)
 
-                    print(f"✅ Staff logged in: {user['full_name']} (ID: {user['id']})")
+                    logger.info(f"✅ Staff logged in: {user['full_name']} (ID: {user['id']})")
 
                     self.show_staff_portal()
                 else:
                     QMessageBox.warning(self, "Login Failed", "Invalid credentials or not a staff account")
             except Exception as e:
-                print(f"Login error: {e}")
+                logger.error(f"Login error: {e}")
                 QMessageBox.critical(self, "Error", f"Login error: {str(e)}")
 
     def handle_admin_login(self):
         """Handle admin login"""
-        email = self.admin_login.email_input.text().strip()
-        password = self.admin_login.password_input.text()
+        admin_login = self.screen('admin_login')
+        email = admin_login.email_input.text().strip()
+        password = admin_login.password_input.text()
 
         if not email or not password:
             QMessageBox.warning(self, "Invalid Input", "Please enter email and password")
@@ -402,7 +471,9 @@ class EnrollifyApp(QMainWindow):
                 user = self.db.authenticate_user(email, password)
                 if user and user['role'] == 'ADMIN':
                     self.current_user = user
-                    self.admin_screen.current_user = user
+                    admin_screen = self.screen('admin')
+                    if admin_screen:
+                        admin_screen.current_user = user
                     self.show_admin_portal()
                 else:
                     QMessageBox.warning(self, "Login Failed", "Invalid credentials")
@@ -410,6 +481,40 @@ class EnrollifyApp(QMainWindow):
                 QMessageBox.critical(self, "Error", f"Login error: {str(e)}")
 
 
+# ============================================================================
+# STARTUP REPORT
+# ============================================================================
+# Modules that should not be loaded before the home screen is on screen
+HEAVY_MODULES = [
+    'PyQt6.QtWebEngineWidgets', 'plotly', 'matplotlib', 'reportlab', 'pandas', 'openpyxl',
+]
+
+
+def report_startup(app):
+    """Log time to first paint; in --startup-report mode print the phases and quit"""
+    mark_startup("first paint")
+    total_ms = _startup_phases[-1][1]
+    logger.info(f"Startup: home screen painted {total_ms:.0f} ms after launch")
+    if not STARTUP_REPORT:
+        return
+
+    print("\n" + "=" * 60)
+    print("STARTUP REPORT")
+    print("=" * 60)
+    previous_ms = 0.0
+    previous_modules = 0
+    for phase, at_ms, modules in _startup_phases:
+        print(f"  {phase:<16} +{at_ms - previous_ms:8.1f} ms  (at {at_ms:8.1f} ms)  "
+              f"{modules - previous_modules:+5d} modules")
+        previous_ms, previous_modules = at_ms, modules
+
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+    print(f"\n  Modules loaded at first paint: {len(sys.modules)}")
+    print(f"  Heavy modules loaded early: {', '.join(loaded) if loaded else 'none'}")
+    print("=" * 60)
+    app.quit()
+
+
 # ============================================================================
 # APPLICATION ENTRY POINT
 # ============================================================================
@@ -417,24 +522,30 @@ def main():
     """Main entry point"""
     try:
         print("\nCreating Application...")
+        Config.ensure_directories()
         app = QApplication(sys.argv)
         app.setStyle('Fusion')
+        apply_app_stylesheet(app)
 
         window = EnrollifyApp()
         window.showMaximized()
 
+        # Runs once the first frame has been painted
+        QTimer.singleShot(0, lambda: report_startup(app))
+        QTimer.singleShot(0, window.start_database_warmup)
+
+        # Export operation latency histograms to Config.LOGS_DIR
+        start_metrics_exporter()
+
+        # Log what blocks the event loop (stalls.log, Ctrl+Shift+D)
+        start_stall_watchdog()
+
         print("\n✅ ENROLLIFY (MVC) IS NOW RUNNING!\n")
 
         sys.exit(app.exec())
 
     except Exception as e:
-        print("\n" + "=" * 80)
-        print("❌ CRITICAL ERROR")
-        print("=" * 80)
-        print(f"Error: {e}\n")
-        import traceback
-        traceback.print_exc()
-        print("=" * 80)
+        logger.critical(f"❌ CRITICAL ERROR: {e}", exc_info=True)
 
         try:
             QMessageBox.critical(
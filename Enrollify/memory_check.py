@@ -0,0 +1,162 @@
+"""
+Tab Cycling Memory Check for Enrollify
+Builds AdminScreen and StaffPortalScreen headlessly, cycles through every
+tab of both screens 100 times and fails when the process grows more than
+the allowed budget after warm-up:
+    - RSS growth (MB)
+    - tracemalloc growth (MB)
+    - live QObjects
+
+Usage:
+    python memory_check.py                                  # 1k seeded students in enrollify_bench
+    python memory_check.py --cycles 200 --budget-mb 15
+    python memory_check.py --existing                       # use the current database as-is
+
+Exit code is 1 when any budget is exceeded, so it can gate a release.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+# Must be set before the first PyQt6 import
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication
+
+from config import Config
+from ui_styles import apply_app_stylesheet
+from memory_tracker import start_tracing, take_snapshot, compare, format_report
+from perf_utils import run_metadata, save_results, current_rss_mb
+
+
+def build_screens(bench, staff_user):
+    from admin_screen import AdminScreen
+    from staff_portal import StaffPortalScreen
+    from benchmark_ui import ADMIN_TABS, STAFF_TABS
+
+    admin = AdminScreen()
+    admin.resize(Config.WINDOW_MIN_WIDTH, Config.WINDOW_MIN_HEIGHT)
+    admin.show()
+
+    staff = StaffPortalScreen()
+    staff.set_current_user(staff_user)
+    staff.resize(Config.WINDOW_MIN_WIDTH, Config.WINDOW_MIN_HEIGHT)
+    staff.show()
+    bench.flush()
+
+    def cycle():
+        """Visit every tab of both screens once, re-querying each cached page"""
+        for tab in ADMIN_TABS:
+            admin.pages.invalidate(tab)
+            admin.load_tab_content(tab)
+            bench.flush()
+        for tab in STAFF_TABS:
+            staff.pages.invalidate(tab)
+            staff.switch_tab(tab)
+            bench.flush()
+
+    return cycle
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cycle all tabs and check memory growth')
+    parser.add_argument('--cycles', type=int, default=100, help='measured tab cycles')
+    parser.add_argument('--warmup', type=int, default=5, help='cycles before the baseline snapshot')
+    parser.add_argument('--budget-mb', type=float, default=25.0, help='allowed RSS growth')
+    parser.add_argument('--traced-budget-mb', type=float, default=10.0, help='allowed tracemalloc growth')
+    parser.add_argument('--qobject-budget', type=int, default=0, help='allowed growth in live QObjects')
+    parser.add_argument('--students', type=int, default=1000, help='seeded dataset size')
+    parser.add_argument('--existing', action='store_true',
+                        help='use the database named by --database without generating data')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='memory_check_results.json')
+    parser.add_argument('--host', default=Config.DB_HOST)
+    parser.add_argument('--port', type=int, default=Config.DB_PORT)
+    parser.add_argument('--user', default=Config.DB_USER)
+    parser.add_argument('--password', default=Config.DB_PASSWORD)
+    parser.add_argument('--database', default=None,
+                        help='defaults to enrollify_bench, or the app database with --existing')
+    args = parser.parse_args(argv)
+
+    # prepare_dataset() expects the benchmark_database options
+    args.backend = 'mysql'
+    args.sqlite_dir = tempfile.gettempdir()
+    if args.database is None:
+        args.database = Config.DB_NAME if args.existing else 'enrollify_bench'
+
+    print("=" * 60)
+    print("ENROLLIFY MEMORY CHECK")
+    print("=" * 60)
+    print(f"Cycles: {args.cycles} (+{args.warmup} warm-up)   Budget: {args.budget_mb} MB RSS, "
+          f"{args.traced_budget_mb} MB traced, {args.qobject_budget:+d} QObjects")
+
+    start_tracing()
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    app.setStyle('Fusion')
+    apply_app_stylesheet(app)
+
+    from benchmark_ui import UIBench, busiest_staff_user
+    from database_manager_mysql import get_database
+
+    try:
+        if args.existing:
+            db = get_database(host=args.host, user=args.user, password=args.password, database=args.database)
+        else:
+            from benchmark_database import prepare_dataset
+            db, _ = prepare_dataset(args, args.students)
+    except Exception as e:
+        print(f"❌ Could not prepare dataset: {e}")
+        return 1
+
+    bench = UIBench(app, repeat=1)
+    cycle = build_screens(bench, busiest_staff_user(db))
+
+    print(f"\n🔥 Warming up ({args.warmup} cycles)...")
+    for _ in range(args.warmup):
+        cycle()
+    baseline = take_snapshot('warm-up')
+
+    trend = []
+    print("⏱️  Cycling tabs...")
+    for i in range(1, args.cycles + 1):
+        cycle()
+        if i % 10 == 0 or i == args.cycles:
+            rss = current_rss_mb()
+            widgets = len(QApplication.allWidgets())
+            trend.append({'cycle': i, 'rss_mb': rss, 'widgets': widgets})
+            print(f"   cycle {i:>4}   RSS {rss} MB   widgets {widgets}")
+
+    final = take_snapshot(f'cycle {args.cycles}')
+    report = compare(baseline, final, top=15)
+    print()
+    print(format_report(report, limit=15))
+
+    failures = []
+    if report['rss_delta_mb'] is not None and report['rss_delta_mb'] > args.budget_mb:
+        failures.append(f"RSS grew {report['rss_delta_mb']} MB (budget {args.budget_mb} MB)")
+    if report['traced_delta_mb'] is not None and report['traced_delta_mb'] > args.traced_budget_mb:
+        failures.append(f"Python heap grew {report['traced_delta_mb']} MB (budget {args.traced_budget_mb} MB)")
+    if report['qobject_total_delta'] > args.qobject_budget:
+        failures.append(f"{report['qobject_total_delta']} QObjects leaked (budget {args.qobject_budget})")
+
+    meta = run_metadata(cycles=args.cycles, warmup=args.warmup, students=None if args.existing else args.students,
+                        budget_mb=args.budget_mb, traced_budget_mb=args.traced_budget_mb,
+                        qobject_budget=args.qobject_budget)
+    save_results(args.output, meta, {'report': report, 'trend': trend, 'failures': failures,
+                                     'dialogs_dismissed': bench.dialogs_dismissed})
+    print(f"\n💾 Results saved to {args.output}")
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+
+    print("✅ Memory stayed within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
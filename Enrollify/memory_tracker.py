@@ -0,0 +1,163 @@
+"""
+Memory instrumentation for Enrollify
+Snapshots taken around tab switches to find what survives a rebuild:
+    - resident set size
+    - tracemalloc allocations (grouped by file:line)
+    - live QObjects per class
+
+Turn it on with ENROLLIFY_MEMORY_TRACKING=1. AdminScreen and
+StaffPortalScreen then checkpoint after every tab load and log how much
+each tab grew since the previous visit to the same tab. memory_check.py
+uses the same helpers for its 100-cycle budget run.
+"""
+
+import gc
+import time
+import tracemalloc
+from collections import Counter
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QCoreApplication, QEvent
+from PyQt6.QtWidgets import QApplication
+
+from config import Config
+from logger_config import get_logger
+from perf_utils import current_rss_mb
+
+logger = get_logger(__name__)
+
+
+def start_tracing(frames=1):
+    """Start tracemalloc if it is not already running"""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def settle():
+    """Run pending deleteLater() calls and a full GC so only live objects are counted"""
+    app = QCoreApplication.instance()
+    if app is not None:
+        app.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        app.processEvents()
+    gc.collect()
+
+
+def count_qobjects():
+    """
+    Live QObjects per class name
+
+    Walks the object tree from the application and every top-level widget,
+    so parentless non-widget QObjects are not included.
+    """
+    app = QCoreApplication.instance()
+    if app is None:
+        return Counter()
+
+    roots = [app]
+    if isinstance(app, QApplication):
+        roots.extend(QApplication.topLevelWidgets())
+
+    counts = Counter()
+    seen = set()
+    for root in roots:
+        for obj in [root] + root.findChildren(QObject):
+            address = sip.unwrapinstance(obj)
+            if address in seen:
+                continue
+            seen.add(address)
+            counts[type(obj).__name__] += 1
+    return counts
+
+
+class MemorySnapshot:
+    """Memory state at one point in time"""
+
+    def __init__(self, label):
+        self.label = label
+        self.taken_at = time.time()
+        self.rss_mb = current_rss_mb()
+        self.qobjects = count_qobjects()
+        self.trace = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        self.traced_mb = tracemalloc.get_traced_memory()[0] / (1024 * 1024) if self.trace else None
+
+
+def take_snapshot(label=''):
+    """Settle pending deletions, then snapshot"""
+    settle()
+    return MemorySnapshot(label)
+
+
+def compare(before, after, top=10):
+    """Growth from one snapshot to another"""
+    qobject_delta = {
+        name: after.qobjects.get(name, 0) - before.qobjects.get(name, 0)
+        for name in set(before.qobjects) | set(after.qobjects)
+    }
+    qobject_delta = dict(sorted(((k, v) for k, v in qobject_delta.items() if v),
+                                key=lambda kv: kv[1], reverse=True))
+
+    report = {
+        'from': before.label,
+        'to': after.label,
+        'rss_delta_mb': (round(after.rss_mb - before.rss_mb, 2)
+                         if after.rss_mb is not None and before.rss_mb is not None else None),
+        'traced_delta_mb': (round(after.traced_mb - before.traced_mb, 3)
+                            if after.traced_mb is not None and before.traced_mb is not None else None),
+        'qobject_total_delta': sum(after.qobjects.values()) - sum(before.qobjects.values()),
+        'qobject_delta': qobject_delta,
+        'top_allocations': [],
+    }
+
+    if before.trace is not None and after.trace is not None:
+        for stat in after.trace.compare_to(before.trace, 'lineno')[:top]:
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            report['top_allocations'].append({
+                'location': f"{frame.filename}:{frame.lineno}",
+                'size_kb': round(stat.size_diff / 1024, 1),
+                'count': stat.count_diff,
+            })
+    return report
+
+
+def format_report(report, limit=8):
+    """Readable multi-line version of a compare() result"""
+    lines = [
+        f"Memory growth {report['from']} -> {report['to']}: "
+        f"RSS {report['rss_delta_mb']} MB, traced {report['traced_delta_mb']} MB, "
+        f"QObjects {report['qobject_total_delta']:+d}"
+    ]
+    for name, delta in list(report['qobject_delta'].items())[:limit]:
+        lines.append(f"    {name:<30} {delta:+d}")
+    for alloc in report['top_allocations'][:limit]:
+        lines.append(f"    {alloc['size_kb']:>9.1f} KB  {alloc['count']:+6d}  {alloc['location']}")
+    return "\n".join(lines)
+
+
+class MemoryTracker:
+    """Compares each tab load with the previous load of the same tab"""
+
+    def __init__(self, name):
+        self.name = name
+        self._last = {}
+        start_tracing()
+
+    def checkpoint(self, tab_name):
+        """Snapshot after a tab has loaded; logs growth since its last visit"""
+        snapshot = take_snapshot(f"{self.name}.{tab_name}")
+        previous = self._last.get(tab_name)
+        self._last[tab_name] = snapshot
+        if previous is None:
+            return None
+
+        report = compare(previous, snapshot)
+        leaked = report['qobject_total_delta'] > 0 or (report['traced_delta_mb'] or 0) > 1
+        (logger.warning if leaked else logger.info)(format_report(report))
+        return report
+
+
+def get_memory_tracker(name):
+    """A MemoryTracker when ENROLLIFY_MEMORY_TRACKING is on, otherwise None"""
+    return MemoryTracker(name) if Config.MEMORY_TRACKING else None
@@ -0,0 +1,256 @@
+"""
+In-process operation metrics for Enrollify
+Latency histograms, call counts and error counts per operation, exported
+periodically to Config.LOGS_DIR as:
+    - metrics.prom  (Prometheus textfile collector format)
+    - metrics.json  (same data with p50/p95/p99 worked out)
+
+Recording is lock-free: every thread writes into its own shard and the
+exporter merges the shards when it takes a snapshot.
+"""
+
+import atexit
+import json
+import os
+import socket
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from config import Config
+from logger_config import get_logger
+
+logger = get_logger(__name__)
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +Inf)
+BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+
+class _Shard:
+    """One thread's counts for one metric - only that thread ever writes to it"""
+
+    __slots__ = ('buckets', 'count', 'errors', 'sum_ms', 'max_ms')
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+
+def _percentile_from_buckets(buckets, count, max_ms, pct):
+    """Estimate a percentile by interpolating inside the histogram bucket"""
+    if not count:
+        return 0.0
+    rank = count * pct / 100.0
+    seen = 0
+    for index, bucket_count in enumerate(buckets):
+        if bucket_count and seen + bucket_count >= rank:
+            lower = BUCKETS_MS[index - 1] if index > 0 else 0.0
+            upper = BUCKETS_MS[index] if index < len(BUCKETS_MS) else max_ms
+            upper = max(lower, min(upper, max_ms))
+            return round(lower + (upper - lower) * (rank - seen) / bucket_count, 2)
+        seen += bucket_count
+    return round(max_ms, 2)
+
+
+class MetricsRegistry:
+    """Latency histograms and counters keyed by operation name"""
+
+    def __init__(self):
+        self._local = threading.local()
+        # (name, shard) pairs from every thread; the lock is only taken the
+        # first time a thread records a given metric
+        self._shards = []
+        self._shards_lock = threading.Lock()
+        self.started_at = time.time()
+
+    def _shard(self, name):
+        shards = getattr(self._local, 'shards', None)
+        if shards is None:
+            shards = self._local.shards = {}
+        shard = shards.get(name)
+        if shard is None:
+            shard = shards[name] = _Shard()
+            with self._shards_lock:
+                self._shards.append((name, shard))
+        return shard
+
+    def observe(self, name, elapsed_ms, error=False):
+        """Record one call of an operation"""
+        shard = self._shard(name)
+        shard.buckets[bisect_left(BUCKETS_MS, elapsed_ms)] += 1
+        shard.count += 1
+        shard.sum_ms += elapsed_ms
+        if elapsed_ms > shard.max_ms:
+            shard.max_ms = elapsed_ms
+        if error:
+            shard.errors += 1
+
+    def increment(self, name, amount=1):
+        """Count an event that has no duration (e.g. a denied action)"""
+        self._shard(f"event:{name}").count += amount
+
+    def snapshot(self):
+        """Merge every thread's shards into {'operations': {...}, 'events': {...}}"""
+        with self._shards_lock:
+            shards = list(self._shards)
+
+        merged = {}
+        for name, shard in shards:
+            total = merged.get(name)
+            if total is None:
+                total = merged[name] = _Shard()
+            for i, value in enumerate(shard.buckets):
+                total.buckets[i] += value
+            total.count += shard.count
+            total.errors += shard.errors
+            total.sum_ms += shard.sum_ms
+            total.max_ms = max(total.max_ms, shard.max_ms)
+
+        operations, events = {}, {}
+        for name, total in sorted(merged.items()):
+            if name.startswith('event:'):
+                events[name[len('event:'):]] = total.count
+                continue
+            operations[name] = {
+                'count': total.count,
+                'errors': total.errors,
+                'sum_ms': round(total.sum_ms, 2),
+                'max_ms': round(total.max_ms, 2),
+                'p50_ms': _percentile_from_buckets(total.buckets, total.count, total.max_ms, 50),
+                'p95_ms': _percentile_from_buckets(total.buckets, total.count, total.max_ms, 95),
+                'p99_ms': _percentile_from_buckets(total.buckets, total.count, total.max_ms, 99),
+                'buckets': total.buckets,
+            }
+        return {'operations': operations, 'events': events}
+
+
+registry = MetricsRegistry()
+
+
+@contextmanager
+def timed(name):
+    """
+    Time a block and record it under `name`; exceptions count as errors
+    and are re-raised.
+
+    Example:
+        with timed("enrollment_submit"):
+            db.add_student(form_data)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        registry.observe(name, (time.perf_counter() - started) * 1000, error=True)
+        raise
+    registry.observe(name, (time.perf_counter() - started) * 1000)
+
+
+# ==================== EXPORT ====================
+
+def terminal_name():
+    """Label that tells terminals apart when their metric files are collected"""
+    return Config.TERMINAL_NAME or socket.gethostname()
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', ' ')
+
+
+def to_prometheus(snapshot, terminal):
+    """Render a snapshot in the Prometheus text exposition format"""
+    term = _label(terminal)
+    lines = [
+        '# HELP enrollify_operation_duration_ms Operation latency in milliseconds',
+        '# TYPE enrollify_operation_duration_ms histogram',
+    ]
+    for name, op in snapshot['operations'].items():
+        labels = f'operation="{_label(name)}",terminal="{term}"'
+        cumulative = 0
+        for bound, count in zip(BUCKETS_MS + ['+Inf'], op['buckets']):
+            cumulative += count
+            lines.append(f'enrollify_operation_duration_ms_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'enrollify_operation_duration_ms_sum{{{labels}}} {op["sum_ms"]}')
+        lines.append(f'enrollify_operation_duration_ms_count{{{labels}}} {op["count"]}')
+
+    lines.append('# HELP enrollify_operation_errors_total Operations that raised')
+    lines.append('# TYPE enrollify_operation_errors_total counter')
+    for name, op in snapshot['operations'].items():
+        lines.append(f'enrollify_operation_errors_total{{operation="{_label(name)}",terminal="{term}"}} '
+                     f'{op["errors"]}')
+
+    lines.append('# HELP enrollify_events_total Counted events without a duration')
+    lines.append('# TYPE enrollify_events_total counter')
+    for name, count in snapshot['events'].items():
+        lines.append(f'enrollify_events_total{{event="{_label(name)}",terminal="{term}"}} {count}')
+    return '\n'.join(lines) + '\n'
+
+
+def _write_atomic(path, text):
+    """Write via a temp file so collectors never read a half-written file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def export_metrics(directory=None):
+    """Write metrics.prom and metrics.json; returns the snapshot"""
+    directory = directory or Config.LOGS_DIR
+    os.makedirs(directory, exist_ok=True)
+
+    snapshot = registry.snapshot()
+    terminal = terminal_name()
+    _write_atomic(os.path.join(directory, 'metrics.prom'), to_prometheus(snapshot, terminal))
+
+    document = {
+        'terminal': terminal,
+        'exported_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'uptime_s': round(time.time() - registry.started_at, 1),
+        'bucket_bounds_ms': BUCKETS_MS,
+    }
+    document.update(snapshot)
+    _write_atomic(os.path.join(directory, 'metrics.json'), json.dumps(document, indent=2))
+    return snapshot
+
+
+class MetricsExporter(threading.Thread):
+    """Background thread that exports the registry every `interval` seconds"""
+
+    def __init__(self, interval=None, directory=None):
+        super().__init__(name='metrics-exporter', daemon=True)
+        self.interval = interval or Config.METRICS_EXPORT_INTERVAL
+        self.directory = directory
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self._export()
+
+    def _export(self):
+        try:
+            export_metrics(self.directory)
+        except Exception as e:
+            logger.error(f"Metrics export failed: {e}")
+
+    def stop(self):
+        """Stop the thread and write one final export"""
+        self._stop_event.set()
+        self._export()
+
+
+_exporter = None
+
+
+def start_metrics_exporter(interval=None, directory=None):
+    """Start the periodic export once per process (also exports on exit)"""
+    global _exporter
+    if _exporter is None:
+        _exporter = MetricsExporter(interval, directory)
+        _exporter.start()
+        atexit.register(_exporter.stop)
+    return _exporter
@@ -0,0 +1,426 @@
+"""
+Offline enrollment queue for Enrollify
+When MySQL cannot be reached, enrollment submissions and payments are
+journaled to a local SQLite file (Config.OFFLINE_QUEUE_PATH) instead of
+being lost. Writing a journal entry takes a millisecond, so kiosks keep
+accepting enrollments at full speed while the database is down.
+
+Once the connection monitor reports the database connected again, the
+journal is replayed in order, Config.OFFLINE_SYNC_BATCH entries per event
+loop turn, through the normal DatabaseManager methods (add_student,
+add_payment_with_receipt), so change events, audit entries and data
+versions are exactly those of a live submission:
+
+    sync = start_offline_sync(db)
+    if not sync.is_online():
+        sync.queue.enqueue_student(form_data)       # replayed later
+    sync.progress.connect(...)                      # (replayed, total)
+
+Replay is idempotent: each entry (keyed by a UUID made when it was
+journaled) is checked against the database before it is written, so an
+entry replayed twice (e.g. after a crash between the MySQL commit and
+the journal update) is only recorded once. A journaled student whose LRN
+is already taken in the database is:
+    - marked 'duplicate' when it is the same person (same name and birthdate)
+    - marked 'conflict' when it is someone else; the entry, and payments
+      for that LRN, are kept for the registrar to resolve
+Likewise a journaled payment whose receipt number is already in the
+database is a 'duplicate' only for the same LRN and amount, and a
+'conflict' otherwise.
+
+Operators can check or drain the journal from the command line:
+    python offline_queue.py --status
+    python offline_queue.py --sync
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+import uuid
+from collections import namedtuple
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from mysql.connector import errors as mysql_errors
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from config import Config
+from connection_monitor import get_connection_monitor, CONNECTED, FAILED
+from logger_config import get_logger
+from metrics import registry as metrics
+
+logger = get_logger(__name__)
+
+STUDENT = 'student'
+PAYMENT = 'payment'
+
+# Entry states
+PENDING = 'pending'
+SYNCED = 'synced'
+DUPLICATE = 'duplicate'   # already in the database (same student / same payment)
+CONFLICT = 'conflict'     # LRN or receipt number taken by someone else - needs the registrar
+
+# Client errors meaning the server could not be reached (as opposed to a rejected write)
+CONNECTION_ERRNOS = {2002, 2003, 2005, 2006, 2013, 2055}
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS journal (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT NOT NULL,
+        key TEXT NOT NULL UNIQUE,
+        payload TEXT NOT NULL,
+        state TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        last_error TEXT,
+        created_at TEXT NOT NULL,
+        synced_at TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_journal_state ON journal (state, id);
+'''
+
+JournalEntry = namedtuple('JournalEntry', 'id kind key data state attempts last_error created_at')
+
+
+class ReplayResult:
+    """Counts for one replay run"""
+
+    def __init__(self):
+        self.synced = 0
+        self.duplicates = 0
+        self.conflicts = 0
+        self.failed = 0
+        # True when the run stopped because the database went away again
+        self.disconnected = False
+        # Journal id of the last entry processed; the next batch starts after it
+        self.last_id = 0
+
+    @property
+    def processed(self):
+        return self.synced + self.duplicates + self.conflicts + self.failed
+
+    def add(self, other):
+        self.synced += other.synced
+        self.duplicates += other.duplicates
+        self.conflicts += other.conflicts
+        self.failed += other.failed
+        self.disconnected = other.disconnected
+        self.last_id = max(self.last_id, other.last_id)
+
+    def as_dict(self):
+        return {'synced': self.synced, 'duplicates': self.duplicates,
+                'conflicts': self.conflicts, 'failed': self.failed}
+
+
+def is_connection_error(error):
+    """True if error (or an error it was raised from) means MySQL was unreachable"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, mysql_errors.InterfaceError) or getattr(error, 'errno', None) in CONNECTION_ERRNOS:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class OfflineQueue:
+    """Local SQLite journal of enrollments and payments made while MySQL was unreachable"""
+
+    def __init__(self, path=None):
+        self.path = str(path or Config.OFFLINE_QUEUE_PATH)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        # WAL + NORMAL: an entry survives an application crash, and writing one never waits on fsync
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # ==================== JOURNALING ====================
+
+    def _enqueue(self, kind, data, label):
+        # Neither LRNs (resubmissions) nor receipt numbers (random, per day) are unique keys
+        key = f"{kind}:{uuid.uuid4().hex}"
+        payload = json.dumps(data, default=str)
+        with self._lock:
+            self.conn.execute('''
+                INSERT INTO journal (kind, key, payload, created_at) VALUES (?, ?, ?, ?)
+            ''', (kind, key, payload, datetime.now().isoformat(timespec='seconds')))
+            self.conn.commit()
+        metrics.increment(f'offline_{kind}_queued')
+        logger.info(f"📥 Journaled {kind} {label} for replay ({key})")
+        return key
+
+    def enqueue_student(self, student_data):
+        """Journal an enrollment submission (the form data given to add_student)"""
+        return self._enqueue(STUDENT, student_data, student_data['lrn'])
+
+    def enqueue_payment(self, payment_data, receipt_number):
+        """Journal a payment (the arguments of add_payment_with_receipt)"""
+        data = dict(payment_data, receipt_number=receipt_number)
+        return self._enqueue(PAYMENT, data, receipt_number)
+
+    # ==================== READING ====================
+
+    def _entries(self, where, params=(), limit=None):
+        sql = f'''
+            SELECT id, kind, key, payload, state, attempts, last_error, created_at
+            FROM journal WHERE {where} ORDER BY id
+        '''
+        if limit:
+            sql += f' LIMIT {int(limit)}'
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [JournalEntry(row[0], row[1], row[2], json.loads(row[3]), *row[4:]) for row in rows]
+
+    def pending(self, limit=None, after_id=0):
+        return self._entries('state = ? AND id > ?', (PENDING, after_id), limit)
+
+    def conflicts(self):
+        return self._entries('state = ?', (CONFLICT,))
+
+    def pending_count(self):
+        with self._lock:
+            return self.conn.execute('SELECT COUNT(*) FROM journal WHERE state = ?', (PENDING,)).fetchone()[0]
+
+    def counts(self):
+        """{state: number of entries}"""
+        with self._lock:
+            return dict(self.conn.execute('SELECT state, COUNT(*) FROM journal GROUP BY state').fetchall())
+
+    def _mark(self, entry_id, state, error=None):
+        with self._lock:
+            self.conn.execute('''
+                UPDATE journal
+                SET state = ?, last_error = ?, attempts = attempts + 1,
+                    synced_at = CASE WHEN ? = 'pending' THEN NULL ELSE ? END
+                WHERE id = ?
+            ''', (state, error, state, datetime.now().isoformat(timespec='seconds'), entry_id))
+            self.conn.commit()
+
+    # ==================== REPLAY ====================
+
+    def replay(self, db, limit=None, after_id=0):
+        """
+        Replay up to limit pending entries after after_id, oldest first, through db
+
+        Stops early (result.disconnected) when the database is unreachable
+        again; the remaining entries stay pending for the next run.
+        """
+        result = ReplayResult()
+        # LRNs whose journaled student conflicts: their payments must not be applied
+        conflicting = {entry.data['lrn'] for entry in self.conflicts() if entry.kind == STUDENT}
+
+        for entry in self.pending(limit, after_id):
+            result.last_id = entry.id
+            try:
+                if entry.kind == STUDENT:
+                    state, error = self._replay_student(db, entry.data)
+                else:
+                    state, error = self._replay_payment(db, entry.data, conflicting)
+            except Exception as e:
+                if is_connection_error(e):
+                    logger.warning(f"Offline replay paused, database unreachable: {e}")
+                    result.disconnected = True
+                    break
+                # Rejected write (bad data, constraint): keep it pending and move on
+                logger.error(f"Offline replay of {entry.key} failed: {e}")
+                self._mark(entry.id, PENDING, str(e))
+                result.failed += 1
+                continue
+
+            self._mark(entry.id, state, error)
+            if state == SYNCED:
+                result.synced += 1
+            elif state == DUPLICATE:
+                result.duplicates += 1
+            else:
+                result.conflicts += 1
+                if entry.kind == STUDENT:
+                    conflicting.add(entry.data['lrn'])
+                logger.warning(f"⚠️ Offline {entry.key} not applied: {error}")
+            metrics.increment(f'offline_replay_{state}')
+
+        return result
+
+    def _replay_student(self, db, data):
+        existing = db.get_student_by_lrn(data['lrn'])
+        if existing is None:
+            db.add_student(data)
+            return SYNCED, None
+        if same_student(existing, data):
+            # Replayed before, or enrolled at another terminal meanwhile
+            return DUPLICATE, None
+        return CONFLICT, (f"LRN {data['lrn']} already belongs to "
+                          f"{existing.get('firstname', '')} {existing.get('lastname', '')}")
+
+    def _replay_payment(self, db, data, conflicting):
+        lrn = data['student_data']['lrn']
+        if lrn in conflicting:
+            return CONFLICT, f"Student {lrn} was not applied (LRN conflict)"
+        existing = db.get_receipt_by_number(data['receipt_number'])
+        if existing is None:
+            db.add_payment_with_receipt(data, data['receipt_number'])
+            return SYNCED, None
+        if same_payment(existing, lrn, data['amount']):
+            # Replayed before
+            return DUPLICATE, None
+        return CONFLICT, (f"Receipt {data['receipt_number']} already records "
+                          f"{existing.get('amount')} for LRN {existing.get('lrn')}")
+
+
+def same_student(existing, data):
+    """True when a database row and journaled form data describe the same person"""
+    def norm(value):
+        return str(value or '').strip().lower()
+
+    return (norm(existing.get('firstname')) == norm(data.get('firstname'))
+            and norm(existing.get('lastname')) == norm(data.get('lastname'))
+            and str(existing.get('birthdate') or '')[:10] == str(data.get('birthdate') or '')[:10])
+
+
+def same_payment(existing, lrn, amount):
+    """True when a stored receipt (get_receipt_by_number) is a payment of amount by lrn"""
+    try:
+        same_amount = Decimal(str(existing.get('amount'))) == Decimal(str(amount))
+    except InvalidOperation:
+        same_amount = False
+    return same_amount and str(existing.get('lrn')) == str(lrn)
+
+
+# ==================== GUI SYNC ====================
+
+class OfflineSync(QObject):
+    """Routes writes to the journal while offline and replays it once the database is back"""
+
+    # replayed, total - emitted after every batch
+    progress = pyqtSignal(int, int)
+    # ReplayResult.as_dict() of the whole run
+    finished = pyqtSignal(dict)
+
+    def __init__(self, db, queue=None, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.queue = queue or OfflineQueue()
+        self._lost = False
+        self._run = None
+        self._total = 0
+
+        self.monitor = get_connection_monitor()
+        if self.monitor is not None:
+            self.monitor.state_changed.connect(self._on_database_state)
+
+    def is_online(self):
+        """Whether writes should go to MySQL now (False: journal them)"""
+        if self.db is None or self._lost:
+            return False
+        return self.monitor is None or self.monitor.is_connected()
+
+    def connection_lost(self):
+        """A write failed to reach MySQL: journal from now on and reconnect in the background"""
+        if self._lost:
+            return
+        self._lost = True
+        logger.warning("⚠️ Database unreachable - journaling enrollments offline")
+        if self.monitor is not None:
+            self.monitor.start()
+
+    def _on_database_state(self, state, detail):
+        if state == CONNECTED:
+            self._lost = False
+            self.start_replay()
+        elif state == FAILED:
+            self._lost = True
+
+    def start_replay(self):
+        """Replay the journal in batches between event loop turns"""
+        if self._run is not None or self.db is None:
+            return
+        self._total = self.queue.pending_count()
+        if not self._total:
+            return
+        logger.info(f"🔄 Replaying {self._total} offline entries")
+        self._run = ReplayResult()
+        QTimer.singleShot(0, self._replay_batch)
+
+    def _replay_batch(self):
+        result = self.queue.replay(self.db, limit=Config.OFFLINE_SYNC_BATCH, after_id=self._run.last_id)
+        self._run.add(result)
+        self.progress.emit(self._run.processed, max(self._total, self._run.processed))
+
+        # Entries journaled during the run are picked up too; failed ones wait for the next run
+        if result.processed == Config.OFFLINE_SYNC_BATCH and not result.disconnected:
+            QTimer.singleShot(0, self._replay_batch)
+            return
+
+        run, self._run = self._run, None
+        logger.info(f"✅ Offline replay finished: {run.as_dict()}")
+        self.finished.emit(run.as_dict())
+        if result.disconnected:
+            self.connection_lost()
+
+
+_sync = None
+
+
+def start_offline_sync(db):
+    """Create the offline journal and replay whatever it holds once connected (GUI thread)"""
+    global _sync
+    if _sync is None:
+        _sync = OfflineSync(db)
+        if _sync.is_online():
+            _sync.start_replay()
+    return _sync
+
+
+def get_offline_sync():
+    return _sync
+
+
+# ==================== COMMAND LINE ====================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Enrollify offline enrollment queue')
+    parser.add_argument('--status', action='store_true', help='show journal counts and conflicts')
+    parser.add_argument('--sync', action='store_true', help='replay pending entries into MySQL now')
+    parser.add_argument('--path', default=None, help=f'journal file (default {Config.OFFLINE_QUEUE_PATH})')
+    args = parser.parse_args(argv)
+
+    if not (args.status or args.sync):
+        parser.print_help()
+        return 0
+
+    queue = OfflineQueue(args.path)
+    try:
+        if args.sync:
+            from database_manager_mysql import get_database
+            db = get_database()
+            total = queue.pending_count()
+            print(f"🔄 Replaying {total} pending entries...")
+            run = ReplayResult()
+            while True:
+                result = queue.replay(db, limit=Config.OFFLINE_SYNC_BATCH, after_id=run.last_id)
+                run.add(result)
+                print(f"   {run.processed}/{total}")
+                if result.disconnected or result.processed < Config.OFFLINE_SYNC_BATCH:
+                    break
+            if run.disconnected:
+                print("❌ Database unreachable - remaining entries are still pending")
+            print(f"✅ Synced {run.synced}, duplicates {run.duplicates}, "
+                  f"conflicts {run.conflicts}, failed {run.failed}")
+
+        counts = queue.counts()
+        print("\n📋 Journal: " + (", ".join(f"{state} {n}" for state, n in sorted(counts.items())) or "empty"))
+        for entry in queue.conflicts():
+            print(f"   ⚠️ {entry.key} ({entry.created_at}): {entry.last_error}")
+        return 1 if (args.sync and run.disconnected) else 0
+    finally:
+        queue.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
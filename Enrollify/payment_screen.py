@@ -5,8 +5,9 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen, QPainterPath
 from database_manager_mysql import get_database
 from receipt_dialog import ReceiptDialog
+import icons
+from ui_styles import set_screen
 from PyQt6.QtCore import QDateTime
-import os
 
 
 class PaymentScreen(QWidget):
@@ -19,30 +20,20 @@ class PaymentScreen(QWidget):
         self.student_data = {}
         self.selected_payment_method = None
         self.db = get_database()
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #F8FAFA;
-            }
-        """)
+        set_screen(self, "paymentScreen")
         self.setup_ui()
 
     def load_icon(self, icon_name):
         """Load icon from assets/icons/ with fallback to emoji"""
-        path = f"assets/icons/{icon_name}"
-        if os.path.exists(path):
-            pixmap = QPixmap(path).scaled(
-                40, 40,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        pixmap = icons.pixmap(f"icons/{icon_name}", 40)
+        if pixmap is not None:
             label = QLabel()
             label.setPixmap(pixmap)
-            label.setStyleSheet("background: transparent; border: none;")
             return label
         else:
             # Fallback to emoji
             label = QLabel(icon_name)
-            label.setStyleSheet("font-size: 40px; background: transparent; border: none;")
+            label.setObjectName("methodIcon")
             return label
 
     def setup_ui(self):
@@ -53,7 +44,7 @@ class PaymentScreen(QWidget):
         # Header
         header = QWidget()
         header.setFixedHeight(100)
-        header.setStyleSheet("background-color: white; border-bottom: none;")  # Removed border
+        header.setObjectName("pageHeader")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(60, 20, 60, 20)
 
@@ -69,21 +60,9 @@ class PaymentScreen(QWidget):
         title_container = QVBoxLayout()
         title_container.setSpacing(2)
         title = QLabel("Enrollify")
-        title.setStyleSheet("""
-            color: #234940; 
-            font-size: 26px; 
-            font-weight: 700;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("headerTitle")
         subtitle = QLabel("Student Enrollment Portal")
-        subtitle.setStyleSheet("""
-            color: #6B7280; 
-            font-size: 14px; 
-            font-weight: 500;
-            border: none;
-            background: transparent;
-        """)
+        subtitle.setObjectName("headerSubtitle")
         title_container.addWidget(title)
         title_container.addWidget(subtitle)
         logo_title_layout.addLayout(title_container)
@@ -94,19 +73,7 @@ class PaymentScreen(QWidget):
         logout_btn = QPushButton("↪ Logout")
         logout_btn.setFixedSize(110, 40)
         logout_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        logout_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #2D9B84;
-                border: 2px solid #2D9B84;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            QPushButton:hover { 
-                background-color: #F0FAF8;
-            }
-        """)
+        logout_btn.setObjectName("logoutButton")
         logout_btn.clicked.connect(self.logout_signal.emit)
         header_layout.addWidget(logout_btn)
         main_layout.addWidget(header)
@@ -115,16 +82,17 @@ class PaymentScreen(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
+        scroll.setObjectName("portalScroll")
 
         scroll_content = QWidget()
+        scroll_content.setObjectName("portalContent")
         scroll_layout = QVBoxLayout(scroll_content)
         scroll_layout.setContentsMargins(60, 40, 60, 40)
         scroll_layout.setSpacing(30)
 
         # Page Title
         page_title_container = QWidget()
-        page_title_container.setStyleSheet("background-color: #E8F5F3; border-radius: 12px; border: none;")
+        page_title_container.setObjectName("portalBanner")
         page_title_layout = QHBoxLayout(page_title_container)
         page_title_layout.setContentsMargins(30, 25, 30, 25)
         page_title_layout.setSpacing(15)
@@ -132,21 +100,9 @@ class PaymentScreen(QWidget):
         title_text_layout = QVBoxLayout()
         title_text_layout.setSpacing(5)
         page_title = QLabel("Complete Your Payment")
-        page_title.setStyleSheet("""
-            color: #234940; 
-            font-size: 28px; 
-            font-weight: 700;
-            border: none;
-            background: transparent;
-        """)
+        page_title.setObjectName("pageTitle")
         page_subtitle = QLabel("Finalize your SHS enrollment with secure payment")
-        page_subtitle.setStyleSheet("""
-            color: #6B7280; 
-            font-size: 15px; 
-            font-weight: 500;
-            border: none;
-            background: transparent;
-        """)
+        page_subtitle.setObjectName("pageSubtitle")
         title_text_layout.addWidget(page_title)
         title_text_layout.addWidget(page_subtitle)
         page_title_layout.addLayout(title_text_layout)
@@ -155,19 +111,7 @@ class PaymentScreen(QWidget):
         cancel_btn = QPushButton("✕  Cancel")
         cancel_btn.setFixedSize(120, 40)
         cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #2D9B84;
-                border: none;
-                font-size: 15px;
-                font-weight: 600;
-            }
-            QPushButton:hover { 
-                color: #234940;
-                text-decoration: underline;
-            }
-        """)
+        cancel_btn.setObjectName("linkButton")
         cancel_btn.clicked.connect(self.back_signal.emit)
         page_title_layout.addWidget(cancel_btn)
         scroll_layout.addWidget(page_title_container)
@@ -191,46 +135,14 @@ class PaymentScreen(QWidget):
         back_btn = QPushButton("←  Back")
         back_btn.setFixedHeight(55)
         back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #6B7280;
-                border: 2px solid #E5E7EB;
-                border-radius: 10px;
-                font-size: 16px;
-                font-weight: 600;
-                padding: 0 30px;
-                border: none;
-            }
-            QPushButton:hover { 
-                background-color: #F9FAFB;
-                border-color: #D1D5DB;
-            }
-        """)
+        back_btn.setObjectName("backButton")
         back_btn.clicked.connect(self.back_signal.emit)
         action_layout.addWidget(back_btn, 1)
 
         self.pay_btn = QPushButton("Pay ₱32,500")
         self.pay_btn.setFixedHeight(55)
         self.pay_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.pay_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2D9B84;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-size: 16px;
-                font-weight: 700;
-                padding: 0 40px;
-            }
-            QPushButton:hover { 
-                background-color: #35B499;
-            }
-            QPushButton:disabled {
-                background-color: #D1D5DB;
-                color: #9CA3AF;
-            }
-        """)
+        self.pay_btn.setObjectName("primaryButton")
         self.pay_btn.clicked.connect(self.process_payment)
         self.pay_btn.setEnabled(False)
         action_layout.addWidget(self.pay_btn, 2)
@@ -239,14 +151,7 @@ class PaymentScreen(QWidget):
         # Footer
         footer_label = QLabel("Your Gateway to Senior High Success")
         footer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        footer_label.setStyleSheet("""
-            color: #9CA3AF; 
-            font-size: 14px; 
-            font-weight: 500; 
-            padding: 20px;
-            border: none;
-            background: transparent;
-        """)
+        footer_label.setObjectName("footerNote")
         scroll_layout.addWidget(footer_label)
         scroll_layout.addStretch()
         scroll.setWidget(scroll_content)
@@ -254,25 +159,13 @@ class PaymentScreen(QWidget):
 
     def create_student_info_card(self):
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 16px;
-                border: none;
-            }
-        """)
+        card.setObjectName("card")
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(40, 30, 40, 30)
         card_layout.setSpacing(20)
 
         title = QLabel("Student Information")
-        title.setStyleSheet("""
-            color: #1F2937; 
-            font-size: 20px; 
-            font-weight: 700;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("cardTitle")
         card_layout.addWidget(title)
 
         info_grid = QHBoxLayout()
@@ -307,25 +200,12 @@ class PaymentScreen(QWidget):
         layout.setSpacing(10)
 
         label = QLabel(label_text)
-        label.setStyleSheet("""
-            color: #6B7280; 
-            font-size: 14px; 
-            font-weight: 500;
-            border: none;
-            background: transparent;
-        """)
+        label.setObjectName("infoLabel")
         label.setFixedWidth(100)
 
         value = QLabel(value_text)
-        value.setStyleSheet("""
-            color: #1F2937; 
-            font-size: 14px; 
-            font-weight: 600;
-            border: none;
-            background: transparent;
-        """)
+        value.setObjectName("infoText")
         value.setWordWrap(True)
-        value.setObjectName("value_label")
 
         layout.addWidget(label)
         layout.addWidget(value, 1)
@@ -334,13 +214,7 @@ class PaymentScreen(QWidget):
     def create_payment_summary_card(self):
         """Create payment summary card with dynamic fee labels"""
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 16px;
-                border: none;
-            }
-        """)
+        card.setObjectName("card")
 
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(40, 30, 40, 30)
@@ -348,13 +222,7 @@ class PaymentScreen(QWidget):
 
         # Card title
         title = QLabel("Payment Summary")
-        title.setStyleSheet("""
-            color: #1F2937; 
-            font-size: 20px; 
-            font-weight: 700;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("cardTitle")
         card_layout.addWidget(title)
 
         # Fee items (store labels for dynamic update)
@@ -366,28 +234,16 @@ class PaymentScreen(QWidget):
         # Divider
         divider = QFrame()
         divider.setFrameShape(QFrame.Shape.HLine)
-        divider.setStyleSheet("background-color: #E5E7EB; max-height: 1px; border: none;")
+        divider.setObjectName("divider")
         card_layout.addWidget(divider)
 
         # Total
         total_layout = QHBoxLayout()
         total_label = QLabel("Total Amount")
-        total_label.setStyleSheet("""
-            color: #1F2937; 
-            font-size: 18px; 
-            font-weight: 700;
-            border: none;
-            background: transparent;
-        """)
+        total_label.setObjectName("totalLabel")
 
         self.total_amount_label = QLabel("₱26,500")
-        self.total_amount_label.setStyleSheet("""
-            color: #2D9B84; 
-            font-size: 24px; 
-            font-weight: 700;
-            border: none;
-            background: transparent;
-        """)
+        self.total_amount_label.setObjectName("totalAmount")
 
         total_layout.addWidget(total_label)
         total_layout.addStretch()
@@ -423,22 +279,10 @@ class PaymentScreen(QWidget):
         item_layout.setSpacing(10)
 
         label = QLabel(label_text)
-        label.setStyleSheet("""
-            color: #6B7280; 
-            font-size: 15px; 
-            font-weight: 500;
-            border: none;
-            background: transparent;
-        """)
+        label.setObjectName("feeLabel")
 
         amount = QLabel(amount_text)
-        amount.setStyleSheet("""
-            color: #1F2937; 
-            font-size: 15px; 
-            font-weight: 600;
-            border: none;
-            background: transparent;
-        """)
+        amount.setObjectName("feeAmount")
 
         item_layout.addWidget(label)
         item_layout.addStretch()
@@ -451,26 +295,14 @@ class PaymentScreen(QWidget):
     def create_payment_summary_card(self):
         """Create payment summary card with dynamic fee labels"""
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 16px;
-                border: none;
-            }
-        """)
+        card.setObjectName("card")
 
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(40, 30, 40, 30)
         card_layout.setSpacing(20)
 
         title = QLabel("Payment Summary")
-        title.setStyleSheet("""
-            color: #1F2937; 
-            font-size: 20px; 
-            font-weight: 700;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("cardTitle")
         card_layout.addWidget(title)
 
         # ✅ Store references to amount labels
@@ -482,28 +314,16 @@ class PaymentScreen(QWidget):
         # Divider
         divider = QFrame()
         divider.setFrameShape(QFrame.Shape.HLine)
-        divider.setStyleSheet("background-color: #E5E7EB; max-height: 1px; border: none;")
+        divider.setObjectName("divider")
         card_layout.addWidget(divider)
 
         # Total
         total_layout = QHBoxLayout()
         total_label = QLabel("Total Amount")
-        total_label.setStyleSheet("""
-            color: #1F2937; 
-            font-size: 18px; 
-            font-weight: 700;
-            border: none;
-            background: transparent;
-        """)
+        total_label.setObjectName("totalLabel")
 
         self.total_amount_label = QLabel("₱26,500")
-        self.total_amount_label.setStyleSheet("""
-            color: #2D9B84; 
-            font-size: 24px; 
-            font-weight: 700;
-            border: none;
-            background: transparent;
-        """)
+        self.total_amount_label.setObjectName("totalAmount")
 
         total_layout.addWidget(total_label)
         total_layout.addStretch()
@@ -514,25 +334,13 @@ class PaymentScreen(QWidget):
 
     def create_payment_method_card(self):
         card = QFrame()
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 16px;
-                border: none;
-            }
-        """)
+        card.setObjectName("card")
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(40, 30, 40, 30)
         card_layout.setSpacing(25)
 
         title = QLabel("Select Payment Method")
-        title.setStyleSheet("""
-            color: #1F2937; 
-            font-size: 20px; 
-            font-weight: 700;
-            border: none;
-            background: transparent;
-        """)
+        title.setObjectName("cardTitle")
         card_layout.addWidget(title)
 
         methods_layout = QHBoxLayout()
@@ -559,22 +367,7 @@ class PaymentScreen(QWidget):
         btn = QPushButton()
         btn.setFixedHeight(120)
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                border: 2px solid #E5E7EB;
-                border-radius: 12px;
-            }
-            QPushButton:hover {
-                border-color: #2D9B84;
-                background-color: #F0FAF8;
-            }
-            QPushButton:checked {
-                border-color: #2D9B84;
-                background-color: #E8F5F3;
-                border-width: 3px;
-            }
-        """)
+        btn.setObjectName("methodButton")
         btn.setCheckable(True)
 
         btn_layout = QVBoxLayout(btn)
@@ -587,13 +380,7 @@ class PaymentScreen(QWidget):
         # Method name
         name_label = QLabel(method_name)
         name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        name_label.setStyleSheet("""
-            color: #1F2937; 
-            font-size: 15px; 
-            font-weight: 600;
-            border: none;
-            background: transparent;
-        """)
+        name_label.setObjectName("methodName")
         btn_layout.addWidget(name_label)
         return btn
 
@@ -617,16 +404,12 @@ class PaymentScreen(QWidget):
 
     def create_checkmark_logo(self, label):
         label.setText("")
-        label.setStyleSheet("background-color: transparent; border: none;")
 
-        if os.path.exists('assets/enrollify_logo.png'):
-            pixmap = QPixmap('assets/enrollify_logo.png')
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio,
-                                       Qt.TransformationMode.SmoothTransformation)
-                label.setPixmap(scaled)
-                label.setFixedSize(scaled.size())
-                return
+        scaled = icons.pixmap('enrollify_logo.png', 50)
+        if scaled is not None:
+            label.setPixmap(scaled)
+            label.setFixedSize(icons.logical_size(scaled))
+            return
 
         # Fallback checkmark
         self.logo_pixmap = QPixmap(50, 50)
@@ -665,7 +448,7 @@ class PaymentScreen(QWidget):
         self.update_payment_summary()
 
     def update_info_value(self, container, new_value):
-        value_label = container.findChild(QLabel, "value_label")
+        value_label = container.findChild(QLabel, "infoText")
         if value_label:
             value_label.setText(new_value)
 
@@ -696,6 +479,8 @@ class PaymentScreen(QWidget):
             # Generate receipt number
             import random
             receipt_number = f"{QDateTime.currentDateTime().toString('yyyyMMdd')}{random.randint(1000, 9999)}"
+            # Recorded under the number shown on the receipt (and journaled under it when offline)
+            payment_data['receipt_number'] = receipt_number
 
             # Show success message first
             QMessageBox.information(
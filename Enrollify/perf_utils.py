@@ -0,0 +1,157 @@
+"""
+Performance helpers shared by the Enrollify benchmark and stress scripts
+Timing, percentiles, peak memory and JSON result files with baseline comparison
+"""
+
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+
+
+def percentile(samples, pct):
+    """Linear-interpolated percentile (pct in 0-100) of a list of numbers"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return float(ordered[0])
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples_ms):
+    """Summary statistics for a list of timings in milliseconds"""
+    if not samples_ms:
+        return {'count': 0}
+    return {
+        'count': len(samples_ms),
+        'min_ms': round(min(samples_ms), 3),
+        'median_ms': round(percentile(samples_ms, 50), 3),
+        'mean_ms': round(sum(samples_ms) / len(samples_ms), 3),
+        'p95_ms': round(percentile(samples_ms, 95), 3),
+        'p99_ms': round(percentile(samples_ms, 99), 3),
+        'max_ms': round(max(samples_ms), 3),
+    }
+
+
+def time_call(func, repeat=5, warmup=1):
+    """
+    Call func() warmup + repeat times
+
+    Returns (samples_ms, last_result) where samples_ms only covers the
+    timed repetitions.
+    """
+    result = None
+    for _ in range(warmup):
+        result = func()
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, result
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None if unavailable)"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS reports bytes
+        return round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1)
+    except ImportError:
+        pass
+
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return round(getattr(info, 'peak_wset', info.rss) / (1024 * 1024), 1)
+    except ImportError:
+        return None
+
+
+def current_rss_mb():
+    """Current resident set size in MB (None if psutil is not installed)"""
+    try:
+        import psutil
+        return round(psutil.Process().memory_info().rss / (1024 * 1024), 1)
+    except ImportError:
+        return None
+
+
+def run_metadata(**extra):
+    """Header describing where and when a result file was produced"""
+    meta = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+    meta.update(extra)
+    return meta
+
+
+def save_results(path, meta, results):
+    """Write {'meta': ..., 'results': {group: {case: summary}}} as JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'results': results}, f, indent=2, default=str)
+
+
+def load_results(path):
+    """Read a result file written by save_results"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline, current, threshold=1.25, metric='median_ms', min_delta_ms=1.0):
+    """
+    Compare two result files case by case
+
+    A case regresses when it is `threshold` times slower than the baseline
+    and at least `min_delta_ms` slower in absolute terms (so sub-millisecond
+    noise does not fail a run).
+
+    Returns a list of dicts sorted worst first.
+    """
+    rows = []
+    base_results = baseline.get('results', {})
+    for group, cases in current.get('results', {}).items():
+        for case, summary in cases.items():
+            if metric not in summary:
+                continue
+            base = base_results.get(group, {}).get(case)
+            if not base or metric not in base:
+                rows.append({'group': group, 'case': case, 'baseline': None,
+                             'current': summary.get(metric), 'ratio': None, 'status': 'new'})
+                continue
+
+            old, new = base[metric], summary[metric]
+            ratio = (new / old) if old else None
+            status = 'ok'
+            if ratio is not None and new - old >= min_delta_ms:
+                if ratio >= threshold:
+                    status = 'REGRESSION'
+            if ratio is not None and old - new >= min_delta_ms and ratio <= 1 / threshold:
+                status = 'faster'
+            rows.append({'group': group, 'case': case, 'baseline': old,
+                         'current': new, 'ratio': ratio, 'status': status})
+
+    rows.sort(key=lambda r: r['ratio'] or 0, reverse=True)
+    return rows
+
+
+def print_comparison(rows, metric='median_ms'):
+    """Print the output of compare_results as a table"""
+    print(f"{'group':<12} {'case':<40} {'baseline':>10} {'current':>10} {'ratio':>7}  status")
+    print("-" * 92)
+    for r in rows:
+        base = f"{r['baseline']:.2f}" if r['baseline'] is not None else '-'
+        cur = f"{r['current']:.2f}" if r['current'] is not None else '-'
+        ratio = f"{r['ratio']:.2f}x" if r['ratio'] is not None else '-'
+        print(f"{r['group']:<12} {r['case']:<40} {base:>10} {cur:>10} {ratio:>7}  {r['status']}")
+    print(f"(times are {metric})")
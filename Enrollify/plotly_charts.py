@@ -0,0 +1,131 @@
+"""
+Plotly report charts for Enrollify (QtWebEngine)
+Used by ReportsScreen when Config.REPORT_CHARTS is 'plotly'. Importing this
+module loads QtWebEngine, so nothing else should import it at startup.
+"""
+
+import os
+from PyQt6.QtCore import QUrl
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+import plotly
+import plotly.graph_objects as go
+import plotly.io as pio
+from config import Config
+from logger_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def plotly_js_path():
+    """
+    Local plotly.min.js - assets/js/plotly.min.js if present (pin a version
+    there), otherwise the copy bundled with the plotly package. Never a CDN.
+    """
+    bundled = Config.ASSETS_DIR / 'js' / 'plotly.min.js'
+    if bundled.exists():
+        return str(bundled)
+    return os.path.join(os.path.dirname(plotly.__file__), 'package_data', 'plotly.min.js')
+
+
+CHART_PAGE = """
+<html>
+  <head>
+    <meta charset="utf-8"/>
+    <style>
+      body {{ margin:0; padding:0; background-color: #ffffff; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial; overflow: hidden; }}
+      #chart {{ width: 100%; height: 100%; box-sizing:border-box; }}
+    </style>
+    <script src="{script}"></script>
+    <script>
+      function render(fig) {{
+        Plotly.react('chart', fig.data, fig.layout, {{responsive: true, displaylogo: false}});
+      }}
+    </script>
+  </head>
+  <body>
+    <div id="chart"></div>
+  </body>
+</html>
+"""
+
+
+class PlotlyChartView(QWebEngineView):
+    """
+    A QWebEngineView that loads the chart page once and then updates the
+    figure in place with Plotly.react - refreshes send only the figure JSON.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ready = False
+        self._pending = None
+        self.loadFinished.connect(self._on_load_finished)
+
+        script = plotly_js_path()
+        self.setHtml(CHART_PAGE.format(script=os.path.basename(script)),
+                     QUrl.fromLocalFile(os.path.dirname(script) + os.sep))
+
+    def set_figure(self, fig):
+        """Show fig (a plotly Figure); queued until the page has loaded"""
+        figure_json = pio.to_json(fig, validate=False)
+        if self._ready:
+            self.page().runJavaScript(f"render({figure_json});")
+        else:
+            self._pending = figure_json
+
+    def _on_load_finished(self, ok):
+        if not ok:
+            logger.error("Chart page failed to load")
+            return
+        self._ready = True
+        if self._pending is not None:
+            self.page().runJavaScript(f"render({self._pending});")
+            self._pending = None
+
+
+def build_figures(data):
+    """Plotly figures for ReportsScreen's chart data, keyed like the data"""
+    # Enrollment status pie
+    status_labels, status_values = data['status']
+    fig_status = go.Figure(data=[go.Pie(labels=status_labels, values=status_values, hole=0.4,
+                                        marker=dict(colors=['#0099FF', '#5DBAA3']),
+                                        textfont=dict(size=14))])
+    fig_status.update_layout(margin=dict(t=30, b=80, l=50, r=50),
+                             legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5, font=dict(size=12)),
+                             paper_bgcolor="white", plot_bgcolor="white",
+                             height=380, autosize=True)
+
+    # Track distribution - bar chart
+    track_labels, track_values = data['tracks']
+    fig_track = go.Figure(data=[go.Bar(x=track_labels, y=track_values,
+                                       marker_color=['#8B7EC8' for _ in track_labels],
+                                       text=track_values, textposition='outside')])
+    fig_track.update_layout(title_text="By Track", showlegend=False,
+                            margin=dict(t=60, b=80, l=70, r=50),
+                            paper_bgcolor="white", plot_bgcolor="white",
+                            xaxis=dict(title=None, tickfont=dict(size=11)),
+                            yaxis=dict(title=dict(text="Students", font=dict(size=12)), tickfont=dict(size=11)),
+                            height=380, autosize=True)
+
+    # Grade distribution - donut
+    grade_labels, grade_values = data['grades']
+    fig_grade = go.Figure(data=[go.Pie(labels=grade_labels, values=grade_values, hole=0.45,
+                                       marker=dict(colors=['#0099FF', '#5DBAA3']),
+                                       textfont=dict(size=14))])
+    fig_grade.update_layout(margin=dict(t=30, b=80, l=50, r=50),
+                            legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5, font=dict(size=12)),
+                            paper_bgcolor="white", plot_bgcolor="white",
+                            height=380, autosize=True)
+
+    # Strand distribution - horizontal bar
+    strand_labels, strand_values = data['strands']
+    fig_strand = go.Figure(data=[go.Bar(x=strand_values, y=strand_labels, orientation='h',
+                                        marker_color=['#F59E0B' for _ in strand_labels],
+                                        text=strand_values, textposition='outside')])
+    fig_strand.update_layout(margin=dict(t=40, b=80, l=150, r=60),
+                             xaxis=dict(title=dict(text="Students", font=dict(size=12)), tickfont=dict(size=11)),
+                             yaxis=dict(tickfont=dict(size=11)),
+                             paper_bgcolor="white", plot_bgcolor="white",
+                             height=380, autosize=True)
+
+    return {'status': fig_status, 'tracks': fig_track, 'grades': fig_grade, 'strands': fig_strand}
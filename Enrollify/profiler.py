@@ -0,0 +1,160 @@
+"""
+On-demand cProfile capture for Enrollify
+Operations wrapped with profile_block(...) (or decorators.profiled) run under
+cProfile when profiling is on, and each run writes two files to
+Config.LOGS_DIR / 'profiles':
+    - <operation>_<timestamp>.pstats          (python -m pstats, snakeviz)
+    - <operation>_<timestamp>.collapsed.txt   (flamegraph.pl / speedscope)
+
+Profiling is switched on with ENROLLIFY_PROFILE=all (or a comma separated
+list of operation names / prefixes, e.g. ENROLLIFY_PROFILE=admin.tab,payment_post),
+or at runtime with Ctrl+Shift+P on the admin screen.
+"""
+
+import cProfile
+import os
+import pstats
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from config import Config
+from logger_config import get_logger
+
+logger = get_logger(__name__)
+
+_env = os.environ.get('ENROLLIFY_PROFILE', '').strip()
+_filters = [f.strip() for f in _env.split(',') if f.strip() and f.strip().lower() != 'all']
+_enabled = bool(_env)
+
+# cProfile cannot nest - only the outermost profiled operation is captured
+_active = threading.local()
+
+
+def is_enabled(operation_name=None):
+    """Whether an operation should be profiled right now"""
+    if not _enabled:
+        return False
+    if not _filters or operation_name is None:
+        return True
+    return any(operation_name.startswith(f) for f in _filters)
+
+
+def set_enabled(enabled, operations=None):
+    """Turn profiling on or off at runtime (operations: optional name prefixes)"""
+    global _enabled, _filters
+    _enabled = enabled
+    _filters = list(operations or [])
+    logger.info(f"Profiling {'enabled' if enabled else 'disabled'}"
+                + (f" for {', '.join(_filters)}" if enabled and _filters else ""))
+
+
+def profiles_dir():
+    return os.path.join(str(Config.LOGS_DIR), 'profiles')
+
+
+# ==================== COLLAPSED STACKS ====================
+
+def _frame_label(func):
+    filename, line, name = func
+    if filename == '~':
+        # Built-ins: ('~', 0, "<method 'execute' of ...>")
+        return name.replace(';', ',')
+    return f"{os.path.basename(filename)}:{name}".replace(';', ',')
+
+
+def collapsed_stacks(stats, max_depth=64):
+    """
+    Flamegraph lines ('root;child;leaf microseconds') from a pstats.Stats
+
+    cProfile keeps caller -> callee edges, not whole stacks, so each
+    function's time is split between its callers in proportion to the
+    cumulative time each caller edge accounts for.
+    """
+    raw = stats.stats
+    callees = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge[3]
+
+    weights = {}
+
+    def walk(func, path, share):
+        _, _, tt, ct, _ = raw[func]
+        fraction = share / ct if ct else 0.0
+        stack = path + (_frame_label(func),)
+        own = tt * fraction
+        if own > 0:
+            weights[stack] = weights.get(stack, 0.0) + own
+        if len(stack) >= max_depth:
+            return
+        for callee, edge_ct in callees.get(func, {}).items():
+            if callee in raw and _frame_label(callee) not in stack:
+                walk(callee, stack, edge_ct * fraction)
+
+    roots = [func for func, (_, _, _, _, callers) in raw.items()
+             if not any(caller in raw for caller in callers)]
+    for root in roots:
+        walk(root, (), raw[root][3])
+
+    return [f"{';'.join(stack)} {int(seconds * 1_000_000)}"
+            for stack, seconds in sorted(weights.items()) if seconds * 1_000_000 >= 1]
+
+
+# ==================== CAPTURE ====================
+
+def _safe_name(operation_name):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', operation_name)
+
+
+def _dump(profile, operation_name, elapsed_ms):
+    directory = profiles_dir()
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, f"{_safe_name(operation_name)}_{time.strftime('%Y%m%d_%H%M%S')}"
+                                   f"_{int(time.time() * 1000) % 1000:03d}")
+
+    profile.dump_stats(f"{base}.pstats")
+    stats = pstats.Stats(profile)
+    with open(f"{base}.collapsed.txt", 'w', encoding='utf-8') as f:
+        f.write("\n".join(collapsed_stacks(stats)) + "\n")
+
+    logger.info(f"Profiled {operation_name} ({elapsed_ms:.0f} ms) -> {base}.pstats")
+    return base
+
+
+@contextmanager
+def profile_block(operation_name):
+    """
+    Profile the block when profiling is on for operation_name
+
+    Example:
+        with profile_block(f"admin.tab.{tab_name}"):
+            method_map[tab_name]()
+    """
+    if not is_enabled(operation_name) or getattr(_active, 'running', False):
+        yield
+        return
+
+    profile = cProfile.Profile()
+    _active.running = True
+    started = time.perf_counter()
+    try:
+        profile.enable()
+    except ValueError as e:
+        # Another profiler (debugger, IDE) already owns the hook
+        _active.running = False
+        logger.warning(f"Cannot profile {operation_name}: {e}")
+        yield
+        return
+
+    try:
+        yield
+    finally:
+        profile.disable()
+        _active.running = False
+        try:
+            _dump(profile, operation_name, (time.perf_counter() - started) * 1000)
+        except Exception as e:
+            logger.error(f"Could not write profile for {operation_name}: {e}")
+
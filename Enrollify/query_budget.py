@@ -0,0 +1,140 @@
+"""
+Round-trip budgets for user actions
+Wrap a tab switch or button handler in action_scope() and every statement
+it issues (seen through query_stats) is counted:
+    - round-trips and rows transferred
+    - repeated statement shapes, reported as N+1 patterns
+
+An action that goes over Config.QUERY_BUDGET round-trips, or that repeats
+one statement shape Config.N_PLUS_ONE_THRESHOLD times or more, is logged
+as a warning with the statements that caused it.
+"""
+
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+
+from config import Config
+from logger_config import get_logger
+from query_stats import registry as query_registry
+
+logger = get_logger(__name__)
+
+
+class ActionScope:
+    """Statements issued during one user action"""
+
+    def __init__(self, name, budget=None):
+        self.name = name
+        self.budget = budget if budget is not None else Config.QUERY_BUDGET
+        self.round_trips = 0
+        self.rows = 0
+        self.db_ms = 0.0
+        self.shapes = Counter()
+        self.started = time.perf_counter()
+        self.elapsed_ms = 0.0
+
+    def record(self, fingerprint_text, elapsed_ms, rows):
+        self.round_trips += 1
+        self.rows += rows
+        self.db_ms += elapsed_ms
+        self.shapes[fingerprint_text] += 1
+
+    def repeated_shapes(self, threshold=None):
+        """[(fingerprint, count)] for shapes run at least `threshold` times"""
+        threshold = threshold or Config.N_PLUS_ONE_THRESHOLD
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    @property
+    def over_budget(self):
+        return self.round_trips > self.budget
+
+    def to_dict(self):
+        return {
+            'action': self.name,
+            'round_trips': self.round_trips,
+            'rows': self.rows,
+            'db_ms': round(self.db_ms, 2),
+            'elapsed_ms': round(self.elapsed_ms, 2),
+            'budget': self.budget,
+            'over_budget': self.over_budget,
+            'n_plus_one': [{'fingerprint': shape, 'count': count}
+                           for shape, count in self.repeated_shapes()],
+        }
+
+
+# Scopes open on each thread id (innermost last); statements count towards all of them.
+# Keyed by thread id rather than thread-local so diagnostics can read other threads.
+_scopes = {}
+
+# Summaries of the most recent actions, for diagnostics
+_recent = deque(maxlen=50)
+
+
+def _on_statement(fingerprint_text, elapsed_ms, rows):
+    """query_stats listener - runs on the thread that issued the statement"""
+    for scope in _scopes.get(threading.get_ident(), ()):
+        scope.record(fingerprint_text, elapsed_ms, rows)
+
+
+def current_action(thread_id):
+    """Name of the innermost action running on a thread, or None"""
+    scopes = _scopes.get(thread_id)
+    return scopes[-1].name if scopes else None
+
+
+query_registry.add_listener(_on_statement)
+
+
+def _report(scope):
+    summary = scope.to_dict()
+    _recent.append(summary)
+
+    problems = []
+    if scope.over_budget:
+        problems.append(f"{scope.round_trips} round-trips (budget {scope.budget})")
+    for shape, count in scope.repeated_shapes():
+        problems.append(f"N+1: {count}x {shape[:200]}")
+
+    if problems:
+        logger.warning(
+            f"Action '{scope.name}' took {scope.elapsed_ms:.0f} ms, {scope.round_trips} queries, "
+            f"{scope.rows} rows - " + "; ".join(problems)
+        )
+    else:
+        logger.debug(
+            f"Action '{scope.name}': {scope.round_trips} queries, {scope.rows} rows, "
+            f"{scope.db_ms:.0f}/{scope.elapsed_ms:.0f} ms in DB"
+        )
+
+
+@contextmanager
+def action_scope(name, budget=None):
+    """
+    Count the statements issued inside the block as one user action
+
+    Example:
+        with action_scope("admin.tab.staff"):
+            self.show_staff_content()
+    """
+    scope = ActionScope(name, budget)
+    thread_id = threading.get_ident()
+    scopes = _scopes.setdefault(thread_id, [])
+    scopes.append(scope)
+    try:
+        yield scope
+    finally:
+        scopes.remove(scope)
+        if not scopes:
+            _scopes.pop(thread_id, None)
+        scope.elapsed_ms = (time.perf_counter() - scope.started) * 1000
+        try:
+            _report(scope)
+        except Exception as e:
+            logger.error(f"Could not report action '{name}': {e}")
+
+
+def recent_actions(limit=20):
+    """Summaries of the last `limit` actions, newest first"""
+    return list(_recent)[-limit:][::-1]
@@ -0,0 +1,359 @@
+"""
+Statement timing for the MySQL data layer
+
+DatabaseManager wraps its connection with instrument_connection(), so every
+cursor.execute - including the raw cursors the screens open through
+db.get_connection() - records:
+    - the statement fingerprint (literals and parameters replaced by ?)
+    - parameter count
+    - rows returned / affected
+    - elapsed time (execute + fetch)
+
+Statements slower than Config.SLOW_QUERY_MS are logged through
+logger_config with the call site that issued them.
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+
+from config import Config
+from logger_config import get_logger
+
+logger = get_logger(__name__)
+
+_THIS_FILE = os.path.basename(__file__)
+_DATA_LAYER_FILES = {'database_manager_mysql.py', 'database_manager.py', 'models.py'}
+
+
+# ==================== FINGERPRINTS ====================
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s)(?:\s*,\s*(?:\?|%s))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_fingerprint_cache = {}
+
+
+def fingerprint(sql):
+    """
+    Normalise a statement so every execution of the same query shape
+    maps to one key: literals become ?, IN (...) lists collapse, and
+    whitespace is squeezed.
+    """
+    cached = _fingerprint_cache.get(sql)
+    if cached is not None:
+        return cached
+
+    text = _STRING_LITERAL.sub('?', sql)
+    text = _NUMBER_LITERAL.sub('?', text)
+    text = text.replace('%s', '?')
+    text = _PLACEHOLDER_LIST.sub('(?+)', text)
+    text = _WHITESPACE.sub(' ', text).strip()
+
+    if len(_fingerprint_cache) < 5000:
+        _fingerprint_cache[sql] = text
+    return text
+
+
+def _param_count(params):
+    if params is None:
+        return 0
+    if isinstance(params, (list, tuple, dict)):
+        return len(params)
+    return 1
+
+
+def find_call_site():
+    """
+    Where a statement came from, as 'method <- file.py:line caller'
+
+    The first frame is the data layer method, the second the first frame
+    outside the data layer (usually a screen or controller).
+    """
+    frame = sys._getframe(1)
+    db_frame = None
+    while frame is not None:
+        filename = os.path.basename(frame.f_code.co_filename)
+        if filename != _THIS_FILE:
+            if filename in _DATA_LAYER_FILES:
+                if db_frame is None:
+                    db_frame = frame
+            else:
+                caller = f"{filename}:{frame.f_lineno} {frame.f_code.co_name}"
+                if db_frame is not None:
+                    return f"{db_frame.f_code.co_name} <- {caller}"
+                return caller
+        frame = frame.f_back
+
+    if db_frame is not None:
+        return f"{db_frame.f_code.co_name} ({os.path.basename(db_frame.f_code.co_filename)})"
+    return "unknown"
+
+
+# ==================== REGISTRY ====================
+
+class StatementStats:
+    """Aggregated timings for one fingerprint"""
+
+    __slots__ = ('fingerprint', 'count', 'total_ms', 'max_ms', 'rows', 'params',
+                 'slow_count', 'errors', 'last_call_site')
+
+    def __init__(self, fingerprint_text):
+        self.fingerprint = fingerprint_text
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.params = 0
+        self.slow_count = 0
+        self.errors = 0
+        self.last_call_site = ''
+
+    @property
+    def avg_ms(self):
+        return self.total_ms / self.count if self.count else 0.0
+
+    def to_dict(self):
+        return {
+            'fingerprint': self.fingerprint,
+            'count': self.count,
+            'total_ms': round(self.total_ms, 2),
+            'avg_ms': round(self.avg_ms, 2),
+            'max_ms': round(self.max_ms, 2),
+            'rows': self.rows,
+            'params': self.params,
+            'slow_count': self.slow_count,
+            'errors': self.errors,
+            'call_site': self.last_call_site,
+        }
+
+
+class QueryRegistry:
+    """Per-fingerprint statistics for the whole process"""
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """callback(fingerprint, elapsed_ms, rows) is called for every finished statement"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def record(self, fingerprint_text, params, rows, elapsed_ms, call_site, error=False):
+        slow = elapsed_ms >= Config.SLOW_QUERY_MS
+        with self._lock:
+            stats = self._stats.get(fingerprint_text)
+            if stats is None:
+                stats = self._stats[fingerprint_text] = StatementStats(fingerprint_text)
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.rows += rows
+            stats.params = params
+            if elapsed_ms > stats.max_ms:
+                stats.max_ms = elapsed_ms
+                stats.last_call_site = call_site
+            if slow:
+                stats.slow_count += 1
+            if error:
+                stats.errors += 1
+
+        if slow:
+            logger.warning(
+                f"Slow query ({elapsed_ms:.0f} ms, {rows} rows, {params} params) "
+                f"at {call_site}: {fingerprint_text[:300]}"
+            )
+
+        for callback in list(self._listeners):
+            try:
+                callback(fingerprint_text, elapsed_ms, rows)
+            except Exception as e:
+                logger.error(f"Query listener failed: {e}")
+
+    def top(self, limit=10, key='total_ms'):
+        """Most expensive statements, sorted by total_ms, max_ms, avg_ms or count"""
+        with self._lock:
+            stats = list(self._stats.values())
+        sort_key = {
+            'total_ms': lambda s: s.total_ms,
+            'max_ms': lambda s: s.max_ms,
+            'avg_ms': lambda s: s.avg_ms,
+            'count': lambda s: s.count,
+        }[key]
+        return [s.to_dict() for s in sorted(stats, key=sort_key, reverse=True)[:limit]]
+
+    def slow_statements(self, limit=10):
+        """Statements that crossed the slow threshold at least once, worst first"""
+        return [s for s in self.top(limit=len(self._stats), key='max_ms') if s['slow_count']][:limit]
+
+    def snapshot(self):
+        with self._lock:
+            return [s.to_dict() for s in self._stats.values()]
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+registry = QueryRegistry()
+
+# Statement currently executing on each thread (read by diagnostics)
+_active = {}
+
+
+def active_statement(thread_id):
+    """(sql, started_at) for the statement running or being fetched on a thread, or None"""
+    entry = _active.get(thread_id)
+    return entry[:2] if entry else None
+
+
+# ==================== WRAPPERS ====================
+
+class InstrumentedCursor:
+    """Cursor proxy that times execute + fetch and reports to the registry"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._pending = None
+
+    def _start(self, operation, params):
+        self._finish()
+        thread_id = threading.get_ident()
+        started = time.perf_counter()
+        _active[thread_id] = (operation, time.time(), id(self))
+        self._pending = {
+            'thread_id': thread_id,
+            'fingerprint': fingerprint(operation),
+            'params': _param_count(params),
+            'rows': 0,
+            'elapsed': 0.0,
+            'call_site': find_call_site(),
+            'error': False,
+        }
+        return started
+
+    def _add_time(self, started, rows=0):
+        if self._pending is not None:
+            self._pending['elapsed'] += time.perf_counter() - started
+            self._pending['rows'] += rows
+
+    def _finish(self):
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            entry = _active.get(pending['thread_id'])
+            if entry is not None and entry[2] == id(self):
+                _active.pop(pending['thread_id'], None)
+            registry.record(pending['fingerprint'], pending['params'], pending['rows'],
+                            pending['elapsed'] * 1000, pending['call_site'], pending['error'])
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        started = self._start(operation, params)
+        try:
+            if params is None:
+                result = self._cursor.execute(operation, *args, **kwargs)
+            else:
+                result = self._cursor.execute(operation, params, *args, **kwargs)
+        except Exception:
+            self._pending['error'] = True
+            self._add_time(started)
+            self._finish()
+            raise
+
+        # DML reports affected rows straight away; SELECT rows are counted on fetch
+        affected = self._cursor.rowcount if not getattr(self._cursor, 'description', None) else 0
+        self._add_time(started, max(affected or 0, 0))
+        return result
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        seq_params = list(seq_params)
+        started = self._start(operation, seq_params[0] if seq_params else None)
+        try:
+            result = self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        except Exception:
+            self._pending['error'] = True
+            self._add_time(started)
+            self._finish()
+            raise
+        self._add_time(started, max(self._cursor.rowcount or 0, 0))
+        self._finish()
+        return result
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._add_time(started, 1 if row is not None else 0)
+        if row is None:
+            self._finish()
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._add_time(started, len(rows))
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._add_time(started, len(rows))
+        self._finish()
+        return rows
+
+    def close(self):
+        self._finish()
+        return self._cursor.close()
+
+    def __iter__(self):
+        row = self.fetchone()
+        while row is not None:
+            yield row
+            row = self.fetchone()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def __del__(self):
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class InstrumentedConnection:
+    """Connection proxy whose cursors are InstrumentedCursors"""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    @property
+    def raw_connection(self):
+        return self._connection
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._connection.cursor(*args, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+def instrument_connection(connection):
+    """Wrap a DB-API connection unless statement timing is switched off"""
+    if not Config.QUERY_STATS_ENABLED or isinstance(connection, InstrumentedConnection):
+        return connection
+    return InstrumentedConnection(connection)
@@ -8,9 +8,9 @@ from PyQt6.QtWidgets import (
     QPushButton, QFrame, QMessageBox, QScrollArea
 )
 from PyQt6.QtCore import Qt, QDateTime
-from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtGui import QFont
 from PyQt6.QtPrintSupport import QPrinter, QPrintDialog
-import os
+import icons
 
 
 class ReceiptDialog(QDialog):
@@ -173,11 +173,8 @@ class ReceiptDialog(QDialog):
 
         # Logo
         logo_label = QLabel()
-        if os.path.exists('assets/enrollify_logo.png'):
-            pixmap = QPixmap('assets/enrollify_logo.png').scaled(
-                70, 70, Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        pixmap = icons.pixmap('enrollify_logo.png', 70)
+        if pixmap is not None:
             logo_label.setPixmap(pixmap)
         else:
             logo_label.setText("✓")
@@ -2,11 +2,28 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-import plotly.graph_objects as go
-import plotly.io as pio
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from change_bus import changes
+from charts import BarChart, DonutChart
+from config import Config
 from database_manager_mysql import get_database
+from decorators import profiled
+from logger_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _load_plotly_charts():
+    """plotly_charts (and QtWebEngine) when Config.REPORT_CHARTS asks for it, else None"""
+    if Config.REPORT_CHARTS != 'plotly':
+        return None
+    try:
+        import plotly_charts
+        return plotly_charts
+    except Exception as e:
+        logger.warning(f"Plotly charts unavailable, using native charts: {e}")
+        return None
+
 
 # Keep the same signals as before for compatibility
 class ReportsScreen(QWidget):
@@ -19,10 +36,33 @@ class ReportsScreen(QWidget):
         super().__init__()
         self.setStyleSheet("background-color: #F5F7FA;")
         self.db = get_database()  # uses the existing database manager
+        self.plotly_charts = _load_plotly_charts()
         self.setup_ui()
         # initial load
         self.refresh_data()
 
+        # Student writes change every chart: recount once per burst, and
+        # only while the screen is shown (otherwise when it is next shown)
+        self._stale = False
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.timeout.connect(self._refresh_if_visible)
+        changes.subscribe(self.on_student_changed)
+
+    def on_student_changed(self, event):
+        self._stale = True
+        if not self._change_timer.isActive():
+            self._change_timer.start(Config.CHANGE_REFRESH_DELAY_MS)
+
+    def _refresh_if_visible(self):
+        if self._stale and self.isVisible():
+            self._stale = False
+            self.refresh_data()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._refresh_if_visible()
+
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -82,7 +122,7 @@ class ReportsScreen(QWidget):
             }
             QPushButton:hover { background-color: #35B499; }
         """)
-        refresh_btn.clicked.connect(self.refresh_data)
+        refresh_btn.clicked.connect(lambda: self.refresh_data())
         c_layout.addWidget(refresh_btn)
         c_layout.addStretch()
 
@@ -93,7 +133,7 @@ class ReportsScreen(QWidget):
 
         main_layout.addWidget(controls)
 
-        # Chart grid: 2x2 using two QWebEngineViews (left: status + track; right: grade + strand)
+        # Chart grid: 2x2 (left: status + track; right: grade + strand)
         grid = QFrame()
         grid_layout = QHBoxLayout(grid)
         grid_layout.setContentsMargins(40, 20, 40, 40)
@@ -103,12 +143,10 @@ class ReportsScreen(QWidget):
         left_col = QVBoxLayout()
         left_col.setSpacing(40)
 
-        self.view_enrollment_status = QWebEngineView()
-        self.view_enrollment_status.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.view_enrollment_status = self._create_chart('status')
         left_col.addWidget(self.card_wrapper("Enrollment Status", self.view_enrollment_status, height=450))
 
-        self.view_track_dist = QWebEngineView()
-        self.view_track_dist.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.view_track_dist = self._create_chart('tracks')
         left_col.addWidget(self.card_wrapper("Track Distribution", self.view_track_dist, height=450))
 
         grid_layout.addLayout(left_col, 1)
@@ -117,12 +155,10 @@ class ReportsScreen(QWidget):
         right_col = QVBoxLayout()
         right_col.setSpacing(40)
 
-        self.view_grade_dist = QWebEngineView()
-        self.view_grade_dist.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.view_grade_dist = self._create_chart('grades')
         right_col.addWidget(self.card_wrapper("Grade Level Distribution", self.view_grade_dist, height=450))
 
-        self.view_strand_dist = QWebEngineView()
-        self.view_strand_dist.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.view_strand_dist = self._create_chart('strands')
         right_col.addWidget(self.card_wrapper("Strand Distribution", self.view_strand_dist, height=450))
 
         grid_layout.addLayout(right_col, 1)
@@ -135,8 +171,23 @@ class ReportsScreen(QWidget):
         footer.setStyleSheet("color: #999; font-size: 13px; padding: 20px 0;")
         main_layout.addWidget(footer)
 
-    def card_wrapper(self, title_text, web_view: QWebEngineView, height=360):
-        """Wrap a QWebEngineView inside a styled card with title"""
+    def _create_chart(self, name):
+        """Native QPainter chart, or a PlotlyChartView in plotly mode"""
+        if self.plotly_charts is not None:
+            chart = self.plotly_charts.PlotlyChartView()
+        elif name == 'status':
+            chart = DonutChart(colors=['#0099FF', '#5DBAA3'], hole=0.4)
+        elif name == 'grades':
+            chart = DonutChart(colors=['#0099FF', '#5DBAA3'], hole=0.45)
+        elif name == 'tracks':
+            chart = BarChart(color='#8B7EC8', axis_title="Students")
+        else:
+            chart = BarChart(color='#F59E0B', horizontal=True, axis_title="Students")
+        chart.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        return chart
+
+    def card_wrapper(self, title_text, web_view, height=360):
+        """Wrap a chart inside a styled card with title"""
         frame = QFrame()
         frame.setStyleSheet("""
             QFrame {
@@ -162,120 +213,50 @@ class ReportsScreen(QWidget):
     # -------------------------
     # Data fetching + chart generation
     # -------------------------
+    @profiled("reports.refresh_data")
     def refresh_data(self):
         """Fetch data from database and render all charts"""
         try:
             stats = self.db.get_statistics()
         except Exception as e:
-            print("Failed to fetch statistics:", e)
+            logger.error(f"Failed to fetch statistics: {e}")
             stats = {
                 'total_students': 0, 'enrolled': 0, 'pending': 0,
                 'grade11': 0, 'grade12': 0, 'tracks': {}, 'total_revenue': 0
             }
 
-        # Prepare data for charts
-        # Enrollment status pie
-        status_labels = ["Enrolled", "Pending"]
-        status_values = [stats.get('enrolled', 0), stats.get('pending', 0)]
-        fig_status = go.Figure(data=[go.Pie(labels=status_labels, values=status_values, hole=0.4,
-                                            marker=dict(colors=['#0099FF', '#5DBAA3']),
-                                            textfont=dict(size=14))])
-        fig_status.update_layout(margin=dict(t=30, b=80, l=50, r=50),
-                                 legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5, font=dict(size=12)),
-                                 paper_bgcolor="white", plot_bgcolor="white",
-                                 height=380, autosize=True)
-
-        # Track distribution - bar chart (sort by count desc)
+        # Chart data: name -> (labels, values)
         tracks = stats.get('tracks', {}) or {}
-        track_labels = list(tracks.keys()) if tracks else ["N/A"]
-        track_values = list(tracks.values()) if tracks else [0]
-        fig_track = go.Figure(data=[go.Bar(x=track_labels, y=track_values,
-                                           marker_color=['#8B7EC8' for _ in track_labels],
-                                           text=track_values, textposition='outside')])
-        fig_track.update_layout(title_text="By Track", showlegend=False,
-                                margin=dict(t=60, b=80, l=70, r=50),
-                                paper_bgcolor="white", plot_bgcolor="white",
-                                xaxis=dict(title=None, tickfont=dict(size=11)),
-                                yaxis=dict(title=dict(text="Students", font=dict(size=12)), tickfont=dict(size=11)),
-                                height=380, autosize=True)
-
-        # Grade distribution - donut
-        grade_labels = ["Grade 11", "Grade 12"]
-        grade_values = [stats.get('grade11', 0), stats.get('grade12', 0)]
-        fig_grade = go.Figure(data=[go.Pie(labels=grade_labels, values=grade_values, hole=0.45,
-                                           marker=dict(colors=['#0099FF', '#5DBAA3']),
-                                           textfont=dict(size=14))])
-        fig_grade.update_layout(margin=dict(t=30, b=80, l=50, r=50),
-                                legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5, font=dict(size=12)),
-                                paper_bgcolor="white", plot_bgcolor="white",
-                                height=380, autosize=True)
-
-        # Strand distribution - horizontal bar (if many strands, show top N)
-        # We'll query the DB for strand counts using a direct SQL for better accuracy
         strands = self._get_strand_counts()
-        if strands:
-            strand_labels = [s for s, _ in strands]
-            strand_values = [v for _, v in strands]
-        else:
-            strand_labels = ["N/A"]
-            strand_values = [0]
-
-        fig_strand = go.Figure(data=[go.Bar(x=strand_values, y=strand_labels, orientation='h',
-                                           marker_color=['#F59E0B' for _ in strand_labels],
-                                           text=strand_values, textposition='outside')])
-        fig_strand.update_layout(margin=dict(t=40, b=80, l=150, r=60),
-                                 xaxis=dict(title=dict(text="Students", font=dict(size=12)), tickfont=dict(size=11)),
-                                 yaxis=dict(tickfont=dict(size=11)),
-                                 paper_bgcolor="white", plot_bgcolor="white",
-                                 height=380, autosize=True)
-
-        # Render each figure into the corresponding QWebEngineView
+        data = {
+            'status': (["Enrolled", "Pending"], [stats.get('enrolled', 0), stats.get('pending', 0)]),
+            'tracks': (list(tracks.keys()) or ["N/A"], list(tracks.values()) or [0]),
+            'grades': (["Grade 11", "Grade 12"], [stats.get('grade11', 0), stats.get('grade12', 0)]),
+            'strands': ([s for s, _ in strands] or ["N/A"], [v for _, v in strands] or [0]),
+        }
+        charts = {
+            'status': self.view_enrollment_status,
+            'tracks': self.view_track_dist,
+            'grades': self.view_grade_dist,
+            'strands': self.view_strand_dist,
+        }
+
+        # Update the existing charts in place
         try:
-            self._render_plot_in_view(fig_status, self.view_enrollment_status)
-            self._render_plot_in_view(fig_track, self.view_track_dist)
-            self._render_plot_in_view(fig_grade, self.view_grade_dist)
-            self._render_plot_in_view(fig_strand, self.view_strand_dist)
+            if self.plotly_charts is not None:
+                for name, fig in self.plotly_charts.build_figures(data).items():
+                    charts[name].set_figure(fig)
+            else:
+                for name, (labels, values) in data.items():
+                    charts[name].set_data(labels, values)
         except Exception as e:
-            print("Failed to render plots:", e)
-
-    def _render_plot_in_view(self, fig, web_view: QWebEngineView):
-        """Convert plotly fig to HTML and load into QWebEngineView"""
-        # Use CDN plotly JS so HTML is small
-        html_body = pio.to_html(fig, full_html=False, include_plotlyjs='cdn')
-        # small wrapper to keep the card background consistent
-        html = f"""
-        <html>
-          <head>
-            <meta charset="utf-8"/>
-            <style>
-              body {{ margin:0; padding:0; background-color: #ffffff; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial; overflow: hidden; }}
-              .chart-container {{ width: 100%; height: 100%; box-sizing:border-box; }}
-            </style>
-          </head>
-          <body>
-            <div class="chart-container">{html_body}</div>
-          </body>
-        </html>
-        """
-        web_view.setHtml(html)
+            logger.error(f"Failed to render plots: {e}")
 
     def _get_strand_counts(self, top_n=8):
-        """Query DB for strand counts, return list of (strand, count) sorted desc"""
+        """Strand counts from the database, as a list of (strand, count) sorted desc"""
         try:
-            conn = self.db.get_connection()
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT IFNULL(strand, 'Unspecified') AS strand, COUNT(*) AS cnt
-                FROM students
-                GROUP BY IFNULL(strand, 'Unspecified')
-                ORDER BY cnt DESC
-                LIMIT ?
-            """, (top_n,))
-            rows = cur.fetchall()
-            conn.close()
-            # rows are tuples (strand, cnt)
-            return [(r[0], r[1]) for r in rows]
+            counts = self.db.count_by_strand(top_n)
+            return [(strand, count) for strand, count in counts.items() if count]
         except Exception:
             # fallback to stats summary or empty
             return []
-
@@ -1,7 +1,6 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QLineEdit, QSizePolicy
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap
-import os
+import icons
 
 
 class StaffLoginScreen(QWidget):
@@ -83,15 +82,10 @@ class StaffLoginScreen(QWidget):
         logo_container = QHBoxLayout()
         logo_label = QLabel()
 
-        if os.path.exists('assets/enrollify_logo.png'):
-            pixmap = QPixmap('assets/enrollify_logo.png')
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(70, 70, Qt.AspectRatioMode.KeepAspectRatio,
-                                       Qt.TransformationMode.SmoothTransformation)
-                logo_label.setPixmap(scaled)
-                logo_label.setFixedSize(scaled.size())
-            else:
-                self.create_fallback_logo(logo_label, 70)
+        scaled = icons.pixmap('enrollify_logo.png', 70)
+        if scaled is not None:
+            logo_label.setPixmap(scaled)
+            logo_label.setFixedSize(icons.logical_size(scaled))
         else:
             self.create_fallback_logo(logo_label, 70)
 
@@ -1,13 +1,21 @@
 # staff_portal.py - FIXED VERSION
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
-    QScrollArea, QGridLayout, QTableWidget, QTableWidgetItem,
+    QGridLayout, QTableWidget, QTableWidgetItem,
     QHeaderView, QMessageBox, QSizePolicy, QComboBox, QLineEdit
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from database_manager_mysql import get_database
-import os
+from decorators import query_budget
+from query_budget import action_scope
+from memory_tracker import get_memory_tracker
+from logger_config import get_logger
+import icons
+from ui_styles import set_role, set_state, set_screen
+from tab_pages import TabStack, KeyedRows, row_widget, bar_row, pill_row, set_metric
+from change_bus import changes, STUDENT_ASSIGNED, STUDENT_DELETED, STUDENTS_CLEARED, STUDENT_SYNCED
+
+logger = get_logger(__name__)
 
 
 class StaffPortalScreen(QWidget):
@@ -16,31 +24,33 @@ class StaffPortalScreen(QWidget):
     def set_current_user(self, user):
         """Set the currently logged-in staff user"""
         self.current_user = user
-        print(f"✅ Staff Portal: User set to {user.get('full_name')} (ID: {user.get('id')})")
+        logger.info(f"✅ Staff Portal: User set to {user.get('full_name')} (ID: {user.get('id')})")
+        # Every page shows this user's students
+        self.pages.invalidate()
 
     def __init__(self):
         super().__init__()
-        self.setStyleSheet("background-color: #F8F9FA;")
+        set_screen(self, "staffPortal")
         self.db = get_database()
         self.current_tab = "analytics"
         self.current_user = None
+        self._my_students = None
+        self.my_enrollees = {}
+        self.memory_tracker = get_memory_tracker("staff")
         self.setup_ui()
+        changes.subscribe(self.on_student_changed)
 
     def load_icon(self, icon_name):
         """Load an icon from assets/icons/"""
-        path = f"assets/icons/{icon_name}"
-        if os.path.exists(path):
-            pixmap = QPixmap(path).scaled(
-                20, 20, Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        pixmap = icons.pixmap(f"icons/{icon_name}", 20)
+        if pixmap is not None:
             label = QLabel()
             label.setPixmap(pixmap)
             return label
         else:
             # Fallback to text icon if image not found
             fallback_label = QLabel(icon_name)
-            fallback_label.setStyleSheet("font-size: 20px; color: #9CA3AF;")
+            fallback_label.setObjectName("iconFallback")
             return fallback_label
 
     def setup_ui(self):
@@ -56,45 +66,20 @@ class StaffPortalScreen(QWidget):
         nav_tabs = self.create_nav_tabs()
         main_layout.addWidget(nav_tabs)
 
-        # Scroll Area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #F8F9FA;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #F0F0F0;
-                width: 10px;
-                margin: 0px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #C0C0C0;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-        """)
-
-        # Content Container - FIXED SPACING
-        self.content_container = QWidget()
-        self.content_container.setStyleSheet("background-color: #F8F9FA;")
-        self.content_layout = QVBoxLayout(self.content_container)
-        self.content_layout.setContentsMargins(80, 60, 80, 100)  # Match admin screen
-        self.content_layout.setSpacing(40)  # Match admin screen
+        # One page per tab, built on first visit and refreshed in place afterwards
+        # (margins and spacing match the admin screen)
+        self.pages = TabStack()
+        self.pages.add_tab("analytics", self.build_analytics_page)
+        self.pages.add_tab("enrollees", self.build_enrollees_page)
+        self.pages.add_tab("reports", self.build_reports_page)
 
         # Load initial content
-        self.show_analytics_content()
-
-        scroll.setWidget(self.content_container)
-        main_layout.addWidget(scroll)
+        self.pages.show_tab("analytics")
+        main_layout.addWidget(self.pages)
 
     def create_header(self):
         header = QFrame()
-        header.setStyleSheet("QFrame { background-color: white; border: none; }")
+        header.setObjectName("pageHeader")
         header.setFixedHeight(100)
 
         layout = QHBoxLayout(header)
@@ -102,31 +87,20 @@ class StaffPortalScreen(QWidget):
 
         # Logo
         logo = QLabel()
-        if os.path.exists('assets/enrollify_logo.png'):
-            pixmap = QPixmap('assets/enrollify_logo.png').scaled(
-                60, 60, Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        pixmap = icons.pixmap('enrollify_logo.png', 60)
+        if pixmap is not None:
             logo.setPixmap(pixmap)
         else:
             logo.setText("📚")
-            logo.setStyleSheet("font-size: 32px; color: #060C0B;")
+            logo.setObjectName("headerLogo")
 
         # Title
         text_layout = QVBoxLayout()
         text_layout.setSpacing(4)
         title = QLabel("Enrollify")
-        title.setStyleSheet("""
-            font-size: 26px;
-            font-weight: 700;
-            color: #060C0B;
-        """)
+        title.setObjectName("headerTitle")
         subtitle = QLabel("Staff Portal - Enrollment Management")
-        subtitle.setStyleSheet("""
-            font-size: 16px;
-            color: #666;
-            font-weight: 500;
-        """)
+        subtitle.setObjectName("headerSubtitle")
         text_layout.addWidget(title)
         text_layout.addWidget(subtitle)
 
@@ -137,26 +111,13 @@ class StaffPortalScreen(QWidget):
         # Logout Button
         logout_btn = QPushButton("⎋ Logout")
         logout_btn.setFixedHeight(45)
-        logout_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #2D9B84;
-                border: 2px solid #2D9B84;
-                border-radius: 10px;
-                font-size: 15px;
-                font-weight: 600;
-                padding: 0 20px;
-            }
-            QPushButton:hover {
-                background-color: #E8F4F2;
-            }
-        """)
+        logout_btn.setObjectName("logoutButton")
         logout_btn.clicked.connect(self.logout_signal.emit)
         layout.addWidget(logout_btn)
 
         return header
 
-    def create_tab_button(self, text, is_active, icon_path=None):
+    def create_tab_button(self, text, is_active, icon_name=None):
         btn = QPushButton()
         btn.setFixedHeight(65)
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -170,13 +131,9 @@ class StaffPortalScreen(QWidget):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Add icon if provided
-        if icon_path and os.path.exists(icon_path):
+        pixmap = icons.pixmap(f"icons/{icon_name}", 20) if icon_name else None
+        if pixmap is not None:
             icon_label = QLabel()
-            pixmap = QPixmap(icon_path).scaled(
-                20, 20,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
             icon_label.setPixmap(pixmap)
             layout.addWidget(icon_label)
         # Optional: fallback to emoji if you want (not required)
@@ -191,49 +148,22 @@ class StaffPortalScreen(QWidget):
         text_label = QLabel(text)
         layout.addWidget(text_label)
 
-        # Apply styles
-        if is_active:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #060C0B;
-                    border: none;
-                    border-bottom: 3px solid #2D9B84;
-                    font-size: 16px;
-                    font-weight: 600;
-                    padding: 0 12px;
-                }
-            """)
-        else:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    color: #666;
-                    font-size: 15px;
-                    font-weight: 500;
-                    padding: 0 12px;
-                }
-                QPushButton:hover {
-                    background-color: #F9FAFB;
-                    color: #060C0B;
-                }
-            """)
+        set_role(btn, "tabButton", active=is_active)
 
         return btn
 
     def create_nav_tabs(self):
         nav = QFrame()
-        nav.setStyleSheet("QFrame { background-color: white; border: none; border-bottom: 1px solid #E5E7EB; }")
+        nav.setObjectName("tabBar")
         nav.setFixedHeight(65)
         layout = QHBoxLayout(nav)
         layout.setContentsMargins(40, 0, 40, 0)
         layout.setSpacing(20)
 
         # Updated calls with icon paths
-        self.analytics_btn = self.create_tab_button("Analytics", True, "assets/icons/analytics.png")
-        self.enrollees_btn = self.create_tab_button("Enrollees", False, "assets/icons/enrollees.png")
-        self.reports_btn = self.create_tab_button("Reports", False, "assets/icons/reports.png")
+        self.analytics_btn = self.create_tab_button("Analytics", True, "analytics.png")
+        self.enrollees_btn = self.create_tab_button("Enrollees", False, "enrollees.png")
+        self.reports_btn = self.create_tab_button("Reports", False, "reports.png")
 
         self.analytics_btn.clicked.connect(lambda: self.switch_tab("analytics"))
         self.enrollees_btn.clicked.connect(lambda: self.switch_tab("enrollees"))
@@ -248,443 +178,237 @@ class StaffPortalScreen(QWidget):
     def switch_tab(self, tab_name):
         self.current_tab = tab_name
 
-        # Reset all button styles
-        buttons = [self.analytics_btn, self.enrollees_btn, self.reports_btn]
-        for btn in buttons:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    color: #666;
-                    padding: 0 24px;
-                    font-size: 15px;
-                    font-weight: 500;
-                }
-                QPushButton:hover {
-                    background-color: #F9FAFB;
-                    color: #060C0B;
-                }
-            """)
-
-        # Activate current button
+        # The active state is a dynamic property matched by the app stylesheet
         btn_map = {
             "analytics": self.analytics_btn,
             "enrollees": self.enrollees_btn,
             "reports": self.reports_btn
         }
-        active_btn = btn_map[tab_name]
-        active_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #060C0B;
-                border: none;
-                border-bottom: 3px solid #2D9B84;
-                font-size: 16px;
-                font-weight: 600;
-                padding: 0 24px;
-            }
-        """)
-
-        # Clear old content first
-        self.clear_content()
-
-        # Force process pending events to ensure deletion
-        from PyQt6.QtWidgets import QApplication
-        QApplication.processEvents()
-
-        # Load new content
-        method_map = {
-            "analytics": self.show_analytics_content,
-            "enrollees": self.show_enrollees_content,
-            "reports": self.show_reports_content
-        }
-        method_map[tab_name]()
-
-    def clear_content(self):
-        """Clear all content from layout - FIXED"""
-        while self.content_layout.count():
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-            elif child.layout():
-                self.clear_layout(child.layout())
-
-    def clear_layout(self, layout):
-        """Recursively clear nested layouts"""
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-            elif child.layout():
-                self.clear_layout(child.layout())
+        for name, btn in btn_map.items():
+            set_state(btn, active=name == tab_name)
+
+        # Pages are kept - only stale data is re-queried
+        with action_scope(f"staff.tab.{tab_name}"):
+            self.pages.show_tab(tab_name)
+
+        if self.memory_tracker:
+            # After the event loop has run the deleteLater() calls of rows that went away
+            QTimer.singleShot(0, lambda: self.memory_tracker.checkpoint(tab_name))
 
     # ==================== ANALYTICS TAB ====================
-    def show_analytics_content(self):
-        self.clear_content()
+    def get_my_students(self):
+        """Students assigned to the current user, fetched once per analytics refresh"""
+        if self._my_students is None:
+            self._my_students = self.db.get_students_by_staff(self.current_user.get('id'))
+        return self._my_students
+
+    def build_analytics_page(self, page):
+        layout = page.content_layout
 
         # Title with staff name
-        if hasattr(self, 'current_user') and self.current_user:
-            staff_name = self.current_user.get('full_name', 'Staff')
-            title = QLabel(f"Analytics Dashboard - {staff_name}")
-        else:
-            title = QLabel("Analytics Dashboard")
+        title = QLabel("Analytics Dashboard")
+        title.setObjectName("pageTitle")
+        layout.addWidget(title)
 
-        title.setStyleSheet("""
-            font-size: 28px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
-        self.content_layout.addWidget(title)
+        @page.on_refresh
+        def refresh_title():
+            # Every analytics panel reads the same list - fetch it once
+            self._my_students = None
+            if self.current_user:
+                staff_name = self.current_user.get('full_name', 'Staff')
+                title.setText(f"Analytics Dashboard - {staff_name}")
+            else:
+                title.setText("Analytics Dashboard")
 
         subtitle = QLabel("Your assigned students' data")
-        subtitle.setStyleSheet("""
-            font-size: 14px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
-        self.content_layout.addWidget(subtitle)
-        self.content_layout.addSpacing(40)
+        subtitle.setObjectName("pageSubtitle")
+        layout.addWidget(subtitle)
+        layout.addSpacing(40)
 
         # Top Metrics - 4 Cards (filtered by staff)
         top_cards = QHBoxLayout()
         top_cards.setSpacing(24)
 
-        try:
-            # Get staff-specific data
-            if hasattr(self, 'current_user') and self.current_user:
-                staff_id = self.current_user.get('id')
-                my_students = self.db.get_students_by_staff(staff_id)
-            else:
-                my_students = []
-
-            total = len(my_students)
-            enrolled = sum(1 for s in my_students if s.get('status') == 'Enrolled')
-            pending = sum(1 for s in my_students if s.get('status') == 'Pending')
-
-            # Grade distribution from my students
-            grade11 = sum(1 for s in my_students if s.get('grade') == "Grade 11")
-            grade12 = sum(1 for s in my_students if s.get('grade') == "Grade 12")
-
-            enrolled_pct = int((enrolled / total * 100)) if total > 0 else 0
-
-            # Card 1: My Students
-            card1 = self.create_metric_card(
-                "My Students",
-                str(total),
-                "Assigned to you",
-                "👥",
-                "#111827"
-            )
-
-            # Card 2: Enrolled
-            card2 = self.create_metric_card(
-                "Enrolled",
-                str(enrolled),
-                f"{enrolled_pct}% of yours",
-                "✓",
-                "#10B981"
-            )
-
-            # Card 3: Grade 11
-            card3 = self.create_metric_card(
-                "Grade 11",
-                str(grade11),
-                "Your students",
-                "🎓",
-                "#3B82F6"
-            )
-
-            # Card 4: Grade 12
-            card4 = self.create_metric_card(
-                "Grade 12",
-                str(grade12),
-                "Your students",
-                "📈",
-                "#8B5CF6"
-            )
-
-            top_cards.addWidget(card1)
-            top_cards.addWidget(card2)
-            top_cards.addWidget(card3)
-            top_cards.addWidget(card4)
-            self.content_layout.addLayout(top_cards)
+        cards = {
+            'total': self.create_metric_card("My Students", "0", "Assigned to you", "👥", "dark"),
+            'enrolled': self.create_metric_card("Enrolled", "0", "0% of yours", "✓", "green"),
+            'grade11': self.create_metric_card("Grade 11", "0", "Your students", "🎓", "blue"),
+            'grade12': self.create_metric_card("Grade 12", "0", "Your students", "📈", "purple"),
+        }
+        for card in cards.values():
+            top_cards.addWidget(card)
+        layout.addLayout(top_cards)
 
-        except Exception as e:
-            print(f"Error loading metrics: {e}")
+        @page.on_refresh
+        def refresh_cards():
+            try:
+                # Get staff-specific data
+                my_students = self.get_my_students() if self.current_user else []
+
+                total = len(my_students)
+                enrolled = sum(1 for s in my_students if s.get('status') == 'Enrolled')
+
+                # Grade distribution from my students
+                grade11 = sum(1 for s in my_students if s.get('grade') == "Grade 11")
+                grade12 = sum(1 for s in my_students if s.get('grade') == "Grade 12")
 
-        self.content_layout.addSpacing(40)
+                enrolled_pct = int((enrolled / total * 100)) if total > 0 else 0
+
+                set_metric(cards['total'], total)
+                set_metric(cards['enrolled'], enrolled, f"{enrolled_pct}% of yours")
+                set_metric(cards['grade11'], grade11)
+                set_metric(cards['grade12'], grade12)
+            except Exception as e:
+                logger.error(f"Error loading metrics: {e}")
+
+        layout.addSpacing(40)
 
         # Charts Grid - 2x2 (using staff's data)
         charts_grid = QGridLayout()
         charts_grid.setSpacing(30)
 
-        track_panel = self.create_my_track_distribution_panel()
-        grade_panel = self.create_my_grade_distribution_panel()
-        status_panel = self.create_my_status_distribution_panel()
-        recent_panel = self.create_my_recent_enrollments_panel()
+        track_panel = self.create_my_track_distribution_panel(page)
+        grade_panel = self.create_my_grade_distribution_panel(page)
+        status_panel = self.create_my_status_distribution_panel(page)
+        recent_panel = self.create_my_recent_enrollments_panel(page)
 
         charts_grid.addWidget(track_panel, 0, 0)
         charts_grid.addWidget(grade_panel, 0, 1)
         charts_grid.addWidget(status_panel, 1, 0)
         charts_grid.addWidget(recent_panel, 1, 1)
 
-        self.content_layout.addLayout(charts_grid)
-        self.content_layout.addSpacing(80)
+        layout.addLayout(charts_grid)
+        layout.addSpacing(80)
 
-    def create_my_track_distribution_panel(self):
-        """Track distribution for MY students"""
+        @page.on_refresh
+        def release_students():
+            self._my_students = None
+
+    def count_my_students(self, field):
+        """My students counted by one field, e.g. 'track'"""
+        counts = {}
+        for s in self.get_my_students():
+            value = s.get(field, 'Unknown')
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    def create_my_distribution_panel(self, page, title_text, field, create_row):
+        """Panel of bar rows counting MY students by one field"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
-        title = QLabel("My Students - Track Distribution")
-        title.setStyleSheet("font-size: 18px; font-weight: 700; color: #060C0B;")
+        title = QLabel(title_text)
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
 
-        try:
-            if hasattr(self, 'current_user') and self.current_user:
-                staff_id = self.current_user.get('id')
-                my_students = self.db.get_students_by_staff(staff_id)
-
-                # Count by track
-                track_counts = {}
-                for s in my_students:
-                    track = s.get('track', 'Unknown')
-                    track_counts[track] = track_counts.get(track, 0) + 1
-
-                total = sum(track_counts.values()) if track_counts else 1
-
-                for track, count in track_counts.items():
-                    row = QHBoxLayout()
-                    lbl = QLabel(track)
-                    lbl.setStyleSheet("font-size: 14px; color: #111827;")
-
-                    bar = QFrame()
-                    bar.setFixedHeight(8)
-                    bar.setStyleSheet("background-color: #059669; border-radius: 4px;")
-                    bar.setFixedWidth(int((count / total) * 200))
-
-                    val = QLabel(str(count))
-                    val.setStyleSheet("font-size: 14px; color: #111827; font-weight: 600;")
-
-                    row.addWidget(lbl)
-                    row.addWidget(bar)
-                    row.addWidget(val)
-                    row.addStretch()
-                    layout.addLayout(row)
-            else:
-                layout.addWidget(QLabel("No user logged in"))
+        rows = KeyedRows(layout, create_row)
 
-        except Exception as e:
-            print(f"Track error: {e}")
-            layout.addWidget(QLabel("No data available"))
+        @page.on_refresh
+        def refresh():
+            if not self.current_user:
+                rows.show_message("No user logged in", role="")
+                return
+            try:
+                counts = self.count_my_students(field)
+                total = sum(counts.values()) if counts else 1
+                rows.bind((key, (count, total)) for key, count in counts.items())
+            except Exception as e:
+                logger.error(f"{field.capitalize()} error: {e}")
+                rows.show_message("No data available", role="")
 
         layout.addStretch()
         return panel
 
-    def create_my_grade_distribution_panel(self):
+    def create_my_track_distribution_panel(self, page):
+        """Track distribution for MY students"""
+        return self.create_my_distribution_panel(
+            page, "My Students - Track Distribution", 'track',
+            lambda track: bar_row(track, fill={'tone': 'teal'}, value={'tone': 'dark'}, track=False)
+        )
+
+    def create_my_grade_distribution_panel(self, page):
         """Grade distribution for MY students"""
-        panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(20)
+        return self.create_my_distribution_panel(
+            page, "My Students - Grade Distribution", 'grade',
+            lambda grade: bar_row(grade, fill={'tone': 'indigo'}, value={'tone': 'indigo'}, track=False)
+        )
 
-        title = QLabel("My Students - Grade Distribution")
-        title.setStyleSheet("font-size: 18px; font-weight: 700; color: #060C0B;")
-        layout.addWidget(title)
+    def create_my_status_distribution_panel(self, page):
+        """Status distribution for MY students"""
+        return self.create_my_distribution_panel(
+            page, "My Students - Status", 'status',
+            lambda status: bar_row(status, fill={'status': status}, value={'status': status}, track=False)
+        )
 
-        try:
-            if hasattr(self, 'current_user') and self.current_user:
-                staff_id = self.current_user.get('id')
-                my_students = self.db.get_students_by_staff(staff_id)
-
-                # Count by grade
-                grade_counts = {}
-                for s in my_students:
-                    grade = s.get('grade', 'Unknown')
-                    grade_counts[grade] = grade_counts.get(grade, 0) + 1
-
-                total = sum(grade_counts.values()) if grade_counts else 1
-
-                for grade, count in grade_counts.items():
-                    row = QHBoxLayout()
-                    lbl = QLabel(grade)
-                    lbl.setStyleSheet("font-size: 14px; color: #111827;")
-
-                    bar = QFrame()
-                    bar.setFixedHeight(8)
-                    bar.setStyleSheet("background-color: #2563EB; border-radius: 4px;")
-                    bar.setFixedWidth(int((count / total) * 200))
-
-                    val = QLabel(str(count))
-                    val.setStyleSheet("font-size: 14px; color: #2563EB; font-weight: 600;")
-
-                    row.addWidget(lbl)
-                    row.addWidget(bar)
-                    row.addWidget(val)
-                    row.addStretch()
-                    layout.addLayout(row)
-            else:
-                layout.addWidget(QLabel("No user logged in"))
+    def create_recent_student_row(self, lrn):
+        """Name, grade/track and enrollment date of one student, for KeyedRows"""
+        widget, row = row_widget()
 
-        except Exception as e:
-            print(f"Grade error: {e}")
-            layout.addWidget(QLabel("No data available"))
+        info_layout = QVBoxLayout()
+        info_layout.setSpacing(4)
 
-        layout.addStretch()
-        return panel
+        name = QLabel()
+        name.setObjectName("itemName")
 
-    def create_my_status_distribution_panel(self):
-        """Status distribution for MY students"""
-        panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(20)
+        details = QLabel()
+        details.setObjectName("itemDetail")
 
-        title = QLabel("My Students - Status")
-        title.setStyleSheet("font-size: 18px; font-weight: 700; color: #060C0B;")
-        layout.addWidget(title)
+        info_layout.addWidget(name)
+        info_layout.addWidget(details)
 
-        try:
-            if hasattr(self, 'current_user') and self.current_user:
-                staff_id = self.current_user.get('id')
-                my_students = self.db.get_students_by_staff(staff_id)
-
-                # Count by status
-                status_counts = {}
-                for s in my_students:
-                    status = s.get('status', 'Unknown')
-                    status_counts[status] = status_counts.get(status, 0) + 1
-
-                total = sum(status_counts.values()) if status_counts else 1
-
-                for status, count in status_counts.items():
-                    color = "#10B981" if status == "Enrolled" else "#F59E0B" if status == "Pending" else "#EF4444"
-
-                    row = QHBoxLayout()
-                    lbl = QLabel(status)
-                    lbl.setStyleSheet("font-size: 14px; color: #111827;")
-
-                    bar = QFrame()
-                    bar.setFixedHeight(8)
-                    bar.setStyleSheet(f"background-color: {color}; border-radius: 4px;")
-                    bar.setFixedWidth(int((count / total) * 200))
-
-                    val = QLabel(str(count))
-                    val.setStyleSheet(f"font-size: 14px; color: {color}; font-weight: 600;")
-
-                    row.addWidget(lbl)
-                    row.addWidget(bar)
-                    row.addWidget(val)
-                    row.addStretch()
-                    layout.addLayout(row)
-            else:
-                layout.addWidget(QLabel("No user logged in"))
+        date = QLabel()
+        date.setObjectName("itemDetail")
 
-        except Exception as e:
-            print(f"Status error: {e}")
-            layout.addWidget(QLabel("No data available"))
+        row.addLayout(info_layout)
+        row.addStretch()
+        row.addWidget(date)
 
-        layout.addStretch()
-        return panel
+        def update(student):
+            name.setText(f"{student['firstname']} {student['lastname']}")
+            details.setText(f"{student['grade']} - {student['track']}")
+            date.setText(str(student.get('created_at', 'N/A')).split()[0])
+
+        return widget, update
 
-    def create_my_recent_enrollments_panel(self):
+    def create_my_recent_enrollments_panel(self, page):
         """Recent enrollments for MY students"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("My Recent Students")
-        title.setStyleSheet("font-size: 18px; font-weight: 700; color: #060C0B;")
+        title.setObjectName("panelTitle")
         layout.addWidget(title)
 
-        try:
-            if hasattr(self, 'current_user') and self.current_user:
-                staff_id = self.current_user.get('id')
-                my_students = self.db.get_students_by_staff(staff_id)
+        rows = KeyedRows(layout, self.create_recent_student_row)
 
+        @page.on_refresh
+        def refresh():
+            if not self.current_user:
+                rows.show_message("No user logged in", role="")
+                return
+            try:
                 # Sort by created_at and get recent 5
-                recent = sorted(my_students, key=lambda x: x.get('created_at', ''), reverse=True)[:5]
-
-                for student in recent:
-                    row = QHBoxLayout()
-
-                    info_layout = QVBoxLayout()
-                    info_layout.setSpacing(4)
-
-                    name = QLabel(f"{student['firstname']} {student['lastname']}")
-                    name.setStyleSheet("font-size: 14px; font-weight: 600; color: #111827;")
-
-                    details = QLabel(f"{student['grade']} - {student['track']}")
-                    details.setStyleSheet("font-size: 13px; color: #6B7280;")
-
-                    info_layout.addWidget(name)
-                    info_layout.addWidget(details)
-
-                    date = QLabel(student.get('created_at', 'N/A').split()[0])
-                    date.setStyleSheet("font-size: 13px; color: #6B7280;")
-
-                    row.addLayout(info_layout)
-                    row.addStretch()
-                    row.addWidget(date)
-
-                    layout.addLayout(row)
-            else:
-                layout.addWidget(QLabel("No user logged in"))
-
-        except Exception as e:
-            print(f"Recent error: {e}")
-            layout.addWidget(QLabel("No recent students"))
+                recent = sorted(self.get_my_students(), key=lambda x: str(x.get('created_at', '')), reverse=True)[:5]
+                rows.bind((student['lrn'], student) for student in recent)
+            except Exception as e:
+                logger.error(f"Recent error: {e}")
+                rows.show_message("No recent students", role="")
 
         layout.addStretch()
         return panel
 
-    def create_metric_card(self, title, value, subtext="", icon="", color="#6B7280"):
+    def create_metric_card(self, title, value, subtext="", icon="", tone="gray"):
         """Create modern metric card matching the design"""
         card = QFrame()
         # REMOVE setFixedHeight → let layout manage height
         card.setMinimumHeight(160)  # Minimum height for consistency
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 24px;
-            }}
-        """)
+        card.setObjectName("metricCard")
         layout = QVBoxLayout(card)
         layout.setSpacing(16)  # Increased spacing
         layout.setContentsMargins(8, 8, 8, 8)  # Added padding
@@ -692,24 +416,9 @@ class StaffPortalScreen(QWidget):
         # Icon + Title
         header_layout = QHBoxLayout()
         icon_label = self.load_icon(f"{title.lower().replace(' ', '_')}.png")
-        icon_label.setStyleSheet(f"""
-            font-size: 20px;
-            color: {color};
-            border: none;
-            background: transparent;
-            margin: 0;
-            padding: 0;
-        """)
+        set_role(icon_label, "metricIcon", tone=tone)
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            font-size: 14px;
-            color: #666;
-            font-weight: 500;
-            border: none;
-            background: transparent;
-            margin: 0;
-            padding: 0;
-        """)
+        title_label.setObjectName("metricTitle")
         header_layout.addWidget(icon_label)
         header_layout.addWidget(title_label)
         header_layout.addStretch()
@@ -718,27 +427,10 @@ class StaffPortalScreen(QWidget):
         # Value + Subtext
         value_layout = QHBoxLayout()
         value_label = QLabel(value)
-        value_label.setStyleSheet(f"""
-            font-size: 32px;
-            font-weight: 700;
-            color: {color};
-            border: none;
-            background: transparent;
-            margin: 0;
-            padding: 0;
-        """)
+        set_role(value_label, "metricValue", tone=tone)
         if subtext:
             sub_label = QLabel(subtext)
-            sub_label.setStyleSheet(f"""
-                font-size: 14px;
-                font-weight: 600;
-                color: {color};
-                border: none;
-                background: transparent;
-                margin: 0;
-                padding: 0;
-                margin-left: 12px;
-            """)
+            set_role(sub_label, "metricDelta", tone=tone)
             value_layout.addWidget(value_label)
             value_layout.addWidget(sub_label)
             value_layout.addStretch()
@@ -751,32 +443,15 @@ class StaffPortalScreen(QWidget):
 
     def create_track_distribution_panel(self):
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("Track Distribution")
-        title.setStyleSheet("""
-            font-size: 20px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
+        set_role(title, "panelTitle", size="large")
         subtitle = QLabel("Students per track")
-        subtitle.setStyleSheet("""
-            font-size: 20px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
@@ -788,29 +463,15 @@ class StaffPortalScreen(QWidget):
             for track, count in tracks.items():
                 row = QHBoxLayout()
                 lbl = QLabel(track)
-                lbl.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827;
-                    background: transparent;
-                    border: none;
-                """)
+                lbl.setObjectName("rowLabel")
 
                 bar = QFrame()
                 bar.setFixedHeight(8)
-                bar.setStyleSheet("""
-                    background-color: #059669; 
-                    border-radius: 4px;
-                """)
+                set_role(bar, "barFill", tone="teal")
                 bar.setFixedWidth(int((count / total) * 200))
 
                 val = QLabel(str(count))
-                val.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827; 
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                """)
+                set_role(val, "rowValue", tone="dark")
 
                 row.addWidget(lbl)
                 row.addWidget(bar)
@@ -819,9 +480,9 @@ class StaffPortalScreen(QWidget):
                 layout.addLayout(row)
 
         except Exception as e:
-            print(f"Track error: {e}")
+            logger.error(f"Track error: {e}")
             error_lbl = QLabel("No track data available")
-            error_lbl.setStyleSheet("color: #EF4444; font-size: 13px;")
+            error_lbl.setObjectName("errorText")
             layout.addWidget(error_lbl)
 
         layout.addStretch()
@@ -829,32 +490,15 @@ class StaffPortalScreen(QWidget):
 
     def create_grade_distribution_panel(self):
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("Grade Distribution")
-        title.setStyleSheet("""
-            font-size: 18px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
+        title.setObjectName("panelTitle")
         subtitle = QLabel("Students per grade level")
-        subtitle.setStyleSheet("""
-            font-size: 20px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
@@ -866,29 +510,15 @@ class StaffPortalScreen(QWidget):
             for grade, count in grades.items():
                 row = QHBoxLayout()
                 lbl = QLabel(grade)
-                lbl.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827;
-                    background: transparent;
-                    border: none;
-                """)
+                lbl.setObjectName("rowLabel")
 
                 bar = QFrame()
                 bar.setFixedHeight(8)
-                bar.setStyleSheet("""
-                    background-color: #2563EB; 
-                    border-radius: 4px;
-                """)
+                set_role(bar, "barFill", tone="indigo")
                 bar.setFixedWidth(int((count / total) * 200))
 
                 val = QLabel(str(count))
-                val.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #2563EB; 
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                """)
+                set_role(val, "rowValue", tone="indigo")
 
                 row.addWidget(lbl)
                 row.addWidget(bar)
@@ -897,9 +527,9 @@ class StaffPortalScreen(QWidget):
                 layout.addLayout(row)
 
         except Exception as e:
-            print(f"Grade error: {e}")
+            logger.error(f"Grade error: {e}")
             error_lbl = QLabel("No grade data available")
-            error_lbl.setStyleSheet("color: #EF4444; font-size: 13px;")
+            error_lbl.setObjectName("errorText")
             layout.addWidget(error_lbl)
 
         layout.addStretch()
@@ -907,32 +537,15 @@ class StaffPortalScreen(QWidget):
 
     def create_status_distribution_panel(self):
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("Enrollment Status")
-        title.setStyleSheet("""
-            font-size: 18px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
+        title.setObjectName("panelTitle")
         subtitle = QLabel("Application status breakdown")
-        subtitle.setStyleSheet("""
-            font-size: 20px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
@@ -943,32 +556,16 @@ class StaffPortalScreen(QWidget):
             for status, count in statuses.items():
                 row = QHBoxLayout()
                 lbl = QLabel(status)
-                lbl.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827;
-                    background: transparent;
-                    border: none;
-                """)
-
-                color = "#10B981" if "enrolled" in status.lower() else "#F59E0B" if "pending" in status.lower() else "#EF4444"
+                lbl.setObjectName("rowLabel")
 
                 bar = QFrame()
                 bar.setFixedHeight(8)
-                bar.setStyleSheet(f"""
-                    background-color: {color}; 
-                    border-radius: 4px;
-                """)
+                set_role(bar, "barFill", status=status)
                 total = sum(statuses.values()) if statuses else 1
                 bar.setFixedWidth(int((count / total) * 200))
 
                 val = QLabel(str(count))
-                val.setStyleSheet(f"""
-                    font-size: 14px; 
-                    color: {color}; 
-                    font-weight: 600;
-                    background: transparent;
-                    border: none;
-                """)
+                set_role(val, "rowValue", status=status)
 
                 row.addWidget(lbl)
                 row.addWidget(bar)
@@ -977,9 +574,9 @@ class StaffPortalScreen(QWidget):
                 layout.addLayout(row)
 
         except Exception as e:
-            print(f"Status error: {e}")
+            logger.error(f"Status error: {e}")
             error_lbl = QLabel("No status data available")
-            error_lbl.setStyleSheet("color: #EF4444; font-size: 13px;")
+            error_lbl.setObjectName("errorText")
             layout.addWidget(error_lbl)
 
         layout.addStretch()
@@ -987,32 +584,15 @@ class StaffPortalScreen(QWidget):
 
     def create_recent_enrollments_panel(self):
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 28px;
-            }
-        """)
+        panel.setObjectName("panel")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
         layout.setSpacing(20)
 
         title = QLabel("Recent Enrollments")
-        title.setStyleSheet("""
-            font-size: 18px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
+        title.setObjectName("panelTitle")
         subtitle = QLabel("Latest enrolled students")
-        subtitle.setStyleSheet("""
-            font-size: 20px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
@@ -1028,32 +608,16 @@ class StaffPortalScreen(QWidget):
                 info_layout.setSpacing(4)
 
                 name = QLabel(f"{student['firstname']} {student['lastname']}")
-                name.setStyleSheet("""
-                    font-size: 14px; 
-                    font-weight: 600; 
-                    color: #111827;
-                    background: transparent;
-                    border: none;
-                """)
+                name.setObjectName("itemName")
 
                 details = QLabel(f"{student['grade']} - {student['track']}")
-                details.setStyleSheet("""
-                    font-size: 13px; 
-                    color: #6B7280;
-                    background: transparent;
-                    border: none;
-                """)
+                details.setObjectName("itemDetail")
 
                 info_layout.addWidget(name)
                 info_layout.addWidget(details)
 
                 date = QLabel(student.get('created_at', 'N/A').split()[0])
-                date.setStyleSheet("""
-                    font-size: 13px; 
-                    color: #6B7280;
-                    background: transparent;
-                    border: none;
-                """)
+                date.setObjectName("itemDetail")
 
                 row.addLayout(info_layout)
                 row.addStretch()
@@ -1062,38 +626,27 @@ class StaffPortalScreen(QWidget):
                 layout.addLayout(row)
 
         except Exception as e:
-            print(f"Recent enrollments error: {e}")
+            logger.error(f"Recent enrollments error: {e}")
             error_lbl = QLabel("No recent enrollments")
-            error_lbl.setStyleSheet("color: #EF4444; font-size: 13px;")
+            error_lbl.setObjectName("errorText")
             layout.addWidget(error_lbl)
 
         layout.addStretch()
         return panel
 
     # ==================== ENROLLEES TAB ====================
-    def show_enrollees_content(self):
-        self.clear_content()
+    def build_enrollees_page(self, page):
+        layout = page.content_layout
 
         # Title
         title = QLabel("Enrolled Students")
-        title.setStyleSheet("""
-            font-size: 28px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
-        self.content_layout.addWidget(title)
+        title.setObjectName("pageTitle")
+        layout.addWidget(title)
 
         subtitle = QLabel("Manage and view all enrolled students")
-        subtitle.setStyleSheet("""
-            font-size: 20px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
-        self.content_layout.addWidget(subtitle)
-        self.content_layout.addSpacing(40)
+        subtitle.setObjectName("panelSubtitle")
+        layout.addWidget(subtitle)
+        layout.addSpacing(40)
 
         # Filters
         filter_layout = QHBoxLayout()
@@ -1101,31 +654,13 @@ class StaffPortalScreen(QWidget):
 
         # Search
         search_frame = QFrame()
-        search_frame.setStyleSheet("""
-            QFrame {
-                background-color: #F9FAFB;
-                border: 1px solid #E5E7EB;
-                border-radius: 8px;
-                padding: 8px 16px;
-            }
-        """)
+        search_frame.setObjectName("searchBox")
         search_layout = QHBoxLayout(search_frame)
         search_icon = self.load_icon("search.png")
-        search_icon.setStyleSheet("font-size: 16px;")
+        search_icon.setObjectName("searchIcon")
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by name or LRN...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background: transparent;
-                border: none;
-                font-size: 14px;
-                color: #111827;
-                padding: 4px;
-            }
-            QLineEdit::placeholder {
-                color: #9CA3AF;
-            }
-        """)
+        self.search_input.setObjectName("searchField")
         self.search_input.textChanged.connect(self.filter_enrollees)
         search_layout.addWidget(search_icon)
         search_layout.addWidget(self.search_input)
@@ -1133,82 +668,19 @@ class StaffPortalScreen(QWidget):
         # Grade Filter
         self.grade_combo = QComboBox()
         self.grade_combo.addItems(["All Grades", "Grade 11", "Grade 12"])
-        self.grade_combo.setStyleSheet("""
-            QComboBox {
-                background: #F9FAFB;
-                border: 1px solid #E5E7EB;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 14px;
-                color: #111827;
-                min-width: 120px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                color: #111827;
-                background-color: white;
-                selection-background-color: #E8F4F2;
-                selection-color: #111827;
-            }
-        """)
+        self.grade_combo.setObjectName("filterCombo")
         self.grade_combo.currentIndexChanged.connect(self.filter_enrollees)
 
         # Track Filter
         self.track_combo = QComboBox()
         self.track_combo.addItem("All Tracks")
-        try:
-            tracks = self.db.get_all_tracks()
-            for track in tracks:
-                self.track_combo.addItem(track)
-        except:
-            pass
-        self.track_combo.setStyleSheet("""
-            QComboBox {
-                background: #F9FAFB;
-                border: 1px solid #E5E7EB;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 14px;
-                color: #111827;
-                min-width: 120px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                color: #111827;
-                background-color: white;
-                selection-background-color: #E8F4F2;
-                selection-color: #111827;
-            }
-        """)
+        self.track_combo.setObjectName("filterCombo")
         self.track_combo.currentIndexChanged.connect(self.filter_enrollees)
 
         # Status Filter
         self.status_combo = QComboBox()
         self.status_combo.addItems(["All Status", "Enrolled", "Pending", "Rejected"])
-        self.status_combo.setStyleSheet("""
-            QComboBox {
-                background: #F9FAFB;
-                border: 1px solid #E5E7EB;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-size: 14px;
-                color: #111827;
-                min-width: 120px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                color: #111827;
-                background-color: white;
-                selection-background-color: #E8F4F2;
-                selection-color: #111827;
-            }
-        """)
+        self.status_combo.setObjectName("filterCombo")
         self.status_combo.currentIndexChanged.connect(self.filter_enrollees)
 
         filter_layout.addWidget(search_frame)
@@ -1217,8 +689,8 @@ class StaffPortalScreen(QWidget):
         filter_layout.addWidget(self.status_combo)
         filter_layout.addStretch()
 
-        self.content_layout.addLayout(filter_layout)
-        self.content_layout.addSpacing(10)  # Reduced from 20
+        layout.addLayout(filter_layout)
+        layout.addSpacing(10)  # Reduced from 20
 
         # Table - EXPANDED TO FILL SPACE
         self.enrollees_table = QTableWidget()
@@ -1241,47 +713,35 @@ class StaffPortalScreen(QWidget):
         self.enrollees_table.setRowHeight(0, 60)  # Increased row height
         self.enrollees_table.verticalHeader().setDefaultSectionSize(60)  # Default row height
         self.enrollees_table.setMinimumHeight(600)  # Set minimum height for table
-        self.enrollees_table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 12px;
-                gridline-color: #F3F4F6;
-                font-size: 14px;
-                color: #111827;
-            }
-            QTableWidget::item {
-                padding: 18px 16px;
-                color: #111827;
-                border-bottom: 1px solid #F3F4F6;
-            }
-            QHeaderView::section {
-                background-color: #F9FAFB;
-                padding: 16px 16px;
-                font-size: 14px;
-                font-weight: 600;
-                color: #111827;
-                border: none;
-                border-bottom: 2px solid #E5E7EB;
-            }
-        """)
+        self.enrollees_table.setObjectName("enrolleesTable")
 
         # Prevent text wrapping
         self.enrollees_table.setWordWrap(False)
 
-        self.content_layout.addWidget(self.enrollees_table, 1)  # Stretch factor = 1
-        self.content_layout.addSpacing(30)  # Reduced from 80
+        layout.addWidget(self.enrollees_table, 1)  # Stretch factor = 1
+        layout.addSpacing(30)  # Reduced from 80
 
-        # Load data
-        self.load_enrollees_data()
+        @page.on_refresh
+        def refresh():
+            self.load_track_filter()
+            self.load_enrollees_data()
 
-    def load_enrollees_data(self):
-        """Load and display MY enrollees with filtering"""
-        search_text = self.search_input.text().strip().lower()
-        selected_grade = self.grade_combo.currentText()
-        selected_track = self.track_combo.currentText()
-        selected_status = self.status_combo.currentText()
+    def load_track_filter(self):
+        """Refill the track filter from the database, keeping the current choice"""
+        current = self.track_combo.currentText()
+        self.track_combo.blockSignals(True)
+        self.track_combo.clear()
+        self.track_combo.addItem("All Tracks")
+        try:
+            self.track_combo.addItems(self.db.get_all_tracks())
+        except:
+            pass
+        self.track_combo.setCurrentIndex(max(self.track_combo.findText(current), 0))
+        self.track_combo.blockSignals(False)
 
+    @query_budget("staff.load_enrollees")
+    def load_enrollees_data(self):
+        """Load MY enrollees and display them with the current filters"""
         # Get only MY students
         if hasattr(self, 'current_user') and self.current_user:
             staff_id = self.current_user.get('id')
@@ -1289,109 +749,176 @@ class StaffPortalScreen(QWidget):
         else:
             students = []
 
-        # Filter
-        filtered = []
-        for s in students:
-            if search_text and search_text not in s[
-                'lrn'].lower() and search_text not in f"{s['firstname']} {s['lastname']}".lower():
-                continue
-            if selected_grade != "All Grades" and s['grade'] != selected_grade:
-                continue
-            if selected_track != "All Tracks" and s['track'] != selected_track:
-                continue
-            if selected_status != "All Status" and s['status'] != selected_status:
-                continue
-            filtered.append(s)
-
-        # Populate table (rest stays the same)
+        # lrn -> student, in query order; kept current by on_student_changed
+        self.my_enrollees = {s['lrn']: s for s in students}
+        self.filter_enrollees()
+
+    def enrollee_matches(self, s):
+        """Does a student pass the search box and filter combos?"""
+        search_text = self.search_input.text().strip().lower()
+        selected_grade = self.grade_combo.currentText()
+        selected_track = self.track_combo.currentText()
+        selected_status = self.status_combo.currentText()
+
+        if search_text and search_text not in s[
+            'lrn'].lower() and search_text not in f"{s['firstname']} {s['lastname']}".lower():
+            return False
+        if selected_grade != "All Grades" and s['grade'] != selected_grade:
+            return False
+        if selected_track != "All Tracks" and s['track'] != selected_track:
+            return False
+        if selected_status != "All Status" and s['status'] != selected_status:
+            return False
+        return True
+
+    def filter_enrollees(self):
+        """Re-filter the loaded enrollees and refill the table (no query)"""
+        filtered = [s for s in self.my_enrollees.values() if self.enrollee_matches(s)]
+
         self.enrollees_table.setRowCount(len(filtered))
         for row, student in enumerate(filtered):
-            # ... (keep the existing table population code)
-            # LRN
-            lrn_item = QTableWidgetItem(student['lrn'])
-            lrn_item.setForeground(Qt.GlobalColor.black)
-            lrn_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            self.enrollees_table.setItem(row, 0, lrn_item)
-
-            # Name
-            name_item = QTableWidgetItem(f"{student['firstname']} {student['lastname']}")
-            name_item.setForeground(Qt.GlobalColor.black)
-            name_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            self.enrollees_table.setItem(row, 1, name_item)
-
-            # Grade
-            grade_item = QTableWidgetItem(student['grade'])
-            grade_item.setForeground(Qt.GlobalColor.black)
-            grade_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            self.enrollees_table.setItem(row, 2, grade_item)
-
-            # Track
-            track_item = QTableWidgetItem(student['track'])
-            track_item.setForeground(Qt.GlobalColor.black)
-            track_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            self.enrollees_table.setItem(row, 3, track_item)
-
-            # Status dropdown
-            status_widget = QWidget()
-            status_layout = QHBoxLayout(status_widget)
-            status_layout.setContentsMargins(4, 4, 4, 4)
-            status_layout.setSpacing(0)
-
-            status_combo = QComboBox()
-            status_combo.addItems(["Enrolled", "Pending", "Rejected"])
-            status_combo.setCurrentText(student['status'])
-            status_combo.setFixedWidth(130)
-            status_combo.setStyleSheet("""
-                QComboBox {
-                    background: white;
-                    border: 1px solid #E5E7EB;
-                    border-radius: 6px;
-                    padding: 6px 10px;
-                    font-size: 14px;
-                    color: #111827;
-                    font-weight: 500;
-                }
-            """)
-            status_combo.currentTextChanged.connect(
-                lambda new_status, lrn=student['lrn']: self.update_status(lrn, new_status))
-
-            status_layout.addWidget(status_combo)
-            status_layout.addStretch()
-            self.enrollees_table.setCellWidget(row, 4, status_widget)
-
-            # Contact
-            email_item = QTableWidgetItem(student['email'])
-            email_item.setForeground(Qt.GlobalColor.black)
-            email_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            self.enrollees_table.setItem(row, 5, email_item)
-
-            # Actions
-            btn_widget = QWidget()
-            btn_layout = QHBoxLayout(btn_widget)
-            btn_layout.setContentsMargins(8, 4, 8, 4)
-            btn_layout.setSpacing(8)
-
-            view_btn = QPushButton("👁️")
-            view_btn.setFixedSize(32, 32)
-            view_btn.setStyleSheet("""
-                QPushButton { background: #F3F4F6; border: none; border-radius: 6px; font-size: 16px; }
-                QPushButton:hover { background: #E5E7EB; }
-            """)
-            view_btn.clicked.connect(lambda _, s=student: self.view_student(s))
-
-            btn_layout.addWidget(view_btn)
-            btn_layout.addStretch()
-
-            self.enrollees_table.setCellWidget(row, 6, btn_widget)
+            self.fill_enrollee_row(row, student)
 
         # Resize columns
         for col in [0, 1, 2, 3]:
             self.enrollees_table.resizeColumnToContents(col)
 
-    def filter_enrollees(self):
-        """Re-filter and reload table"""
-        self.load_enrollees_data()
-
+    def fill_enrollee_row(self, row, student):
+        """Create the cells of one table row"""
+        # LRN
+        lrn_item = QTableWidgetItem(student['lrn'])
+        lrn_item.setForeground(Qt.GlobalColor.black)
+        lrn_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        self.enrollees_table.setItem(row, 0, lrn_item)
+
+        # Name, Grade, Track, Contact (text set by patch_enrollee_row)
+        for col in (1, 2, 3, 5):
+            item = QTableWidgetItem()
+            item.setForeground(Qt.GlobalColor.black)
+            item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+            self.enrollees_table.setItem(row, col, item)
+
+        # Status dropdown
+        status_widget = QWidget()
+        status_layout = QHBoxLayout(status_widget)
+        status_layout.setContentsMargins(4, 4, 4, 4)
+        status_layout.setSpacing(0)
+
+        status_combo = QComboBox()
+        status_combo.addItems(["Enrolled", "Pending", "Rejected"])
+        status_combo.setFixedWidth(130)
+        status_combo.setObjectName("rowCombo")
+
+        status_layout.addWidget(status_combo)
+        status_layout.addStretch()
+        self.enrollees_table.setCellWidget(row, 4, status_widget)
+
+        self.patch_enrollee_row(row, student)
+        status_combo.currentTextChanged.connect(
+            lambda new_status, lrn=student['lrn']: self.update_status(lrn, new_status))
+
+        # Actions
+        btn_widget = QWidget()
+        btn_layout = QHBoxLayout(btn_widget)
+        btn_layout.setContentsMargins(8, 4, 8, 4)
+        btn_layout.setSpacing(8)
+
+        view_btn = QPushButton("👁️")
+        view_btn.setFixedSize(32, 32)
+        view_btn.setObjectName("iconButton")
+        view_btn.clicked.connect(lambda _, s=student: self.view_student(s))
+
+        btn_layout.addWidget(view_btn)
+        btn_layout.addStretch()
+
+        self.enrollees_table.setCellWidget(row, 6, btn_widget)
+
+    def patch_enrollee_row(self, row, student):
+        """Write a student's current values into the existing cells of its row"""
+        values = {1: f"{student['firstname']} {student['lastname']}", 2: student['grade'],
+                  3: student['track'], 5: student['email']}
+        for col, text in values.items():
+            self.enrollees_table.item(row, col).setText(text)
+
+        status_combo = self.enrollees_table.cellWidget(row, 4).findChild(QComboBox)
+        status_combo.blockSignals(True)
+        status_combo.setCurrentText(student['status'])
+        status_combo.blockSignals(False)
+
+    def find_enrollee_row(self, lrn):
+        for row in range(self.enrollees_table.rowCount()):
+            if self.enrollees_table.item(row, 0).text() == lrn:
+                return row
+        return None
+
+    def add_enrollee(self, student):
+        """Add a student to my_enrollees where get_students_by_staff orders it (newest created_at first)"""
+        created_at = student.get('created_at')
+        items = list(self.my_enrollees.items())
+        index = 0 if created_at is None else next(
+            (i for i, (_, s) in enumerate(items) if s.get('created_at') is not None and s['created_at'] < created_at),
+            len(items))
+        items.insert(index, (student['lrn'], student))
+        self.my_enrollees = dict(items)
+
+    def enrollee_position(self, lrn):
+        """Row an enrollee goes in: rows keep the order of my_enrollees"""
+        order = {key: index for index, key in enumerate(self.my_enrollees)}
+        return sum(1 for row in range(self.enrollees_table.rowCount())
+                   if order[self.enrollees_table.item(row, 0).text()] < order[lrn])
+
+    def on_student_changed(self, event):
+        """Patch the enrollees table for one write instead of reloading it"""
+        my_id = self.current_user.get('id') if self.current_user else None
+        mine = event.lrn in self.my_enrollees
+        if event.kind == STUDENTS_CLEARED:
+            self.my_enrollees = {}
+        elif event.kind == STUDENT_ASSIGNED and event.fields['staff_id'] == my_id and my_id is not None:
+            if not mine:
+                student = self.db.get_student_by_lrn(event.lrn)
+                if student:
+                    self.add_enrollee(student)
+                    mine = True
+        elif event.kind == STUDENT_SYNCED:
+            # Changed on another terminal: the full row says whether it is mine
+            if my_id is not None and event.fields.get('assigned_staff_id') == my_id:
+                if mine:
+                    self.my_enrollees[event.lrn].update(event.fields)
+                else:
+                    self.add_enrollee(dict(event.fields))
+            elif mine:
+                del self.my_enrollees[event.lrn]
+            else:
+                return
+        elif not mine:
+            return
+        elif event.kind in (STUDENT_DELETED, STUDENT_ASSIGNED):
+            del self.my_enrollees[event.lrn]
+        else:
+            student = self.my_enrollees[event.lrn]
+            student.update((key, value) for key, value in event.fields.items() if key in student)
+
+        # Analytics and reports count these students
+        self.pages.invalidate_soon("analytics", "reports")
+        if self.pages.page("enrollees") is None:
+            return
+
+        student = self.my_enrollees.get(event.lrn)
+        row = self.find_enrollee_row(event.lrn) if event.lrn else None
+        matches = student is not None and self.enrollee_matches(student)
+        if row is not None and matches:
+            self.patch_enrollee_row(row, student)
+        elif row is not None:
+            # Gone, or no longer passes the filters
+            self.enrollees_table.removeRow(row)
+        elif matches:
+            row = self.enrollee_position(event.lrn)
+            self.enrollees_table.insertRow(row)
+            self.fill_enrollee_row(row, student)
+        elif event.kind == STUDENTS_CLEARED:
+            self.filter_enrollees()
+
+    @query_budget("staff.update_status")
     def update_status(self, lrn, new_status):
         """Update student status in database - FULLY FUNCTIONAL"""
         reply = QMessageBox.question(
@@ -1403,7 +930,7 @@ class StaffPortalScreen(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                # Update in database
+                # Update in database (on_student_changed patches the row)
                 self.db.update_enrollment_status(lrn, new_status)
 
                 # Log the action
@@ -1416,10 +943,8 @@ class StaffPortalScreen(QWidget):
                     f"Status successfully updated to '{new_status}'"
                 )
 
-                # Refresh the enrollees table to show updated data
-                self.load_enrollees_data()
-
-                print(f"✅ Database updated: {lrn} → {new_status}")
+                logger.info(f"✅ Database updated: {lrn} → {new_status}")
+                return
 
             except Exception as e:
                 QMessageBox.critical(
@@ -1427,9 +952,12 @@ class StaffPortalScreen(QWidget):
                     "Error",
                     f"Failed to update status: {str(e)}"
                 )
-                print(f"❌ Error updating status: {e}")
-                # Reload data to revert any UI changes
-                self.load_enrollees_data()
+                logger.error(f"❌ Error updating status: {e}")
+
+        # Put the row's dropdown back to the stored status
+        row = self.find_enrollee_row(lrn)
+        if row is not None and lrn in self.my_enrollees:
+            self.patch_enrollee_row(row, self.my_enrollees[lrn])
 
     def view_student(self, student):
         """View student details"""
@@ -1464,6 +992,7 @@ class StaffPortalScreen(QWidget):
 
         dialog.exec()
 
+    @query_budget("staff.delete_student")
     def delete_student(self, student):
         """Delete student"""
         reply = QMessageBox.question(self, "Confirm",
@@ -1473,326 +1002,103 @@ class StaffPortalScreen(QWidget):
             try:
                 self.db.delete_student(student['lrn'])
                 QMessageBox.information(self, "Success", "Student deleted")
-                self.load_enrollees_data()
             except Exception as e:
                 QMessageBox.critical(self, "Error", str(e))
 
     # ==================== REPORTS TAB ====================
-    def show_reports_content(self):
-        self.clear_content()
+    def build_reports_page(self, page):
+        layout = page.content_layout
 
         # Title
         title = QLabel("Reports")
-        title.setStyleSheet("""
-            font-size: 28px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
-        self.content_layout.addWidget(title)
+        title.setObjectName("pageTitle")
+        layout.addWidget(title)
 
         subtitle = QLabel("Enrollment statistics and distributions")
-        subtitle.setStyleSheet("""
-            font-size: 20px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
-        self.content_layout.addWidget(subtitle)
-        self.content_layout.addSpacing(40)
+        subtitle.setObjectName("panelSubtitle")
+        layout.addWidget(subtitle)
+        layout.addSpacing(40)
 
         # Reports Grid - 2x2
         reports_grid = QGridLayout()
         reports_grid.setSpacing(30)
 
-        enrollment_panel = self.create_enrollment_report_panel()
-        track_report_panel = self.create_track_report_panel()
-        grade_report_panel = self.create_grade_report_panel()
-        strand_report_panel = self.create_strand_report_panel()
+        enrollment_panel = self.create_enrollment_report_panel(page)
+        track_report_panel = self.create_track_report_panel(page)
+        grade_report_panel = self.create_grade_report_panel(page)
+        strand_report_panel = self.create_strand_report_panel(page)
 
         reports_grid.addWidget(enrollment_panel, 0, 0)
         reports_grid.addWidget(track_report_panel, 0, 1)
         reports_grid.addWidget(grade_report_panel, 1, 0)
         reports_grid.addWidget(strand_report_panel, 1, 1)
 
-        self.content_layout.addLayout(reports_grid)
-        self.content_layout.addSpacing(80)
+        layout.addLayout(reports_grid)
+        layout.addSpacing(80)
 
-    def create_enrollment_report_panel(self):
+    def create_report_panel(self, page, title_text, subtitle_text, create_row, load, error_text):
+        """Report panel of label / pill rows; load() returns the (label, value) pairs"""
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 32px;
-            }
-        """)
+        set_role(panel, "panel", size="large")
         layout = QVBoxLayout(panel)
+        layout.setContentsMargins(32, 32, 32, 32)
         layout.setSpacing(20)
 
-        title = QLabel("Enrollment Status")
-        title.setStyleSheet("""
-            font-size: 16px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
-        subtitle = QLabel("Current status breakdown")
-        subtitle.setStyleSheet("""
-            font-size: 20px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
+        title = QLabel(title_text)
+        set_role(title, "panelTitle", size="small")
+        subtitle = QLabel(subtitle_text)
+        subtitle.setObjectName("panelSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
         layout.addSpacing(16)
 
-        try:
-            stats = self.db.get_statistics()
-
-            rows = [
-                ("Total Enrollees", stats['total_students'], "#F3F4F6"),
-                ("Enrolled", stats['enrolled'], "#DCFCE7"),
-                ("Pending", stats['pending'], "#FEF3C7")
-            ]
+        rows = KeyedRows(layout, create_row)
 
-            for label, value, bg in rows:
-                row = QHBoxLayout()
-                lbl = QLabel(label)
-                lbl.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827;
-                    background: transparent;
-                    border: none;
-                """)
-                val = QLabel(str(value))
-                val.setStyleSheet(f"""
-                    font-size: 14px; 
-                    color: #111827; 
-                    background: {bg}; 
-                    padding: 4px 8px; 
-                    border-radius: 8px; 
-                    font-weight: 600;
-                    border: none;
-                """)
-                row.addWidget(lbl)
-                row.addStretch()
-                row.addWidget(val)
-                layout.addLayout(row)
-
-        except Exception as e:
-            print(f"Enrollment report error: {e}")
-            error_lbl = QLabel("No enrollment data")
-            error_lbl.setStyleSheet("color: #EF4444; font-size: 13px;")
-            layout.addWidget(error_lbl)
-
-        layout.addStretch()
-        return panel
-
-    def create_track_report_panel(self):
-        panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 32px;
-            }
-        """)
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(20)
-
-        title = QLabel("Track Distribution")
-        title.setStyleSheet("""
-            font-size: 16px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
-        subtitle = QLabel("Students per track")
-        subtitle.setStyleSheet("""
-            font-size: 20px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
-        layout.addWidget(title)
-        layout.addWidget(subtitle)
-        layout.addSpacing(16)
-
-        try:
-            tracks = self.db.count_by_track()
-
-            for track, count in tracks.items():
-                row = QHBoxLayout()
-                lbl = QLabel(track)
-                lbl.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827;
-                    background: transparent;
-                    border: none;
-                """)
-                val = QLabel(str(count))
-                val.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827; 
-                    background: #F0fdfa; 
-                    padding: 4px 8px; 
-                    border-radius: 8px; 
-                    font-weight: 600;
-                    border: none;
-                """)
-                row.addWidget(lbl)
-                row.addStretch()
-                row.addWidget(val)
-                layout.addLayout(row)
-
-        except Exception as e:
-            print(f"Track report error: {e}")
-            error_lbl = QLabel("No track data")
-            error_lbl.setStyleSheet("color: #EF4444; font-size: 13px;")
-            layout.addWidget(error_lbl)
-
-        layout.addStretch()
-        return panel
-
-    def create_grade_report_panel(self):
-        panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 32px;
-            }
-        """)
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(20)
-
-        title = QLabel("Grade Distribution")
-        title.setStyleSheet("""
-            font-size: 16px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
-        subtitle = QLabel("Students per grade level")
-        subtitle.setStyleSheet("""
-            font-size: 20px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
-        layout.addWidget(title)
-        layout.addWidget(subtitle)
-        layout.addSpacing(16)
-
-        try:
-            grades = self.db.count_by_grade()
-
-            for grade, count in grades.items():
-                row = QHBoxLayout()
-                lbl = QLabel(grade)
-                lbl.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827;
-                    background: transparent;
-                    border: none;
-                """)
-                val = QLabel(str(count))
-                val.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827; 
-                    background: #DBEAFE; 
-                    padding: 4px 8px; 
-                    border-radius: 8px; 
-                    font-weight: 600;
-                    border: none;
-                """)
-                row.addWidget(lbl)
-                row.addStretch()
-                row.addWidget(val)
-                layout.addLayout(row)
-
-        except Exception as e:
-            print(f"Grade report error: {e}")
-            error_lbl = QLabel("No grade data")
-            error_lbl.setStyleSheet("color: #EF4444; font-size: 13px;")
-            layout.addWidget(error_lbl)
+        @page.on_refresh
+        def refresh():
+            try:
+                rows.bind(load())
+            except Exception as e:
+                logger.error(f"{title_text} report error: {e}")
+                rows.show_message(error_text)
 
         layout.addStretch()
         return panel
 
-    def create_strand_report_panel(self):
-        panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #E5E7EB;
-                border-radius: 16px;
-                padding: 32px;
-            }
-        """)
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(20)
+    def create_enrollment_report_panel(self, page):
+        tones = {"Total Enrollees": None, "Enrolled": "green", "Pending": "amber"}
 
-        title = QLabel("Strand Distribution")
-        title.setStyleSheet("""
-            font-size: 16px; 
-            font-weight: 700; 
-            color: #060C0B;
-            background: transparent;
-            border: none;
-        """)
-        subtitle = QLabel("Students per strand")
-        subtitle.setStyleSheet("""
-            font-size: 20px; 
-            color: #6B7280;
-            background: transparent;
-            border: none;
-        """)
-        layout.addWidget(title)
-        layout.addWidget(subtitle)
-        layout.addSpacing(16)
+        def load():
+            stats = self.db.get_statistics()
+            return [
+                ("Total Enrollees", stats['total_students']),
+                ("Enrolled", stats['enrolled']),
+                ("Pending", stats['pending'])
+            ]
 
-        try:
-            strands = self.db.count_by_strand()
+        return self.create_report_panel(
+            page, "Enrollment Status", "Current status breakdown",
+            lambda label: pill_row(label, pill={'tone': tones[label]}, stretch_before=True),
+            load, "No enrollment data"
+        )
 
-            for strand, count in strands.items():
-                row = QHBoxLayout()
-                lbl = QLabel(strand)
-                lbl.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827;
-                    background: transparent;
-                    border: none;
-                """)
-                val = QLabel(str(count))
-                val.setStyleSheet("""
-                    font-size: 14px; 
-                    color: #111827; 
-                    background: #F3E8FF; 
-                    padding: 4px 8px; 
-                    border-radius: 8px; 
-                    font-weight: 600;
-                    border: none;
-                """)
-                row.addWidget(lbl)
-                row.addStretch()
-                row.addWidget(val)
-                layout.addLayout(row)
+    def create_track_report_panel(self, page):
+        return self.create_report_panel(
+            page, "Track Distribution", "Students per track",
+            lambda track: pill_row(track, pill={'tone': 'teal'}, stretch_before=True),
+            lambda: self.db.count_by_track().items(), "No track data"
+        )
 
-        except Exception as e:
-            print(f"Strand report error: {e}")
-            error_lbl = QLabel("No strand data")
-            error_lbl.setStyleSheet("color: #EF4444; font-size: 13px;")
-            layout.addWidget(error_lbl)
+    def create_grade_report_panel(self, page):
+        return self.create_report_panel(
+            page, "Grade Distribution", "Students per grade level",
+            lambda grade: pill_row(grade, pill={'tone': 'blue'}, stretch_before=True),
+            lambda: self.db.count_by_grade().items(), "No grade data"
+        )
 
-        layout.addStretch()
-        return panel
\ No newline at end of file
+    def create_strand_report_panel(self, page):
+        return self.create_report_panel(
+            page, "Strand Distribution", "Students per strand",
+            lambda strand: pill_row(strand, pill={'tone': 'purple'}, stretch_before=True),
+            lambda: self.db.count_by_strand().items(), "No strand data"
+        )
\ No newline at end of file
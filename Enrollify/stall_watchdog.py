@@ -0,0 +1,271 @@
+"""
+GUI stall watchdog for Enrollify
+A QTimer in the GUI thread heartbeats the event loop; a background thread
+watches the heartbeat. When the loop has not run for Config.STALL_THRESHOLD_MS
+the watchdog samples, without stopping the GUI thread:
+    - the GUI thread's Python stack
+    - the DB statement it is running or fetching (query_stats)
+    - the user action it belongs to (query_budget)
+
+Finished stalls are appended to Config.LOGS_DIR / 'stalls.log', recorded
+as the 'gui_stall' metric and listed in StallDiagnosticsDialog (Ctrl+Shift+D).
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+    QTableWidgetItem, QHeaderView, QPlainTextEdit, QAbstractItemView
+)
+from PyQt6.QtCore import Qt, QObject, QTimer
+
+from config import Config
+from logger_config import get_logger
+from metrics import registry as metrics
+from query_budget import current_action
+from query_stats import active_statement
+
+logger = get_logger(__name__)
+
+# Samples kept per stall (the stack can move while the loop is blocked)
+MAX_SAMPLES = 5
+
+
+class StallWatchdog(QObject):
+    """Heartbeat timer in the GUI thread plus a monitor thread"""
+
+    def __init__(self, threshold_ms=None, heartbeat_ms=None, log_path=None, parent=None):
+        super().__init__(parent)
+        self.threshold = (threshold_ms or Config.STALL_THRESHOLD_MS) / 1000.0
+        self.heartbeat_ms = heartbeat_ms or Config.STALL_HEARTBEAT_MS
+        self.log_path = log_path or Config.LOGS_DIR / 'stalls.log'
+        self.stalls = deque(maxlen=100)
+
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._current = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._beat)
+
+    def start(self):
+        self._last_beat = time.monotonic()
+        self._timer.start(self.heartbeat_ms)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='stall-watchdog', daemon=True)
+        self._thread.start()
+        logger.info(f"Stall watchdog started (threshold {self.threshold * 1000:.0f} ms)")
+
+    def stop(self):
+        self._timer.stop()
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+
+    # ==================== MONITOR THREAD ====================
+
+    def _run(self):
+        poll = min(self.threshold / 4, 0.02)
+        while not self._stop_event.wait(poll):
+            last_beat = self._last_beat
+            blocked = time.monotonic() - last_beat
+
+            if self._current is not None and self._current['last_beat'] != last_beat:
+                # The loop ran again - the stall is over
+                self._finish(last_beat)
+            elif blocked >= self.threshold:
+                self._sample(last_beat, blocked)
+
+    def _sample(self, last_beat, blocked):
+        """Capture what the GUI thread is doing right now"""
+        stall = self._current
+        if stall is None:
+            stall = self._current = {
+                'started_at': datetime.now().timestamp() - blocked,
+                'last_beat': last_beat,
+                'samples': [],
+                'next_sample': 0.0,
+            }
+        elif blocked < stall['next_sample'] or len(stall['samples']) >= MAX_SAMPLES:
+            return
+
+        frame = sys._current_frames().get(self._gui_thread_id)
+        summary = traceback.extract_stack(frame, limit=30) if frame is not None else []
+        statement = active_statement(self._gui_thread_id)
+
+        stall['samples'].append({
+            'at_ms': round(blocked * 1000),
+            'stack': summary.format() if summary else [],
+            'location': _innermost_app_frame(summary),
+            'action': current_action(self._gui_thread_id),
+            'statement': statement[0] if statement else None,
+            'statement_ms': round((time.time() - statement[1]) * 1000) if statement else None,
+        })
+        # Re-sample after each further doubling of the stall
+        stall['next_sample'] = blocked * 2
+
+    def _finish(self, resumed_beat):
+        stall, self._current = self._current, None
+        duration_ms = (resumed_beat - stall['last_beat']) * 1000
+        first = stall['samples'][0] if stall['samples'] else {}
+
+        record = {
+            'started_at': datetime.fromtimestamp(stall['started_at']).strftime('%Y-%m-%d %H:%M:%S'),
+            'duration_ms': round(duration_ms),
+            'action': next((s['action'] for s in stall['samples'] if s['action']), None),
+            'statement': next((s['statement'] for s in stall['samples'] if s['statement']), None),
+            'location': first.get('location', 'unknown'),
+            'samples': stall['samples'],
+        }
+        with self._lock:
+            self.stalls.append(record)
+        metrics.observe('gui_stall', duration_ms)
+
+        logger.warning(
+            f"GUI stalled {record['duration_ms']} ms in {record['location']}"
+            + (f" during {record['action']}" if record['action'] else "")
+            + (f" (SQL: {record['statement'][:120]})" if record['statement'] else "")
+        )
+        try:
+            self._write(record)
+        except Exception as e:
+            logger.error(f"Could not write stall log: {e}")
+
+    def _write(self, record):
+        lines = [
+            "=" * 70,
+            f"{record['started_at']}  GUI stalled {record['duration_ms']} ms",
+            f"Action:    {record['action'] or '-'}",
+            f"Statement: {record['statement'] or '-'}",
+        ]
+        for sample in record['samples']:
+            lines.append(f"--- blocked {sample['at_ms']} ms"
+                         + (f", statement running {sample['statement_ms']} ms" if sample['statement'] else ""))
+            lines.extend(line.rstrip('\n') for line in sample['stack'])
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+    def recent_stalls(self):
+        """Finished stalls, newest first"""
+        with self._lock:
+            return list(self.stalls)[::-1]
+
+
+def _innermost_app_frame(summary):
+    """'file.py:line in func' for the deepest frame that is Enrollify code"""
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    for entry in reversed(summary):
+        if os.path.dirname(os.path.abspath(entry.filename)) == app_dir:
+            return f"{os.path.basename(entry.filename)}:{entry.lineno} in {entry.name}"
+    return 'unknown'
+
+
+_watchdog = None
+
+
+def start_stall_watchdog():
+    """Start the watchdog once, from the GUI thread (no-op when disabled)"""
+    global _watchdog
+    if _watchdog is None and Config.STALL_WATCHDOG_ENABLED:
+        _watchdog = StallWatchdog()
+        _watchdog.start()
+    return _watchdog
+
+
+def get_stall_watchdog():
+    return _watchdog
+
+
+# ==================== DIAGNOSTICS VIEW ====================
+
+class StallDiagnosticsDialog(QDialog):
+    """Recent GUI stalls with the captured stack of the selected one"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostics - GUI Stalls")
+        self.resize(900, 600)
+        self.stalls = []
+
+        layout = QVBoxLayout(self)
+
+        watchdog = get_stall_watchdog()
+        status = (f"Watching for stalls over {watchdog.threshold * 1000:.0f} ms - log: {watchdog.log_path}"
+                  if watchdog else "Stall watchdog is not running (Config.STALL_WATCHDOG_ENABLED)")
+        info = QLabel(status)
+        info.setStyleSheet("color: #6B7280; font-size: 12px;")
+        layout.addWidget(info)
+
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(["Time", "Duration", "Where", "Action / SQL"])
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        self.table.itemSelectionChanged.connect(self.show_selected_stack)
+        layout.addWidget(self.table, 1)
+
+        self.stack_view = QPlainTextEdit()
+        self.stack_view.setReadOnly(True)
+        self.stack_view.setStyleSheet("font-family: Consolas, monospace; font-size: 12px;")
+        layout.addWidget(self.stack_view, 1)
+
+        buttons = QHBoxLayout()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.load_stalls)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        buttons.addStretch()
+        buttons.addWidget(refresh_btn)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+        self.load_stalls()
+
+    def load_stalls(self):
+        watchdog = get_stall_watchdog()
+        self.stalls = watchdog.recent_stalls() if watchdog else []
+
+        self.table.setRowCount(len(self.stalls))
+        for row, stall in enumerate(self.stalls):
+            detail = stall['action'] or ''
+            if stall['statement']:
+                detail = f"{detail}  {stall['statement'][:150]}".strip()
+            for col, value in enumerate([stall['started_at'], f"{stall['duration_ms']} ms",
+                                         stall['location'], detail]):
+                self.table.setItem(row, col, QTableWidgetItem(value))
+        self.table.resizeColumnsToContents()
+
+        if self.stalls:
+            self.table.selectRow(0)
+        else:
+            self.stack_view.setPlainText("No stalls recorded yet.")
+
+    def show_selected_stack(self):
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return
+        stall = self.stalls[rows[0].row()]
+        text = []
+        for sample in stall['samples']:
+            text.append(f"--- blocked {sample['at_ms']} ms"
+                        + (f" | action: {sample['action']}" if sample['action'] else "")
+                        + (f" | SQL ({sample['statement_ms']} ms): {sample['statement']}"
+                           if sample['statement'] else ""))
+            text.extend(line.rstrip('\n') for line in sample['stack'])
+        self.stack_view.setPlainText("\n".join(text))
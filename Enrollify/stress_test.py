@@ -0,0 +1,422 @@
+"""
+Multi-Terminal Concurrency Stress Test for Enrollify
+Simulates enrollment week: kiosks submitting forms, cashiers posting
+payments and staff approving/assigning students, all at the same time.
+
+Each terminal is a thread (or a process with --processes) with its own
+DatabaseManager connection, just like separate machines would have.
+
+Reports:
+    - throughput and latency percentiles per operation
+    - deadlocks, lock wait timeouts and other failures
+    - InnoDB row lock waits during the run
+    - integrity violations (duplicate receipts, payments on students that
+      are not Enrolled, orphaned payments, lost inserts)
+
+Usage:
+    python stress_test.py                                   # 6 kiosks, 4 cashiers, 2 staff for 30s
+    python stress_test.py --kiosks 10 --cashiers 8 --duration 60 --processes
+    python stress_test.py --seed-students 5000              # fresh enrollify_bench dataset first
+"""
+
+import argparse
+import multiprocessing
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+
+from config import Config
+from perf_utils import summarize, run_metadata, save_results
+
+
+# LRNs created by the stress run: 7 + terminal (3 digits) + sequence (8 digits)
+STRESS_LRN_PREFIX = '7'
+
+OPERATIONS = ['add_student', 'add_payment_with_receipt', 'update_enrollment_status', 'assign_student_to_staff']
+
+
+def classify_error(message):
+    """Map a MySQL error message to a failure bucket"""
+    text = str(message)
+    if 'Deadlock' in text or '1213' in text:
+        return 'deadlock'
+    if 'Lock wait timeout' in text or '1205' in text:
+        return 'lock_wait_timeout'
+    if 'Duplicate entry' in text or '1062' in text:
+        return 'duplicate'
+    if 'Lost connection' in text or 'gone away' in text:
+        return 'connection'
+    return 'other'
+
+
+def make_receipt_number(style, terminal, seq):
+    """Receipt number the way payment_screen builds it, or a collision-free one"""
+    today = datetime.now().strftime('%Y%m%d')
+    if style == 'app':
+        return f"{today}{random.randint(1000, 9999)}"
+    return f"{today}T{terminal:03d}{seq:07d}"
+
+
+def student_form(lrn, rng):
+    return {
+        'lrn': lrn, 'firstname': rng.choice(['Juan', 'Maria', 'Jose', 'Angel', 'Mark', 'Bea']),
+        'middlename': 'Stress', 'lastname': rng.choice(['Santos', 'Reyes', 'Cruz', 'Garcia']),
+        'gender': rng.choice(['Male', 'Female']), 'birthdate': '2008-06-15',
+        'email': f'{lrn}@stress.example.com', 'phone': '09171234567', 'address': '1 Rizal St., Manila',
+        'grade': rng.choice(['Grade 11', 'Grade 12']), 'track': 'Academic Track',
+        'strand': rng.choice(['STEM', 'ABM', 'HUMSS', 'GAS']),
+        'guardian_name': 'Stress Guardian', 'guardian_contact': '09181234567', 'status': 'Pending'
+    }
+
+
+# ==================== TERMINAL ====================
+
+def run_terminal(config):
+    """
+    Body of one terminal; runs until the deadline and returns its stats
+
+    Kept at module level (and only taking/returning plain data) so it can
+    run in a thread or a separate process.
+    """
+    from database_manager_mysql import DatabaseManager
+
+    terminal = config['terminal']
+    kind = config['kind']
+    rng = random.Random(config['seed'] + terminal)
+    stats = {
+        'terminal': terminal, 'kind': kind,
+        'latencies': {op: [] for op in OPERATIONS},
+        'ok': {op: 0 for op in OPERATIONS},
+        'failures': {},
+        'created_lrns': [],
+    }
+
+    try:
+        db = DatabaseManager(host=config['host'], user=config['user'],
+                             password=config['password'], database=config['database'])
+    except Exception as e:
+        stats['failures']['connect'] = {'connection': 1}
+        stats['connect_error'] = str(e)
+        return stats
+
+    hot = config['hot_lrns']
+    staff = config['staff']
+    seq = 0
+
+    # Everyone starts together so the first seconds are the most contended
+    while time.time() < config['start_at']:
+        time.sleep(0.005)
+
+    while time.time() < config['deadline']:
+        seq += 1
+        if kind == 'kiosk':
+            op = 'add_student'
+            lrn = f"{STRESS_LRN_PREFIX}{terminal:03d}{seq:08d}"
+            call = lambda: db.add_student(student_form(lrn, rng))
+        elif kind == 'cashier':
+            op = 'add_payment_with_receipt'
+            lrn = rng.choice(hot)
+            payment = {'student_data': {'lrn': lrn}, 'amount': 26500, 'payment_method': 'ewallet'}
+            receipt = make_receipt_number(config['receipt_style'], terminal, seq)
+            call = lambda: db.add_payment_with_receipt(payment, receipt)
+        elif rng.random() < 0.5:
+            op = 'update_enrollment_status'
+            lrn = rng.choice(hot)
+            call = lambda: db.update_enrollment_status(lrn, 'Enrolled')
+        else:
+            op = 'assign_student_to_staff'
+            lrn = rng.choice(hot)
+            staff_id, staff_email = rng.choice(staff)
+            call = lambda: db.assign_student_to_staff(lrn, staff_id, staff_email)
+
+        started = time.perf_counter()
+        try:
+            result = call()
+            failed = result is False
+            error = 'returned False'
+        except Exception as e:
+            failed = True
+            error = e
+        elapsed = (time.perf_counter() - started) * 1000
+
+        stats['latencies'][op].append(elapsed)
+        if failed:
+            bucket = classify_error(error)
+            stats['failures'].setdefault(op, {})
+            stats['failures'][op][bucket] = stats['failures'][op].get(bucket, 0) + 1
+        else:
+            stats['ok'][op] += 1
+            if op == 'add_student':
+                stats['created_lrns'].append(lrn)
+
+        if config['think_ms']:
+            time.sleep(rng.uniform(0, config['think_ms']) / 1000)
+
+    db.close_connection()
+    return stats
+
+
+# ==================== SETUP & CHECKS ====================
+
+def open_admin_connection(args):
+    import mysql.connector
+    return mysql.connector.connect(host=args.host, user=args.user, password=args.password,
+                                   database=args.database, port=args.port, autocommit=True)
+
+
+def pick_fixtures(conn, hot_count):
+    """Pending students to fight over and staff accounts to assign them to"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT lrn FROM students WHERE enrollment_status = 'Pending' ORDER BY id LIMIT %s",
+                   (hot_count,))
+    hot = [row[0] for row in cursor.fetchall()]
+    cursor.execute("SELECT id, email FROM users WHERE role = 'STAFF' ORDER BY id LIMIT 20")
+    staff = [(row[0], row[1]) for row in cursor.fetchall()]
+    cursor.close()
+    return hot, staff
+
+
+def lock_counters(conn):
+    """InnoDB row lock counters (cumulative since server start)"""
+    cursor = conn.cursor()
+    cursor.execute("SHOW GLOBAL STATUS LIKE 'Innodb_row_lock%'")
+    counters = {name: int(value) for name, value in cursor.fetchall() if str(value).isdigit()}
+    cursor.close()
+    return counters
+
+
+def integrity_checks(conn, created_lrns):
+    """Queries that must all return zero after a clean run"""
+    cursor = conn.cursor()
+    checks = {}
+
+    cursor.execute('''
+                   SELECT COUNT(*)
+                   FROM (SELECT receipt_number
+                         FROM payments
+                         WHERE receipt_number IS NOT NULL
+                         GROUP BY receipt_number
+                         HAVING COUNT(*) > 1) dup
+                   ''')
+    checks['duplicate_receipts'] = cursor.fetchone()[0]
+
+    cursor.execute('''
+                   SELECT COUNT(*)
+                   FROM payments p
+                            JOIN students s ON s.id = p.student_id
+                   WHERE s.enrollment_status <> 'Enrolled'
+                   ''')
+    checks['payments_without_enrolled_status'] = cursor.fetchone()[0]
+
+    cursor.execute('''
+                   SELECT COUNT(*)
+                   FROM payments p
+                            LEFT JOIN students s ON s.id = p.student_id
+                   WHERE s.id IS NULL
+                      OR s.lrn <> p.lrn
+                   ''')
+    checks['orphaned_payments'] = cursor.fetchone()[0]
+
+    cursor.execute('''
+                   SELECT COUNT(*)
+                   FROM students s
+                            LEFT JOIN users u ON u.id = s.assigned_staff_id
+                   WHERE s.assigned_staff_id IS NOT NULL
+                     AND (u.id IS NULL OR u.email <> s.assigned_staff_email)
+                   ''')
+    checks['mismatched_assignments'] = cursor.fetchone()[0]
+
+    # Inserts reported as successful but not in the table
+    lost = 0
+    for start in range(0, len(created_lrns), 1000):
+        chunk = created_lrns[start:start + 1000]
+        placeholders = ', '.join(['%s'] * len(chunk))
+        cursor.execute(f'SELECT COUNT(*) FROM students WHERE lrn IN ({placeholders})', chunk)
+        lost += len(chunk) - cursor.fetchone()[0]
+    checks['lost_student_inserts'] = lost
+
+    cursor.close()
+    return checks
+
+
+def cleanup_stress_rows(conn):
+    """Remove students (and their payments) created by earlier stress runs"""
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM payments WHERE lrn LIKE %s", (f'{STRESS_LRN_PREFIX}%',))
+    cursor.execute("DELETE FROM students WHERE lrn LIKE %s", (f'{STRESS_LRN_PREFIX}%',))
+    cursor.close()
+
+
+# ==================== REPORT ====================
+
+def merge_stats(all_stats, wall_seconds):
+    latencies = {op: [] for op in OPERATIONS}
+    ok = {op: 0 for op in OPERATIONS}
+    failures = {}
+    created = []
+    for stats in all_stats:
+        for op in OPERATIONS:
+            latencies[op].extend(stats['latencies'].get(op, []))
+            ok[op] += stats['ok'].get(op, 0)
+        for op, buckets in stats['failures'].items():
+            for bucket, count in buckets.items():
+                failures.setdefault(op, {})
+                failures[op][bucket] = failures[op].get(bucket, 0) + count
+        created.extend(stats['created_lrns'])
+
+    operations = {}
+    for op in OPERATIONS:
+        if not latencies[op]:
+            continue
+        summary = summarize(latencies[op])
+        summary['ok'] = ok[op]
+        summary['failed'] = sum(failures.get(op, {}).values())
+        summary['throughput_per_s'] = round(ok[op] / wall_seconds, 1) if wall_seconds else 0
+        operations[op] = summary
+    return operations, failures, created
+
+
+def print_report(operations, failures, lock_delta, checks, wall_seconds):
+    print("\n" + "=" * 78)
+    print("THROUGHPUT & LATENCY")
+    print("=" * 78)
+    print(f"{'operation':<28} {'ok/s':>7} {'ok':>7} {'fail':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for op, s in operations.items():
+        print(f"{op:<28} {s['throughput_per_s']:>7} {s['ok']:>7} {s['failed']:>6} "
+              f"{s['median_ms']:>8.1f} {s['p95_ms']:>8.1f} {s['p99_ms']:>8.1f} {s['max_ms']:>8.1f}")
+    total_ok = sum(s['ok'] for s in operations.values())
+    print(f"\nTotal: {total_ok:,} successful operations in {wall_seconds:.1f}s "
+          f"({total_ok / wall_seconds if wall_seconds else 0:,.1f}/s)")
+
+    print("\n" + "=" * 78)
+    print("FAILURES & LOCKING")
+    print("=" * 78)
+    totals = {}
+    for op, buckets in failures.items():
+        for bucket, count in buckets.items():
+            totals[bucket] = totals.get(bucket, 0) + count
+            print(f"   {op:<28} {bucket:<20} {count:>6}")
+    if not failures:
+        print("   No failed operations")
+    print(f"   Deadlocks:            {totals.get('deadlock', 0)}")
+    print(f"   Lock wait timeouts:   {totals.get('lock_wait_timeout', 0)}")
+    print(f"   Row lock waits:       {lock_delta.get('Innodb_row_lock_waits', 'n/a')}")
+    print(f"   Row lock time (ms):   {lock_delta.get('Innodb_row_lock_time', 'n/a')}")
+
+    print("\n" + "=" * 78)
+    print("INTEGRITY")
+    print("=" * 78)
+    for name, count in checks.items():
+        print(f"   {'✅' if count == 0 else '❌'} {name:<36} {count}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Concurrent terminal stress test for Enrollify')
+    parser.add_argument('--kiosks', type=int, default=6, help='terminals submitting enrollments')
+    parser.add_argument('--cashiers', type=int, default=4, help='terminals posting payments')
+    parser.add_argument('--staff', type=int, default=2, help='terminals approving and assigning')
+    parser.add_argument('--duration', type=float, default=30, help='seconds to run')
+    parser.add_argument('--think-ms', type=float, default=0, help='max random pause between operations')
+    parser.add_argument('--hot-students', type=int, default=200,
+                        help='pending students cashiers and staff compete for')
+    parser.add_argument('--receipt-style', choices=['app', 'unique'], default='app',
+                        help="'app' builds receipts like payment_screen (date + 4 random digits)")
+    parser.add_argument('--processes', action='store_true', help='run terminals as processes, not threads')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--seed-students', type=int, default=0,
+                        help='generate a fresh dataset of this size first (drops --database)')
+    parser.add_argument('--keep', action='store_true', help='keep rows created by earlier stress runs')
+    parser.add_argument('--output', default='stress_results.json')
+    parser.add_argument('--host', default=Config.DB_HOST)
+    parser.add_argument('--port', type=int, default=Config.DB_PORT)
+    parser.add_argument('--user', default=Config.DB_USER)
+    parser.add_argument('--password', default=Config.DB_PASSWORD)
+    parser.add_argument('--database', default='enrollify_bench')
+    args = parser.parse_args(argv)
+
+    print("=" * 78)
+    print("ENROLLIFY CONCURRENCY STRESS TEST")
+    print("=" * 78)
+    print(f"Terminals: {args.kiosks} kiosks, {args.cashiers} cashiers, {args.staff} staff "
+          f"({'processes' if args.processes else 'threads'})   Duration: {args.duration:.0f}s")
+
+    if args.database == Config.DB_NAME:
+        print(f"⚠️  Running against the application database '{Config.DB_NAME}'")
+
+    try:
+        if args.seed_students:
+            from benchmark_database import prepare_dataset
+            args.backend = 'mysql'
+            prepare_dataset(args, args.seed_students)
+        admin = open_admin_connection(args)
+        if not args.keep:
+            cleanup_stress_rows(admin)
+        hot, staff = pick_fixtures(admin, args.hot_students)
+    except Exception as e:
+        print(f"❌ Setup failed: {e}")
+        return 1
+
+    if not hot or not staff:
+        print("❌ Need pending students and STAFF users - run with --seed-students 1000")
+        return 1
+
+    start_at = time.time() + 1.0
+    base = {
+        'host': args.host, 'user': args.user, 'password': args.password, 'database': args.database,
+        'seed': args.seed, 'hot_lrns': hot, 'staff': staff, 'receipt_style': args.receipt_style,
+        'think_ms': args.think_ms, 'start_at': start_at, 'deadline': start_at + args.duration,
+    }
+    configs = []
+    for kind, count in [('kiosk', args.kiosks), ('cashier', args.cashiers), ('staff', args.staff)]:
+        for _ in range(count):
+            configs.append(dict(base, terminal=len(configs) + 1, kind=kind))
+
+    locks_before = lock_counters(admin)
+
+    if args.processes:
+        with multiprocessing.Pool(len(configs)) as pool:
+            all_stats = pool.map(run_terminal, configs)
+    else:
+        all_stats = [None] * len(configs)
+
+        def worker(index, config):
+            all_stats[index] = run_terminal(config)
+
+        threads = [threading.Thread(target=worker, args=(i, c), daemon=True) for i, c in enumerate(configs)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    wall_seconds = max(time.time() - start_at, 0.001)
+    locks_after = lock_counters(admin)
+    lock_delta = {name: locks_after[name] - locks_before.get(name, 0)
+                  for name in ('Innodb_row_lock_waits', 'Innodb_row_lock_time') if name in locks_after}
+
+    connect_errors = [s['connect_error'] for s in all_stats if s.get('connect_error')]
+    if connect_errors:
+        print(f"⚠️  {len(connect_errors)} terminal(s) could not connect: {connect_errors[0]}")
+
+    operations, failures, created = merge_stats(all_stats, wall_seconds)
+    checks = integrity_checks(admin, created)
+    admin.close()
+
+    print_report(operations, failures, lock_delta, checks, wall_seconds)
+
+    meta = run_metadata(terminals=len(configs), kiosks=args.kiosks, cashiers=args.cashiers, staff=args.staff,
+                        duration=args.duration, processes=args.processes, receipt_style=args.receipt_style)
+    save_results(args.output, meta, {
+        'operations': operations,
+        'failures': failures,
+        'locks': lock_delta,
+        'integrity': checks,
+    })
+    print(f"\n💾 Results saved to {args.output}")
+
+    return 0 if all(count == 0 for count in checks.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
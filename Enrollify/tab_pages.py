@@ -0,0 +1,311 @@
+"""
+Cached tab pages for the admin and staff screens
+Every tab is built once into its own scrollable page inside a QStackedWidget.
+Coming back to a tab shows the page that already exists; only when its data
+is older than the staleness window are the page's refresh callbacks run,
+which re-query and write the new values into the existing widgets.
+
+    self.pages = TabStack()
+    self.pages.add_tab("overview", self.build_overview_page)
+    self.pages.show_tab("overview")
+
+    def build_overview_page(self, page):
+        page.content_layout.addWidget(...)          # widgets only, no queries
+        page.on_refresh(lambda: rows.bind(...))     # queries, run on show/refresh
+
+After an edit, invalidate() marks pages stale; the visible page is
+refreshed straight away, the others on their next visit. Change events
+(change_bus.py) use invalidate_soon(), so a burst of writes costs one
+refresh.
+"""
+
+import time
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QScrollArea, QStackedWidget
+)
+
+from config import Config
+from logger_config import get_logger
+from ui_styles import set_role, set_state
+
+logger = get_logger(__name__)
+
+
+class TabPage(QScrollArea):
+    """One tab: a scroll area around the page content and its refresh callbacks"""
+
+    def __init__(self, name, margins, spacing, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.setWidgetResizable(True)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setObjectName("pageScroll")
+
+        self.content = QWidget()
+        self.content.setObjectName("pageContent")
+        self.content_layout = QVBoxLayout(self.content)
+        self.content_layout.setContentsMargins(*margins)
+        self.content_layout.setSpacing(spacing)
+        self.setWidget(self.content)
+
+        self.refreshers = []
+        self.loaded_at = None
+
+    def on_refresh(self, callback):
+        """Run callback (re-query and rebind) whenever the page's data is refreshed"""
+        self.refreshers.append(callback)
+        return callback
+
+    def refresh(self):
+        for callback in self.refreshers:
+            callback()
+        self.loaded_at = time.monotonic()
+
+    def is_stale(self, max_age):
+        if self.loaded_at is None:
+            return True
+        return max_age is not None and time.monotonic() - self.loaded_at >= max_age
+
+
+class TabStack(QStackedWidget):
+    """Builds each tab page on first visit and keeps it for the next ones"""
+
+    def __init__(self, margins=(80, 60, 80, 100), spacing=40, max_age=None, parent=None):
+        super().__init__(parent)
+        self.margins = margins
+        self.spacing = spacing
+        # Seconds a page is shown as-is before its data is re-queried (None = until invalidated)
+        self.max_age = Config.TAB_STALE_AFTER if max_age is None else max_age
+        self._builders = {}
+        self._pages = {}
+        self.current_name = None
+
+        # Tabs waiting for invalidate_soon (None = all of them)
+        self._pending = set()
+        self._pending_timer = QTimer(self)
+        self._pending_timer.setSingleShot(True)
+        self._pending_timer.timeout.connect(self._invalidate_pending)
+
+    def add_tab(self, name, build):
+        """Register build(page), called the first time the tab is shown"""
+        self._builders[name] = build
+
+    def page(self, name):
+        return self._pages.get(name)
+
+    def _build(self, name):
+        page = TabPage(name, self.margins, self.spacing)
+        self._builders[name](page)
+        self._pages[name] = page
+        self.addWidget(page)
+        return page
+
+    def show_tab(self, name):
+        """
+        Show a tab, building or refreshing it only when needed
+
+        Returns 'built', 'refreshed' or 'cached'.
+        """
+        page = self._pages.get(name)
+        if page is None:
+            page = self._build(name)
+            page.refresh()
+            outcome = 'built'
+        elif page.is_stale(self.max_age):
+            page.refresh()
+            outcome = 'refreshed'
+        else:
+            outcome = 'cached'
+
+        self.setCurrentWidget(page)
+        self.current_name = name
+        logger.debug(f"Tab {name}: {outcome}")
+        return outcome
+
+    def refresh(self, name):
+        """Re-query and rebind a tab now (builds it if it was never shown)"""
+        page = self._pages.get(name)
+        if page is None:
+            page = self._build(name)
+        page.refresh()
+
+    def invalidate(self, *names):
+        """Mark tabs stale (all of them when none are named); the visible one is refreshed now"""
+        for name in names or list(self._pages):
+            page = self._pages.get(name)
+            if page is None:
+                continue
+            page.loaded_at = None
+            if name == self.current_name:
+                page.refresh()
+
+    def invalidate_soon(self, *names):
+        """invalidate() once Config.CHANGE_REFRESH_DELAY_MS has passed, merging repeated calls"""
+        self._pending.update(names or [None])
+        if not self._pending_timer.isActive():
+            self._pending_timer.start(Config.CHANGE_REFRESH_DELAY_MS)
+
+    def _invalidate_pending(self):
+        pending, self._pending = self._pending, set()
+        if None in pending:
+            self.invalidate()
+        else:
+            self.invalidate(*pending)
+
+    def discard(self, name=None):
+        """Delete built pages so the next visit builds them again"""
+        for page_name in [name] if name else list(self._pages):
+            page = self._pages.pop(page_name, None)
+            if page is not None:
+                self.removeWidget(page)
+                page.deleteLater()
+                if page_name == self.current_name:
+                    self.current_name = None
+
+
+# ==================== IN-PLACE ROWS ====================
+
+class KeyedRows:
+    """
+    The data rows of a panel, one per key, updated in place
+
+    create_row(key) returns (row_widget, update); update(value) writes a value
+    into the row's existing widgets. bind() keeps the row of every key that is
+    still present, creates rows for new keys, deletes rows whose key is gone
+    and puts the rows in the order given.
+    """
+
+    def __init__(self, parent_layout, create_row, empty_text=None, empty_role="emptyText"):
+        self.create_row = create_row
+        self.empty_text = empty_text
+        self.empty_role = empty_role
+        self.rows = {}
+
+        self.container = QWidget()
+        self.layout = QVBoxLayout(self.container)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.setSpacing(parent_layout.spacing())
+        parent_layout.addWidget(self.container)
+
+        # Empty and error states
+        self.message = QLabel()
+        self.message.hide()
+        parent_layout.addWidget(self.message)
+
+    def bind(self, items):
+        """items: (key, value) pairs in display order"""
+        items = list(items)
+        keys = {key for key, _ in items}
+        for key in [key for key in self.rows if key not in keys]:
+            widget, _ = self.rows.pop(key)
+            self.layout.removeWidget(widget)
+            widget.deleteLater()
+
+        for index, (key, value) in enumerate(items):
+            if key not in self.rows:
+                self.rows[key] = self.create_row(key)
+            widget, update = self.rows[key]
+            update(value)
+            if self.layout.indexOf(widget) != index:
+                self.layout.removeWidget(widget)
+                self.layout.insertWidget(index, widget)
+
+        if not items and self.empty_text:
+            self.show_message(self.empty_text, self.empty_role)
+        else:
+            self.message.hide()
+            self.container.show()
+
+    def show_message(self, text, role="errorText"):
+        """Replace the rows with a message (e.g. when the query failed)"""
+        self.message.setText(text)
+        set_role(self.message, role)
+        set_state(self.message)
+        self.message.show()
+        self.container.hide()
+
+
+def row_widget():
+    """Empty row for KeyedRows: a plain widget with a margin-less QHBoxLayout"""
+    widget = QWidget()
+    layout = QHBoxLayout(widget)
+    layout.setContentsMargins(0, 0, 0, 0)
+    return widget, layout
+
+
+def bar_row(key, text=None, fill=None, value=None, value_role="rowValue", label_width=None,
+            scale=200, min_width=0, percent=False, track=True, stretch_track=False):
+    """
+    Label, proportional bar and value; update((count, total)) resizes the bar
+
+    fill / value are the set_role properties of the bar and the value label
+    (e.g. {'tone': 'teal'} or {'status': 'Enrolled'}).
+    """
+    widget, layout = row_widget()
+
+    label = QLabel(text or key)
+    label.setObjectName("rowLabel")
+    if label_width:
+        label.setFixedWidth(label_width)
+
+    bar = QFrame()
+    bar.setFixedHeight(8)
+    set_role(bar, "barFill", **(fill or {}))
+
+    val = QLabel()
+    set_role(val, value_role, **(value or {}))
+
+    layout.addWidget(label)
+    if track:
+        bar_container = QFrame()
+        bar_container.setFixedHeight(8)
+        bar_container.setObjectName("barTrack")
+        bar.setParent(bar_container)
+        bar_layout = QHBoxLayout(bar_container)
+        bar_layout.setContentsMargins(0, 0, 0, 0)
+        bar_layout.addWidget(bar)
+        bar_layout.addStretch()
+        layout.addWidget(bar_container, 1 if stretch_track else 0)
+    else:
+        layout.addWidget(bar)
+    layout.addWidget(val)
+    layout.addStretch()
+
+    def update(data):
+        count, total = data
+        share = count / total if total else 0
+        bar.setFixedWidth(max(min_width, int(share * scale)))
+        val.setText(f"{count} ({int(share * 100)}%)" if percent else str(count))
+
+    return widget, update
+
+
+def pill_row(key, text=None, pill=None, stretch_before=False):
+    """Label and a pill-shaped value; update(value) sets the value text"""
+    widget, layout = row_widget()
+
+    label = QLabel(text or key)
+    label.setObjectName("rowLabel")
+    val = QLabel()
+    set_role(val, "pill", **(pill or {}))
+
+    layout.addWidget(label)
+    if stretch_before:
+        layout.addStretch()
+        layout.addWidget(val)
+    else:
+        layout.addWidget(val)
+        layout.addStretch()
+
+    return widget, lambda value: val.setText(str(value))
+
+
+def set_metric(card, value, subtext=None):
+    """Rebind the value (and delta text) of a metric card built by create_metric_card"""
+    card.findChild(QLabel, "metricValue").setText(str(value))
+    if subtext is not None:
+        delta = card.findChild(QLabel, "metricDelta")
+        if delta is not None:
+            delta.setText(subtext)
@@ -0,0 +1,94 @@
+"""add_student commits and publishes STUDENT_ADDED with the whole form payload"""
+
+from datetime import datetime
+
+from change_bus import changes, STUDENT_ADDED
+from database_manager_mysql import DatabaseManager
+
+
+class FakeCursor:
+    lastrowid = 42
+    updated_at = datetime(2026, 10, 19, 10, 0, 0)
+
+    def __init__(self, statements):
+        self.statements = statements
+
+    def execute(self, sql, params=None):
+        self.statements.append((' '.join(sql.split()), params))
+
+    def fetchone(self):
+        return (self.updated_at,)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Stands in for the MySQL connection: records statements, always connected"""
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def is_connected(self):
+        return True
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self.statements)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def student_payload():
+    return {
+        'lrn': '123456789012', 'firstname': 'Ana', 'middlename': '', 'lastname': 'Cruz',
+        'gender': 'Female', 'birthdate': '2008-05-01', 'email': 'ana@example.com',
+        'phone': '09171234567', 'address': 'Quezon City', 'grade': 'Grade 11',
+        'track': 'Academic Track', 'strand': 'STEM', 'guardian_name': 'Maria Cruz',
+        'guardian_contact': '09181234567'
+    }
+
+
+def test_add_student_publishes_student_added():
+    db = DatabaseManager(connect=False)
+    db.connection = FakeConnection()
+    events = []
+    callback = changes.subscribe(lambda event: events.append(event), kinds=(STUDENT_ADDED,))
+    try:
+        assert db.add_student(student_payload()) == 42
+    finally:
+        changes.unsubscribe(callback)
+
+    assert any(sql.startswith('INSERT INTO students') for sql, _ in db.connection.statements)
+    assert db.connection.commits >= 1
+    assert len(events) == 1
+    event = events[0]
+    assert event.kind == STUDENT_ADDED
+    assert event.lrn == '123456789012'
+    assert event.fields['lrn'] == '123456789012'
+    assert event.fields['status'] == 'Pending'
+    # The row version the change feed uses to recognise this terminal's own write
+    assert event.fields['updated_at'] == FakeCursor.updated_at
+
+
+def test_publish_accepts_fields_named_like_its_arguments():
+    events = []
+    callback = changes.subscribe(lambda event: events.append(event))
+    try:
+        changes.publish(STUDENT_ADDED, '1', lrn='1', kind='row field')
+    finally:
+        changes.unsubscribe(callback)
+    assert events[0].fields == {'lrn': '1', 'kind': 'row field'}
+
+
+def test_data_versions_rows_are_bumped_in_one_order():
+    db = DatabaseManager(connect=False)
+    db._versioned = True
+    statements = []
+    db._bump_versions(FakeCursor(statements), 'students', 'payments', 'students')
+    db._bump_versions(FakeCursor(statements), 'payments', 'students')
+    assert [params for _, params in statements] == [('payments', 'students')] * 2
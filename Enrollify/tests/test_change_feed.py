@@ -0,0 +1,83 @@
+"""ChangeFeed delivers every other-terminal write once and skips only this terminal's own rows"""
+
+from datetime import datetime
+
+import pytest
+
+from change_bus import changes, STATUS_CHANGED, STUDENT_DELETED, STUDENT_SYNCED
+from change_feed import ChangeFeed
+
+START = datetime(2026, 10, 19, 10, 0, 0)
+SECOND = datetime(2026, 10, 19, 10, 0, 1)
+
+
+class ScriptedCursor:
+    """Returns the next scripted result for each fetch"""
+
+    def __init__(self, script):
+        self.script = script
+
+    def execute(self, sql, params=None):
+        pass
+
+    def fetchone(self):
+        return self.script.pop(0)
+
+    def fetchall(self):
+        return self.script.pop(0)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def feed():
+    feed = ChangeFeed(db=None, interval_ms=1000)
+    feed.script = []
+    feed._cursor = lambda **kwargs: ScriptedCursor(feed.script)
+    feed.script.append((START, 0))
+    assert feed.poll() == []
+    yield feed
+    changes.unsubscribe(feed._on_local_change)
+
+
+def student(status):
+    return {'lrn': '1', 'status': status, 'updated_at': SECOND}
+
+
+def test_second_update_in_the_same_second_is_delivered(feed):
+    feed.script += [[('student', '1', SECOND, 5, None, None)], [student('Pending')]]
+    assert [lrn for _, lrn, _ in feed.poll()] == ['1']
+
+    # Same updated_at, different row: a second write within that second
+    feed.script += [[('student', '1', SECOND, 5, None, None)], [student('Enrolled')]]
+    assert [fields['status'] for _, _, fields in feed.poll()] == ['Enrolled']
+
+    # Unchanged row re-read inside the overlap window
+    feed.script += [[('student', '1', SECOND, 5, None, None)], [student('Enrolled')]]
+    assert feed.poll() == []
+
+
+def test_only_the_row_version_written_here_is_suppressed(feed):
+    events = []
+    callback = changes.subscribe(lambda event: events.append(event), kinds=(STUDENT_SYNCED,))
+    try:
+        changes.publish(STATUS_CHANGED, '1', status='Pending', updated_at=START)
+        feed._publish([(STUDENT_SYNCED, '1', student('Enrolled')),
+                       (STUDENT_SYNCED, '1', dict(student('Pending'), updated_at=START))])
+    finally:
+        changes.unsubscribe(callback)
+
+    assert [event.fields['status'] for event in events] == ['Enrolled']
+
+
+def test_audit_mark_advances_past_rows_that_are_not_deletions(feed):
+    # Only logins and adds since the start: no deletion rows, just the newest id
+    feed.script += [[('audit_mark', None, None, 75, None, None)]]
+    assert feed.poll() == []
+    assert feed.audit_id == 75
+
+    feed.script += [[('audit', None, SECOND, 80, 'DELETE_STUDENT', 'Deleted student: 1'),
+                     ('audit_mark', None, None, 81, None, None)]]
+    assert feed.poll() == [(STUDENT_DELETED, '1', {})]
+    assert feed.audit_id == 81
@@ -0,0 +1,105 @@
+"""POST /payments with a client receipt number, and malformed Content-Length headers"""
+
+import asyncio
+import json
+from decimal import Decimal
+from http import HTTPStatus
+
+from mysql.connector import IntegrityError
+
+import enrollment_service
+from enrollment_service import EnrollmentService, serve_connection
+
+RECORDED = {'receipt_number': 'R1', 'lrn': '111111111111', 'amount': Decimal('5000.00')}
+
+
+class FakeAsyncDatabase:
+    """The AsyncDatabaseManager coroutines used by pay()"""
+
+    def __init__(self, taken=()):
+        self.payments = []
+        # Receipt numbers another terminal records between our check and our insert
+        self.taken = set(taken)
+
+    async def get_receipt_by_number(self, receipt_number):
+        return RECORDED if receipt_number == RECORDED['receipt_number'] else None
+
+    async def get_student_by_lrn(self, lrn):
+        return {'lrn': lrn, 'track': 'Academic Track', 'strand': 'STEM'}
+
+    async def add_payment_with_receipt(self, payment_data, receipt_number):
+        if receipt_number in self.taken:
+            error = IntegrityError(msg="Duplicate entry", errno=1062)
+            raise Exception(f"Error adding payment: {error}") from error
+        self.payments.append(receipt_number)
+        return len(self.payments)
+
+
+class FakeWriter:
+    def __init__(self):
+        self.data = b''
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def pay(service, **data):
+    body = json.dumps(dict({'payment_method': 'Cash', 'receipt_number': 'R1'}, **data)).encode()
+    return asyncio.run(service.handle('POST', '/payments', body))
+
+
+def test_retried_payment_returns_the_recorded_one():
+    adb = FakeAsyncDatabase()
+    status, payload = pay(EnrollmentService(adb), lrn='111111111111', amount=5000)
+    assert status == HTTPStatus.OK
+    assert payload['payment'] == RECORDED
+    assert adb.payments == []
+
+
+def test_recorded_receipt_for_another_payment_is_a_conflict():
+    adb = FakeAsyncDatabase()
+    service = EnrollmentService(adb)
+    assert pay(service, lrn='222222222222', amount=5000)[0] == HTTPStatus.CONFLICT
+    assert pay(service, lrn='111111111111', amount=4000)[0] == HTTPStatus.CONFLICT
+    assert adb.payments == []
+
+
+def test_invalid_content_length_is_a_bad_request():
+    async def request(raw):
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        writer = FakeWriter()
+        await serve_connection(EnrollmentService(FakeAsyncDatabase()), reader, writer)
+        return writer.data.split(b'\r\n', 1)[0]
+
+    for length in (b'abc', b'-5'):
+        raw = b'POST /payments HTTP/1.1\r\nContent-Length: ' + length + b'\r\n\r\n'
+        assert asyncio.run(request(raw)) == b'HTTP/1.1 400 Bad Request'
+
+
+def test_generated_receipt_numbers_skip_recorded_ones(monkeypatch):
+    today = enrollment_service.datetime.now().strftime('%Y%m%d')
+    recorded_today = dict(RECORDED, receipt_number=f"{today}1000")
+    suffixes = iter([1000, 2000, 3000])
+    monkeypatch.setattr(enrollment_service.random, 'randint', lambda low, high: next(suffixes))
+
+    adb = FakeAsyncDatabase(taken={f"{today}2000"})
+    adb.get_receipt_by_number = lambda number: _receipt(recorded_today if number == f"{today}1000" else None)
+    status, payload = asyncio.run(EnrollmentService(adb).handle(
+        'POST', '/payments', json.dumps({'lrn': '111111111111', 'payment_method': 'Cash', 'amount': 100}).encode()))
+
+    # 1000 is already recorded, 2000 is taken by a concurrent insert
+    assert status == HTTPStatus.CREATED
+    assert payload['receipt_number'] == f"{today}3000"
+    assert adb.payments == [f"{today}3000"]
+
+
+async def _receipt(value):
+    return value
@@ -0,0 +1,58 @@
+"""Journaled payments are never merged by receipt number, and replay only skips true duplicates"""
+
+from decimal import Decimal
+
+import pytest
+
+from offline_queue import OfflineQueue, PAYMENT, SYNCED, DUPLICATE, CONFLICT
+
+
+class FakeDatabase:
+    """Receipts by number, as get_receipt_by_number returns them"""
+
+    def __init__(self, receipts=()):
+        self.receipts = {receipt['receipt_number']: receipt for receipt in receipts}
+
+    def get_receipt_by_number(self, receipt_number):
+        return self.receipts.get(receipt_number)
+
+    def add_payment_with_receipt(self, data, receipt_number):
+        self.receipts[receipt_number] = {'receipt_number': receipt_number, 'lrn': data['student_data']['lrn'],
+                                         'amount': Decimal(str(data['amount']))}
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = OfflineQueue(tmp_path / 'journal.db')
+    yield queue
+    queue.close()
+
+
+def payment(lrn, amount):
+    return {'student_data': {'lrn': lrn}, 'amount': amount, 'payment_method': 'Cash'}
+
+
+def states(queue):
+    return [entry.state for entry in queue._entries('kind = ?', (PAYMENT,))]
+
+
+def test_colliding_receipt_numbers_keep_both_payments(queue):
+    queue.enqueue_payment(payment('111', 5000), '202610191234')
+    queue.enqueue_payment(payment('222', 7500), '202610191234')
+
+    queue.replay(FakeDatabase())
+
+    assert states(queue) == [SYNCED, CONFLICT]
+    assert '202610191234' in queue.conflicts()[0].last_error
+
+
+def test_replayed_receipt_is_a_duplicate_only_for_the_same_lrn_and_amount(queue):
+    db = FakeDatabase([{'receipt_number': 'R1', 'lrn': '111', 'amount': Decimal('5000.00')},
+                       {'receipt_number': 'R2', 'lrn': '111', 'amount': Decimal('5000.00')}])
+    queue.enqueue_payment(payment('111', 5000), 'R1')
+    queue.enqueue_payment(payment('111', 4000), 'R2')
+
+    result = queue.replay(db)
+
+    assert (result.duplicates, result.conflicts) == (1, 1)
+    assert states(queue) == [DUPLICATE, CONFLICT]
@@ -0,0 +1,46 @@
+"""A background warm-up never makes other threads wait on the connect"""
+
+import threading
+
+import pytest
+from mysql.connector import InterfaceError
+
+import database_manager_mysql
+from database_manager_mysql import DatabaseManager
+from offline_queue import is_connection_error
+
+
+class SlowConnection:
+    def is_connected(self):
+        return True
+
+
+def test_get_connection_fails_fast_while_warming_up(monkeypatch):
+    opening = threading.Event()
+    release = threading.Event()
+
+    def connect(**settings):
+        opening.set()
+        release.wait(5)
+        return SlowConnection()
+
+    monkeypatch.setattr(database_manager_mysql.mysql.connector, 'connect', connect)
+    monkeypatch.setattr(database_manager_mysql, 'instrument_connection', lambda conn: conn)
+    monkeypatch.setattr(DatabaseManager, '_ensure_data_versions', lambda self: None)
+    monkeypatch.setattr(DatabaseManager, '_ensure_updated_at_index', lambda self: None)
+    monkeypatch.setattr(DatabaseManager, '_ensure_unique_receipts', lambda self: None)
+    monkeypatch.setattr(DatabaseManager, 'prefetch_reference_data', lambda self: None)
+
+    db = DatabaseManager(connect=False)
+    warm_up = threading.Thread(target=db.warm_up)
+    warm_up.start()
+    try:
+        assert opening.wait(5)
+        with pytest.raises(InterfaceError) as raised:
+            db.get_connection()
+        assert is_connection_error(raised.value)
+    finally:
+        release.set()
+        warm_up.join(5)
+
+    assert isinstance(db.get_connection(), SlowConnection)
@@ -4,6 +4,7 @@ Professional, consistent styling for all components
 """
 
 from PyQt6.QtWidgets import QGraphicsDropShadowEffect
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 
 
@@ -407,6 +408,287 @@ class Styles:
         return f"font-size: 12px; color: {Colors.GRAY_500};"
 
 
+# ============================================================================
+# APPLICATION STYLESHEET
+# ============================================================================
+# One stylesheet installed on the QApplication instead of a setStyleSheet()
+# string per widget. Qt parses it once; widgets only carry an objectName
+# (their role) and optional dynamic properties:
+#
+#     title.setObjectName("panelTitle")
+#     set_role(bar, "barFill", status="Enrolled")
+#
+# Rules are keyed by #role so they never cascade into child widgets the way
+# the old "QFrame { ... }" panel sheets did. After changing a property on a
+# visible widget call set_state() so Qt re-polishes it.
+
+# tone name -> (foreground, soft background)
+TONES = {
+    'dark': ('#111827', '#F3F4F6'),
+    'slate': ('#374151', '#F3F4F6'),
+    'gray': ('#6B7280', '#F3F4F6'),
+    'lightgray': ('#9CA3AF', '#F3F4F6'),
+    'green': ('#10B981', '#D1FAE5'),
+    'teal': ('#059669', '#F0FDFA'),
+    'amber': ('#F59E0B', '#FEF3C7'),
+    'red': ('#EF4444', '#FEF2F2'),
+    'blue': ('#3B82F6', '#DBEAFE'),
+    'indigo': ('#2563EB', '#DBEAFE'),
+    'purple': ('#8B5CF6', '#F3E8FF'),
+    'violet': ('#9333EA', '#F3E8FF'),
+    'pink': ('#EC4899', '#FCE7F3'),
+}
+
+# enrollment status -> tone, for widgets styled with status="..."
+STATUS_TONES = {
+    'Enrolled': 'green',
+    'Pending': 'amber',
+    'Rejected': 'red',
+    'Cancelled': 'gray',
+    'Dropped': 'lightgray',
+}
+
+APP_STYLESHEET = """
+/* ---------- Screens ---------- */
+#adminScreen, #staffPortal, #pageContent { background-color: #F8F9FA; }
+#paymentScreen, #enrollmentScreen, #portalContent { background-color: #F8FAFA; }
+
+QScrollArea#pageScroll { border: none; background-color: #F8F9FA; }
+QScrollArea#portalScroll { border: none; background-color: transparent; }
+QScrollArea#pageScroll QScrollBar:vertical { border: none; background: #F0F0F0; width: 10px; margin: 0px; border-radius: 5px; }
+QScrollArea#pageScroll QScrollBar::handle:vertical { background: #C0C0C0; border-radius: 5px; min-height: 20px; }
+QScrollArea#pageScroll QScrollBar::handle:vertical:hover { background: #A0A0A0; }
+QScrollArea#pageScroll QScrollBar::add-line:vertical, QScrollArea#pageScroll QScrollBar::sub-line:vertical { height: 0px; }
+
+/* ---------- Header ---------- */
+#pageHeader { background-color: white; border: none; }
+#headerLogo { font-size: 32px; color: #060C0B; }
+#headerTitle { font-size: 24px; font-weight: 700; color: #060C0B; }
+#headerSubtitle { font-size: 14px; font-weight: 500; color: #666; }
+#staffPortal #headerTitle { font-size: 26px; }
+#staffPortal #headerSubtitle { font-size: 16px; }
+#paymentScreen #headerTitle { font-size: 26px; color: #234940; }
+#paymentScreen #headerSubtitle { color: #6B7280; }
+#enrollmentScreen #headerTitle { font-size: 28px; color: #234940; }
+#enrollmentScreen #headerSubtitle { font-size: 15px; color: #6B7280; }
+
+QPushButton#logoutButton { background-color: white; color: #2D9B84; border: 2px solid #2D9B84; border-radius: 10px; font-size: 15px; font-weight: 600; padding: 0 20px; }
+QPushButton#logoutButton:hover { background-color: #E8F4F2; }
+#paymentScreen QPushButton#logoutButton, #enrollmentScreen QPushButton#logoutButton { border-radius: 8px; font-size: 14px; padding: 0px; }
+#paymentScreen QPushButton#logoutButton:hover, #enrollmentScreen QPushButton#logoutButton:hover { background-color: #F0FAF8; }
+
+/* ---------- Navigation ---------- */
+QFrame#navPills { background-color: #F3F4F6; border-radius: 20px; padding: 4px; margin: 0 40px; }
+QPushButton#navPill { background-color: transparent; border: none; color: #666; font-size: 14px; font-weight: 500; padding: 8px 20px; }
+QPushButton#navPill:hover { background-color: #E5E7EB; color: #060C0B; }
+QPushButton#navPill[active="true"] { background-color: white; color: #060C0B; border-radius: 16px; font-weight: 600; }
+
+QFrame#tabBar { background-color: white; border: none; border-bottom: 1px solid #E5E7EB; }
+QPushButton#tabButton { background-color: transparent; border: none; color: #666; font-size: 15px; font-weight: 500; padding: 0 24px; }
+QPushButton#tabButton:hover { background-color: #F9FAFB; color: #060C0B; }
+QPushButton#tabButton[active="true"] { background-color: transparent; color: #060C0B; border-bottom: 3px solid #2D9B84; font-size: 16px; font-weight: 600; }
+
+/* ---------- Page and panel text ---------- */
+#pageTitle { font-size: 28px; font-weight: 700; color: #060C0B; }
+#pageSubtitle { font-size: 14px; color: #666; }
+#staffPortal #pageSubtitle { font-size: 20px; color: #6B7280; }
+
+QFrame#panel { background-color: white; border: 1px solid #E5E7EB; border-radius: 16px; }
+#panelTitle { font-size: 18px; font-weight: 700; color: #060C0B; }
+#panelTitle[size="large"] { font-size: 20px; }
+#panelTitle[size="small"] { font-size: 16px; }
+#panelSubtitle { font-size: 13px; color: #666; }
+#staffPortal #panelSubtitle { font-size: 20px; color: #6B7280; }
+
+#rowLabel, #rowValue { font-size: 14px; color: #333; }
+#rowValue[tone], #rowValue[status] { font-weight: 600; }
+#itemName { font-size: 14px; font-weight: 600; color: #111827; }
+#itemDetail { font-size: 13px; color: #6B7280; }
+#infoKey { font-size: 14px; color: #666; }
+#infoValue { font-size: 16px; font-weight: 600; color: #111827; }
+#emptyText { font-size: 14px; color: #9CA3AF; padding: 12px 0; }
+#successText { font-size: 14px; color: #059669; padding: 20px; }
+#errorText { font-size: 13px; color: #EF4444; }
+#errorBanner { font-size: 14px; color: #EF4444; padding: 20px; background: #FEF2F2; border-radius: 12px; }
+#iconFallback { font-size: 20px; color: #9CA3AF; }
+#divider { background-color: #E5E7EB; max-height: 1px; border: none; }
+
+/* ---------- Bars, pills and metric cards ---------- */
+QFrame#barTrack { background-color: #E5E7EB; border-radius: 4px; }
+QFrame#barFill { background-color: #6B7280; border-radius: 4px; }
+
+#pill { font-size: 14px; font-weight: 600; color: #111827; padding: 4px 12px; background: #F3F4F6; border-radius: 8px; }
+#pill[size="small"] { font-size: 13px; }
+#pill[tone="red"] { color: #DC2626; background: #FEE2E2; }
+
+QFrame#metricCard { background-color: white; border: 1px solid #E5E7EB; border-radius: 16px; padding: 24px; }
+#metricTitle { font-size: 14px; font-weight: 500; color: #666; }
+#metricValue { font-size: 32px; font-weight: 700; color: #6B7280; }
+#metricIcon { font-size: 20px; color: #6B7280; }
+#metricDelta { font-size: 14px; font-weight: 600; color: #6B7280; margin-left: 8px; }
+
+QFrame#statCard { background-color: #F9FAFB; border-radius: 12px; padding: 20px; }
+#statLabel { font-size: 14px; color: #666; }
+#statValue { font-size: 24px; font-weight: 700; color: #111827; }
+#statValue[size="small"] { font-size: 18px; font-weight: 600; }
+
+/* ---------- Buttons ---------- */
+QPushButton#outlineButton { background-color: white; color: #374151; border: 2px solid #D1D5DB; border-radius: 8px; font-size: 14px; font-weight: 600; padding: 0 20px; }
+QPushButton#outlineButton:hover { background-color: #F3F4F6; }
+QPushButton#outlineButton[size="small"] { border-width: 1px; font-size: 13px; padding: 0 16px; }
+QPushButton#outlineButton[tone="blue"] { color: #2563EB; border-color: #3B82F6; }
+QPushButton#outlineButton[tone="blue"]:hover { background-color: #DBEAFE; }
+QPushButton#outlineButton[tone="blue"]:pressed { background-color: #BFDBFE; }
+QPushButton#outlineButton[tone="red"] { color: #EF4444; border-color: #F87171; }
+QPushButton#outlineButton[tone="red"]:hover { background-color: #FEF2F2; }
+QPushButton#outlineButton[tone="red"]:pressed { background-color: #FEE2E2; }
+QPushButton#outlineButton[tone="amber"] { color: #7C2D12; border-color: #F59E0B; }
+QPushButton#outlineButton[tone="amber"]:hover { background-color: #FEF3C7; }
+QPushButton#outlineButton[tone="teal"] { background-color: #F0FDFA; color: #065F46; border: 1px solid #6EE7B7; padding: 0 16px; }
+QPushButton#outlineButton[tone="teal"]:hover { background-color: #CCFBF1; }
+
+QPushButton#rowButton { background: #F3F4F6; border: none; border-radius: 6px; font-size: 13px; font-weight: 600; padding: 0 12px; }
+QPushButton#rowButton:hover, QPushButton#iconButton:hover { background: #E5E7EB; }
+QPushButton#iconButton { background: #F3F4F6; border: none; border-radius: 6px; font-size: 16px; }
+QPushButton#secondaryButton { background: #F9FAFB; border: 1px solid #E5E7EB; border-radius: 8px; padding: 0 16px; font-size: 13px; font-weight: 600; color: #111827; }
+QPushButton#secondaryButton:hover { background: #E5E7EB; }
+QPushButton#successButton { background: #059669; border: none; border-radius: 8px; padding: 0 16px; font-size: 13px; font-weight: 600; color: white; }
+QPushButton#successButton:hover { background: #047857; }
+QPushButton#successButton[size="large"] { padding: 10px 20px; font-size: 14px; }
+
+/* ---------- Inputs and tables ---------- */
+QLineEdit#searchInput { background: #F9FAFB; border: 1px solid #E5E7EB; border-radius: 8px; padding: 0 15px; font-size: 14px; }
+QLineEdit#searchInput:focus { border: 2px solid #2D9B84; }
+QFrame#searchBox { background-color: #F9FAFB; border: 1px solid #E5E7EB; border-radius: 8px; padding: 8px 16px; }
+#searchIcon { font-size: 16px; }
+QLineEdit#searchField { background: transparent; border: none; font-size: 14px; color: #111827; padding: 4px; }
+
+QComboBox#filterCombo { background: #F9FAFB; border: 1px solid #E5E7EB; border-radius: 8px; padding: 8px 16px; font-size: 14px; color: #111827; min-width: 120px; }
+QComboBox#filterCombo::drop-down { border: none; }
+QComboBox#filterCombo QAbstractItemView { color: #111827; background-color: white; selection-background-color: #E8F4F2; selection-color: #111827; }
+QComboBox#rowCombo { background: white; border: 1px solid #E5E7EB; border-radius: 6px; padding: 6px 10px; font-size: 14px; color: #111827; font-weight: 500; }
+
+QTableWidget#dataTable { background-color: white; border: none; gridline-color: #F3F4F6; }
+QTableWidget#dataTable::item { padding: 12px; border-bottom: 1px solid #F3F4F6; }
+QTableWidget#dataTable QHeaderView::section { background-color: #F9FAFB; padding: 12px; font-weight: 700; font-size: 13px; color: #111827; border: none; border-bottom: 2px solid #E5E7EB; }
+QTableWidget#compactTable { background-color: white; border: none; gridline-color: #F3F4F6; font-size: 12px; }
+QTableWidget#compactTable QHeaderView::section { background-color: #F9FAFB; padding: 8px; font-weight: 700; font-size: 12px; color: #111827; border: none; border-bottom: 2px solid #E5E7EB; }
+QTableWidget#enrolleesTable { background-color: white; border: 1px solid #E5E7EB; border-radius: 12px; gridline-color: #F3F4F6; font-size: 14px; color: #111827; }
+QTableWidget#enrolleesTable::item { padding: 18px 16px; color: #111827; border-bottom: 1px solid #F3F4F6; }
+QTableWidget#enrolleesTable QHeaderView::section { background-color: #F9FAFB; padding: 16px 16px; font-size: 14px; font-weight: 600; color: #111827; border: none; border-bottom: 2px solid #E5E7EB; }
+
+/* ---------- Dialogs ---------- */
+#dialogTitle { font-size: 20px; font-weight: 700; }
+#dialogHeading { font-size: 16px; font-weight: 600; }
+#dialogSubtitle { font-size: 14px; color: #6B7280; }
+
+/* ---------- Student portal (enrollment form, payment) ---------- */
+#portalBanner { background-color: #E8F5F3; border-radius: 12px; border: none; }
+#portalBanner #pageTitle { color: #234940; }
+#portalBanner #pageSubtitle { font-size: 15px; font-weight: 500; color: #6B7280; }
+QFrame#card { background-color: white; border-radius: 16px; border: none; }
+#cardTitle { color: #1F2937; font-size: 20px; font-weight: 700; }
+#infoLabel { color: #6B7280; font-size: 14px; font-weight: 500; }
+#infoText { color: #1F2937; font-size: 14px; font-weight: 600; }
+#feeLabel { color: #6B7280; font-size: 15px; font-weight: 500; }
+#feeAmount { color: #1F2937; font-size: 15px; font-weight: 600; }
+#totalLabel { color: #1F2937; font-size: 18px; font-weight: 700; }
+#totalAmount { color: #2D9B84; font-size: 24px; font-weight: 700; }
+#footerNote { color: #9CA3AF; font-size: 14px; font-weight: 500; padding: 20px; }
+#methodIcon { font-size: 40px; }
+#methodName { color: #1F2937; font-size: 15px; font-weight: 600; }
+QPushButton#methodButton { background-color: white; border: 2px solid #E5E7EB; border-radius: 12px; }
+QPushButton#methodButton:hover { border-color: #2D9B84; background-color: #F0FAF8; }
+QPushButton#methodButton:checked { border-color: #2D9B84; background-color: #E8F5F3; border-width: 3px; }
+QPushButton#linkButton { background-color: transparent; color: #2D9B84; border: none; font-size: 15px; font-weight: 600; }
+QPushButton#linkButton:hover { color: #234940; text-decoration: underline; }
+QPushButton#backButton { background-color: white; color: #6B7280; border: none; border-radius: 10px; font-size: 16px; font-weight: 600; padding: 0 30px; }
+QPushButton#backButton:hover { background-color: #F9FAFB; border-color: #D1D5DB; }
+QPushButton#primaryButton { background-color: #2D9B84; color: white; border: none; border-radius: 10px; font-size: 16px; font-weight: 700; padding: 0 40px; }
+QPushButton#primaryButton:hover { background-color: #35B499; }
+QPushButton#primaryButton:disabled { background-color: #D1D5DB; color: #9CA3AF; }
+
+/* ---------- Form components ---------- */
+#fieldLabel { color: #374151; font-size: 14px; font-weight: 600; letter-spacing: 0.3px; }
+#fieldHint { color: #9CA3AF; font-size: 12px; font-weight: 500; }
+#ageHint { color: #059669; font-size: 11px; font-weight: 500; margin-top: 4px; }
+QLineEdit#fieldInput, QComboBox#fieldInput, QSpinBox#fieldInput { background-color: #FFFFFF; border: none; border-bottom: 2px solid #E5E7EB; border-radius: 0px; padding: 12px 4px; font-size: 14px; color: #1F2937; }
+QLineEdit#fieldInput:focus, QComboBox#fieldInput:focus, QSpinBox#fieldInput:focus { border-bottom: 2px solid #2D9B84; background-color: #FAFBFC; }
+QComboBox#fieldInput::drop-down { border: none; width: 24px; }
+QComboBox#fieldInput::down-arrow { image: none; width: 0px; }
+QLabel#sectionHeader { color: #1F2937; font-size: 17px; font-weight: 700; padding-top: 20px; padding-bottom: 10px; letter-spacing: 0.5px; }
+QPushButton#submitButton { background-color: #2D9B84; color: white; border: none; border-radius: 8px; font-size: 15px; font-weight: 700; padding: 12px 30px; letter-spacing: 0.5px; }
+QPushButton#submitButton:hover { background-color: #35B499; }
+QPushButton#submitButton:pressed { background-color: #1F7A66; }
+"""
+
+
+def _tone_rules():
+    """Colour rules for every tone and status value"""
+    rules = []
+    selectors = [(f'[tone="{name}"]', name) for name in TONES]
+    selectors += [(f'[status="{status}"]', tone) for status, tone in STATUS_TONES.items()]
+    for selector, tone in selectors:
+        foreground, soft = TONES[tone]
+        rules.append(f"QFrame#barFill{selector} {{ background-color: {foreground}; }}")
+        rules.append(f"#rowValue{selector}, #metricValue{selector}, #metricIcon{selector}, "
+                     f"#metricDelta{selector} {{ color: {foreground}; }}")
+        rules.append(f"QFrame#metricCard{selector} {{ border-color: {soft}; }}")
+        if selector.startswith('[status'):
+            rules.append(f"#pill{selector} {{ color: {foreground}; background: {soft}; }}")
+        elif tone != 'red':
+            rules.append(f"#pill{selector} {{ background: {soft}; }}")
+    return "\n".join(rules)
+
+
+_stylesheet = None
+
+
+def application_stylesheet():
+    """The full application stylesheet (built once)"""
+    global _stylesheet
+    if _stylesheet is None:
+        _stylesheet = APP_STYLESHEET + "\n/* ---------- Tones ---------- */\n" + _tone_rules() + "\n"
+    return _stylesheet
+
+
+def apply_app_stylesheet(app):
+    """Install the application stylesheet on the QApplication"""
+    app.setStyleSheet(application_stylesheet())
+
+
+def status_tone(status):
+    """Tone used for an enrollment status ('gray' when unknown)"""
+    return STATUS_TONES.get(status, 'gray')
+
+
+def set_role(widget, role, **properties):
+    """Give a widget its stylesheet role (objectName) and dynamic properties (None values are skipped)"""
+    widget.setObjectName(role)
+    for name, value in properties.items():
+        if value is not None:
+            widget.setProperty(name, value)
+    return widget
+
+
+def set_state(widget, **properties):
+    """Change dynamic properties on a polished widget and re-apply its style"""
+    for name, value in properties.items():
+        widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def set_screen(widget, role, **properties):
+    """
+    Role for a screen's top-level widget; QWidget subclasses only paint a
+    stylesheet background with WA_StyledBackground set
+    """
+    widget.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+    return set_role(widget, role, **properties)
+
+
 # ============================================================================
 # USAGE EXAMPLES
 # ============================================================================
@@ -281,6 +281,46 @@ class ValidationUtils:
         return phone
 
 
+# Required enrollment fields and their labels, as asked for by the enrollment form
+ENROLLMENT_REQUIRED_FIELDS = {
+    "lrn": "Learner Reference Number (LRN)",
+    "gender": "Gender",
+    "firstname": "First Name",
+    "lastname": "Last Name",
+    "birthdate": "Birthdate",
+    "email": "Email Address",
+    "phone": "Phone Number",
+    "address": "Complete Address",
+    "grade": "Grade Level",
+    "track": "Track",
+    "guardian_name": "Guardian Name",
+    "guardian_contact": "Guardian Contact"
+}
+
+
+def validate_enrollment_submission(data):
+    """
+    The enrollment form's checks (without the database track lookup),
+    shared by the form controller and enrollment_service.py
+    """
+    for key, label in ENROLLMENT_REQUIRED_FIELDS.items():
+        value = data.get(key, "")
+        if not value or not isinstance(value, str) or value.startswith("Select "):
+            return False, f"Please fill in: {label}"
+
+    # Validate LRN format
+    if not data["lrn"].isdigit() or len(data["lrn"]) != 12:
+        return False, "LRN must be exactly 12 digits"
+
+    # Track-specific strand validation
+    if data["track"] in ["Academic", "TVL", "Academic Track", "TVL Track"]:
+        strand = data.get("strand")
+        if not strand or strand == "Select strand":
+            return False, "Please select or enter a valid strand for this track"
+
+    return True, ""
+
+
 # Utility function for quick access
 def validate_form(form_data):
     """Quick validation function"""